@@ -106,6 +106,89 @@ def main():
         default=os.getenv("AIRFLOW_PASSWORD"),
         help="Password for Airflow API token authentication",
     )
+    parser.add_argument(
+        "--max-connections",
+        type=int,
+        default=os.getenv("AIRFLOW_HTTP_MAX_CONNECTIONS"),
+        help="Maximum pooled HTTP connections to the Airflow API (default: 20)",
+    )
+    parser.add_argument(
+        "--max-keepalive-connections",
+        type=int,
+        default=os.getenv("AIRFLOW_HTTP_MAX_KEEPALIVE_CONNECTIONS"),
+        help="Maximum idle keep-alive connections kept in the pool (default: 10)",
+    )
+    parser.add_argument(
+        "--keepalive-expiry",
+        type=float,
+        default=os.getenv("AIRFLOW_HTTP_KEEPALIVE_EXPIRY"),
+        help="Seconds to keep idle Airflow API connections open (default: 30)",
+    )
+    parser.add_argument(
+        "--http2",
+        action="store_true",
+        default=os.getenv("AIRFLOW_HTTP2", "").lower() in ("1", "true", "yes"),
+        help="Negotiate HTTP/2 with the Airflow API (requires the 'http2' extra)",
+    )
+    parser.add_argument(
+        "--no-response-cache",
+        dest="response_cache",
+        action="store_false",
+        default=os.getenv("AIRFLOW_RESPONSE_CACHE", "true").lower() not in ("0", "false", "no"),
+        help="Disable the in-memory cache of read-only Airflow API responses",
+    )
+    parser.add_argument(
+        "--cache-max-entries",
+        type=int,
+        default=os.getenv("AIRFLOW_RESPONSE_CACHE_MAX_ENTRIES"),
+        help="Maximum number of cached Airflow API responses (default: 512)",
+    )
+    parser.add_argument(
+        "--airflow-version",
+        type=str,
+        default=os.getenv("AIRFLOW_VERSION_OVERRIDE"),
+        help="Airflow version of the target instance (e.g. 3.1.3); skips version detection",
+    )
+    parser.add_argument(
+        "--version-cache-file",
+        type=str,
+        default=os.getenv("AIRFLOW_VERSION_CACHE_FILE"),
+        help="JSON file caching detected Airflow versions across restarts (default: disabled)",
+    )
+    parser.add_argument(
+        "--run-history-db",
+        type=str,
+        default=os.getenv("AIRFLOW_RUN_HISTORY_DB"),
+        help="SQLite file for a locally synced DAG run history used by get_run_history "
+        "(default: disabled)",
+    )
+    parser.add_argument(
+        "--output-format",
+        type=str,
+        default=os.getenv("MCP_OUTPUT_FORMAT", "compact"),
+        choices=["compact", "pretty"],
+        help="JSON format of tool output: compact (default, fewer tokens) or pretty",
+    )
+    parser.add_argument(
+        "--log-sample-rate",
+        type=float,
+        default=os.getenv("MCP_LOG_SAMPLE_RATE", "0"),
+        help="Fraction of tool calls whose truncated arguments and results are logged (default: 0)",
+    )
+    parser.add_argument(
+        "--log-slow-call-seconds",
+        type=float,
+        default=os.getenv("MCP_LOG_SLOW_CALL_SECONDS", "5"),
+        help="Log the truncated payloads of tool calls taking at least this long (default: 5)",
+    )
+    parser.add_argument(
+        "--otel-exporter",
+        type=str,
+        default=os.getenv("OTEL_TRACES_EXPORTER", "none"),
+        choices=["none", "console", "otlp"],
+        help="OpenTelemetry span exporter; otlp uses the OTEL_EXPORTER_OTLP_* variables "
+        "(default: none, requires astro-airflow-mcp[tracing])",
+    )
     parser.add_argument(
         "--airflow-project-dir",
         type=str,
@@ -138,6 +221,19 @@ def main():
         username=args.username,
         password=args.password,
         project_dir=args.airflow_project_dir,
+        max_connections=args.max_connections,
+        max_keepalive_connections=args.max_keepalive_connections,
+        keepalive_expiry=args.keepalive_expiry,
+        http2=args.http2,
+        response_cache=args.response_cache,
+        cache_max_entries=args.cache_max_entries,
+        airflow_version=args.airflow_version,
+        version_cache_file=args.version_cache_file,
+        run_history_db=args.run_history_db,
+        output_format=args.output_format,
+        log_sample_rate=args.log_sample_rate,
+        log_slow_call_seconds=args.log_slow_call_seconds,
+        trace_exporter=args.otel_exporter,
     )
 
     # Log configuration
@@ -1,12 +1,28 @@
 """Adapter factory for creating version-specific Airflow clients."""
 
+import asyncio
+import inspect
 from collections.abc import Callable
+from pathlib import Path
+from typing import cast
 
 import httpx
 
-from astro_airflow_mcp.adapters.airflow_v2 import AirflowV2Adapter
-from astro_airflow_mcp.adapters.airflow_v3 import AirflowV3Adapter
-from astro_airflow_mcp.adapters.base import AirflowAdapter, NotFoundError
+from astro_airflow_mcp.adapters.airflow_v2 import AirflowV2Adapter, AsyncAirflowV2Adapter
+from astro_airflow_mcp.adapters.airflow_v3 import AirflowV3Adapter, AsyncAirflowV3Adapter
+from astro_airflow_mcp.adapters.base import (
+    AirflowAdapter,
+    AsyncAirflowAdapter,
+    NotFoundError,
+    TokenGetter,
+)
+from astro_airflow_mcp.adapters.cache import ResponseCache
+from astro_airflow_mcp.adapters.version_cache import (
+    clear_version_cache,
+    get_cached_version,
+    parse_major_version,
+    store_version,
+)
 
 
 def detect_version(
@@ -40,37 +56,21 @@ def detect_version(
     if basic_auth_getter:
         auth = basic_auth_getter()
 
-    # Try Airflow 3 API first (/api/v2/version)
-    try:
-        with httpx.Client(timeout=10.0) as client:
-            response = client.get(
-                f"{airflow_url}/api/v2/version",
-                headers=headers,
-                auth=auth,
-            )
-            if response.status_code == 200:
-                data = response.json()
-                version = data.get("version", "3.0.0")
-                major = int(version.split(".")[0])
-                return (major, version)
-    except Exception:  # nosec B110 - try v1 API next
-        pass
-
-    # Try Airflow 2 API (/api/v1/version)
-    try:
-        with httpx.Client(timeout=10.0) as client:
-            response = client.get(
-                f"{airflow_url}/api/v1/version",
-                headers=headers,
-                auth=auth,
-            )
-            if response.status_code == 200:
-                data = response.json()
-                version = data.get("version", "2.0.0")
-                major = int(version.split(".")[0])
-                return (major, version)
-    except Exception:  # nosec B110 - raise RuntimeError below
-        pass
+    # Probe Airflow 3 (/api/v2) first, then Airflow 2 (/api/v1), over one client
+    with httpx.Client(timeout=10.0) as client:
+        for api_path, default_version in (("/api/v2", "3.0.0"), ("/api/v1", "2.0.0")):
+            try:
+                response = client.get(
+                    f"{airflow_url}{api_path}/version",
+                    headers=headers,
+                    auth=auth,
+                )
+                if response.status_code == 200:
+                    data = response.json()
+                    version = data.get("version", default_version)
+                    return (parse_major_version(version), version)
+            except Exception:  # nosec B112 - try the next API version
+                continue
 
     raise RuntimeError(
         f"Failed to detect Airflow version at {airflow_url}. "
@@ -78,10 +78,56 @@ def detect_version(
     )
 
 
+def resolve_version(
+    airflow_url: str,
+    token_getter: Callable[[], str | None] | None = None,
+    basic_auth_getter: Callable[[], tuple[str, str] | None] | None = None,
+    airflow_version: str | None = None,
+    version_cache_file: str | Path | None = None,
+) -> tuple[int, str]:
+    """Resolve the Airflow version, probing the API only when necessary.
+
+    Order: explicit override, then the in-process/on-disk version cache, then
+    detect_version (whose result is cached for next time).
+
+    Args:
+        airflow_url: Base URL of Airflow webserver
+        token_getter: Callable that returns current auth token (or None)
+        basic_auth_getter: Callable that returns (username, password) tuple or None
+        airflow_version: Known version string; skips detection entirely
+        version_cache_file: Optional JSON file persisting detected versions across restarts
+
+    Returns:
+        Tuple of (major_version, full_version_string)
+
+    Raises:
+        RuntimeError: If version detection fails
+        ValueError: If airflow_version is not a valid version string
+    """
+    if airflow_version:
+        return (parse_major_version(airflow_version), airflow_version)
+
+    cached = get_cached_version(airflow_url, cache_file=version_cache_file)
+    if cached:
+        return (parse_major_version(cached), cached)
+
+    major_version, full_version = detect_version(
+        airflow_url, token_getter=token_getter, basic_auth_getter=basic_auth_getter
+    )
+    store_version(airflow_url, full_version, cache_file=version_cache_file)
+    return (major_version, full_version)
+
+
 def create_adapter(
     airflow_url: str,
     token_getter: Callable[[], str | None] | None = None,
     basic_auth_getter: Callable[[], tuple[str, str] | None] | None = None,
+    limits: httpx.Limits | None = None,
+    http2: bool = False,
+    cache: ResponseCache | None = None,
+    on_unauthorized: Callable[[], None] | None = None,
+    airflow_version: str | None = None,
+    version_cache_file: str | Path | None = None,
 ) -> AirflowAdapter:
     """Create appropriate adapter based on detected Airflow version.
 
@@ -90,6 +136,12 @@ def create_adapter(
         token_getter: Callable that returns current auth token (or None)
         basic_auth_getter: Callable that returns (username, password) tuple or None
                          Used as fallback for Airflow 2.x which doesn't support token auth
+        limits: Connection pool limits for the adapter's HTTP client
+        http2: Whether the adapter's HTTP client should negotiate HTTP/2
+        cache: Optional response cache shared by the adapter's GET requests
+        on_unauthorized: Called on a 401 before the request is retried once
+        airflow_version: Known Airflow version; skips detection entirely
+        version_cache_file: Optional JSON file persisting detected versions across restarts
 
     Returns:
         Version-specific adapter instance
@@ -97,8 +149,12 @@ def create_adapter(
     Raises:
         RuntimeError: If version detection fails or version is unsupported
     """
-    major_version, full_version = detect_version(
-        airflow_url, token_getter=token_getter, basic_auth_getter=basic_auth_getter
+    major_version, full_version = resolve_version(
+        airflow_url,
+        token_getter=token_getter,
+        basic_auth_getter=basic_auth_getter,
+        airflow_version=airflow_version,
+        version_cache_file=version_cache_file,
     )
 
     if major_version == 2:
@@ -107,6 +163,10 @@ def create_adapter(
             full_version,
             token_getter=token_getter,
             basic_auth_getter=basic_auth_getter,
+            limits=limits,
+            http2=http2,
+            cache=cache,
+            on_unauthorized=on_unauthorized,
         )
     if major_version >= 3:
         return AirflowV3Adapter(
@@ -114,6 +174,73 @@ def create_adapter(
             full_version,
             token_getter=token_getter,
             basic_auth_getter=basic_auth_getter,
+            limits=limits,
+            http2=http2,
+            cache=cache,
+            on_unauthorized=on_unauthorized,
+        )
+    raise RuntimeError(f"Unsupported Airflow version: {major_version}")
+
+
+async def create_async_adapter(
+    airflow_url: str,
+    token_getter: TokenGetter | None = None,
+    basic_auth_getter: Callable[[], tuple[str, str] | None] | None = None,
+    limits: httpx.Limits | None = None,
+    http2: bool = False,
+    cache: ResponseCache | None = None,
+    on_unauthorized: Callable[[], None] | None = None,
+    airflow_version: str | None = None,
+    version_cache_file: str | Path | None = None,
+) -> AsyncAirflowAdapter:
+    """Create the async adapter matching the detected Airflow version.
+
+    Version resolution may probe the API or read the version cache file, so it
+    runs in a worker thread to keep the event loop free. Arguments are the same
+    as create_adapter, except that token_getter may be a coroutine function.
+
+    Returns:
+        Version-specific async adapter instance
+
+    Raises:
+        RuntimeError: If version detection fails or version is unsupported
+    """
+    detect_token_getter = cast("Callable[[], str | None] | None", token_getter)
+    if inspect.iscoroutinefunction(token_getter):
+        # Version detection runs in a thread, so hand it the token fetched here
+        token = await token_getter()
+        detect_token_getter = AirflowV3Adapter._make_token_getter(token)
+
+    major_version, full_version = await asyncio.to_thread(
+        resolve_version,
+        airflow_url,
+        token_getter=detect_token_getter,
+        basic_auth_getter=basic_auth_getter,
+        airflow_version=airflow_version,
+        version_cache_file=version_cache_file,
+    )
+
+    if major_version == 2:
+        return AsyncAirflowV2Adapter(
+            airflow_url,
+            full_version,
+            token_getter=token_getter,
+            basic_auth_getter=basic_auth_getter,
+            limits=limits,
+            http2=http2,
+            cache=cache,
+            on_unauthorized=on_unauthorized,
+        )
+    if major_version >= 3:
+        return AsyncAirflowV3Adapter(
+            airflow_url,
+            full_version,
+            token_getter=token_getter,
+            basic_auth_getter=basic_auth_getter,
+            limits=limits,
+            http2=http2,
+            cache=cache,
+            on_unauthorized=on_unauthorized,
         )
     raise RuntimeError(f"Unsupported Airflow version: {major_version}")
 
@@ -122,7 +249,14 @@ __all__ = [
     "AirflowAdapter",
     "AirflowV2Adapter",
     "AirflowV3Adapter",
+    "AsyncAirflowAdapter",
+    "AsyncAirflowV2Adapter",
+    "AsyncAirflowV3Adapter",
     "NotFoundError",
+    "ResponseCache",
+    "clear_version_cache",
     "create_adapter",
+    "create_async_adapter",
     "detect_version",
+    "resolve_version",
 ]
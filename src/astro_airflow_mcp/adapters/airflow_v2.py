@@ -1,8 +1,64 @@
 """Adapter for Airflow 2.x API."""
 
+import asyncio
+from collections.abc import Sequence
 from typing import Any
 
-from astro_airflow_mcp.adapters.base import AirflowAdapter, NotFoundError
+from astro_airflow_mcp.adapters.base import (
+    DEFAULT_PAGE_CONCURRENCY,
+    AirflowAdapter,
+    AsyncAirflowAdapter,
+    NotFoundError,
+)
+
+TASK_LOGS_ALTERNATIVE = "Check if the task instance exists and has been executed"
+DATASETS_ALTERNATIVE = "Datasets/Assets were added in Airflow 2.4"
+CONFIG_NOTE = "Config endpoint may require expose_config=True in airflow.cfg"
+
+
+def _merge_chunk_results(
+    chunks: list[list[str]], results: Sequence[dict[str, Any] | BaseException]
+) -> dict[str, Any]:
+    """Merge dagStats chunk responses in chunk order, reporting failed chunks as errors.
+
+    Raises:
+        BaseException: The first failure, if no chunk succeeded
+    """
+    responses: list[dict[str, Any]] = []
+    for chunk, result in zip(chunks, results, strict=True):
+        if isinstance(result, BaseException):
+            responses.append({"errors": [{"dag_ids": chunk, "error": str(result)}]})
+        else:
+            responses.append(result)
+    failures = [r for r in results if isinstance(r, BaseException)]
+    if failures and len(failures) == len(results):
+        raise failures[0]
+    return AirflowAdapter._merge_dag_stats(responses)
+
+
+def _trigger_body(logical_date: str | None, conf: dict[str, Any] | None) -> dict[str, Any]:
+    """Build the DAG run trigger body (Airflow 2 uses execution_date)."""
+    json_body: dict[str, Any] = {}
+    if logical_date:
+        # Airflow 2.x uses execution_date instead of logical_date
+        json_body["execution_date"] = logical_date
+    if conf:
+        json_body["conf"] = conf
+    return json_body
+
+
+def _normalize_datasets(data: dict[str, Any]) -> dict[str, Any]:
+    """Normalize dataset field names for consistency with Airflow 3.
+
+    - 'datasets' -> 'assets'
+    - 'consuming_dags' -> 'scheduled_dags'
+    """
+    if "datasets" in data:
+        data["assets"] = data.pop("datasets")
+        for asset in data.get("assets", []):
+            if "consuming_dags" in asset:
+                asset["scheduled_dags"] = asset.pop("consuming_dags")
+    return data
 
 
 class AirflowV2Adapter(AirflowAdapter):
@@ -44,7 +100,9 @@ class AirflowV2Adapter(AirflowAdapter):
         Returns:
             Updated DAG details with is_paused=True
         """
-        return self._patch(f"dags/{dag_id}", json_data={"is_paused": True})
+        data = self._patch(f"dags/{dag_id}", json_data={"is_paused": True})
+        self._invalidate_dag(dag_id)
+        return data
 
     def unpause_dag(self, dag_id: str) -> dict[str, Any]:
         """Unpause a DAG to allow new runs to be scheduled.
@@ -55,7 +113,9 @@ class AirflowV2Adapter(AirflowAdapter):
         Returns:
             Updated DAG details with is_paused=False
         """
-        return self._patch(f"dags/{dag_id}", json_data={"is_paused": False})
+        data = self._patch(f"dags/{dag_id}", json_data={"is_paused": False})
+        self._invalidate_dag(dag_id)
+        return data
 
     def list_dag_runs(
         self, dag_id: str | None = None, limit: int = 100, offset: int = 0, **kwargs: Any
@@ -88,14 +148,9 @@ class AirflowV2Adapter(AirflowAdapter):
         Returns:
             Details of the triggered DAG run
         """
-        json_body: dict[str, Any] = {}
-        if logical_date:
-            # Airflow 2.x uses execution_date instead of logical_date
-            json_body["execution_date"] = logical_date
-        if conf:
-            json_body["conf"] = conf
-
-        return self._post(f"dags/{dag_id}/dagRuns", json_data=json_body)
+        data = self._post(f"dags/{dag_id}/dagRuns", json_data=_trigger_body(logical_date, conf))
+        self._invalidate_dag(dag_id)
+        return data
 
     def list_tasks(self, dag_id: str) -> dict[str, Any]:
         """List all tasks in a DAG."""
@@ -133,6 +188,7 @@ class AirflowV2Adapter(AirflowAdapter):
         try_number: int = 1,
         map_index: int = -1,
         full_content: bool = True,
+        continuation_token: str | None = None,
     ) -> dict[str, Any]:
         """Get logs for a specific task instance.
 
@@ -143,18 +199,15 @@ class AirflowV2Adapter(AirflowAdapter):
             try_number: Task try number (1-indexed, default 1)
             map_index: Map index for mapped tasks (-1 for unmapped, default -1)
             full_content: Whether to return full log content (default True)
+            continuation_token: Token from a previous response to read the next chunk
         """
-        endpoint = f"dags/{dag_id}/dagRuns/{dag_run_id}/taskInstances/{task_id}/logs/{try_number}"
-        params: dict[str, Any] = {"full_content": full_content}
-        if map_index != -1:
-            params["map_index"] = map_index
-
+        endpoint, params = self._task_logs_request(
+            dag_id, dag_run_id, task_id, try_number, map_index, full_content, continuation_token
+        )
         try:
             return self._call(endpoint, params=params)
         except NotFoundError:
-            return self._handle_not_found(
-                "task logs", alternative="Check if the task instance exists and has been executed"
-            )
+            return self._handle_not_found("task logs", alternative=TASK_LOGS_ALTERNATIVE)
 
     def list_assets(self, limit: int = 100, offset: int = 0, **kwargs: Any) -> dict[str, Any]:
         """List assets (called 'datasets' in Airflow 2).
@@ -165,19 +218,9 @@ class AirflowV2Adapter(AirflowAdapter):
         """
         try:
             data = self._call("datasets", params={"limit": limit, "offset": offset}, **kwargs)
-
-            # Normalize field names
-            if "datasets" in data:
-                data["assets"] = data.pop("datasets")
-                for asset in data.get("assets", []):
-                    if "consuming_dags" in asset:
-                        asset["scheduled_dags"] = asset.pop("consuming_dags")
-
-            return data
+            return _normalize_datasets(data)
         except NotFoundError:
-            return self._handle_not_found(
-                "datasets", alternative="Datasets/Assets were added in Airflow 2.4"
-            )
+            return self._handle_not_found("datasets", alternative=DATASETS_ALTERNATIVE)
 
     def list_variables(self, limit: int = 100, offset: int = 0) -> dict[str, Any]:
         """List Airflow variables."""
@@ -204,17 +247,25 @@ class AirflowV2Adapter(AirflowAdapter):
         """Get DAG run statistics by state.
 
         Note: Airflow 2.x requires dag_ids parameter. If not provided, we fetch all DAGs first.
+        IDs are sent in chunks sized to keep each request URL short; a chunk that
+        fails is reported under "errors" unless every chunk fails.
         """
         if dag_ids is None:
             # Airflow 2.x requires dag_ids, so fetch all DAGs first
-            dags_response = self.list_dags(limit=1000)
+            dags_response = self.fetch_all(self.list_dags, "dags")
             dag_ids = [dag["dag_id"] for dag in dags_response.get("dags", [])]
 
             if not dag_ids:
                 return {"dags": [], "total_entries": 0}
 
-        params = {"dag_ids": ",".join(dag_ids)}
-        return self._call("dagStats", params=params)
+        chunks = self._chunk_dag_ids(dag_ids)
+        results: list[dict[str, Any] | BaseException] = []
+        for chunk in chunks:
+            try:
+                results.append(self._call("dagStats", params={"dag_ids": ",".join(chunk)}))
+            except Exception as e:
+                results.append(e)
+        return _merge_chunk_results(chunks, results)
 
     def list_dag_warnings(self, limit: int = 100, offset: int = 0) -> dict[str, Any]:
         """List DAG warnings."""
@@ -244,7 +295,190 @@ class AirflowV2Adapter(AirflowAdapter):
         try:
             return self._call("config")
         except Exception as e:
-            return {
-                "error": str(e),
-                "note": "Config endpoint may require expose_config=True in airflow.cfg",
-            }
+            return {"error": str(e), "note": CONFIG_NOTE}
+
+
+class AsyncAirflowV2Adapter(AsyncAirflowAdapter):
+    """Async adapter for Airflow 2.x API (/api/v1).
+
+    Same endpoints and normalization as AirflowV2Adapter, awaited on httpx.AsyncClient.
+    """
+
+    @property
+    def api_base_path(self) -> str:
+        """API base path for Airflow 2.x."""
+        return "/api/v1"
+
+    async def list_dags(self, limit: int = 100, offset: int = 0, **kwargs: Any) -> dict[str, Any]:
+        """List all DAGs."""
+        return await self._call("dags", params={"limit": limit, "offset": offset}, **kwargs)
+
+    async def get_dag(self, dag_id: str) -> dict[str, Any]:
+        """Get details of a specific DAG."""
+        return await self._call(f"dags/{dag_id}")
+
+    async def get_dag_source(self, dag_id: str) -> dict[str, Any]:
+        """Get source code of a DAG (resolved through the DAG's file_token)."""
+        dag_data = await self.get_dag(dag_id)
+        file_token = dag_data.get("file_token")
+        if not file_token:
+            return {"error": "DAG has no file_token", "dag_id": dag_id}
+
+        return await self._call(f"dagSources/{file_token}")
+
+    async def pause_dag(self, dag_id: str) -> dict[str, Any]:
+        """Pause a DAG to prevent new runs from being scheduled."""
+        data = await self._patch(f"dags/{dag_id}", json_data={"is_paused": True})
+        self._invalidate_dag(dag_id)
+        return data
+
+    async def unpause_dag(self, dag_id: str) -> dict[str, Any]:
+        """Unpause a DAG to allow new runs to be scheduled."""
+        data = await self._patch(f"dags/{dag_id}", json_data={"is_paused": False})
+        self._invalidate_dag(dag_id)
+        return data
+
+    async def list_dag_runs(
+        self, dag_id: str | None = None, limit: int = 100, offset: int = 0, **kwargs: Any
+    ) -> dict[str, Any]:
+        """List DAG runs ('~' lists runs for all DAGs)."""
+        dag_id_param = dag_id if dag_id else "~"
+        return await self._call(
+            f"dags/{dag_id_param}/dagRuns",
+            params={"limit": limit, "offset": offset},
+            **kwargs,
+        )
+
+    async def get_dag_run(self, dag_id: str, dag_run_id: str) -> dict[str, Any]:
+        """Get details of a specific DAG run."""
+        return await self._call(f"dags/{dag_id}/dagRuns/{dag_run_id}")
+
+    async def trigger_dag_run(
+        self, dag_id: str, logical_date: str | None = None, conf: dict[str, Any] | None = None
+    ) -> dict[str, Any]:
+        """Trigger a new DAG run (logical_date is sent as execution_date)."""
+        data = await self._post(
+            f"dags/{dag_id}/dagRuns", json_data=_trigger_body(logical_date, conf)
+        )
+        self._invalidate_dag(dag_id)
+        return data
+
+    async def list_tasks(self, dag_id: str) -> dict[str, Any]:
+        """List all tasks in a DAG."""
+        return await self._call(f"dags/{dag_id}/tasks")
+
+    async def get_task(self, dag_id: str, task_id: str) -> dict[str, Any]:
+        """Get details of a specific task."""
+        return await self._call(f"dags/{dag_id}/tasks/{task_id}")
+
+    async def get_task_instance(self, dag_id: str, dag_run_id: str, task_id: str) -> dict[str, Any]:
+        """Get details of a task instance."""
+        return await self._call(f"dags/{dag_id}/dagRuns/{dag_run_id}/taskInstances/{task_id}")
+
+    async def get_task_instances(
+        self, dag_id: str, dag_run_id: str, limit: int = 100, offset: int = 0
+    ) -> dict[str, Any]:
+        """List all task instances for a DAG run."""
+        return await self._call(
+            f"dags/{dag_id}/dagRuns/{dag_run_id}/taskInstances",
+            params={"limit": limit, "offset": offset},
+        )
+
+    async def get_task_logs(
+        self,
+        dag_id: str,
+        dag_run_id: str,
+        task_id: str,
+        try_number: int = 1,
+        map_index: int = -1,
+        full_content: bool = True,
+        continuation_token: str | None = None,
+    ) -> dict[str, Any]:
+        """Get logs for a specific task instance."""
+        endpoint, params = self._task_logs_request(
+            dag_id, dag_run_id, task_id, try_number, map_index, full_content, continuation_token
+        )
+        try:
+            return await self._call(endpoint, params=params)
+        except NotFoundError:
+            return self._handle_not_found("task logs", alternative=TASK_LOGS_ALTERNATIVE)
+
+    async def list_assets(self, limit: int = 100, offset: int = 0, **kwargs: Any) -> dict[str, Any]:
+        """List assets (called 'datasets' in Airflow 2), normalized to Airflow 3 names."""
+        try:
+            data = await self._call("datasets", params={"limit": limit, "offset": offset}, **kwargs)
+            return _normalize_datasets(data)
+        except NotFoundError:
+            return self._handle_not_found("datasets", alternative=DATASETS_ALTERNATIVE)
+
+    async def list_variables(self, limit: int = 100, offset: int = 0) -> dict[str, Any]:
+        """List Airflow variables."""
+        return await self._call("variables", params={"limit": limit, "offset": offset})
+
+    async def get_variable(self, variable_key: str) -> dict[str, Any]:
+        """Get a specific variable."""
+        return await self._call(f"variables/{variable_key}")
+
+    async def list_connections(self, limit: int = 100, offset: int = 0) -> dict[str, Any]:
+        """List Airflow connections (passwords filtered)."""
+        data = await self._call("connections", params={"limit": limit, "offset": offset})
+        return self._filter_passwords(data)
+
+    async def list_pools(self, limit: int = 100, offset: int = 0) -> dict[str, Any]:
+        """List Airflow pools."""
+        return await self._call("pools", params={"limit": limit, "offset": offset})
+
+    async def get_pool(self, pool_name: str) -> dict[str, Any]:
+        """Get details of a specific pool."""
+        return await self._call(f"pools/{pool_name}")
+
+    async def get_dag_stats(self, dag_ids: list[str] | None = None) -> dict[str, Any]:
+        """Get DAG run statistics by state (fetching all DAG IDs first if none given).
+
+        Chunks of IDs are requested concurrently, at most DEFAULT_PAGE_CONCURRENCY at a time.
+        """
+        if dag_ids is None:
+            dags_response = await self.fetch_all(self.list_dags, "dags")
+            dag_ids = [dag["dag_id"] for dag in dags_response.get("dags", [])]
+
+            if not dag_ids:
+                return {"dags": [], "total_entries": 0}
+
+        chunks = self._chunk_dag_ids(dag_ids)
+        semaphore = asyncio.Semaphore(DEFAULT_PAGE_CONCURRENCY)
+
+        async def _chunk_stats(chunk: list[str]) -> dict[str, Any]:
+            async with semaphore:
+                return await self._call("dagStats", params={"dag_ids": ",".join(chunk)})
+
+        results = await asyncio.gather(
+            *(_chunk_stats(chunk) for chunk in chunks), return_exceptions=True
+        )
+        return _merge_chunk_results(chunks, results)
+
+    async def list_dag_warnings(self, limit: int = 100, offset: int = 0) -> dict[str, Any]:
+        """List DAG warnings."""
+        return await self._call("dagWarnings", params={"limit": limit, "offset": offset})
+
+    async def list_import_errors(self, limit: int = 100, offset: int = 0) -> dict[str, Any]:
+        """List import errors from DAG files."""
+        return await self._call("importErrors", params={"limit": limit, "offset": offset})
+
+    async def list_plugins(self, limit: int = 100, offset: int = 0) -> dict[str, Any]:
+        """List installed Airflow plugins."""
+        return await self._call("plugins", params={"limit": limit, "offset": offset})
+
+    async def list_providers(self) -> dict[str, Any]:
+        """List installed Airflow provider packages."""
+        return await self._call("providers")
+
+    async def get_version(self) -> dict[str, Any]:
+        """Get Airflow version info."""
+        return await self._call("version")
+
+    async def get_config(self) -> dict[str, Any]:
+        """Get Airflow configuration (may require expose_config=True)."""
+        try:
+            return await self._call("config")
+        except Exception as e:
+            return {"error": str(e), "note": CONFIG_NOTE}
@@ -1,11 +1,51 @@
 """Adapter for Airflow 3.x API."""
 
+import asyncio
 from collections.abc import Callable
 from typing import Any
 
 import httpx
 
-from astro_airflow_mcp.adapters.base import AirflowAdapter, NotFoundError
+from astro_airflow_mcp.adapters.base import (
+    DEFAULT_PAGE_CONCURRENCY,
+    AirflowAdapter,
+    AsyncAirflowAdapter,
+    NotFoundError,
+    TokenGetter,
+)
+from astro_airflow_mcp.adapters.cache import ResponseCache
+from astro_airflow_mcp.task_logs import NDJSON_MEDIA_TYPE
+
+TASK_LOGS_ALTERNATIVE = "Check if the task instance exists and has been executed"
+ASSETS_ALTERNATIVE = "Try 'datasets' endpoint if using older Airflow 3.x"
+DAG_STATS_ALTERNATIVE = "Use list_dag_runs to compute statistics"
+DAG_STATS_BUG_NOTE = "Airflow 3.2.0 bug: dag_display_name may be None"
+
+
+def _trigger_body(logical_date: str | None, conf: dict[str, Any] | None) -> dict[str, Any]:
+    """Build the DAG run trigger body (logical_date may be null in Airflow 3)."""
+    json_body: dict[str, Any] = {"logical_date": logical_date}
+    if conf:
+        json_body["conf"] = conf
+    return json_body
+
+
+def _dag_filters(filters: dict[str, Any]) -> dict[str, Any]:
+    """Rename Airflow 2 list_dags filters (only_active -> exclude_stale)."""
+    only_active = filters.pop("only_active", None)
+    if only_active is not None:
+        filters["exclude_stale"] = only_active
+    return filters
+
+
+def _is_server_error(error: Exception) -> bool:
+    """Whether error is a 500 response from Airflow."""
+    return isinstance(error, httpx.HTTPStatusError) and error.response.status_code == 500
+
+
+def _dag_stats_error(dag_id: str, error: Exception) -> dict[str, Any]:
+    """dagStats result recording that stats for dag_id could not be fetched."""
+    return {"errors": [{"dag_id": dag_id, "error": str(error), "note": DAG_STATS_BUG_NOTE}]}
 
 
 class AirflowV3Adapter(AirflowAdapter):
@@ -13,30 +53,53 @@ class AirflowV3Adapter(AirflowAdapter):
 
     Authentication is handled via JWT token. If basic_auth_getter is provided
     instead of token_getter, this adapter will automatically exchange the
-    credentials for a JWT token via the /auth/token endpoint.
+    credentials for a JWT token via the /auth/token endpoint on its first request.
 
     See: https://github.com/apache/airflow-client-python
     """
 
+    # Airflow 3 streams structured log entries as NDJSON
+    log_stream_media_type = NDJSON_MEDIA_TYPE
+    # Cleared after a multi-DAG dagStats request hits the Airflow 3.2.0 500 error
+    _batch_dag_stats = True
+
     def __init__(
         self,
         airflow_url: str,
         version: str,
         token_getter: Callable[[], str | None] | None = None,
         basic_auth_getter: Callable[[], tuple[str, str] | None] | None = None,
+        limits: httpx.Limits | None = None,
+        http2: bool = False,
+        cache: ResponseCache | None = None,
+        on_unauthorized: Callable[[], None] | None = None,
     ):
-        """Initialize V3 adapter, exchanging basic auth for JWT if needed."""
-        # If we have basic auth but no token, exchange for JWT
-        if basic_auth_getter and not token_getter:
-            creds = basic_auth_getter()
-            if creds:
-                jwt_token = self._exchange_for_token(airflow_url, creds[0], creds[1])
-                if jwt_token:
-                    # Create a token getter that returns the JWT
-                    token_getter = self._make_token_getter(jwt_token)
-                    basic_auth_getter = None  # Don't use basic auth
-
-        super().__init__(airflow_url, version, token_getter, basic_auth_getter)
+        """Initialize V3 adapter; JWT exchange is deferred to the first request."""
+        super().__init__(
+            airflow_url,
+            version,
+            token_getter,
+            basic_auth_getter,
+            limits=limits,
+            http2=http2,
+            cache=cache,
+            on_unauthorized=on_unauthorized,
+        )
+        # If we have basic auth but no token, exchange for JWT on first use
+        self._needs_token_exchange = bool(basic_auth_getter and not token_getter)
+
+    def _prepare_auth(self) -> None:
+        """Exchange basic auth credentials for a JWT before the first request."""
+        if not self._needs_token_exchange:
+            return
+        self._needs_token_exchange = False
+        creds = self._basic_auth_getter() if self._basic_auth_getter else None
+        if creds:
+            jwt_token = self._exchange_for_token(self.airflow_url, creds[0], creds[1])
+            if jwt_token:
+                # Create a token getter that returns the JWT
+                self._token_getter = self._make_token_getter(jwt_token)
+                self._basic_auth_getter = None  # Don't use basic auth
 
     @staticmethod
     def _make_token_getter(token: str) -> Callable[[], str | None]:
@@ -79,9 +142,10 @@ class AirflowV3Adapter(AirflowAdapter):
             limit: Maximum number of DAGs to return
             offset: Offset for pagination
             **kwargs: Additional filters (e.g., tags, paused, only_active)
-                      Passed through to Airflow API for forward compatibility.
+                      Passed through to Airflow API for forward compatibility;
+                      only_active is sent as Airflow 3's exclude_stale.
         """
-        return self._call("dags", params={"limit": limit, "offset": offset}, **kwargs)
+        return self._call("dags", params={"limit": limit, "offset": offset}, **_dag_filters(kwargs))
 
     def get_dag(self, dag_id: str) -> dict[str, Any]:
         """Get details of a specific DAG."""
@@ -103,7 +167,9 @@ class AirflowV3Adapter(AirflowAdapter):
         Returns:
             Updated DAG details with is_paused=True
         """
-        return self._patch(f"dags/{dag_id}", json_data={"is_paused": True})
+        data = self._patch(f"dags/{dag_id}", json_data={"is_paused": True})
+        self._invalidate_dag(dag_id)
+        return data
 
     def unpause_dag(self, dag_id: str) -> dict[str, Any]:
         """Unpause a DAG to allow new runs to be scheduled.
@@ -114,7 +180,9 @@ class AirflowV3Adapter(AirflowAdapter):
         Returns:
             Updated DAG details with is_paused=False
         """
-        return self._patch(f"dags/{dag_id}", json_data={"is_paused": False})
+        data = self._patch(f"dags/{dag_id}", json_data={"is_paused": False})
+        self._invalidate_dag(dag_id)
+        return data
 
     def list_dag_runs(
         self, dag_id: str | None = None, limit: int = 100, offset: int = 0, **kwargs: Any
@@ -151,11 +219,9 @@ class AirflowV3Adapter(AirflowAdapter):
         Returns:
             Details of the triggered DAG run
         """
-        json_body: dict[str, Any] = {"logical_date": logical_date}
-        if conf:
-            json_body["conf"] = conf
-
-        return self._post(f"dags/{dag_id}/dagRuns", json_data=json_body)
+        data = self._post(f"dags/{dag_id}/dagRuns", json_data=_trigger_body(logical_date, conf))
+        self._invalidate_dag(dag_id)
+        return data
 
     def list_tasks(self, dag_id: str) -> dict[str, Any]:
         """List all tasks in a DAG."""
@@ -174,9 +240,7 @@ class AirflowV3Adapter(AirflowAdapter):
         try:
             return self._call("assets", params={"limit": limit, "offset": offset}, **kwargs)
         except NotFoundError:
-            return self._handle_not_found(
-                "assets", alternative="Try 'datasets' endpoint if using older Airflow 3.x"
-            )
+            return self._handle_not_found("assets", alternative=ASSETS_ALTERNATIVE)
 
     def list_variables(self, limit: int = 100, offset: int = 0) -> dict[str, Any]:
         """List Airflow variables."""
@@ -212,38 +276,40 @@ class AirflowV3Adapter(AirflowAdapter):
             2. Multiple dag_ids in one call causes a 500 error
             3. DAGs with dag_display_name=None cause a 500 error
 
-            We work around these by calling once per DAG and handling errors.
+            IDs are requested in URL-sized chunks. A chunk that fails is
+            retried once per DAG, and after a 500 the adapter stops batching
+            (bug 2). DAGs that still fail are reported under "errors".
 
         Available in Airflow 3.0+. Returns counts by DAG and state.
         """
         try:
-            # Workaround for Airflow 3.2.0 bugs
             if dag_ids:
-                # Call once per DAG to avoid multiple dag_ids bug
-                all_results: dict[str, Any] = {"dags": [], "total_entries": 0, "errors": []}
-                for dag_id in dag_ids:
-                    try:
-                        result = self._call("dagStats", params={"dag_ids": dag_id})
-                        all_results["dags"].extend(result.get("dags", []))
-                        all_results["total_entries"] += result.get("total_entries", 0)
-                    except Exception as e:
-                        # Some DAGs may fail due to dag_display_name=None bug
-                        all_results["errors"].append(
-                            {
-                                "dag_id": dag_id,
-                                "error": str(e),
-                                "note": "Airflow 3.2.0 bug: dag_display_name may be None",
-                            }
-                        )
-                if not all_results["errors"]:
-                    del all_results["errors"]
-                return all_results
+                return self._merge_dag_stats(
+                    [self._dag_stats_chunk(chunk) for chunk in self._chunk_dag_ids(dag_ids)]
+                )
             # Pass empty dag_ids to avoid 500 error
             return self._call("dagStats", params={"dag_ids": ""})
         except NotFoundError:
-            return self._handle_not_found(
-                "dagStats", alternative="Use list_dag_runs to compute statistics"
-            )
+            return self._handle_not_found("dagStats", alternative=DAG_STATS_ALTERNATIVE)
+
+    def _dag_stats_chunk(self, chunk: list[str]) -> dict[str, Any]:
+        """Get stats for a chunk of DAGs, falling back to one request per DAG."""
+        if len(chunk) > 1 and self._batch_dag_stats:
+            try:
+                return self._call("dagStats", params={"dag_ids": chunk})
+            except Exception as e:
+                if _is_server_error(e):
+                    # Airflow 3.2.0 rejects multiple dag_ids; stop trying
+                    self._batch_dag_stats = False
+        return self._merge_dag_stats([self._dag_stats_single(dag_id) for dag_id in chunk])
+
+    def _dag_stats_single(self, dag_id: str) -> dict[str, Any]:
+        """Get stats for one DAG, reporting a failure as an error entry."""
+        try:
+            return self._call("dagStats", params={"dag_ids": dag_id})
+        except Exception as e:
+            # Some DAGs may fail due to dag_display_name=None bug
+            return _dag_stats_error(dag_id, e)
 
     def list_dag_warnings(self, limit: int = 100, offset: int = 0) -> dict[str, Any]:
         """List DAG warnings."""
@@ -300,6 +366,7 @@ class AirflowV3Adapter(AirflowAdapter):
         try_number: int = 1,
         map_index: int = -1,
         full_content: bool = True,
+        continuation_token: str | None = None,
     ) -> dict[str, Any]:
         """Get logs for a specific task instance.
 
@@ -310,17 +377,270 @@ class AirflowV3Adapter(AirflowAdapter):
             try_number: Task try number (1-indexed, default 1)
             map_index: Map index for mapped tasks (-1 for unmapped, default -1)
             full_content: Whether to return full log content (default True)
+            continuation_token: Token from a previous response to read the next chunk
 
         Available in Airflow 3.0+.
         """
-        endpoint = f"dags/{dag_id}/dagRuns/{dag_run_id}/taskInstances/{task_id}/logs/{try_number}"
-        params: dict[str, Any] = {"full_content": full_content}
-        if map_index != -1:
-            params["map_index"] = map_index
-
+        endpoint, params = self._task_logs_request(
+            dag_id, dag_run_id, task_id, try_number, map_index, full_content, continuation_token
+        )
         try:
             return self._call(endpoint, params=params)
         except NotFoundError:
-            return self._handle_not_found(
-                "task logs", alternative="Check if the task instance exists and has been executed"
+            return self._handle_not_found("task logs", alternative=TASK_LOGS_ALTERNATIVE)
+
+
+class AsyncAirflowV3Adapter(AsyncAirflowAdapter):
+    """Async adapter for Airflow 3.x API (/api/v2).
+
+    Same endpoints and workarounds as AirflowV3Adapter, awaited on httpx.AsyncClient.
+    When only basic auth credentials are available they are exchanged for a JWT
+    on the first request rather than in the constructor, so creating the
+    adapter never blocks the event loop.
+    """
+
+    log_stream_media_type = NDJSON_MEDIA_TYPE
+    _batch_dag_stats = True
+
+    def __init__(
+        self,
+        airflow_url: str,
+        version: str,
+        token_getter: TokenGetter | None = None,
+        basic_auth_getter: Callable[[], tuple[str, str] | None] | None = None,
+        limits: httpx.Limits | None = None,
+        http2: bool = False,
+        cache: ResponseCache | None = None,
+        on_unauthorized: Callable[[], None] | None = None,
+    ):
+        """Initialize async V3 adapter; JWT exchange is deferred to the first request."""
+        super().__init__(
+            airflow_url,
+            version,
+            token_getter,
+            basic_auth_getter,
+            limits=limits,
+            http2=http2,
+            cache=cache,
+            on_unauthorized=on_unauthorized,
+        )
+        self._needs_token_exchange = bool(basic_auth_getter and not token_getter)
+
+    async def _prepare_auth(self) -> None:
+        """Exchange basic auth credentials for a JWT before the first request."""
+        if not self._needs_token_exchange:
+            return
+        self._needs_token_exchange = False
+        creds = self._basic_auth_getter() if self._basic_auth_getter else None
+        if not creds:
+            return
+        try:
+            response = await self.client.post(
+                f"{self.airflow_url}/auth/token",
+                data={"username": creds[0], "password": creds[1]},
+                headers={"Content-Type": "application/x-www-form-urlencoded"},
             )
+            if response.status_code in (200, 201):
+                jwt_token = response.json().get("access_token")
+                if jwt_token:
+                    self._token_getter = AirflowV3Adapter._make_token_getter(jwt_token)
+                    self._basic_auth_getter = None  # Don't use basic auth
+        except Exception:  # nosec B110 - silent fallback when token exchange fails
+            pass
+
+    @property
+    def api_base_path(self) -> str:
+        """API base path for Airflow 3.x."""
+        return "/api/v2"
+
+    async def list_dags(self, limit: int = 100, offset: int = 0, **kwargs: Any) -> dict[str, Any]:
+        """List all DAGs with optional pass-through filters (only_active -> exclude_stale)."""
+        return await self._call(
+            "dags", params={"limit": limit, "offset": offset}, **_dag_filters(kwargs)
+        )
+
+    async def get_dag(self, dag_id: str) -> dict[str, Any]:
+        """Get details of a specific DAG."""
+        return await self._call(f"dags/{dag_id}")
+
+    async def get_dag_source(self, dag_id: str) -> dict[str, Any]:
+        """Get source code of a DAG."""
+        return await self._call(f"dagSources/{dag_id}")
+
+    async def pause_dag(self, dag_id: str) -> dict[str, Any]:
+        """Pause a DAG to prevent new runs from being scheduled."""
+        data = await self._patch(f"dags/{dag_id}", json_data={"is_paused": True})
+        self._invalidate_dag(dag_id)
+        return data
+
+    async def unpause_dag(self, dag_id: str) -> dict[str, Any]:
+        """Unpause a DAG to allow new runs to be scheduled."""
+        data = await self._patch(f"dags/{dag_id}", json_data={"is_paused": False})
+        self._invalidate_dag(dag_id)
+        return data
+
+    async def list_dag_runs(
+        self, dag_id: str | None = None, limit: int = 100, offset: int = 0, **kwargs: Any
+    ) -> dict[str, Any]:
+        """List DAG runs ('~' or None lists runs for all DAGs)."""
+        dag_id_param = dag_id if dag_id else "~"
+        return await self._call(
+            f"dags/{dag_id_param}/dagRuns",
+            params={"limit": limit, "offset": offset},
+            **kwargs,
+        )
+
+    async def get_dag_run(self, dag_id: str, dag_run_id: str) -> dict[str, Any]:
+        """Get details of a specific DAG run."""
+        return await self._call(f"dags/{dag_id}/dagRuns/{dag_run_id}")
+
+    async def trigger_dag_run(
+        self, dag_id: str, logical_date: str | None = None, conf: dict[str, Any] | None = None
+    ) -> dict[str, Any]:
+        """Trigger a new DAG run."""
+        data = await self._post(
+            f"dags/{dag_id}/dagRuns", json_data=_trigger_body(logical_date, conf)
+        )
+        self._invalidate_dag(dag_id)
+        return data
+
+    async def list_tasks(self, dag_id: str) -> dict[str, Any]:
+        """List all tasks in a DAG."""
+        return await self._call(f"dags/{dag_id}/tasks")
+
+    async def get_task(self, dag_id: str, task_id: str) -> dict[str, Any]:
+        """Get details of a specific task."""
+        return await self._call(f"dags/{dag_id}/tasks/{task_id}")
+
+    async def get_task_instance(self, dag_id: str, dag_run_id: str, task_id: str) -> dict[str, Any]:
+        """Get details of a task instance."""
+        return await self._call(f"dags/{dag_id}/dagRuns/{dag_run_id}/taskInstances/{task_id}")
+
+    async def list_assets(self, limit: int = 100, offset: int = 0, **kwargs: Any) -> dict[str, Any]:
+        """List assets (renamed from 'datasets' in Airflow 3)."""
+        try:
+            return await self._call("assets", params={"limit": limit, "offset": offset}, **kwargs)
+        except NotFoundError:
+            return self._handle_not_found("assets", alternative=ASSETS_ALTERNATIVE)
+
+    async def list_variables(self, limit: int = 100, offset: int = 0) -> dict[str, Any]:
+        """List Airflow variables."""
+        return await self._call("variables", params={"limit": limit, "offset": offset})
+
+    async def get_variable(self, variable_key: str) -> dict[str, Any]:
+        """Get a specific variable."""
+        return await self._call(f"variables/{variable_key}")
+
+    async def list_connections(self, limit: int = 100, offset: int = 0) -> dict[str, Any]:
+        """List Airflow connections (passwords filtered)."""
+        data = await self._call("connections", params={"limit": limit, "offset": offset})
+        return self._filter_passwords(data)
+
+    async def list_pools(self, limit: int = 100, offset: int = 0) -> dict[str, Any]:
+        """List Airflow pools."""
+        return await self._call("pools", params={"limit": limit, "offset": offset})
+
+    async def get_pool(self, pool_name: str) -> dict[str, Any]:
+        """Get details of a specific pool."""
+        return await self._call(f"pools/{pool_name}")
+
+    async def get_dag_stats(self, dag_ids: list[str] | None = None) -> dict[str, Any]:
+        """Get DAG run statistics by state.
+
+        Applies the same Airflow 3.2.0 workarounds as AirflowV3Adapter.get_dag_stats,
+        with at most DEFAULT_PAGE_CONCURRENCY requests in flight.
+        """
+        try:
+            if dag_ids:
+                semaphore = asyncio.Semaphore(DEFAULT_PAGE_CONCURRENCY)
+                results = await asyncio.gather(
+                    *(
+                        self._dag_stats_chunk(chunk, semaphore)
+                        for chunk in self._chunk_dag_ids(dag_ids)
+                    )
+                )
+                return self._merge_dag_stats(results)
+            # Pass empty dag_ids to avoid 500 error
+            return await self._call("dagStats", params={"dag_ids": ""})
+        except NotFoundError:
+            return self._handle_not_found("dagStats", alternative=DAG_STATS_ALTERNATIVE)
+
+    async def _dag_stats_chunk(
+        self, chunk: list[str], semaphore: asyncio.Semaphore
+    ) -> dict[str, Any]:
+        """Get stats for a chunk of DAGs, falling back to one request per DAG."""
+        if len(chunk) > 1 and self._batch_dag_stats:
+            try:
+                async with semaphore:
+                    return await self._call("dagStats", params={"dag_ids": chunk})
+            except Exception as e:
+                if _is_server_error(e):
+                    # Airflow 3.2.0 rejects multiple dag_ids; stop trying
+                    self._batch_dag_stats = False
+        results = await asyncio.gather(
+            *(self._dag_stats_single(dag_id, semaphore) for dag_id in chunk)
+        )
+        return self._merge_dag_stats(results)
+
+    async def _dag_stats_single(self, dag_id: str, semaphore: asyncio.Semaphore) -> dict[str, Any]:
+        """Get stats for one DAG, reporting a failure as an error entry."""
+        try:
+            async with semaphore:
+                return await self._call("dagStats", params={"dag_ids": dag_id})
+        except Exception as e:
+            return _dag_stats_error(dag_id, e)
+
+    async def list_dag_warnings(self, limit: int = 100, offset: int = 0) -> dict[str, Any]:
+        """List DAG warnings."""
+        return await self._call("dagWarnings", params={"limit": limit, "offset": offset})
+
+    async def list_import_errors(self, limit: int = 100, offset: int = 0) -> dict[str, Any]:
+        """List import errors from DAG files."""
+        return await self._call("importErrors", params={"limit": limit, "offset": offset})
+
+    async def list_plugins(self, limit: int = 100, offset: int = 0) -> dict[str, Any]:
+        """List installed Airflow plugins."""
+        return await self._call("plugins", params={"limit": limit, "offset": offset})
+
+    async def list_providers(self) -> dict[str, Any]:
+        """List installed Airflow provider packages."""
+        return await self._call("providers")
+
+    async def get_version(self) -> dict[str, Any]:
+        """Get Airflow version info."""
+        return await self._call("version")
+
+    async def get_config(self) -> dict[str, Any]:
+        """Get Airflow configuration."""
+        return await self._call("config")
+
+    async def get_task_instances(
+        self, dag_id: str, dag_run_id: str, limit: int = 100, offset: int = 0
+    ) -> dict[str, Any]:
+        """List all task instances for a DAG run."""
+        try:
+            return await self._call(
+                f"dags/{dag_id}/dagRuns/{dag_run_id}/taskInstances",
+                params={"limit": limit, "offset": offset},
+            )
+        except NotFoundError:
+            return self._handle_not_found(f"dags/{dag_id}/dagRuns/{dag_run_id}/taskInstances")
+
+    async def get_task_logs(
+        self,
+        dag_id: str,
+        dag_run_id: str,
+        task_id: str,
+        try_number: int = 1,
+        map_index: int = -1,
+        full_content: bool = True,
+        continuation_token: str | None = None,
+    ) -> dict[str, Any]:
+        """Get logs for a specific task instance."""
+        endpoint, params = self._task_logs_request(
+            dag_id, dag_run_id, task_id, try_number, map_index, full_content, continuation_token
+        )
+        try:
+            return await self._call(endpoint, params=params)
+        except NotFoundError:
+            return self._handle_not_found("task logs", alternative=TASK_LOGS_ALTERNATIVE)
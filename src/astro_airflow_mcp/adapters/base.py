@@ -1,11 +1,40 @@
 """Base adapter interface for Airflow API clients."""
 
+import asyncio
+import inspect
+import itertools
 from abc import ABC, abstractmethod
-from collections.abc import Callable
+from collections.abc import AsyncGenerator, AsyncIterator, Awaitable, Callable, Iterator, Sequence
 from typing import Any
+from urllib.parse import quote
 
 import httpx
 
+from astro_airflow_mcp.adapters.cache import CacheKey, ResponseCache, auth_identity
+from astro_airflow_mcp.logging import get_logger
+from astro_airflow_mcp.metrics import record_cache_lookup, upstream_request
+from astro_airflow_mcp.task_logs import NDJSON_MEDIA_TYPE, decode_ndjson_line
+from astro_airflow_mcp.tracing import request_span, set_attributes, span
+
+logger = get_logger(__name__)
+
+# Timeout applied to every Airflow API request
+DEFAULT_TIMEOUT_SECONDS = 30.0
+# Connection pool defaults for the adapter's long-lived HTTP client
+DEFAULT_MAX_CONNECTIONS = 20
+DEFAULT_MAX_KEEPALIVE_CONNECTIONS = 10
+DEFAULT_KEEPALIVE_EXPIRY_SECONDS = 30.0
+# Page size used when walking list endpoints (Airflow's default maximum_page_limit)
+DEFAULT_PAGE_SIZE = 100
+# Number of pages requested at once by the async page iterator
+DEFAULT_PAGE_CONCURRENCY = 4
+# Characters of dag_ids query string per dagStats request, well under common URL limits
+DAG_STATS_URL_BUDGET = 2000
+
+
+# Returns the current bearer token; async adapters also accept coroutine functions
+TokenGetter = Callable[[], "str | None | Awaitable[str | None]"]
+
 
 class NotFoundError(Exception):
     """Raised when an API endpoint returns 404."""
@@ -15,39 +44,77 @@ class NotFoundError(Exception):
         super().__init__(f"Endpoint not found: {endpoint}")
 
 
-class AirflowAdapter(ABC):
-    """Abstract base class for Airflow API adapters.
+def _http2_available(requested: bool) -> bool:
+    """Return whether HTTP/2 can be used, warning if it was requested but 'h2' is missing."""
+    if not requested:
+        return False
+    try:
+        import h2  # noqa: F401
+    except ImportError:
+        logger.warning("HTTP/2 requested but 'h2' is not installed; falling back to HTTP/1.1")
+        return False
+    return True
 
-    Adapters wrap version-specific API calls and provide a consistent
-    interface for the MCP server tools.
-    """
+
+class _AdapterBase(ABC):
+    """Connection details, auth and response helpers shared by sync and async adapters."""
+
+    # Media type requested when streaming task logs line by line
+    log_stream_media_type = "text/plain"
 
     def __init__(
         self,
         airflow_url: str,
         version: str,
-        token_getter: Callable[[], str | None] | None = None,
+        token_getter: TokenGetter | None = None,
         basic_auth_getter: Callable[[], tuple[str, str] | None] | None = None,
+        limits: httpx.Limits | None = None,
+        http2: bool = False,
+        cache: ResponseCache | None = None,
+        on_unauthorized: Callable[[], None] | None = None,
     ):
         """Initialize adapter with connection details.
 
         Args:
             airflow_url: Base URL of Airflow webserver
             version: Full version string (e.g., "3.1.3")
-            token_getter: Callable that returns current auth token (or None)
+            token_getter: Callable that returns current auth token (or None); async
+                          adapters also accept a coroutine function
             basic_auth_getter: Callable that returns (username, password) tuple or None
                              Used as fallback for Airflow 2.x which doesn't support token auth
+            limits: Connection pool limits for the shared HTTP client
+                    (defaults to DEFAULT_MAX_CONNECTIONS / DEFAULT_KEEPALIVE_EXPIRY_SECONDS)
+            http2: Whether to negotiate HTTP/2 (requires the 'h2' package)
+            cache: Optional response cache for GET requests (None disables caching)
+            on_unauthorized: Called when Airflow answers 401 (e.g. to invalidate a
+                             cached token); the request is then retried once
         """
         self.airflow_url = airflow_url
         self.version = version
         self._token_getter = token_getter
         self._basic_auth_getter = basic_auth_getter
+        self._limits = limits or httpx.Limits(
+            max_connections=DEFAULT_MAX_CONNECTIONS,
+            max_keepalive_connections=DEFAULT_MAX_KEEPALIVE_CONNECTIONS,
+            keepalive_expiry=DEFAULT_KEEPALIVE_EXPIRY_SECONDS,
+        )
+        self._http2 = http2
+        self.cache = cache
+        self._on_unauthorized = on_unauthorized
 
     @property
     @abstractmethod
     def api_base_path(self) -> str:
         """API base path for this version (e.g., '/api/v1' or '/api/v2')."""
 
+    def _client_kwargs(self) -> dict[str, Any]:
+        """Keyword arguments used to build the pooled HTTP client."""
+        return {
+            "timeout": DEFAULT_TIMEOUT_SECONDS,
+            "limits": self._limits,
+            "http2": _http2_available(self._http2),
+        }
+
     def _setup_auth(self) -> tuple[dict[str, str], tuple[str, str] | None]:
         """Set up authentication using token or basic auth.
 
@@ -57,21 +124,448 @@ class AirflowAdapter(ABC):
         Returns:
             Tuple of (headers dict, auth tuple or None)
         """
-        headers: dict[str, str] = {}
-        auth: tuple[str, str] | None = None
+        token = self._token_getter() if self._token_getter else None
+        return self._auth_for_token(token)
+
+    def _auth_for_token(self, token: Any) -> tuple[dict[str, str], tuple[str, str] | None]:
+        """Build request credentials from a token, falling back to basic auth without one."""
+        if token:
+            return {"Authorization": f"Bearer {token}"}, None
+        return {}, self._basic_auth_getter() if self._basic_auth_getter else None
+
+    def _url(self, endpoint: str) -> str:
+        """Build the full URL for an API endpoint path."""
+        return f"{self.airflow_url}{self.api_base_path}/{endpoint}"
+
+    @staticmethod
+    def _merge_params(
+        params: dict[str, Any] | None, extra_params: dict[str, Any]
+    ) -> dict[str, Any]:
+        """Merge params with pass-through extra_params, dropping None values."""
+        # Merge params with extra_params for forward compatibility
+        all_params = {**(params or {}), **extra_params}
+        # Remove None values
+        return {k: v for k, v in all_params.items() if v is not None}
+
+    @staticmethod
+    def _parse_response(response: httpx.Response, endpoint: str) -> dict[str, Any]:
+        """Raise for error responses and return the parsed JSON body.
+
+        Raises:
+            NotFoundError: If endpoint returns 404
+            Exception: For other HTTP errors
+        """
+        if response.status_code == 404:
+            raise NotFoundError(endpoint)
+
+        response.raise_for_status()
+        return response.json()
+
+    def _cache_lookup(
+        self,
+        endpoint: str,
+        params: dict[str, Any],
+        headers: dict[str, str],
+        auth: tuple[str, str] | None,
+    ) -> tuple[CacheKey | None, dict[str, Any] | None]:
+        """Look up a GET request in the response cache.
+
+        Adds If-None-Match to `headers` when a stale entry can be revalidated.
+        Hits and misses are counted here, before any request is sent; the
+        outcome of a revalidation is counted once Airflow answers it.
+
+        Returns:
+            Tuple of (cache key or None when caching is disabled, fresh cached data or None)
+        """
+        if self.cache is None:
+            return None, None
+        with span("cache lookup") as current:
+            key = self.cache.make_key(endpoint, params, auth_identity(headers, auth))
+            data, etag = self.cache.get(key)
+            set_attributes(current, **{"cache.hit": data is not None, "cache.etag": bool(etag)})
+        if data is not None:
+            record_cache_lookup("hit")
+        elif etag:
+            headers["If-None-Match"] = etag
+        else:
+            record_cache_lookup("miss")
+        return key, data
+
+    def _parse_cacheable_response(
+        self,
+        response: httpx.Response,
+        endpoint: str,
+        cache_key: CacheKey | None,
+        revalidating: bool = False,
+    ) -> dict[str, Any]:
+        """Parse a GET response, answering 304s from the cache and storing new bodies.
+
+        `revalidating` marks a conditional request, whose cache lookup is only
+        counted now that its outcome is known.
+        """
+        if self.cache is None or cache_key is None:
+            return self._parse_response(response, endpoint)
+        if response.status_code == 304:
+            cached = self.cache.revalidated(cache_key)
+            if cached is not None:
+                record_cache_lookup("revalidated")
+                return cached
+        if revalidating:
+            record_cache_lookup("miss")
+        data = self._parse_response(response, endpoint)
+        self.cache.put(cache_key, data, response.headers.get("ETag"))
+        return data
+
+    def _reauthenticate(
+        self, headers: dict[str, str]
+    ) -> tuple[dict[str, str], tuple[str, str] | None] | None:
+        """Handle a 401 by running the on_unauthorized hook and rebuilding credentials.
+
+        Returns:
+            (headers, auth) for a single retry, or None if no hook is configured
+        """
+        if self._on_unauthorized is None:
+            return None
+        self._on_unauthorized()
+        return self._retry_credentials(headers, *self._setup_auth())
+
+    @staticmethod
+    def _retry_credentials(
+        headers: dict[str, str], auth_headers: dict[str, str], auth: tuple[str, str] | None
+    ) -> tuple[dict[str, str], tuple[str, str] | None]:
+        """Replace the credentials in a request's headers for its retry."""
+        retry_headers = {k: v for k, v in headers.items() if k != "Authorization"}
+        retry_headers.update(auth_headers)
+        return retry_headers, auth
+
+    def _invalidate_dag(self, dag_id: str) -> None:
+        """Drop cached responses made stale by a change to dag_id."""
+        if self.cache is not None:
+            self.cache.invalidate_dag(dag_id)
+
+    @staticmethod
+    def _task_logs_request(
+        dag_id: str,
+        dag_run_id: str,
+        task_id: str,
+        try_number: int,
+        map_index: int,
+        full_content: bool,
+        continuation_token: str | None = None,
+    ) -> tuple[str, dict[str, Any]]:
+        """Build the endpoint and query params for a task log request."""
+        endpoint = f"dags/{dag_id}/dagRuns/{dag_run_id}/taskInstances/{task_id}/logs/{try_number}"
+        params: dict[str, Any] = {"full_content": full_content}
+        if map_index != -1:
+            params["map_index"] = map_index
+        if continuation_token:
+            params["token"] = continuation_token
+        return endpoint, params
+
+    def _decode_log_line(self, line: str) -> str:
+        """Turn one streamed log line into text (Airflow 3 streams structured NDJSON)."""
+        if self.log_stream_media_type == NDJSON_MEDIA_TYPE:
+            return decode_ndjson_line(line)
+        return line
+
+    @staticmethod
+    def _raise_for_stream_status(response: httpx.Response, endpoint: str) -> None:
+        """Raise for an error status on a streamed response without reading its body.
+
+        Raises:
+            NotFoundError: If endpoint returns 404
+            httpx.HTTPStatusError: For other HTTP errors
+        """
+        if response.status_code == 404:
+            raise NotFoundError(endpoint)
+        response.raise_for_status()
+
+    @staticmethod
+    def _chunk_dag_ids(
+        dag_ids: Sequence[str], budget: int = DAG_STATS_URL_BUDGET
+    ) -> list[list[str]]:
+        """Split DAG IDs into chunks whose encoded dag_ids query fits in budget characters.
+
+        Each ID is costed as a repeated "&dag_ids=<id>" parameter, which also
+        covers the comma-joined form used by Airflow 2. An ID longer than the
+        budget gets a chunk of its own.
+        """
+        chunks: list[list[str]] = []
+        current: list[str] = []
+        size = 0
+        for dag_id in dag_ids:
+            cost = len("&dag_ids=") + len(quote(dag_id, safe=""))
+            if current and size + cost > budget:
+                chunks.append(current)
+                current, size = [], 0
+            current.append(dag_id)
+            size += cost
+        if current:
+            chunks.append(current)
+        return chunks
+
+    @staticmethod
+    def _merge_dag_stats(results: Sequence[dict[str, Any]]) -> dict[str, Any]:
+        """Combine dagStats responses in request order, collecting their errors."""
+        merged: dict[str, Any] = {"dags": [], "total_entries": 0}
+        errors: list[dict[str, Any]] = []
+        for result in results:
+            merged["dags"].extend(result.get("dags", []))
+            merged["total_entries"] += result.get("total_entries", 0)
+            errors.extend(result.get("errors", []))
+        if errors:
+            merged["errors"] = errors
+        return merged
+
+    @staticmethod
+    def _first_page_size(page_size: int, max_items: int | None) -> int:
+        """Size of the first page request, so small limits need a single small request."""
+        if max_items is None:
+            return page_size
+        return max(1, min(page_size, max_items))
+
+    @staticmethod
+    def _remaining_offsets(
+        first: dict[str, Any], key: str, offset: int, max_items: int | None
+    ) -> tuple[int, list[int]]:
+        """Plan the pages that follow the first page of a list endpoint.
+
+        The step is the size of the first page rather than the requested limit,
+        because Airflow silently caps limit at its maximum_page_limit setting.
+        Responses without total_entries are treated as a single page.
+
+        Returns:
+            Tuple of (page size to request, offsets of the remaining pages)
+        """
+        step = len(first.get(key, []))
+        total = first.get("total_entries")
+        if not step or total is None:
+            return step, []
+        end = total if max_items is None else min(total, offset + max_items)
+        return step, list(range(offset + step, end, step))
+
+    @staticmethod
+    def _merge_pages(
+        first: dict[str, Any], key: str, items: list[dict[str, Any]]
+    ) -> dict[str, Any]:
+        """Build a list response holding every collected item."""
+        return {**first, key: items, "total_entries": first.get("total_entries", len(items))}
+
+    def _handle_not_found(self, endpoint: str, alternative: str | None = None) -> dict[str, Any]:
+        """Create a structured response for unavailable endpoints.
+
+        Args:
+            endpoint: The endpoint that was not found
+            alternative: Suggested alternative approach
+
+        Returns:
+            Dict with availability info and alternative
+        """
+        result: dict[str, Any] = {
+            "available": False,
+            "note": f"Endpoint '{endpoint}' not available in Airflow {self.version}",
+        }
+        if alternative:
+            result["alternative"] = alternative
+        return result
 
-        # Try token-based auth first
-        if self._token_getter:
-            token = self._token_getter()
-            if token:
-                headers["Authorization"] = f"Bearer {token}"
-                return headers, None
+    def _filter_passwords(self, data: dict[str, Any]) -> dict[str, Any]:
+        """Filter password fields from connection data for security.
 
-        # Fall back to basic auth if no token available
-        if self._basic_auth_getter:
-            auth = self._basic_auth_getter()
+        Args:
+            data: Dict containing connection data
 
-        return headers, auth
+        Returns:
+            Dict with passwords filtered out
+        """
+        if "connections" in data:
+            for conn in data["connections"]:
+                if "password" in conn:
+                    conn["password"] = "***FILTERED***"  # nosec B105
+        return data
+
+
+class AirflowAdapter(_AdapterBase):
+    """Abstract base class for Airflow API adapters.
+
+    Adapters wrap version-specific API calls and provide a consistent
+    interface for the MCP server tools. See AsyncAirflowAdapter for the
+    asyncio counterpart used by the MCP server itself.
+    """
+
+    _client: httpx.Client | None = None
+
+    @property
+    def client(self) -> httpx.Client:
+        """Long-lived, connection-pooled HTTP client shared by all requests.
+
+        Created lazily on first use so that TCP/TLS connections are reused
+        across tool calls instead of being re-established for every request.
+        """
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.Client(**self._client_kwargs())
+        return self._client
+
+    def close(self) -> None:
+        """Close the pooled HTTP client and release its connections."""
+        if self._client is not None:
+            self._client.close()
+            self._client = None
+
+    def __enter__(self) -> "AirflowAdapter":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def _prepare_auth(self) -> None:
+        """Hook run before each request to lazily establish credentials."""
+
+    def iter_pages(
+        self,
+        fetch: Callable[..., dict[str, Any]],
+        key: str,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        max_items: int | None = None,
+        offset: int = 0,
+        **kwargs: Any,
+    ) -> Iterator[list[dict[str, Any]]]:
+        """Walk a paginated list endpoint, yielding one page of items at a time.
+
+        Args:
+            fetch: Adapter list method accepting limit/offset (e.g. self.list_dags)
+            key: Response key holding the items (e.g. 'dags')
+            page_size: Items requested per page
+            max_items: Stop after this many items (None for all)
+            offset: Offset of the first item
+            **kwargs: Extra arguments passed to every fetch call
+        """
+        first = fetch(limit=self._first_page_size(page_size, max_items), offset=offset, **kwargs)
+        yield from self._pages_after(first, fetch, key, max_items, offset, kwargs)
+
+    def iter_items(
+        self, fetch: Callable[..., dict[str, Any]], key: str, **kwargs: Any
+    ) -> Iterator[dict[str, Any]]:
+        """Walk a paginated list endpoint item by item (see iter_pages)."""
+        for page in self.iter_pages(fetch, key, **kwargs):
+            yield from page
+
+    def fetch_all(
+        self,
+        fetch: Callable[..., dict[str, Any]],
+        key: str,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        max_items: int | None = None,
+        offset: int = 0,
+        **kwargs: Any,
+    ) -> dict[str, Any]:
+        """Fetch every page of a list endpoint into a single list response.
+
+        Responses without `key` (e.g. an unavailable endpoint) are returned as-is.
+        """
+        first = fetch(limit=self._first_page_size(page_size, max_items), offset=offset, **kwargs)
+        if key not in first:
+            return first
+        items = [
+            item
+            for page in self._pages_after(first, fetch, key, max_items, offset, kwargs)
+            for item in page
+        ]
+        return self._merge_pages(first, key, items)
+
+    def _pages_after(
+        self,
+        first: dict[str, Any],
+        fetch: Callable[..., dict[str, Any]],
+        key: str,
+        max_items: int | None,
+        offset: int,
+        kwargs: dict[str, Any],
+    ) -> Iterator[list[dict[str, Any]]]:
+        """Yield the first page's items followed by the remaining pages, in order."""
+        remaining = max_items
+        step, offsets = self._remaining_offsets(first, key, offset, max_items)
+        # Lazy, so a consumer that stops early never requests the later pages
+        pages = (fetch(limit=step, offset=o, **kwargs) for o in offsets)
+        for data in itertools.chain([first], pages):
+            items = data.get(key, [])
+            if remaining is not None:
+                items = items[:remaining]
+                remaining -= len(items)
+            if not items:
+                return
+            yield items
+            if remaining == 0:
+                return
+
+    def _send(
+        self,
+        method: str,
+        endpoint: str,
+        headers: dict[str, str],
+        auth: tuple[str, str] | None,
+        **kwargs: Any,
+    ) -> httpx.Response:
+        """Send a request, re-authenticating and retrying once if Airflow answers 401."""
+        send = getattr(self.client, method)
+        with (
+            upstream_request(method, endpoint) as record,
+            request_span(method, endpoint, headers, record),
+        ):
+            response = record["response"] = send(
+                self._url(endpoint), headers=headers, auth=auth, **kwargs
+            )
+        if response.status_code == 401:
+            retry = self._reauthenticate(headers)
+            if retry is not None:
+                logger.info(
+                    "Airflow returned 401 for %s; retrying with fresh credentials", endpoint
+                )
+                with (
+                    upstream_request(method, endpoint) as record,
+                    request_span(method, endpoint, retry[0], record),
+                ):
+                    response = record["response"] = send(
+                        self._url(endpoint), headers=retry[0], auth=retry[1], **kwargs
+                    )
+        return response
+
+    def stream_task_logs(
+        self,
+        dag_id: str,
+        dag_run_id: str,
+        task_id: str,
+        try_number: int = 1,
+        map_index: int = -1,
+    ) -> Iterator[str]:
+        """Yield the lines of a task log as they arrive, without buffering the whole body.
+
+        Closing the generator early closes the connection, so callers reading
+        only the start of a log do not download the rest of it.
+
+        Raises:
+            NotFoundError: If the task instance or its log does not exist
+        """
+        endpoint, params = self._task_logs_request(
+            dag_id, dag_run_id, task_id, try_number, map_index, full_content=True
+        )
+        self._prepare_auth()
+        headers, auth = self._setup_auth()
+        headers["Accept"] = self.log_stream_media_type
+        for attempt in range(2):
+            with self.client.stream(
+                "GET", self._url(endpoint), headers=headers, auth=auth, params=params
+            ) as response:
+                if response.status_code == 401 and attempt == 0:
+                    retry = self._reauthenticate(headers)
+                    if retry is not None:
+                        headers, auth = retry
+                        continue
+                self._raise_for_stream_status(response, endpoint)
+                for line in response.iter_lines():
+                    if line:
+                        yield self._decode_log_line(line)
+                return
 
     def _call(
         self,
@@ -93,23 +587,18 @@ class AirflowAdapter(ABC):
             NotFoundError: If endpoint returns 404
             Exception: For other HTTP errors
         """
+        self._prepare_auth()
         headers, auth = self._setup_auth()
         headers["Accept"] = "application/json"
-        url = f"{self.airflow_url}{self.api_base_path}/{endpoint}"
-
-        # Merge params with extra_params for forward compatibility
-        all_params = {**(params or {}), **extra_params}
-        # Remove None values
-        all_params = {k: v for k, v in all_params.items() if v is not None}
-
-        with httpx.Client(timeout=30.0) as client:
-            response = client.get(url, params=all_params, headers=headers, auth=auth)
+        all_params = self._merge_params(params, extra_params)
+        cache_key, cached = self._cache_lookup(endpoint, all_params, headers, auth)
+        if cached is not None:
+            return cached
 
-            if response.status_code == 404:
-                raise NotFoundError(endpoint)
-
-            response.raise_for_status()
-            return response.json()
+        response = self._send("get", endpoint, headers, auth, params=all_params)
+        return self._parse_cacheable_response(
+            response, endpoint, cache_key, revalidating="If-None-Match" in headers
+        )
 
     def _post(
         self,
@@ -129,19 +618,13 @@ class AirflowAdapter(ABC):
             NotFoundError: If endpoint returns 404
             Exception: For other HTTP errors
         """
+        self._prepare_auth()
         headers, auth = self._setup_auth()
         headers["Accept"] = "application/json"
         headers["Content-Type"] = "application/json"
-        url = f"{self.airflow_url}{self.api_base_path}/{endpoint}"
-
-        with httpx.Client(timeout=30.0) as client:
-            response = client.post(url, json=json_data, headers=headers, auth=auth)
-
-            if response.status_code == 404:
-                raise NotFoundError(endpoint)
 
-            response.raise_for_status()
-            return response.json()
+        response = self._send("post", endpoint, headers, auth, json=json_data)
+        return self._parse_response(response, endpoint)
 
     def _patch(
         self,
@@ -161,52 +644,13 @@ class AirflowAdapter(ABC):
             NotFoundError: If endpoint returns 404
             Exception: For other HTTP errors
         """
+        self._prepare_auth()
         headers, auth = self._setup_auth()
         headers["Accept"] = "application/json"
         headers["Content-Type"] = "application/json"
-        url = f"{self.airflow_url}{self.api_base_path}/{endpoint}"
 
-        with httpx.Client(timeout=30.0) as client:
-            response = client.patch(url, json=json_data, headers=headers, auth=auth)
-
-            if response.status_code == 404:
-                raise NotFoundError(endpoint)
-
-            response.raise_for_status()
-            return response.json()
-
-    def _handle_not_found(self, endpoint: str, alternative: str | None = None) -> dict[str, Any]:
-        """Create a structured response for unavailable endpoints.
-
-        Args:
-            endpoint: The endpoint that was not found
-            alternative: Suggested alternative approach
-
-        Returns:
-            Dict with availability info and alternative
-        """
-        result: dict[str, Any] = {
-            "available": False,
-            "note": f"Endpoint '{endpoint}' not available in Airflow {self.version}",
-        }
-        if alternative:
-            result["alternative"] = alternative
-        return result
-
-    def _filter_passwords(self, data: dict[str, Any]) -> dict[str, Any]:
-        """Filter password fields from connection data for security.
-
-        Args:
-            data: Dict containing connection data
-
-        Returns:
-            Dict with passwords filtered out
-        """
-        if "connections" in data:
-            for conn in data["connections"]:
-                if "password" in conn:
-                    conn["password"] = "***FILTERED***"  # nosec B105
-        return data
+        response = self._send("patch", endpoint, headers, auth, json=json_data)
+        return self._parse_response(response, endpoint)
 
     # DAG Operations
     @abstractmethod
@@ -269,6 +713,52 @@ class AirflowAdapter(ABC):
             Details of the triggered DAG run
         """
 
+    def list_dag_runs_batch(
+        self, dag_ids: list[str] | None = None, limit: int = 100, offset: int = 0, **filters: Any
+    ) -> dict[str, Any]:
+        """List DAG runs of several DAGs in one request (POST dags/~/dagRuns/list).
+
+        Args:
+            dag_ids: Only runs of these DAGs (default: all DAGs)
+            limit: Maximum number of runs to return
+            offset: Offset for pagination
+            **filters: Additional body filters (e.g., states, start_date_gte)
+        """
+        body = self._merge_params(
+            {"dag_ids": dag_ids, "page_limit": limit, "page_offset": offset}, filters
+        )
+        return self._post("dags/~/dagRuns/list", json_data=body)
+
+    def list_task_instances_batch(
+        self,
+        dag_ids: list[str] | None = None,
+        dag_run_ids: list[str] | None = None,
+        limit: int = 100,
+        offset: int = 0,
+        **filters: Any,
+    ) -> dict[str, Any]:
+        """List task instances of several DAG runs in one request.
+
+        Uses POST dags/~/dagRuns/~/taskInstances/list.
+
+        Args:
+            dag_ids: Only task instances of these DAGs (default: all DAGs)
+            dag_run_ids: Only task instances of these DAG runs
+            limit: Maximum number of task instances to return
+            offset: Offset for pagination
+            **filters: Additional body filters
+        """
+        body = self._merge_params(
+            {
+                "dag_ids": dag_ids,
+                "dag_run_ids": dag_run_ids,
+                "page_limit": limit,
+                "page_offset": offset,
+            },
+            filters,
+        )
+        return self._post("dags/~/dagRuns/~/taskInstances/list", json_data=body)
+
     # Task Operations
     @abstractmethod
     def list_tasks(self, dag_id: str) -> dict[str, Any]:
@@ -304,6 +794,7 @@ class AirflowAdapter(ABC):
         try_number: int = 1,
         map_index: int = -1,
         full_content: bool = True,
+        continuation_token: str | None = None,
     ) -> dict[str, Any]:
         """Get logs for a specific task instance.
 
@@ -314,6 +805,7 @@ class AirflowAdapter(ABC):
             try_number: Task try number (1-indexed, default 1)
             map_index: Map index for mapped tasks (-1 for unmapped, default -1)
             full_content: Whether to return full log content (default True)
+            continuation_token: Token from a previous response to read the next chunk
         """
 
     # Asset/Dataset Operations
@@ -378,3 +870,515 @@ class AirflowAdapter(ABC):
     @abstractmethod
     def get_config(self) -> dict[str, Any]:
         """Get Airflow configuration."""
+
+
+class AsyncAirflowAdapter(_AdapterBase):
+    """Abstract base class for asyncio Airflow API adapters.
+
+    Mirrors AirflowAdapter method-for-method on top of httpx.AsyncClient so
+    that a slow Airflow endpoint only suspends the calling tool instead of
+    blocking the event loop shared by every MCP session.
+    """
+
+    _client: httpx.AsyncClient | None = None
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """Long-lived, connection-pooled async HTTP client shared by all requests."""
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(**self._client_kwargs())
+        return self._client
+
+    async def aclose(self) -> None:
+        """Close the pooled HTTP client and release its connections."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    async def _setup_auth_async(self) -> tuple[dict[str, str], tuple[str, str] | None]:
+        """Set up authentication like _setup_auth, awaiting an async token getter.
+
+        An async getter (see AirflowTokenManager.aget_token) fetches expired
+        tokens off the event loop, so other tool calls keep running meanwhile.
+        """
+        token = self._token_getter() if self._token_getter else None
+        if inspect.isawaitable(token):
+            token = await token
+        return self._auth_for_token(token)
+
+    async def _reauthenticate_async(
+        self, headers: dict[str, str]
+    ) -> tuple[dict[str, str], tuple[str, str] | None] | None:
+        """Handle a 401 like _reauthenticate, awaiting an async token getter."""
+        if self._on_unauthorized is None:
+            return None
+        self._on_unauthorized()
+        return self._retry_credentials(headers, *await self._setup_auth_async())
+
+    async def __aenter__(self) -> "AsyncAirflowAdapter":
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        await self.aclose()
+
+    async def iter_pages(
+        self,
+        fetch: Callable[..., Awaitable[dict[str, Any]]],
+        key: str,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        max_items: int | None = None,
+        offset: int = 0,
+        max_concurrency: int = DEFAULT_PAGE_CONCURRENCY,
+        **kwargs: Any,
+    ) -> AsyncIterator[list[dict[str, Any]]]:
+        """Walk a paginated list endpoint, yielding one page of items at a time.
+
+        The first page is fetched alone to learn total_entries; the remaining
+        pages are then requested max_concurrency at a time and yielded in order.
+
+        Args:
+            fetch: Adapter list method accepting limit/offset (e.g. self.list_dags)
+            key: Response key holding the items (e.g. 'dags')
+            page_size: Items requested per page
+            max_items: Stop after this many items (None for all)
+            offset: Offset of the first item
+            max_concurrency: Maximum number of page requests in flight
+            **kwargs: Extra arguments passed to every fetch call
+        """
+        first = await fetch(
+            limit=self._first_page_size(page_size, max_items), offset=offset, **kwargs
+        )
+        async for page in self._pages_after(
+            first, fetch, key, max_items, offset, max_concurrency, kwargs
+        ):
+            yield page
+
+    async def iter_items(
+        self, fetch: Callable[..., Awaitable[dict[str, Any]]], key: str, **kwargs: Any
+    ) -> AsyncIterator[dict[str, Any]]:
+        """Walk a paginated list endpoint item by item (see iter_pages)."""
+        async for page in self.iter_pages(fetch, key, **kwargs):
+            for item in page:
+                yield item
+
+    async def fetch_all(
+        self,
+        fetch: Callable[..., Awaitable[dict[str, Any]]],
+        key: str,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        max_items: int | None = None,
+        offset: int = 0,
+        max_concurrency: int = DEFAULT_PAGE_CONCURRENCY,
+        **kwargs: Any,
+    ) -> dict[str, Any]:
+        """Fetch every page of a list endpoint into a single list response.
+
+        Responses without `key` (e.g. an unavailable endpoint) are returned as-is.
+        """
+        first = await fetch(
+            limit=self._first_page_size(page_size, max_items), offset=offset, **kwargs
+        )
+        if key not in first:
+            return first
+        items: list[dict[str, Any]] = []
+        async for page in self._pages_after(
+            first, fetch, key, max_items, offset, max_concurrency, kwargs
+        ):
+            items.extend(page)
+        return self._merge_pages(first, key, items)
+
+    async def _pages_after(
+        self,
+        first: dict[str, Any],
+        fetch: Callable[..., Awaitable[dict[str, Any]]],
+        key: str,
+        max_items: int | None,
+        offset: int,
+        max_concurrency: int,
+        kwargs: dict[str, Any],
+    ) -> AsyncIterator[list[dict[str, Any]]]:
+        """Yield the first page's items followed by the remaining pages, in order."""
+        step, offsets = self._remaining_offsets(first, key, offset, max_items)
+        window_size = max(1, max_concurrency)
+        remaining = max_items
+        responses: list[dict[str, Any]] = [first]
+        next_index = 0
+        while responses:
+            for data in responses:
+                items = data.get(key, [])
+                if remaining is not None:
+                    items = items[:remaining]
+                    remaining -= len(items)
+                if not items:
+                    return
+                yield items
+                if remaining == 0:
+                    return
+            # Request the next window of pages only once the consumer wants more
+            window = offsets[next_index : next_index + window_size]
+            next_index += window_size
+            responses = list(
+                await asyncio.gather(*(fetch(limit=step, offset=o, **kwargs) for o in window))
+            )
+
+    async def _prepare_auth(self) -> None:
+        """Hook run before each request to lazily establish credentials."""
+
+    async def _send(
+        self,
+        method: str,
+        endpoint: str,
+        headers: dict[str, str],
+        auth: tuple[str, str] | None,
+        **kwargs: Any,
+    ) -> httpx.Response:
+        """Send a request, re-authenticating and retrying once if Airflow answers 401."""
+        send = getattr(self.client, method)
+        with (
+            upstream_request(method, endpoint) as record,
+            request_span(method, endpoint, headers, record),
+        ):
+            response = record["response"] = await send(
+                self._url(endpoint), headers=headers, auth=auth, **kwargs
+            )
+        if response.status_code == 401:
+            retry = await self._reauthenticate_async(headers)
+            if retry is not None:
+                logger.info(
+                    "Airflow returned 401 for %s; retrying with fresh credentials", endpoint
+                )
+                with (
+                    upstream_request(method, endpoint) as record,
+                    request_span(method, endpoint, retry[0], record),
+                ):
+                    response = record["response"] = await send(
+                        self._url(endpoint), headers=retry[0], auth=retry[1], **kwargs
+                    )
+        return response
+
+    async def stream_task_logs(
+        self,
+        dag_id: str,
+        dag_run_id: str,
+        task_id: str,
+        try_number: int = 1,
+        map_index: int = -1,
+    ) -> AsyncGenerator[str, None]:
+        """Yield the lines of a task log as they arrive, without buffering the whole body.
+
+        Closing the generator early closes the connection, so callers reading
+        only the start of a log do not download the rest of it.
+
+        Raises:
+            NotFoundError: If the task instance or its log does not exist
+        """
+        endpoint, params = self._task_logs_request(
+            dag_id, dag_run_id, task_id, try_number, map_index, full_content=True
+        )
+        await self._prepare_auth()
+        headers, auth = await self._setup_auth_async()
+        headers["Accept"] = self.log_stream_media_type
+        for attempt in range(2):
+            async with self.client.stream(
+                "GET", self._url(endpoint), headers=headers, auth=auth, params=params
+            ) as response:
+                if response.status_code == 401 and attempt == 0:
+                    retry = await self._reauthenticate_async(headers)
+                    if retry is not None:
+                        headers, auth = retry
+                        continue
+                self._raise_for_stream_status(response, endpoint)
+                async for line in response.aiter_lines():
+                    if line:
+                        yield self._decode_log_line(line)
+                return
+
+    async def _call(
+        self,
+        endpoint: str,
+        params: dict[str, Any] | None = None,
+        **extra_params: Any,
+    ) -> dict[str, Any]:
+        """Make async HTTP GET call to Airflow API.
+
+        Args:
+            endpoint: API endpoint path (without base path)
+            params: Query parameters
+            **extra_params: Additional query parameters (pass-through)
+
+        Returns:
+            Parsed JSON response
+
+        Raises:
+            NotFoundError: If endpoint returns 404
+            Exception: For other HTTP errors
+        """
+        await self._prepare_auth()
+        headers, auth = await self._setup_auth_async()
+        headers["Accept"] = "application/json"
+        all_params = self._merge_params(params, extra_params)
+        cache_key, cached = self._cache_lookup(endpoint, all_params, headers, auth)
+        if cached is not None:
+            return cached
+
+        response = await self._send("get", endpoint, headers, auth, params=all_params)
+        return self._parse_cacheable_response(
+            response, endpoint, cache_key, revalidating="If-None-Match" in headers
+        )
+
+    async def _post(
+        self,
+        endpoint: str,
+        json_data: dict[str, Any] | None = None,
+    ) -> dict[str, Any]:
+        """Make async HTTP POST call to Airflow API.
+
+        Args:
+            endpoint: API endpoint path (without base path)
+            json_data: JSON body to send
+
+        Returns:
+            Parsed JSON response
+
+        Raises:
+            NotFoundError: If endpoint returns 404
+            Exception: For other HTTP errors
+        """
+        await self._prepare_auth()
+        headers, auth = await self._setup_auth_async()
+        headers["Accept"] = "application/json"
+        headers["Content-Type"] = "application/json"
+
+        response = await self._send("post", endpoint, headers, auth, json=json_data)
+        return self._parse_response(response, endpoint)
+
+    async def _patch(
+        self,
+        endpoint: str,
+        json_data: dict[str, Any] | None = None,
+    ) -> dict[str, Any]:
+        """Make async HTTP PATCH call to Airflow API.
+
+        Args:
+            endpoint: API endpoint path (without base path)
+            json_data: JSON body to send
+
+        Returns:
+            Parsed JSON response
+
+        Raises:
+            NotFoundError: If endpoint returns 404
+            Exception: For other HTTP errors
+        """
+        await self._prepare_auth()
+        headers, auth = await self._setup_auth_async()
+        headers["Accept"] = "application/json"
+        headers["Content-Type"] = "application/json"
+
+        response = await self._send("patch", endpoint, headers, auth, json=json_data)
+        return self._parse_response(response, endpoint)
+
+    # DAG Operations
+    @abstractmethod
+    async def list_dags(self, limit: int = 100, offset: int = 0, **kwargs: Any) -> dict[str, Any]:
+        """List all DAGs."""
+
+    @abstractmethod
+    async def get_dag(self, dag_id: str) -> dict[str, Any]:
+        """Get details of a specific DAG."""
+
+    @abstractmethod
+    async def get_dag_source(self, dag_id: str) -> dict[str, Any]:
+        """Get source code of a DAG."""
+
+    @abstractmethod
+    async def pause_dag(self, dag_id: str) -> dict[str, Any]:
+        """Pause a DAG to prevent new runs from being scheduled.
+
+        Args:
+            dag_id: The ID of the DAG to pause
+
+        Returns:
+            Updated DAG details with is_paused=True
+        """
+
+    @abstractmethod
+    async def unpause_dag(self, dag_id: str) -> dict[str, Any]:
+        """Unpause a DAG to allow new runs to be scheduled.
+
+        Args:
+            dag_id: The ID of the DAG to unpause
+
+        Returns:
+            Updated DAG details with is_paused=False
+        """
+
+    # DAG Run Operations
+    @abstractmethod
+    async def list_dag_runs(
+        self, dag_id: str | None = None, limit: int = 100, offset: int = 0, **kwargs: Any
+    ) -> dict[str, Any]:
+        """List DAG runs."""
+
+    @abstractmethod
+    async def get_dag_run(self, dag_id: str, dag_run_id: str) -> dict[str, Any]:
+        """Get details of a specific DAG run."""
+
+    @abstractmethod
+    async def trigger_dag_run(
+        self, dag_id: str, logical_date: str | None = None, conf: dict[str, Any] | None = None
+    ) -> dict[str, Any]:
+        """Trigger a new DAG run.
+
+        Args:
+            dag_id: The ID of the DAG to trigger
+            logical_date: Optional logical/execution date for the run
+            conf: Optional configuration dictionary to pass to the DAG run
+
+        Returns:
+            Details of the triggered DAG run
+        """
+
+    async def list_dag_runs_batch(
+        self, dag_ids: list[str] | None = None, limit: int = 100, offset: int = 0, **filters: Any
+    ) -> dict[str, Any]:
+        """List DAG runs of several DAGs in one request (POST dags/~/dagRuns/list)."""
+        body = self._merge_params(
+            {"dag_ids": dag_ids, "page_limit": limit, "page_offset": offset}, filters
+        )
+        return await self._post("dags/~/dagRuns/list", json_data=body)
+
+    async def list_task_instances_batch(
+        self,
+        dag_ids: list[str] | None = None,
+        dag_run_ids: list[str] | None = None,
+        limit: int = 100,
+        offset: int = 0,
+        **filters: Any,
+    ) -> dict[str, Any]:
+        """List task instances of several DAG runs in one request.
+
+        Uses POST dags/~/dagRuns/~/taskInstances/list.
+        """
+        body = self._merge_params(
+            {
+                "dag_ids": dag_ids,
+                "dag_run_ids": dag_run_ids,
+                "page_limit": limit,
+                "page_offset": offset,
+            },
+            filters,
+        )
+        return await self._post("dags/~/dagRuns/~/taskInstances/list", json_data=body)
+
+    # Task Operations
+    @abstractmethod
+    async def list_tasks(self, dag_id: str) -> dict[str, Any]:
+        """List all tasks in a DAG."""
+
+    @abstractmethod
+    async def get_task(self, dag_id: str, task_id: str) -> dict[str, Any]:
+        """Get details of a specific task."""
+
+    @abstractmethod
+    async def get_task_instance(self, dag_id: str, dag_run_id: str, task_id: str) -> dict[str, Any]:
+        """Get details of a task instance."""
+
+    @abstractmethod
+    async def get_task_instances(
+        self, dag_id: str, dag_run_id: str, limit: int = 100, offset: int = 0
+    ) -> dict[str, Any]:
+        """List all task instances for a DAG run.
+
+        Args:
+            dag_id: DAG ID
+            dag_run_id: DAG run ID
+            limit: Maximum number of task instances to return
+            offset: Offset for pagination
+        """
+
+    @abstractmethod
+    async def get_task_logs(
+        self,
+        dag_id: str,
+        dag_run_id: str,
+        task_id: str,
+        try_number: int = 1,
+        map_index: int = -1,
+        full_content: bool = True,
+        continuation_token: str | None = None,
+    ) -> dict[str, Any]:
+        """Get logs for a specific task instance.
+
+        Args:
+            dag_id: DAG ID
+            dag_run_id: DAG run ID
+            task_id: Task ID
+            try_number: Task try number (1-indexed, default 1)
+            map_index: Map index for mapped tasks (-1 for unmapped, default -1)
+            full_content: Whether to return full log content (default True)
+            continuation_token: Token from a previous response to read the next chunk
+        """
+
+    # Asset/Dataset Operations
+    @abstractmethod
+    async def list_assets(self, limit: int = 100, offset: int = 0, **kwargs: Any) -> dict[str, Any]:
+        """List assets/datasets."""
+
+    # Variable Operations
+    @abstractmethod
+    async def list_variables(self, limit: int = 100, offset: int = 0) -> dict[str, Any]:
+        """List Airflow variables."""
+
+    @abstractmethod
+    async def get_variable(self, variable_key: str) -> dict[str, Any]:
+        """Get a specific variable."""
+
+    # Connection Operations
+    @abstractmethod
+    async def list_connections(self, limit: int = 100, offset: int = 0) -> dict[str, Any]:
+        """List Airflow connections (passwords filtered)."""
+
+    # Pool Operations
+    @abstractmethod
+    async def list_pools(self, limit: int = 100, offset: int = 0) -> dict[str, Any]:
+        """List Airflow pools."""
+
+    @abstractmethod
+    async def get_pool(self, pool_name: str) -> dict[str, Any]:
+        """Get details of a specific pool."""
+
+    # DAG Statistics and Warnings
+    @abstractmethod
+    async def get_dag_stats(self, dag_ids: list[str] | None = None) -> dict[str, Any]:
+        """Get DAG run statistics by state.
+
+        Args:
+            dag_ids: Optional list of DAG IDs to get stats for.
+        """
+
+    @abstractmethod
+    async def list_dag_warnings(self, limit: int = 100, offset: int = 0) -> dict[str, Any]:
+        """List DAG warnings."""
+
+    @abstractmethod
+    async def list_import_errors(self, limit: int = 100, offset: int = 0) -> dict[str, Any]:
+        """List import errors from DAG files."""
+
+    # Plugin and Provider Operations
+    @abstractmethod
+    async def list_plugins(self, limit: int = 100, offset: int = 0) -> dict[str, Any]:
+        """List installed Airflow plugins."""
+
+    @abstractmethod
+    async def list_providers(self) -> dict[str, Any]:
+        """List installed Airflow provider packages."""
+
+    # System Operations
+    @abstractmethod
+    async def get_version(self) -> dict[str, Any]:
+        """Get Airflow version info."""
+
+    @abstractmethod
+    async def get_config(self) -> dict[str, Any]:
+        """Get Airflow configuration."""
@@ -0,0 +1,197 @@
+"""In-memory response cache for read-only Airflow API endpoints."""
+
+import copy
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Mapping
+from dataclasses import dataclass
+from typing import Any
+
+# Maximum number of cached responses before least-recently-used entries are evicted
+DEFAULT_CACHE_MAX_ENTRIES = 512
+# TTL for endpoints without a specific rule below
+DEFAULT_CACHE_TTL_SECONDS = 30.0
+# TTLs keyed by API resource name. The most specific (right-most) resource in an
+# endpoint path wins, e.g. 'dags/x/dagRuns/y' uses the 'dagRuns' rule.
+# A TTL of 0 disables caching for that resource.
+DEFAULT_CACHE_TTLS: dict[str, float] = {
+    # Effectively static for the lifetime of a deployment
+    "version": 3600.0,
+    "providers": 600.0,
+    "plugins": 600.0,
+    "config": 600.0,
+    # Change on deploys or explicit user actions
+    "dags": 60.0,
+    "dagSources": 60.0,
+    "tasks": 60.0,
+    "assets": 60.0,
+    "datasets": 60.0,
+    # Change as the scheduler runs
+    "dagRuns": 2.0,
+    "taskInstances": 2.0,
+    "dagStats": 10.0,
+    # Grow while a task is running and can be very large
+    "logs": 0.0,
+}
+
+CacheKey = tuple[str, tuple[tuple[str, Any], ...], str]
+
+
+@dataclass
+class _CacheEntry:
+    """A cached response body with its freshness information."""
+
+    endpoint: str
+    data: Any
+    etag: str | None
+    expires_at: float
+
+
+def _freeze(value: Any) -> Any:
+    """Make a query parameter value hashable (lists become tuples)."""
+    if isinstance(value, list | tuple):
+        return tuple(_freeze(v) for v in value)
+    return value
+
+
+def auth_identity(headers: Mapping[str, str], auth: tuple[str, str] | None) -> str:
+    """Derive a stable, non-reversible identity for the credentials of a request."""
+    raw = f"{headers.get('Authorization', '')}|{auth[0] if auth else ''}"
+    return hashlib.sha256(raw.encode()).hexdigest()[:16]
+
+
+class ResponseCache:
+    """Thread-safe TTL + LRU cache of parsed API responses.
+
+    Entries are keyed by (endpoint, params, auth identity). Expired entries that
+    carried an ETag are kept so the next request can revalidate them with
+    If-None-Match instead of downloading the body again. Cached data is copied
+    on the way in and out so callers may mutate what they receive.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = DEFAULT_CACHE_MAX_ENTRIES,
+        ttls: Mapping[str, float] | None = None,
+        default_ttl: float = DEFAULT_CACHE_TTL_SECONDS,
+    ):
+        """Initialize the cache.
+
+        Args:
+            max_entries: Maximum number of cached responses (LRU eviction beyond this)
+            ttls: Per-resource TTLs in seconds, merged over DEFAULT_CACHE_TTLS
+            default_ttl: TTL for resources without a specific rule
+        """
+        self.max_entries = max_entries
+        self.ttls = {**DEFAULT_CACHE_TTLS, **(ttls or {})}
+        self.default_ttl = default_ttl
+        self._entries: OrderedDict[CacheKey, _CacheEntry] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.revalidations = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    def ttl_for(self, endpoint: str) -> float:
+        """Get the TTL for an endpoint from its most specific resource name."""
+        for segment in reversed(endpoint.split("/")):
+            if segment in self.ttls:
+                return self.ttls[segment]
+        return self.default_ttl
+
+    @staticmethod
+    def make_key(endpoint: str, params: Mapping[str, Any] | None, identity: str) -> CacheKey:
+        """Build the cache key for a GET request."""
+        frozen = tuple(sorted((k, _freeze(v)) for k, v in (params or {}).items()))
+        return (endpoint, frozen, identity)
+
+    def get(self, key: CacheKey) -> tuple[Any | None, str | None]:
+        """Look up a cached response.
+
+        Returns:
+            (data, None) on a fresh hit, (None, etag) when a stale entry can be
+            revalidated, and (None, None) on a miss
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None, None
+            self._entries.move_to_end(key)
+            if entry.expires_at > time.monotonic():
+                self.hits += 1
+                return copy.deepcopy(entry.data), None
+            self.misses += 1
+            if entry.etag:
+                return None, entry.etag
+            del self._entries[key]
+            return None, None
+
+    def put(self, key: CacheKey, data: Any, etag: str | None = None) -> None:
+        """Store a response if its endpoint is cacheable."""
+        endpoint = key[0]
+        ttl = self.ttl_for(endpoint)
+        if ttl <= 0:
+            return
+        entry = _CacheEntry(endpoint, copy.deepcopy(data), etag, time.monotonic() + ttl)
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def revalidated(self, key: CacheKey) -> Any | None:
+        """Refresh a stale entry after a 304 Not Modified and return its data."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            entry.expires_at = time.monotonic() + self.ttl_for(entry.endpoint)
+            self._entries.move_to_end(key)
+            self.revalidations += 1
+            return copy.deepcopy(entry.data)
+
+    def invalidate_dag(self, dag_id: str) -> None:
+        """Drop every cached response that may describe the given DAG.
+
+        Covers the DAG itself and its sub-resources, the DAG list, cross-DAG run
+        listings ('dags/~/...') and dagStats.
+        """
+        with self._lock:
+            stale = [
+                key
+                for key, entry in self._entries.items()
+                if _describes_dag(entry.endpoint, dag_id)
+            ]
+            for key in stale:
+                del self._entries[key]
+            self.invalidations += len(stale)
+
+    def clear(self) -> None:
+        """Drop all cached responses."""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict[str, int]:
+        """Get hit/miss counters and the current size."""
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "revalidations": self.revalidations,
+                "evictions": self.evictions,
+                "invalidations": self.invalidations,
+                "size": len(self._entries),
+            }
+
+
+def _describes_dag(endpoint: str, dag_id: str) -> bool:
+    """Check whether a cached endpoint may include data about dag_id."""
+    if endpoint in ("dags", "dagStats"):
+        return True
+    segments = endpoint.split("/")
+    return len(segments) >= 2 and segments[0] == "dags" and segments[1] in (dag_id, "~")
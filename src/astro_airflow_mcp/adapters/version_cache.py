@@ -0,0 +1,110 @@
+"""Cache of detected Airflow versions so adapter (re)creation skips probing."""
+
+import contextlib
+import json
+import os
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+from astro_airflow_mcp.logging import get_logger
+
+logger = get_logger(__name__)
+
+# How long a detected version is trusted before the API is probed again
+DEFAULT_VERSION_CACHE_TTL_SECONDS = 3600.0
+
+# In-process cache: airflow_url -> (version, detected_at as Unix time)
+_memory_cache: dict[str, tuple[str, float]] = {}
+_lock = threading.Lock()
+
+
+def parse_major_version(version: str) -> int:
+    """Get the major version number from a version string like '3.1.3'.
+
+    Raises:
+        ValueError: If the version string does not start with a number
+    """
+    try:
+        return int(version.strip().split(".")[0])
+    except ValueError:
+        raise ValueError(f"Invalid Airflow version: {version!r}") from None
+
+
+def get_cached_version(
+    airflow_url: str,
+    cache_file: str | Path | None = None,
+    ttl: float = DEFAULT_VERSION_CACHE_TTL_SECONDS,
+) -> str | None:
+    """Look up a previously detected version for airflow_url.
+
+    Checks the in-process cache first, then the optional on-disk cache (which
+    also warms the in-process cache).
+
+    Returns:
+        The cached version string, or None if absent or older than ttl
+    """
+    now = time.time()
+    with _lock:
+        entry = _memory_cache.get(airflow_url)
+    if entry and now - entry[1] < ttl:
+        return entry[0]
+
+    if cache_file is None:
+        return None
+    disk_entry = _read_cache_file(Path(cache_file)).get(airflow_url)
+    if not isinstance(disk_entry, dict):
+        return None
+    version = disk_entry.get("version")
+    detected_at = disk_entry.get("detected_at", 0)
+    if not isinstance(version, str) or not isinstance(detected_at, int | float):
+        return None
+    if now - detected_at >= ttl:
+        return None
+    with _lock:
+        _memory_cache[airflow_url] = (version, detected_at)
+    return version
+
+
+def store_version(airflow_url: str, version: str, cache_file: str | Path | None = None) -> None:
+    """Remember the detected version for airflow_url in-process and optionally on disk."""
+    detected_at = time.time()
+    with _lock:
+        _memory_cache[airflow_url] = (version, detected_at)
+    if cache_file is None:
+        return
+
+    path = Path(cache_file)
+    data = _read_cache_file(path)
+    data[airflow_url] = {"version": version, "detected_at": detected_at}
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Write-then-rename so concurrent servers never read a partial file
+        fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.")
+        try:
+            with os.fdopen(fd, "w") as f:
+                json.dump(data, f, indent=2)
+            os.replace(tmp_name, path)
+        except BaseException:
+            with contextlib.suppress(OSError):
+                os.unlink(tmp_name)
+            raise
+    except OSError as e:
+        logger.debug("Failed to write version cache %s: %s", path, e)
+
+
+def clear_version_cache() -> None:
+    """Forget all versions detected in this process (the on-disk cache is kept)."""
+    with _lock:
+        _memory_cache.clear()
+
+
+def _read_cache_file(path: Path) -> dict[str, object]:
+    """Read the on-disk version cache, treating a missing or corrupt file as empty."""
+    try:
+        with open(path) as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return data if isinstance(data, dict) else {}
@@ -0,0 +1,354 @@
+"""Local search index of DAG and task metadata.
+
+Questions like "which DAGs use KubernetesPodOperator" would otherwise need a
+list_tasks call per DAG. DagIndex keeps an in-memory inverted index of DAG
+ids, owners, tags, task ids and operator names, filled by a background
+crawler. Refreshes are incremental: list_dags is read every time, but a DAG's
+tasks are only fetched again when its last_parsed_time changes.
+"""
+
+import asyncio
+import contextlib
+import re
+import time
+from collections import defaultdict
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+from typing import Any
+
+from astro_airflow_mcp.adapters import AsyncAirflowAdapter
+from astro_airflow_mcp.logging import get_logger
+
+logger = get_logger(__name__)
+
+# How often the background crawler refreshes the index
+DEFAULT_INDEX_REFRESH_SECONDS = 300.0
+# list_tasks requests in flight at once while crawling
+DEFAULT_INDEX_CONCURRENCY = 5
+# Searchable fields; free-text queries match any of them
+INDEX_FIELDS = ("dag", "owner", "tag", "task", "operator")
+
+_WORD = re.compile(r"[a-z0-9]+")
+
+
+def _tokens(value: str) -> set[str]:
+    """Index terms for a value: the whole lowercased value plus its words."""
+    lowered = value.lower()
+    return {lowered, *_WORD.findall(lowered)}
+
+
+def _matches(value: str | None, terms: list[str]) -> bool:
+    """Whether any word of value starts with any of terms."""
+    if not value or not terms:
+        return False
+    return any(token.startswith(term) for token in _tokens(value) for term in terms)
+
+
+def _tag_names(tags: list[Any] | None) -> list[str]:
+    """Tag names from either plain strings or Airflow's {"name": ...} objects."""
+    return [t.get("name", "") if isinstance(t, dict) else str(t) for t in tags or []]
+
+
+def _operator_name(task: dict[str, Any]) -> str | None:
+    """Operator class name of a task, as reported by either API version."""
+    class_ref = task.get("class_ref") or {}
+    return task.get("operator_name") or class_ref.get("class_name")
+
+
+@dataclass
+class IndexedDag:
+    """The searchable metadata of one DAG."""
+
+    dag_id: str
+    dag_display_name: str | None = None
+    description: str | None = None
+    owners: list[str] = field(default_factory=list)
+    tags: list[str] = field(default_factory=list)
+    is_paused: bool | None = None
+    last_parsed_time: str | None = None
+    tasks: list[dict[str, str | None]] = field(default_factory=list)
+
+    @classmethod
+    def from_api(cls, dag: dict[str, Any], tasks: list[dict[str, Any]]) -> "IndexedDag":
+        """Build an entry from a list_dags item and the DAG's list_tasks items."""
+        return cls(
+            dag_id=dag["dag_id"],
+            dag_display_name=dag.get("dag_display_name"),
+            description=dag.get("description"),
+            owners=list(dag.get("owners") or []),
+            tags=_tag_names(dag.get("tags")),
+            is_paused=dag.get("is_paused"),
+            last_parsed_time=dag.get("last_parsed_time"),
+            tasks=[{"task_id": t.get("task_id"), "operator": _operator_name(t)} for t in tasks],
+        )
+
+    def terms(self) -> dict[str, set[str]]:
+        """Index terms of this DAG, by field."""
+        terms: dict[str, set[str]] = {name: set() for name in INDEX_FIELDS}
+        for value in (self.dag_id, self.dag_display_name, self.description):
+            if value:
+                terms["dag"] |= _tokens(value)
+        for owner in self.owners:
+            terms["owner"] |= _tokens(owner)
+        for tag in self.tags:
+            terms["tag"] |= _tokens(tag)
+        for task in self.tasks:
+            if task["task_id"]:
+                terms["task"] |= _tokens(task["task_id"])
+            if task["operator"]:
+                terms["operator"] |= _tokens(task["operator"])
+        return terms
+
+    def summary(self) -> dict[str, Any]:
+        return {
+            "dag_id": self.dag_id,
+            "dag_display_name": self.dag_display_name,
+            "is_paused": self.is_paused,
+            "owners": self.owners,
+            "tags": self.tags,
+            "last_parsed_time": self.last_parsed_time,
+        }
+
+
+class DagIndex:
+    """In-memory inverted index of DAG metadata, kept fresh by a background crawler.
+
+    The crawler starts on first use and refreshes every refresh_interval
+    seconds. Searches are answered from memory; the first search waits for
+    the initial crawl.
+    """
+
+    def __init__(
+        self,
+        get_adapter: Callable[[], Awaitable[AsyncAirflowAdapter]],
+        refresh_interval: float = DEFAULT_INDEX_REFRESH_SECONDS,
+        max_concurrency: int = DEFAULT_INDEX_CONCURRENCY,
+    ):
+        """Initialize an empty index.
+
+        Args:
+            get_adapter: Coroutine function returning the adapter to crawl with
+            refresh_interval: Seconds between background refreshes
+            max_concurrency: Maximum list_tasks requests in flight while crawling
+        """
+        self._get_adapter = get_adapter
+        self.refresh_interval = refresh_interval
+        self.max_concurrency = max_concurrency
+        self._dags: dict[str, IndexedDag] = {}
+        self._postings: dict[str, defaultdict[str, set[str]]] = {
+            name: defaultdict(set) for name in INDEX_FIELDS
+        }
+        self._dag_terms: dict[str, dict[str, set[str]]] = {}
+        self._task: asyncio.Task[None] | None = None
+        self._refreshing: asyncio.Task[dict[str, int]] | None = None
+        # Bumped by clear() so a crawl of the previous Airflow stops writing
+        self._generation = 0
+        self.last_refresh: float | None = None
+
+    def __len__(self) -> int:
+        return len(self._dags)
+
+    def status(self) -> dict[str, Any]:
+        """Describe how complete and how fresh the index is."""
+        return {
+            "indexed_dags": len(self._dags),
+            "indexed_tasks": sum(len(d.tasks) for d in self._dags.values()),
+            "seconds_since_refresh": (
+                None if self.last_refresh is None else round(time.time() - self.last_refresh, 1)
+            ),
+            "refresh_interval_seconds": self.refresh_interval,
+        }
+
+    def clear(self) -> None:
+        """Forget everything indexed (e.g. when the server points at another Airflow).
+
+        A crawl still in flight is detached and its results are discarded.
+        """
+        self._generation += 1
+        self._refreshing = None
+        self._dags.clear()
+        self._dag_terms.clear()
+        for postings in self._postings.values():
+            postings.clear()
+        self.last_refresh = None
+
+    async def ensure_ready(self) -> None:
+        """Crawl once if the index is empty and make sure background refreshes run."""
+        if self.last_refresh is None:
+            await self.refresh()
+        loop = asyncio.get_running_loop()
+        if self._task is None or self._task.done() or self._task.get_loop() is not loop:
+            self._task = loop.create_task(self._run())
+
+    async def close(self) -> None:
+        """Stop the background crawler."""
+        task, self._task = self._task, None
+        if task is not None and not task.done():
+            task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await task
+
+    async def refresh(self) -> dict[str, int]:
+        """Bring the index up to date with Airflow.
+
+        Concurrent callers share one crawl.
+
+        Returns:
+            Counts of DAGs updated, unchanged and removed
+        """
+        running = self._refreshing
+        if (
+            running is None
+            or running.done()
+            or running.get_loop() is not asyncio.get_running_loop()
+        ):
+            running = self._refreshing = asyncio.ensure_future(self._refresh(self._generation))
+        return await asyncio.shield(running)
+
+    async def _refresh(self, generation: int) -> dict[str, int]:
+        adapter = await self._get_adapter()
+        data = await adapter.fetch_all(adapter.list_dags, "dags")
+        dags = {dag["dag_id"]: dag for dag in data.get("dags", [])}
+
+        stale = [
+            dag
+            for dag_id, dag in dags.items()
+            if dag_id not in self._dags
+            or self._dags[dag_id].last_parsed_time != dag.get("last_parsed_time")
+            or dag.get("last_parsed_time") is None
+        ]
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def _index(dag: dict[str, Any]) -> None:
+            async with semaphore:
+                try:
+                    tasks = (await adapter.list_tasks(dag["dag_id"])).get("tasks", [])
+                except Exception as e:
+                    logger.warning(
+                        "Could not list tasks of %s, retrying on the next refresh: %s",
+                        dag["dag_id"],
+                        e,
+                    )
+                    tasks = None
+            if self._generation != generation:
+                return
+            if tasks is None:
+                # Without a last_parsed_time the DAG counts as stale next time;
+                # keep the tasks indexed so far rather than dropping them
+                previous = self._dags.get(dag["dag_id"])
+                entry = IndexedDag.from_api({**dag, "last_parsed_time": None}, [])
+                entry.tasks = previous.tasks if previous is not None else []
+                self._put(entry)
+            else:
+                self._put(IndexedDag.from_api(dag, tasks))
+
+        await asyncio.gather(*(_index(dag) for dag in stale))
+        if self._generation != generation:
+            return {"updated": 0, "unchanged": 0, "removed": 0}
+
+        stale_ids = {dag["dag_id"] for dag in stale}
+        for dag_id, dag in dags.items():
+            if dag_id not in stale_ids:
+                # Pausing a DAG does not re-parse it
+                self._dags[dag_id].is_paused = dag.get("is_paused")
+        removed = [dag_id for dag_id in self._dags if dag_id not in dags]
+        for dag_id in removed:
+            self._remove(dag_id)
+
+        self.last_refresh = time.time()
+        logger.debug(
+            "DAG index refreshed: %d updated, %d unchanged, %d removed",
+            len(stale),
+            len(dags) - len(stale),
+            len(removed),
+        )
+        return {
+            "updated": len(stale),
+            "unchanged": len(dags) - len(stale),
+            "removed": len(removed),
+        }
+
+    async def _run(self) -> None:
+        """Refresh the index periodically until cancelled."""
+        while True:
+            await asyncio.sleep(self.refresh_interval)
+            try:
+                await self.refresh()
+            except Exception as e:
+                logger.warning("DAG index refresh failed: %s", e)
+
+    def _put(self, entry: IndexedDag) -> None:
+        self._remove(entry.dag_id)
+        terms = entry.terms()
+        for name, tokens in terms.items():
+            for token in tokens:
+                self._postings[name][token].add(entry.dag_id)
+        self._dags[entry.dag_id] = entry
+        self._dag_terms[entry.dag_id] = terms
+
+    def _remove(self, dag_id: str) -> None:
+        self._dags.pop(dag_id, None)
+        for name, tokens in self._dag_terms.pop(dag_id, {}).items():
+            for token in tokens:
+                postings = self._postings[name][token]
+                postings.discard(dag_id)
+                if not postings:
+                    del self._postings[name][token]
+
+    def _lookup(self, term: str, fields: tuple[str, ...]) -> set[str]:
+        """DAG ids with a token in fields starting with term."""
+        term = term.lower()
+        found: set[str] = set()
+        for name in fields:
+            for token, dag_ids in self._postings[name].items():
+                if token.startswith(term):
+                    found |= dag_ids
+        return found
+
+    def search(
+        self,
+        query: str = "",
+        owner: str | None = None,
+        tag: str | None = None,
+        operator: str | None = None,
+        limit: int = 50,
+    ) -> dict[str, Any]:
+        """Find DAGs matching every query word and filter.
+
+        Query words match the start of any word in the DAG id, display name,
+        description, owners, tags, task ids or operator names. Filters only
+        match their own field.
+
+        Returns:
+            Matching DAGs (sorted by dag_id, with the tasks that matched) and
+            the total number of matches
+        """
+        criteria: list[tuple[str, tuple[str, ...]]] = [
+            (word, INDEX_FIELDS) for word in _WORD.findall(query.lower())
+        ]
+        for value, name in ((owner, "owner"), (tag, "tag"), (operator, "operator")):
+            if value:
+                criteria.append((value, (name,)))
+
+        matched: set[str] | None = None
+        for term, fields in criteria:
+            dag_ids = self._lookup(term, fields)
+            matched = dag_ids if matched is None else matched & dag_ids
+        found = sorted(self._dags if matched is None else matched)
+
+        task_terms = [term.lower() for term, fields in criteria if "task" in fields]
+        operator_terms = [term.lower() for term, fields in criteria if "operator" in fields]
+        results = []
+        for dag_id in found[:limit]:
+            entry = self._dags[dag_id]
+            result = entry.summary()
+            matching_tasks = [
+                task
+                for task in entry.tasks
+                if _matches(task["task_id"], task_terms)
+                or _matches(task["operator"], operator_terms)
+            ]
+            if matching_tasks:
+                result["matching_tasks"] = matching_tasks
+            results.append(result)
+        return {"total_matches": len(found), "dags": results}
@@ -1,8 +1,25 @@
 """Logging utilities for Airflow MCP."""
 
+import atexit
 import logging
+import logging.handlers
+import queue
 import sys
 
+# Writes queued log records to the console; replaced on each configure_logging call
+_listener: logging.handlers.QueueListener | None = None
+
+
+def _stop_listener() -> None:
+    """Flush queued records and stop the listener thread."""
+    global _listener
+    listener, _listener = _listener, None
+    if listener is not None:
+        listener.stop()
+
+
+atexit.register(_stop_listener)
+
 
 def get_logger(name: str | None = None) -> logging.Logger:
     """Get a logger instance nested under the airflow_mcp namespace.
@@ -29,6 +46,9 @@ def configure_logging(level: str | int = logging.INFO, stdio_mode: bool = False)
     Sets up a console handler with a standard format. When running in stdio mode,
     logs are sent to stderr to avoid corrupting JSON-RPC messages on stdout.
 
+    Records are put on an in-memory queue and written by a background
+    listener thread, so a slow or blocked console never delays tool calls.
+
     Args:
         level: Logging level (e.g., logging.INFO, logging.DEBUG, or "INFO", "DEBUG")
               Defaults to INFO.
@@ -39,6 +59,8 @@ def configure_logging(level: str | int = logging.INFO, stdio_mode: bool = False)
         >>> configure_logging(level=logging.DEBUG)
         >>> configure_logging(level=logging.INFO, stdio_mode=True)  # For MCP stdio transport
     """
+    global _listener
+
     # Convert string level to int if needed
     if isinstance(level, str):
         level = getattr(logging, level.upper(), logging.INFO)
@@ -49,6 +71,7 @@ def configure_logging(level: str | int = logging.INFO, stdio_mode: bool = False)
 
     # Remove any existing handlers to avoid duplicates
     logger.handlers.clear()
+    _stop_listener()
 
     # Create console handler - use stderr in stdio mode to avoid corrupting JSON-RPC
     stream = sys.stderr if stdio_mode else sys.stdout
@@ -59,8 +82,11 @@ def configure_logging(level: str | int = logging.INFO, stdio_mode: bool = False)
     formatter = logging.Formatter(fmt="%(levelname)s: %(message)s")
     handler.setFormatter(formatter)
 
-    # Add handler to logger
-    logger.addHandler(handler)
+    # Log through a queue; the listener thread does the writing
+    records: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+    logger.addHandler(logging.handlers.QueueHandler(records))
+    _listener = logging.handlers.QueueListener(records, handler, respect_handler_level=True)
+    _listener.start()
 
     # Prevent propagation to root logger to avoid duplicate logs
     logger.propagate = False
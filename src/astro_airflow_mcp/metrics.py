@@ -0,0 +1,223 @@
+"""Prometheus metrics for tool calls and upstream Airflow requests.
+
+Metrics are collected only when prometheus_client is installed
+(``pip install astro-airflow-mcp[metrics]``); otherwise every recording
+helper is a no-op and /metrics answers 501. Labels are kept low-cardinality:
+tools by name, Airflow requests by endpoint template (ids replaced with
+``{id}``), never by DAG or run id.
+"""
+
+import contextlib
+import time
+from collections.abc import Iterator
+from contextvars import ContextVar
+from typing import Any
+
+import httpx
+from fastmcp.server.middleware import CallNext, Middleware, MiddlewareContext
+from starlette.requests import Request
+from starlette.responses import PlainTextResponse, Response
+
+try:
+    import prometheus_client
+except ImportError:  # pragma: no cover - optional dependency
+    prometheus_client = None  # type: ignore[assignment]
+
+METRICS_AVAILABLE = prometheus_client is not None
+
+# Latency buckets (seconds) spanning cache hits to slow log reads
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60)
+# Payload size buckets (bytes), 256 B to 16 MiB
+SIZE_BUCKETS = tuple(256 * 4**i for i in range(9))
+# Path segments that are part of an endpoint rather than an id
+_LITERAL_SEGMENTS = {"~", "list"}
+
+
+class _Metrics:
+    """The metric objects, registered on their own registry."""
+
+    def __init__(self) -> None:
+        registry = self.registry = prometheus_client.CollectorRegistry()
+        self.tool_duration = prometheus_client.Histogram(
+            "airflow_mcp_tool_duration_seconds",
+            "MCP tool call latency",
+            ["tool", "status"],
+            buckets=LATENCY_BUCKETS,
+            registry=registry,
+        )
+        self.tool_response_bytes = prometheus_client.Histogram(
+            "airflow_mcp_tool_response_bytes",
+            "Size of MCP tool results",
+            ["tool"],
+            buckets=SIZE_BUCKETS,
+            registry=registry,
+        )
+        self.tools_in_flight = prometheus_client.Gauge(
+            "airflow_mcp_tool_calls_in_flight",
+            "MCP tool calls being executed",
+            registry=registry,
+        )
+        self.upstream_duration = prometheus_client.Histogram(
+            "airflow_mcp_upstream_request_duration_seconds",
+            "Airflow API request latency",
+            ["method", "endpoint", "status"],
+            buckets=LATENCY_BUCKETS,
+            registry=registry,
+        )
+        self.upstream_response_bytes = prometheus_client.Histogram(
+            "airflow_mcp_upstream_response_bytes",
+            "Size of Airflow API response bodies",
+            ["method", "endpoint"],
+            buckets=SIZE_BUCKETS,
+            registry=registry,
+        )
+        self.upstream_in_flight = prometheus_client.Gauge(
+            "airflow_mcp_upstream_requests_in_flight",
+            "Airflow API requests awaiting a response",
+            registry=registry,
+        )
+        self.cache_requests = prometheus_client.Counter(
+            "airflow_mcp_response_cache_requests",
+            "Response cache lookups by result (hit, revalidated or miss)",
+            ["result"],
+            registry=registry,
+        )
+        self.token_refreshes = prometheus_client.Counter(
+            "airflow_mcp_token_refreshes",
+            "Airflow API token fetches by result",
+            ["result"],
+            registry=registry,
+        )
+
+
+_metrics = _Metrics() if METRICS_AVAILABLE else None
+# Upstream request counter of the current tool call (see count_upstream_requests)
+_upstream_requests: ContextVar[list[int] | None] = ContextVar("upstream_requests", default=None)
+
+
+def endpoint_template(endpoint: str) -> str:
+    """Replace the ids in an Airflow API path with {id}.
+
+    Airflow paths alternate collections and ids
+    (dags/{id}/dagRuns/{id}/taskInstances/{id}/logs/{id}), so every second
+    segment is an id unless it is a literal such as "~" or "list".
+    """
+    segments = endpoint.split("?", 1)[0].strip("/").split("/")
+    return "/".join(
+        "{id}" if i % 2 and segment not in _LITERAL_SEGMENTS else segment
+        for i, segment in enumerate(segments)
+    )
+
+
+@contextlib.contextmanager
+def upstream_request(method: str, endpoint: str) -> Iterator[dict[str, Any]]:
+    """Time an Airflow API request made inside the block.
+
+    Set "response" in the yielded dict to record its status and body size;
+    requests that raise are recorded with status "error".
+    """
+    record: dict[str, Any] = {}
+    counter = _upstream_requests.get()
+    if counter is not None:
+        counter[0] += 1
+    if _metrics is None:
+        yield record
+        return
+    _metrics.upstream_in_flight.inc()
+    start = time.perf_counter()
+    try:
+        yield record
+    finally:
+        _metrics.upstream_in_flight.dec()
+        template = endpoint_template(endpoint)
+        response = record.get("response")
+        if not isinstance(response, httpx.Response):
+            response = None
+        status = "error" if response is None else str(response.status_code)
+        _metrics.upstream_duration.labels(method.upper(), template, status).observe(
+            time.perf_counter() - start
+        )
+        if response is not None:
+            _metrics.upstream_response_bytes.labels(method.upper(), template).observe(
+                len(response.content)
+            )
+
+
+@contextlib.contextmanager
+def count_upstream_requests() -> Iterator[list[int]]:
+    """Count the Airflow API requests made inside the block.
+
+    Requests made by tasks started inside the block are counted too. Yields
+    a one-element list holding the count.
+    """
+    counter = [0]
+    token = _upstream_requests.set(counter)
+    try:
+        yield counter
+    finally:
+        _upstream_requests.reset(token)
+
+
+def record_cache_lookup(result: str) -> None:
+    """Count a response cache lookup: "hit", "revalidated" or "miss"."""
+    if _metrics is not None:
+        _metrics.cache_requests.labels(result).inc()
+
+
+def record_token_refresh(result: str) -> None:
+    """Count a token fetch: "success", "unavailable" or "failure"."""
+    if _metrics is not None:
+        _metrics.token_refreshes.labels(result).inc()
+
+
+def tool_result_size(result: Any) -> int:
+    """Bytes of text in a tool result's content blocks."""
+    return sum(len(getattr(block, "text", "").encode()) for block in result.content or [])
+
+
+class MetricsMiddleware(Middleware):
+    """Record latency, result size and concurrency of MCP tool calls.
+
+    Calls to names that are not registered tools are labelled "unknown" so
+    clients cannot create new label values.
+    """
+
+    def __init__(self) -> None:
+        self._tools: set[str] | None = None
+
+    async def _tool_label(self, context: MiddlewareContext[Any]) -> str:
+        name = context.message.name
+        if self._tools is None or name not in self._tools:
+            server = context.fastmcp_context.fastmcp if context.fastmcp_context else None
+            if server is not None:
+                self._tools = set(await server.get_tools())
+        return name if self._tools and name in self._tools else "unknown"
+
+    async def on_call_tool(self, context: MiddlewareContext[Any], call_next: CallNext) -> Any:
+        if _metrics is None:
+            return await call_next(context)
+        tool = await self._tool_label(context)
+        status = "error"
+        _metrics.tools_in_flight.inc()
+        start = time.perf_counter()
+        try:
+            result = await call_next(context)
+            status = "ok"
+            _metrics.tool_response_bytes.labels(tool).observe(tool_result_size(result))
+            return result
+        finally:
+            _metrics.tools_in_flight.dec()
+            _metrics.tool_duration.labels(tool, status).observe(time.perf_counter() - start)
+
+
+async def metrics_endpoint(_request: Request) -> Response:
+    """Serve the metrics in the Prometheus text format."""
+    if _metrics is None:
+        return PlainTextResponse(
+            "Metrics require prometheus_client: pip install 'astro-airflow-mcp[metrics]'\n",
+            status_code=501,
+        )
+    return Response(
+        prometheus_client.generate_latest(_metrics.registry),
+        media_type=prometheus_client.CONTENT_TYPE_LATEST,
+    )
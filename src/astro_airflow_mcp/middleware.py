@@ -0,0 +1,105 @@
+"""Tool call logging that stays cheap for large payloads.
+
+Every tool call gets one log line with its duration, the number of Airflow
+API requests it made and the size of its result. Arguments and results are
+only logged for a sample of calls and for slow or failed calls, and are cut
+to a fixed size first, so multi-megabyte logs and DAG sources are never
+formatted in full.
+"""
+
+import json
+import random
+import time
+from typing import Any
+
+from fastmcp.server.middleware import CallNext, Middleware, MiddlewareContext
+
+from astro_airflow_mcp.logging import get_logger
+from astro_airflow_mcp.metrics import count_upstream_requests, tool_result_size
+
+logger = get_logger("requests")
+
+# Fraction of tool calls whose payloads are logged (0 disables sampling)
+DEFAULT_LOG_SAMPLE_RATE = 0.0
+# Calls slower than this always have their payloads logged
+DEFAULT_SLOW_CALL_SECONDS = 5.0
+# Characters kept of each logged payload
+DEFAULT_MAX_PAYLOAD_CHARS = 2000
+
+
+def _truncate(text: str, max_chars: int) -> str:
+    if len(text) <= max_chars:
+        return text
+    return f"{text[:max_chars]}... ({len(text) - max_chars} more characters)"
+
+
+def _result_text(result: Any, max_chars: int) -> str:
+    """Text of a tool result cut to max_chars, copying no more of it than that."""
+    parts: list[str] = []
+    size = 0
+    for block in getattr(result, "content", None) or []:
+        text = getattr(block, "text", "")
+        parts.append(text[: max(max_chars - size, 0)])
+        size += len(text)
+        if size > max_chars:
+            return "".join(parts) + "... (truncated)"
+    return "".join(parts)
+
+
+class ToolTimingMiddleware(Middleware):
+    """Log the duration, upstream request count and result size of tool calls.
+
+    Attributes:
+        sample_rate: Fraction of calls whose arguments and result are logged
+        slow_call_seconds: Calls taking at least this long always log payloads
+        max_payload_chars: Characters kept of each logged argument list and result
+    """
+
+    def __init__(
+        self,
+        sample_rate: float = DEFAULT_LOG_SAMPLE_RATE,
+        slow_call_seconds: float = DEFAULT_SLOW_CALL_SECONDS,
+        max_payload_chars: int = DEFAULT_MAX_PAYLOAD_CHARS,
+    ):
+        self.sample_rate = sample_rate
+        self.slow_call_seconds = slow_call_seconds
+        self.max_payload_chars = max_payload_chars
+
+    def _arguments(self, context: MiddlewareContext[Any]) -> str:
+        arguments = getattr(context.message, "arguments", None) or {}
+        return _truncate(json.dumps(arguments, default=str), self.max_payload_chars)
+
+    async def on_call_tool(self, context: MiddlewareContext[Any], call_next: CallNext) -> Any:
+        tool = context.message.name
+        sampled = self.sample_rate > 0 and random.random() < self.sample_rate  # nosec B311
+        start = time.perf_counter()
+        with count_upstream_requests() as upstream:
+            try:
+                result = await call_next(context)
+            except Exception as e:
+                logger.warning(
+                    "Tool %s failed after %.1fms (upstream_requests=%d): %s; arguments=%s",
+                    tool,
+                    (time.perf_counter() - start) * 1000,
+                    upstream[0],
+                    e,
+                    self._arguments(context),
+                )
+                raise
+        elapsed = time.perf_counter() - start
+        logger.info(
+            "Tool %s completed in %.1fms (upstream_requests=%d, response_bytes=%d)",
+            tool,
+            elapsed * 1000,
+            upstream[0],
+            tool_result_size(result),
+        )
+        if sampled or elapsed >= self.slow_call_seconds:
+            logger.info(
+                "Tool %s payload%s: arguments=%s result=%s",
+                tool,
+                "" if sampled else " (slow call)",
+                self._arguments(context),
+                _result_text(result, self.max_payload_chars),
+            )
+        return result
@@ -8,10 +8,12 @@ They can be used for:
 - Type hints and IDE autocompletion during development
 - Documentation of API response structures
 - Future validation if stricter typing is desired
+- Default field projections: `summary_fields` lists the fields list tools
+  return when the caller does not ask for specific ones
 """
 
 from datetime import datetime
-from typing import Any
+from typing import Any, ClassVar
 
 from pydantic import BaseModel, ConfigDict, Field
 
@@ -20,11 +22,25 @@ class DAGInfo(BaseModel):
     """DAG information from Airflow API."""
 
     model_config = ConfigDict(extra="allow")
+    summary_fields: ClassVar[tuple[str, ...]] = (
+        "dag_id",
+        "dag_display_name",
+        "is_paused",
+        "is_active",
+        "is_stale",
+        "owners",
+        "tags",
+        "schedule_interval",
+        "timetable_summary",
+        "has_import_errors",
+        "next_dagrun",
+    )
 
     dag_id: str
     dag_display_name: str | None = None
     is_paused: bool = False
     is_active: bool = True
+    is_stale: bool | None = None  # Airflow 3 replacement for is_active
     is_subdag: bool = False
     fileloc: str | None = None
     file_token: str | None = None
@@ -46,6 +62,16 @@ class DAGRun(BaseModel):
     """DAG run information from Airflow API."""
 
     model_config = ConfigDict(extra="allow")
+    summary_fields: ClassVar[tuple[str, ...]] = (
+        "dag_run_id",
+        "dag_id",
+        "logical_date",
+        "execution_date",
+        "start_date",
+        "end_date",
+        "state",
+        "run_type",
+    )
 
     dag_run_id: str
     dag_id: str
@@ -65,6 +91,13 @@ class TaskInfo(BaseModel):
     """Task definition information from Airflow API."""
 
     model_config = ConfigDict(extra="allow")
+    summary_fields: ClassVar[tuple[str, ...]] = (
+        "task_id",
+        "operator_name",
+        "trigger_rule",
+        "retries",
+        "downstream_task_ids",
+    )
 
     task_id: str
     task_display_name: str | None = None
@@ -91,11 +124,22 @@ class TaskInstance(BaseModel):
     """Task instance execution information from Airflow API."""
 
     model_config = ConfigDict(extra="allow")
+    summary_fields: ClassVar[tuple[str, ...]] = (
+        "task_id",
+        "map_index",
+        "state",
+        "start_date",
+        "end_date",
+        "duration",
+        "try_number",
+        "operator",
+    )
 
     task_id: str
     dag_id: str
     dag_run_id: str | None = None
     run_id: str | None = None
+    map_index: int | None = None
     state: str | None = None
     start_date: datetime | None = None
     end_date: datetime | None = None
@@ -25,6 +25,7 @@ except ImportError:
 try:
     from fastapi import FastAPI
 
+    from astro_airflow_mcp.metrics import metrics_endpoint
     from astro_airflow_mcp.server import mcp
 
     # Get the native MCP protocol ASGI app from FastMCP
@@ -40,6 +41,9 @@ try:
     app.mount("/v1", mcp_protocol_app)
     logger.info("MCP protocol app created and mounted")
 
+    # Prometheus metrics for tool and upstream request latency
+    app.add_route("/metrics", metrics_endpoint, methods=["GET"])
+
     # Airflow plugin configuration
     fastapi_apps_config = [{"app": app, "url_prefix": "/mcp", "name": "Airflow MCP Server"}]
 
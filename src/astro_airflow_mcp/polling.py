@@ -0,0 +1,380 @@
+"""Async wait engine for DAG runs: adaptive intervals and a shared batched poller."""
+
+import asyncio
+import contextlib
+import statistics
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from typing import Any
+
+from astro_airflow_mcp.adapters import AsyncAirflowAdapter
+from astro_airflow_mcp.logging import get_logger
+
+logger = get_logger(__name__)
+
+# Terminal states for DAG runs (polling stops when reached)
+TERMINAL_DAG_RUN_STATES = {"success", "failed", "upstream_failed"}
+# Task instance states that count as finished in progress reports
+FINISHED_TASK_STATES = {"success", "failed", "upstream_failed", "skipped", "removed"}
+# Number of recent successful runs used to estimate how long a run takes
+DURATION_HISTORY_SAMPLE = 5
+# Watched runs are matched on their start_date, which Airflow sets with its own
+# clock; look back this far to absorb clock skew between Airflow and this server
+CLOCK_SKEW_SECONDS = 300.0
+# Queued runs have no start_date, so the batch query cannot see one that fails
+# before it starts; every this many ticks they are looked up one by one
+QUEUED_RUN_POLL_TICKS = 5
+
+ProgressCallback = Callable[[dict[str, Any]], Awaitable[None]]
+
+
+@dataclass
+class PollSchedule:
+    """Adaptive polling intervals for waiting on a DAG run.
+
+    Polls quickly right after the trigger (short runs finish fast) and slows
+    down as the wait gets longer, up to max_interval. When the typical run
+    duration is known, polls before that point are spread out further since
+    the run is unlikely to have finished yet.
+    """
+
+    min_interval: float = 1.0
+    max_interval: float = 30.0
+    # Fraction of the elapsed time to wait before the next poll
+    growth: float = 0.1
+    expected_duration: float | None = None
+
+    def next_interval(self, elapsed: float) -> float:
+        """Get the number of seconds to wait before the next poll."""
+        interval = max(self.min_interval, elapsed * self.growth)
+        if self.expected_duration and elapsed < self.expected_duration:
+            interval = max(interval, (self.expected_duration - elapsed) / 2)
+        return min(self.max_interval, interval)
+
+
+@dataclass
+class WaitResult:
+    """Outcome of waiting for a DAG run."""
+
+    dag_run: dict[str, Any]
+    timed_out: bool
+    elapsed_seconds: float
+    polls: int
+    task_counts: dict[str, int] = field(default_factory=dict)
+
+    @property
+    def state(self) -> str | None:
+        """The last observed DAG run state."""
+        return self.dag_run.get("state")
+
+
+def parse_timestamp(value: Any) -> datetime | None:
+    """Parse an ISO 8601 timestamp from the API, returning None if absent or invalid."""
+    if not isinstance(value, str):
+        return None
+    # datetime.fromisoformat only accepts a trailing "Z" from Python 3.11
+    if value.endswith("Z"):
+        value = value[:-1] + "+00:00"
+    try:
+        return datetime.fromisoformat(value)
+    except ValueError:
+        return None
+
+
+async def expected_run_duration(
+    adapter: AsyncAirflowAdapter,
+    dag_id: str,
+    sample: int = DURATION_HISTORY_SAMPLE,
+) -> float | None:
+    """Estimate how long a run of dag_id takes from its recent successful runs.
+
+    Returns:
+        Median duration in seconds, or None if there is no usable history
+    """
+    try:
+        data = await adapter.list_dag_runs(
+            dag_id=dag_id, limit=sample, state=["success"], order_by="-start_date"
+        )
+    except Exception as e:
+        logger.debug("Could not fetch run history for %s: %s", dag_id, e)
+        return None
+
+    durations = []
+    for run in data.get("dag_runs", []):
+        start = parse_timestamp(run.get("start_date"))
+        end = parse_timestamp(run.get("end_date"))
+        if start and end and end >= start:
+            durations.append((end - start).total_seconds())
+    return statistics.median(durations) if durations else None
+
+
+def _count_task_states(task_instances: list[dict[str, Any]]) -> dict[str, int]:
+    """Summarize task instances as total/finished/running/failed counts."""
+    states = [ti.get("state") for ti in task_instances]
+    return {
+        "total": len(states),
+        "finished": sum(state in FINISHED_TASK_STATES for state in states),
+        "running": states.count("running"),
+        "failed": sum(state in ("failed", "upstream_failed") for state in states),
+    }
+
+
+@dataclass
+class _Watch:
+    """A DAG run some callers are waiting on, with its last observed state."""
+
+    dag_id: str
+    dag_run_id: str
+    future: asyncio.Future[dict[str, Any]]
+    registered_at: datetime
+    started: float
+    schedule: PollSchedule
+    dag_run: dict[str, Any]
+    task_counts: dict[str, int] = field(default_factory=dict)
+    listeners: list[ProgressCallback] = field(default_factory=list)
+    waiters: int = 0
+
+
+class RunStatePoller:
+    """Resolve any number of DAG run waits from one batched query per tick.
+
+    Every pending (dag_id, dag_run_id) wait is registered here and a single
+    background task polls all of them with POST dags/~/dagRuns/list, so the
+    number of upstream requests depends on the number of ticks rather than on
+    the number of waiters. The tick interval is the shortest interval any
+    waiter's PollSchedule asks for. Task instance counts for progress reports
+    are fetched with one more batched query, only when a waiter wants them.
+
+    If the batch endpoint fails, runs are polled individually for that tick.
+    """
+
+    def __init__(self, get_adapter: Callable[[], Awaitable[AsyncAirflowAdapter]]):
+        """Initialize the poller.
+
+        Args:
+            get_adapter: Coroutine function returning the adapter to poll with
+                (called every tick so adapter resets are picked up)
+        """
+        self._get_adapter = get_adapter
+        self._watches: dict[tuple[str, str], _Watch] = {}
+        self._task: asyncio.Task[None] | None = None
+        self._changed: asyncio.Event | None = None
+        self.ticks = 0
+
+    @property
+    def pending(self) -> int:
+        """Number of DAG runs currently being watched."""
+        return len(self._watches)
+
+    async def wait(
+        self,
+        dag_id: str,
+        dag_run_id: str,
+        timeout: float,
+        schedule: PollSchedule | None = None,
+        on_progress: ProgressCallback | None = None,
+        initial_state: str | None = "queued",
+    ) -> WaitResult:
+        """Wait until a DAG run reaches a terminal state or the timeout expires.
+
+        Cancelling the calling task stops this wait without affecting other
+        waiters on the same run.
+
+        Args:
+            dag_id: The ID of the DAG
+            dag_run_id: The ID of the DAG run to wait for
+            timeout: Maximum time to wait in seconds
+            schedule: Polling intervals this waiter needs (default: PollSchedule())
+            on_progress: Optional coroutine called every tick with the run state,
+                elapsed time and, while the run is executing, task counts
+            initial_state: State to report if the run is never observed
+
+        Returns:
+            WaitResult with the last observed DAG run
+        """
+        key = (dag_id, dag_run_id)
+        start = time.monotonic()
+        start_ticks = self.ticks
+        watch = self._watches.get(key)
+        if watch is None:
+            watch = _Watch(
+                dag_id=dag_id,
+                dag_run_id=dag_run_id,
+                future=asyncio.get_running_loop().create_future(),
+                registered_at=datetime.now(timezone.utc),
+                started=start,
+                schedule=schedule or PollSchedule(),
+                dag_run={"dag_id": dag_id, "dag_run_id": dag_run_id, "state": initial_state},
+            )
+            self._watches[key] = watch
+        watch.waiters += 1
+        if on_progress is not None:
+            watch.listeners.append(on_progress)
+        self._ensure_running()
+
+        try:
+            dag_run = await asyncio.wait_for(asyncio.shield(watch.future), timeout)
+            timed_out = False
+        except asyncio.TimeoutError:
+            dag_run, timed_out = watch.dag_run, True
+        except asyncio.CancelledError:
+            logger.info("Stopped waiting for %s/%s: cancelled", dag_id, dag_run_id)
+            raise
+        finally:
+            watch.waiters -= 1
+            if on_progress is not None:
+                watch.listeners.remove(on_progress)
+            if watch.waiters == 0 and self._watches.get(key) is watch:
+                del self._watches[key]
+
+        elapsed = round(time.monotonic() - start, 2)
+        return WaitResult(dag_run, timed_out, elapsed, self.ticks - start_ticks, watch.task_counts)
+
+    async def close(self) -> None:
+        """Stop the background polling task."""
+        task, self._task = self._task, None
+        if task is not None and not task.done():
+            task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await task
+
+    def _ensure_running(self) -> None:
+        """Start the polling task, or wake it so it accounts for a new waiter."""
+        loop = asyncio.get_running_loop()
+        if self._task is None or self._task.done() or self._task.get_loop() is not loop:
+            self._changed = asyncio.Event()
+            self._task = loop.create_task(self._run())
+        elif self._changed is not None:
+            self._changed.set()
+
+    def _next_interval(self, now: float) -> float:
+        """Get the shortest poll interval any current waiter asks for."""
+        return min(w.schedule.next_interval(now - w.started) for w in self._watches.values())
+
+    async def _run(self) -> None:
+        """Poll until no waiters are left."""
+        changed = self._changed
+        last_poll = time.monotonic()
+        while self._watches:
+            now = time.monotonic()
+            delay = last_poll + self._next_interval(now) - now
+            if delay > 0 and changed is not None:
+                changed.clear()
+                # Re-plan early if a waiter with a shorter interval registers
+                with contextlib.suppress(asyncio.TimeoutError):
+                    await asyncio.wait_for(changed.wait(), delay)
+                continue
+            last_poll = time.monotonic()
+            try:
+                await self.poll_once()
+            except Exception as e:
+                logger.debug("DAG run poll failed: %s", e)
+
+    async def poll_once(self) -> None:
+        """Refresh every watched run and wake the waiters of finished runs."""
+        watches = list(self._watches.values())
+        if not watches:
+            return
+        adapter = await self._get_adapter()
+        self.ticks += 1
+        try:
+            runs = await self._fetch_runs(adapter, watches)
+        except Exception as e:
+            logger.debug("Batched DAG run query failed, polling runs individually: %s", e)
+            runs = await self._fetch_runs_individually(adapter, watches)
+        else:
+            # The batch query can't filter on run ids, only on start_date, so it
+            # misses runs that started before the window and runs that never
+            # started; look those up directly, queued ones only now and then
+            poll_queued = self.ticks % QUEUED_RUN_POLL_TICKS == 0
+            missing = [
+                w
+                for w in watches
+                if (w.dag_id, w.dag_run_id) not in runs
+                and (poll_queued or w.dag_run.get("state") != "queued")
+            ]
+            if missing:
+                runs.update(await self._fetch_runs_individually(adapter, missing))
+
+        for watch in watches:
+            run = runs.get((watch.dag_id, watch.dag_run_id))
+            if run is None:
+                continue
+            watch.dag_run = run
+            if run.get("state") in TERMINAL_DAG_RUN_STATES:
+                self._watches.pop((watch.dag_id, watch.dag_run_id), None)
+                if not watch.future.done():
+                    watch.future.set_result(run)
+
+        await self._report_progress(adapter)
+
+    @staticmethod
+    async def _fetch_runs(
+        adapter: AsyncAirflowAdapter, watches: list[_Watch]
+    ) -> dict[tuple[str, str], dict[str, Any]]:
+        """Fetch the watched runs with the batch endpoint.
+
+        Queued runs have no start_date yet and are simply not returned, and
+        neither are runs that started before the start_date window.
+        """
+        since = min(w.registered_at for w in watches) - timedelta(seconds=CLOCK_SKEW_SECONDS)
+        data = await adapter.fetch_all(
+            adapter.list_dag_runs_batch,
+            "dag_runs",
+            dag_ids=sorted({w.dag_id for w in watches}),
+            start_date_gte=since.isoformat(),
+        )
+        return {(run.get("dag_id"), run.get("dag_run_id")): run for run in data["dag_runs"]}
+
+    @staticmethod
+    async def _fetch_runs_individually(
+        adapter: AsyncAirflowAdapter, watches: list[_Watch]
+    ) -> dict[tuple[str, str], dict[str, Any]]:
+        """Fetch the watched runs one request each (fallback for the batch query)."""
+        results = await asyncio.gather(
+            *(adapter.get_dag_run(w.dag_id, w.dag_run_id) for w in watches),
+            return_exceptions=True,
+        )
+        return {
+            (w.dag_id, w.dag_run_id): run
+            for w, run in zip(watches, results, strict=True)
+            if isinstance(run, dict)
+        }
+
+    async def _report_progress(self, adapter: AsyncAirflowAdapter) -> None:
+        """Send progress updates to waiters that asked for them."""
+        listening = [w for w in self._watches.values() if w.listeners]
+        running = [w for w in listening if w.dag_run.get("state") == "running"]
+        if running:
+            try:
+                data = await adapter.fetch_all(
+                    adapter.list_task_instances_batch,
+                    "task_instances",
+                    dag_ids=sorted({w.dag_id for w in running}),
+                    dag_run_ids=sorted({w.dag_run_id for w in running}),
+                )
+                by_run: dict[tuple[str, str], list[dict[str, Any]]] = {}
+                for ti in data.get("task_instances", []):
+                    run_id = ti.get("dag_run_id") or ti.get("run_id")
+                    by_run.setdefault((ti.get("dag_id"), run_id), []).append(ti)
+                for watch in running:
+                    watch.task_counts = _count_task_states(
+                        by_run.get((watch.dag_id, watch.dag_run_id), [])
+                    )
+            except Exception as e:
+                logger.debug("Could not fetch task instances: %s", e)
+
+        now = time.monotonic()
+        for watch in listening:
+            update = {
+                "state": watch.dag_run.get("state"),
+                "elapsed_seconds": round(now - watch.started, 2),
+                "task_counts": watch.task_counts,
+            }
+            for listener in list(watch.listeners):
+                try:
+                    await listener(update)
+                except Exception as e:
+                    logger.debug("Progress callback failed: %s", e)
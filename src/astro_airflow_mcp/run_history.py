@@ -0,0 +1,395 @@
+"""Local DAG run history, synced incrementally from Airflow into SQLite.
+
+Trend questions ("how often did X fail this month") would otherwise page
+through list_dag_runs every time. The store keeps DAG runs and task
+instances in a SQLite file and each sync only asks Airflow for runs that
+started at or after a per-DAG watermark. The watermark is the start of the
+oldest run that was still unfinished at the last sync (or of the newest
+run if all were finished), so upstream load is proportional to new runs.
+"""
+
+import asyncio
+import sqlite3
+import statistics
+import time
+from collections.abc import Iterable
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any
+
+from astro_airflow_mcp.adapters import AsyncAirflowAdapter
+from astro_airflow_mcp.logging import get_logger
+from astro_airflow_mcp.polling import TERMINAL_DAG_RUN_STATES, parse_timestamp
+
+logger = get_logger(__name__)
+
+# How far back the first sync of a DAG reaches
+DEFAULT_HISTORY_DAYS = 30
+# DAGs synced at the same time
+DEFAULT_SYNC_CONCURRENCY = 5
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+CREATE TABLE IF NOT EXISTS dag_runs (
+    dag_id TEXT NOT NULL,
+    dag_run_id TEXT NOT NULL,
+    state TEXT,
+    run_type TEXT,
+    logical_date TEXT,
+    start_date TEXT,
+    end_date TEXT,
+    duration REAL,
+    PRIMARY KEY (dag_id, dag_run_id)
+);
+CREATE INDEX IF NOT EXISTS dag_runs_by_start ON dag_runs (dag_id, start_date);
+CREATE TABLE IF NOT EXISTS task_instances (
+    dag_id TEXT NOT NULL,
+    dag_run_id TEXT NOT NULL,
+    task_id TEXT NOT NULL,
+    map_index INTEGER NOT NULL,
+    state TEXT,
+    try_number INTEGER,
+    start_date TEXT,
+    end_date TEXT,
+    duration REAL,
+    PRIMARY KEY (dag_id, dag_run_id, task_id, map_index)
+);
+CREATE TABLE IF NOT EXISTS watermarks (
+    dag_id TEXT PRIMARY KEY,
+    start_date_gte TEXT NOT NULL,
+    synced_at REAL NOT NULL
+);
+"""
+
+
+def _duration(start: str | None, end: str | None) -> float | None:
+    """Seconds between two ISO timestamps, or None if either is missing."""
+    start_at, end_at = parse_timestamp(start), parse_timestamp(end)
+    if start_at is None or end_at is None:
+        return None
+    return (end_at - start_at).total_seconds()
+
+
+def _percentile(values: list[float], fraction: float) -> float:
+    """Nearest-rank percentile of sorted values."""
+    index = max(0, min(len(values) - 1, round(fraction * len(values)) - 1))
+    return values[index]
+
+
+class RunHistoryStore:
+    """SQLite file holding the DAG runs and task instances of one Airflow instance.
+
+    The file remembers which Airflow it was filled from; opening it for a
+    different URL starts over with empty history.
+    """
+
+    def __init__(self, path: str | Path, airflow_url: str):
+        """Open (or create) the store.
+
+        Args:
+            path: SQLite file to use (":memory:" for a throwaway store)
+            airflow_url: Airflow instance whose history this store holds
+        """
+        self.path = str(path)
+        if self.path != ":memory:":
+            Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+        self._db = sqlite3.connect(self.path)
+        self._db.row_factory = sqlite3.Row
+        self._db.executescript(_SCHEMA)
+        row = self._db.execute("SELECT value FROM meta WHERE key = 'airflow_url'").fetchone()
+        if row is not None and row["value"] != airflow_url:
+            logger.info("Run history in %s is for %s; starting over", self.path, row["value"])
+            with self._db:
+                self._db.execute("DELETE FROM dag_runs")
+                self._db.execute("DELETE FROM task_instances")
+                self._db.execute("DELETE FROM watermarks")
+        with self._db:
+            self._db.execute(
+                "INSERT OR REPLACE INTO meta (key, value) VALUES ('airflow_url', ?)",
+                (airflow_url,),
+            )
+
+    def close(self) -> None:
+        self._db.close()
+
+    def watermark(self, dag_id: str) -> str | None:
+        """start_date_gte to use for the next sync of dag_id."""
+        row = self._db.execute(
+            "SELECT start_date_gte FROM watermarks WHERE dag_id = ?", (dag_id,)
+        ).fetchone()
+        return row["start_date_gte"] if row else None
+
+    def finished_run_ids(self, dag_id: str, dag_run_ids: Iterable[str]) -> set[str]:
+        """Which of dag_run_ids are already stored in a terminal state."""
+        ids = list(dag_run_ids)
+        if not ids:
+            return set()
+        placeholders = ",".join("?" * len(ids))
+        states = ",".join("?" * len(TERMINAL_DAG_RUN_STATES))
+        rows = self._db.execute(
+            f"SELECT dag_run_id FROM dag_runs WHERE dag_id = ? "  # nosec B608 - only "?" placeholders interpolated
+            f"AND dag_run_id IN ({placeholders}) AND state IN ({states})",
+            (dag_id, *ids, *sorted(TERMINAL_DAG_RUN_STATES)),
+        ).fetchall()
+        return {row["dag_run_id"] for row in rows}
+
+    def save_runs(self, dag_id: str, runs: list[dict[str, Any]], watermark: str) -> None:
+        """Upsert DAG runs and move the DAG's watermark, in one transaction."""
+        with self._db:
+            self._db.executemany(
+                "INSERT OR REPLACE INTO dag_runs VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                [
+                    (
+                        dag_id,
+                        run["dag_run_id"],
+                        run.get("state"),
+                        run.get("run_type"),
+                        run.get("logical_date") or run.get("execution_date"),
+                        run.get("start_date"),
+                        run.get("end_date"),
+                        _duration(run.get("start_date"), run.get("end_date")),
+                    )
+                    for run in runs
+                ],
+            )
+            self._db.execute(
+                "INSERT OR REPLACE INTO watermarks VALUES (?, ?, ?)",
+                (dag_id, watermark, time.time()),
+            )
+
+    def save_task_instances(self, task_instances: list[dict[str, Any]]) -> None:
+        """Upsert task instances."""
+        with self._db:
+            self._db.executemany(
+                "INSERT OR REPLACE INTO task_instances VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                [
+                    (
+                        ti["dag_id"],
+                        ti["dag_run_id"],
+                        ti["task_id"],
+                        -1 if ti.get("map_index") is None else ti["map_index"],
+                        ti.get("state"),
+                        ti.get("try_number"),
+                        ti.get("start_date"),
+                        ti.get("end_date"),
+                        ti.get("duration")
+                        if ti.get("duration") is not None
+                        else _duration(ti.get("start_date"), ti.get("end_date")),
+                    )
+                    for ti in task_instances
+                ],
+            )
+
+    @staticmethod
+    def _where(dag_id: str | None, since: str | None, until: str | None) -> tuple[str, list[Any]]:
+        clauses, params = ["1 = 1"], []
+        if dag_id:
+            clauses.append("dag_id = ?")
+            params.append(dag_id)
+        if since:
+            clauses.append("start_date >= ?")
+            params.append(since)
+        if until:
+            clauses.append("start_date < ?")
+            params.append(until)
+        return " AND ".join(clauses), params
+
+    def run_stats(
+        self, dag_id: str | None = None, since: str | None = None, until: str | None = None
+    ) -> list[dict[str, Any]]:
+        """Per-DAG run counts by state, failure rate and duration percentiles.
+
+        Args:
+            dag_id: Only this DAG (default: every DAG in the store)
+            since: Only runs that started at or after this ISO timestamp
+            until: Only runs that started before this ISO timestamp
+        """
+        where, params = self._where(dag_id, since, until)
+        rows = self._db.execute(
+            f"SELECT dag_id, dag_run_id, state, start_date, duration FROM dag_runs "  # nosec B608 - _where builds only constant clauses
+            f"WHERE {where} ORDER BY dag_id, start_date",
+            params,
+        ).fetchall()
+
+        by_dag: dict[str, list[sqlite3.Row]] = {}
+        for row in rows:
+            by_dag.setdefault(row["dag_id"], []).append(row)
+
+        stats = []
+        for dag, dag_rows in by_dag.items():
+            states: dict[str, int] = {}
+            for row in dag_rows:
+                states[row["state"]] = states.get(row["state"], 0) + 1
+            finished = sum(states.get(s, 0) for s in TERMINAL_DAG_RUN_STATES)
+            failures = [r for r in dag_rows if r["state"] == "failed"]
+            durations = sorted(r["duration"] for r in dag_rows if r["duration"] is not None)
+            entry: dict[str, Any] = {
+                "dag_id": dag,
+                "total_runs": len(dag_rows),
+                "states": states,
+                "failure_rate": round(len(failures) / finished, 4) if finished else None,
+                "first_run_start": dag_rows[0]["start_date"],
+                "last_run_start": dag_rows[-1]["start_date"],
+            }
+            if durations:
+                entry["duration_seconds"] = {
+                    "mean": round(statistics.fmean(durations), 2),
+                    "p50": round(_percentile(durations, 0.5), 2),
+                    "p95": round(_percentile(durations, 0.95), 2),
+                    "max": round(durations[-1], 2),
+                }
+            if failures:
+                entry["last_failure"] = {
+                    "dag_run_id": failures[-1]["dag_run_id"],
+                    "start_date": failures[-1]["start_date"],
+                }
+            stats.append(entry)
+        return stats
+
+    def task_failures(
+        self,
+        dag_id: str | None = None,
+        since: str | None = None,
+        until: str | None = None,
+        limit: int = 20,
+    ) -> list[dict[str, Any]]:
+        """Tasks that failed most often, with the number of runs they failed in."""
+        where, params = self._where(dag_id, since, until)
+        rows = self._db.execute(
+            f"SELECT dag_id, task_id, COUNT(DISTINCT dag_run_id) AS failures, "  # nosec B608 - _where builds only constant clauses
+            f"MAX(start_date) AS last_failure FROM task_instances "
+            f"WHERE state = 'failed' AND {where} "
+            f"GROUP BY dag_id, task_id ORDER BY failures DESC, dag_id, task_id LIMIT ?",
+            [*params, limit],
+        ).fetchall()
+        return [dict(row) for row in rows]
+
+    def status(self) -> dict[str, Any]:
+        """Size of the store and when it was last synced."""
+        runs = self._db.execute("SELECT COUNT(*) FROM dag_runs").fetchone()[0]
+        tis = self._db.execute("SELECT COUNT(*) FROM task_instances").fetchone()[0]
+        synced = self._db.execute(
+            "SELECT COUNT(*), MIN(synced_at), MAX(synced_at) FROM watermarks"
+        ).fetchone()
+        return {
+            "path": self.path,
+            "dag_runs": runs,
+            "task_instances": tis,
+            "dags_synced": synced[0],
+            "oldest_sync_age_seconds": round(time.time() - synced[1], 1) if synced[1] else None,
+        }
+
+
+async def _fetch_task_instances(
+    adapter: AsyncAirflowAdapter, dag_id: str, dag_run_ids: list[str]
+) -> list[dict[str, Any]]:
+    """Task instances of the given runs, batched when Airflow supports it."""
+    try:
+        data = await adapter.fetch_all(
+            adapter.list_task_instances_batch,
+            "task_instances",
+            dag_ids=[dag_id],
+            dag_run_ids=dag_run_ids,
+        )
+        return data.get("task_instances", [])
+    except Exception as e:
+        logger.debug("Batch task instance fetch failed (%s); fetching per run", e)
+    task_instances: list[dict[str, Any]] = []
+    for dag_run_id in dag_run_ids:
+        data = await adapter.fetch_all(
+            adapter.get_task_instances, "task_instances", dag_id=dag_id, dag_run_id=dag_run_id
+        )
+        task_instances.extend(
+            {"dag_id": dag_id, "dag_run_id": dag_run_id, **ti}
+            for ti in data.get("task_instances", [])
+        )
+    return task_instances
+
+
+async def sync_dag(
+    adapter: AsyncAirflowAdapter,
+    store: RunHistoryStore,
+    dag_id: str,
+    include_task_instances: bool = True,
+    history_days: int = DEFAULT_HISTORY_DAYS,
+) -> dict[str, int]:
+    """Sync one DAG's runs (and their task instances) started since its watermark.
+
+    Returns:
+        Counts of runs fetched and task instances stored
+    """
+    watermark = store.watermark(dag_id)
+    if watermark is None:
+        watermark = (datetime.now(timezone.utc) - timedelta(days=history_days)).isoformat()
+
+    data = await adapter.fetch_all(
+        adapter.list_dag_runs,
+        "dag_runs",
+        dag_id=dag_id,
+        start_date_gte=watermark,
+        order_by="start_date",
+    )
+    runs = [run for run in data.get("dag_runs", []) if run.get("dag_run_id")]
+
+    started = [run["start_date"] for run in runs if run.get("start_date")]
+    unfinished = [
+        run["start_date"]
+        for run in runs
+        if run.get("start_date") and run.get("state") not in TERMINAL_DAG_RUN_STATES
+    ]
+    # Re-read unfinished runs next time; otherwise continue from the newest run
+    next_watermark = min(unfinished) if unfinished else max(started, default=watermark)
+
+    newly_finished: list[str] = []
+    if include_task_instances:
+        finished = [r["dag_run_id"] for r in runs if r.get("state") in TERMINAL_DAG_RUN_STATES]
+        known = store.finished_run_ids(dag_id, finished)
+        newly_finished = [run_id for run_id in finished if run_id not in known]
+
+    task_instances: list[dict[str, Any]] = []
+    if newly_finished:
+        task_instances = await _fetch_task_instances(adapter, dag_id, newly_finished)
+        store.save_task_instances(task_instances)
+    # Saved last so a failed sync is simply retried from the old watermark
+    store.save_runs(dag_id, runs, next_watermark)
+    return {"dag_runs": len(runs), "task_instances": len(task_instances)}
+
+
+async def sync_run_history(
+    adapter: AsyncAirflowAdapter,
+    store: RunHistoryStore,
+    dag_ids: list[str] | None = None,
+    include_task_instances: bool = True,
+    history_days: int = DEFAULT_HISTORY_DAYS,
+    max_concurrency: int = DEFAULT_SYNC_CONCURRENCY,
+) -> dict[str, Any]:
+    """Sync the given DAGs (default: every DAG), several at a time.
+
+    Returns:
+        Totals of runs and task instances fetched, plus per-DAG errors
+    """
+    if dag_ids is None:
+        dags = await adapter.fetch_all(adapter.list_dags, "dags")
+        dag_ids = [dag["dag_id"] for dag in dags.get("dags", [])]
+
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def _sync(dag_id: str) -> dict[str, int]:
+        async with semaphore:
+            return await sync_dag(adapter, store, dag_id, include_task_instances, history_days)
+
+    results = await asyncio.gather(*(_sync(d) for d in dag_ids), return_exceptions=True)
+    summary: dict[str, Any] = {"dags": len(dag_ids), "dag_runs": 0, "task_instances": 0}
+    errors = []
+    for dag_id, result in zip(dag_ids, results, strict=True):
+        if isinstance(result, BaseException):
+            errors.append({"dag_id": dag_id, "error": str(result)})
+            continue
+        summary["dag_runs"] += result["dag_runs"]
+        summary["task_instances"] += result["task_instances"]
+    if errors:
+        summary["errors"] = errors
+    return summary
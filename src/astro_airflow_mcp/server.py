@@ -1,26 +1,71 @@
 """FastMCP server for Airflow integration."""
 
+import asyncio
+import base64
 import json
+import re
+import threading
 import time
+from collections.abc import AsyncIterator, Awaitable, Sequence
+from contextlib import aclosing, asynccontextmanager
+from dataclasses import asdict
 from typing import Any
 
 import httpx
-from fastmcp import FastMCP
-from fastmcp.server.middleware.logging import LoggingMiddleware
-
-from astro_airflow_mcp.adapters import AirflowAdapter, create_adapter
+from fastmcp import Context, FastMCP
+
+from astro_airflow_mcp import run_history, task_logs, tracing
+from astro_airflow_mcp.adapters import AsyncAirflowAdapter, ResponseCache, create_async_adapter
+from astro_airflow_mcp.adapters.base import (
+    DEFAULT_KEEPALIVE_EXPIRY_SECONDS,
+    DEFAULT_MAX_CONNECTIONS,
+    DEFAULT_MAX_KEEPALIVE_CONNECTIONS,
+)
+from astro_airflow_mcp.adapters.cache import DEFAULT_CACHE_MAX_ENTRIES
+from astro_airflow_mcp.adapters.version_cache import parse_major_version
+from astro_airflow_mcp.dag_index import DagIndex
 from astro_airflow_mcp.logging import get_logger
+from astro_airflow_mcp.metrics import (
+    METRICS_AVAILABLE,
+    MetricsMiddleware,
+    metrics_endpoint,
+    record_token_refresh,
+)
+from astro_airflow_mcp.middleware import ToolTimingMiddleware
+from astro_airflow_mcp.models import DAGInfo, DAGRun, TaskInfo, TaskInstance
+from astro_airflow_mcp.polling import PollSchedule, RunStatePoller, expected_run_duration
+from astro_airflow_mcp.run_history import RunHistoryStore
+from astro_airflow_mcp.task_logs import DEFAULT_LOG_TAIL_BYTES
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional fast path
+    orjson = None  # type: ignore[assignment]
 
 logger = get_logger(__name__)
 
 # Default configuration values
 DEFAULT_AIRFLOW_URL = "http://localhost:8080"
-DEFAULT_LIMIT = 100
 DEFAULT_OFFSET = 0
 # Buffer time before token expiry to trigger refresh (5 minutes)
 TOKEN_REFRESH_BUFFER_SECONDS = 300
-# Terminal states for DAG runs (polling stops when reached)
-TERMINAL_DAG_RUN_STATES = {"success", "failed", "upstream_failed"}
+# Upper bound for each sub-request issued by the consolidated tools
+SUBREQUEST_TIMEOUT_SECONDS = 30.0
+# Supported tool output formats: compact saves tokens, pretty is easier to read
+OUTPUT_FORMATS = ("compact", "pretty")
+DEFAULT_OUTPUT_FORMAT = "compact"
+# Pass as the only entry of a tool's `fields` argument to get every field
+ALL_FIELDS = "*"
+# How many DAG runs trigger_dags_and_wait triggers at the same time by default
+DEFAULT_TRIGGER_CONCURRENCY = 5
+# Task logs read at the same time by search_dag_run_logs and diagnose_dag_run
+DEFAULT_LOG_CONCURRENCY = 5
+# Matches returned by search_dag_run_logs by default
+DEFAULT_LOG_SEARCH_MAX_MATCHES = 50
+# Size cap for each failed task's log summary attached by diagnose_dag_run
+DEFAULT_DIAGNOSE_LOG_BYTES = 8 * 1024
+# How diagnose_dag_run summarizes failed task logs
+DIAGNOSE_LOG_MODES = ("digest", "tail")
 
 
 class AirflowTokenManager:
@@ -32,6 +77,12 @@ class AirflowTokenManager:
 
     For Airflow 2.x (which doesn't have /auth/token), this manager will detect
     the 404 and stop attempting token fetches, falling back to basic auth.
+
+    Safe to share between concurrent tool calls: refreshes are single-flight
+    (one fetch, other callers wait for it), and a token that is close to expiry
+    but still valid is refreshed on a background thread while callers keep
+    using it. On the event loop, use aget_token so a blocking fetch runs in a
+    worker thread instead.
     """
 
     def __init__(
@@ -56,10 +107,19 @@ class AirflowTokenManager:
         self._token_lifetime_seconds: float = 1800
         # Track if token endpoint is available (False for Airflow 2.x)
         self._token_endpoint_available: bool | None = None
+        # Serializes fetches so concurrent callers share a single refresh
+        self._refresh_lock = threading.Lock()
+        # Guards starting the background refresh thread; never held during a fetch,
+        # so callers with a still-valid token do not wait on _refresh_lock
+        self._background_lock = threading.Lock()
+        self._background_refresh: threading.Thread | None = None
 
     def get_token(self) -> str | None:
         """Get current token, fetching/refreshing if needed.
 
+        Only blocks when there is no usable token. A token inside the refresh
+        buffer is returned immediately while a background refresh replaces it.
+
         Returns:
             JWT token string, or None if token fetch fails or endpoint unavailable
         """
@@ -67,7 +127,32 @@ class AirflowTokenManager:
         if self._token_endpoint_available is False:
             return None
         if self._should_refresh():
-            self._fetch_token()
+            if self._is_expired():
+                self._refresh()
+            else:
+                token = self._token
+                self._start_background_refresh()
+                return token
+        return self._token
+
+    async def aget_token(self) -> str | None:
+        """Get current token like get_token, without blocking the event loop.
+
+        When there is no usable token, the fetch runs in a worker thread so
+        other tool calls keep running while it is in flight.
+
+        Returns:
+            JWT token string, or None if token fetch fails or endpoint unavailable
+        """
+        if self._token_endpoint_available is False:
+            return None
+        if self._should_refresh():
+            if self._is_expired():
+                await asyncio.to_thread(self._refresh)
+            else:
+                token = self._token
+                self._start_background_refresh()
+                return token
         return self._token
 
     def get_basic_auth(self) -> tuple[str, str] | None:
@@ -99,9 +184,48 @@ class AirflowTokenManager:
             return True
         if self._token_fetched_at is None:
             return True
-        # Refresh if we're within the buffer time of expiry
+        # Refresh if we're within the buffer time of expiry (at most half the
+        # lifetime, so short-lived tokens aren't refreshed on every call)
+        buffer = min(TOKEN_REFRESH_BUFFER_SECONDS, self._token_lifetime_seconds / 2)
         elapsed = time.time() - self._token_fetched_at
-        return elapsed >= (self._token_lifetime_seconds - TOKEN_REFRESH_BUFFER_SECONDS)
+        return elapsed >= (self._token_lifetime_seconds - buffer)
+
+    def _is_expired(self) -> bool:
+        """Check if there is no token or the current token can no longer be used."""
+        if self._token is None or self._token_fetched_at is None:
+            return True
+        return time.time() - self._token_fetched_at >= self._token_lifetime_seconds
+
+    def _refresh(self) -> None:
+        """Fetch a new token unless another caller already refreshed it (single-flight)."""
+        with self._refresh_lock:
+            if self._should_refresh():
+                with tracing.span("airflow token fetch"):
+                    self._fetch_token()
+
+    def _start_background_refresh(self) -> None:
+        """Refresh the token on a daemon thread if no refresh is already running."""
+        with self._background_lock:
+            if self._background_refresh is not None and self._background_refresh.is_alive():
+                return
+            self._background_refresh = threading.Thread(
+                target=self._refresh, name="airflow-token-refresh", daemon=True
+            )
+            self._background_refresh.start()
+
+    @staticmethod
+    def _jwt_lifetime_seconds(token: str) -> float | None:
+        """Read the remaining lifetime from a JWT's 'exp' claim (no signature check).
+
+        Returns:
+            Seconds until expiry, or None if the token is not a JWT with an 'exp' claim
+        """
+        try:
+            payload = token.split(".")[1]
+            claims = json.loads(base64.urlsafe_b64decode(payload + "=" * (-len(payload) % 4)))
+            return max(0.0, float(claims["exp"]) - time.time())
+        except (IndexError, KeyError, TypeError, ValueError):
+            return None
 
     def _fetch_token(self) -> None:
         """Fetch new token from /auth/token endpoint.
@@ -131,6 +255,7 @@ class AirflowTokenManager:
 
             # Check for 404 - indicates Airflow 2.x without token endpoint
             if response.status_code == 404:
+                record_token_refresh("unavailable")
                 self._token_endpoint_available = False
                 self._token = None
                 # Default to admin:admin for Airflow 2.x if no credentials provided
@@ -157,17 +282,26 @@ class AirflowTokenManager:
                 self._token = data["access_token"]
                 self._token_fetched_at = time.time()
                 self._token_endpoint_available = True
-                # Use expires_in if provided, otherwise keep default
+                record_token_refresh("success")
+                # Use expires_in if provided, then the JWT exp claim, otherwise keep default
                 if "expires_in" in data:
                     self._token_lifetime_seconds = float(data["expires_in"])
+                else:
+                    lifetime = self._jwt_lifetime_seconds(self._token)
+                    if lifetime is not None:
+                        self._token_lifetime_seconds = lifetime
                 logger.info("Successfully fetched Airflow API token")
             else:
                 logger.warning("Unexpected token response format: %s", data)
+                record_token_refresh("failure")
                 self._token = None
 
         except httpx.RequestError as e:
+            record_token_refresh("failure")
             logger.warning("Failed to fetch token from %s: %s", token_url, e)
-            self._token = None
+            # Keep a still-valid token if a proactive refresh failed
+            if self._is_expired():
+                self._token = None
 
     def invalidate(self) -> None:
         """Force token refresh on next request."""
@@ -175,6 +309,21 @@ class AirflowTokenManager:
         self._token_fetched_at = None
 
 
+@asynccontextmanager
+async def _server_lifespan(_server: FastMCP) -> AsyncIterator[dict[str, Any]]:
+    """Release the adapter's pooled HTTP connections when the server shuts down."""
+    global _adapter
+    try:
+        yield {}
+    finally:
+        await _run_poller.close()
+        await _dag_index.close()
+        _close_run_history()
+        adapter, _adapter = _adapter, None
+        if adapter is not None:
+            await adapter.aclose()
+
+
 # Create MCP server
 mcp = FastMCP(
     "Airflow MCP Server",
@@ -193,10 +342,19 @@ mcp = FastMCP(
     use these tools to provide detailed, accurate information directly from the
     Airflow instance.
     """,
+    lifespan=_server_lifespan,
 )
 
-# Add logging middleware to log all MCP tool calls
-mcp.add_middleware(LoggingMiddleware(include_payloads=True))
+# Log every tool call's timing; payloads only when sampled or slow (see configure)
+_timing_middleware = ToolTimingMiddleware()
+mcp.add_middleware(_timing_middleware)
+# Spans per tool call; a pass-through until configure() enables tracing
+mcp.add_middleware(tracing.TracingMiddleware())
+if METRICS_AVAILABLE:
+    mcp.add_middleware(MetricsMiddleware())
+
+# Prometheus scrape endpoint (HTTP transport; the plugin mounts it at /mcp/metrics)
+mcp.custom_route("/metrics", methods=["GET"])(metrics_endpoint)
 
 
 # Global configuration for Airflow API access
@@ -208,39 +366,109 @@ class AirflowConfig:
         self.auth_token: str | None = None
         self.token_manager: AirflowTokenManager | None = None
         self.project_dir: str | None = None
+        self.http_limits: httpx.Limits | None = None
+        self.http2: bool = False
+        self.response_cache: bool = True
+        self.cache_max_entries: int = DEFAULT_CACHE_MAX_ENTRIES
+        self.airflow_version: str | None = None
+        self.version_cache_file: str | None = None
+        self.run_history_db: str | None = None
+        self.output_format: str = DEFAULT_OUTPUT_FORMAT
 
 
 _config = AirflowConfig()
 
 # Global adapter instance (lazy-initialized)
-_adapter: AirflowAdapter | None = None
+_adapter: AsyncAirflowAdapter | None = None
+# Strong references to in-flight adapter close tasks (see _reset_adapter)
+_background_tasks: set[asyncio.Task[None]] = set()
 
 
-def _get_adapter() -> AirflowAdapter:
+async def _get_adapter() -> AsyncAirflowAdapter:
     """Get or create the global adapter instance.
 
     The adapter is lazy-initialized on first use and will automatically
     detect the Airflow version and create the appropriate adapter type.
 
     Returns:
-        Version-specific AirflowAdapter instance
+        Version-specific AsyncAirflowAdapter instance
     """
     global _adapter
     if _adapter is None:
         logger.info("Initializing adapter for %s", _config.url)
-        _adapter = create_adapter(
+        _adapter = await create_async_adapter(
             airflow_url=_config.url,
-            token_getter=_get_auth_token,
+            token_getter=_aget_auth_token,
             basic_auth_getter=_get_basic_auth,
+            limits=_config.http_limits,
+            http2=_config.http2,
+            cache=(
+                ResponseCache(max_entries=_config.cache_max_entries)
+                if _config.response_cache
+                else None
+            ),
+            airflow_version=_config.airflow_version,
+            version_cache_file=_config.version_cache_file,
+            on_unauthorized=_invalidate_token,
         )
         logger.info("Created adapter for Airflow %s", _adapter.version)
     return _adapter
 
 
+# Shared by every trigger_dag_and_wait call so concurrent waits cost one batched
+# query per tick. The lambda looks _get_adapter up on each call.
+_run_poller = RunStatePoller(lambda: _get_adapter())
+# Metadata index behind search_dags, crawled in the background once first used
+_dag_index = DagIndex(lambda: _get_adapter())
+# Local run history behind the history tools (opened on first use if configured)
+_run_history: RunHistoryStore | None = None
+
+
+def _get_run_history() -> RunHistoryStore:
+    """Get or open the run history store.
+
+    Raises:
+        ValueError: If no run history database is configured
+    """
+    global _run_history
+    if _config.run_history_db is None:
+        raise ValueError(
+            "Run history is not enabled. Start the server with --run-history-db PATH "
+            "(or set AIRFLOW_RUN_HISTORY_DB) to keep a local, incrementally synced history."
+        )
+    if _run_history is None:
+        _run_history = RunHistoryStore(_config.run_history_db, _config.url)
+    return _run_history
+
+
+def _close_run_history() -> None:
+    global _run_history
+    store, _run_history = _run_history, None
+    if store is not None:
+        store.close()
+
+
 def _reset_adapter() -> None:
-    """Reset the global adapter (e.g., when config changes)."""
+    """Reset the global adapter (e.g., when config changes).
+
+    Closes the adapter's pooled HTTP client so its connections are released.
+    When called from inside a running event loop the close is scheduled as a
+    task; otherwise the client is simply dropped along with the adapter.
+    """
     global _adapter
-    _adapter = None
+    adapter, _adapter = _adapter, None
+    # The index may describe a different Airflow from now on
+    _dag_index.clear()
+    _close_run_history()
+    if adapter is None:
+        return
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        return
+    task = loop.create_task(adapter.aclose())
+    _background_tasks.add(task)
+    task.add_done_callback(_background_tasks.discard)
 
 
 def configure(
@@ -249,6 +477,19 @@ def configure(
     username: str | None = None,
     password: str | None = None,
     project_dir: str | None = None,
+    max_connections: int | None = None,
+    max_keepalive_connections: int | None = None,
+    keepalive_expiry: float | None = None,
+    http2: bool | None = None,
+    response_cache: bool | None = None,
+    cache_max_entries: int | None = None,
+    airflow_version: str | None = None,
+    version_cache_file: str | None = None,
+    run_history_db: str | None = None,
+    output_format: str | None = None,
+    log_sample_rate: float | None = None,
+    log_slow_call_seconds: float | None = None,
+    trace_exporter: str | None = None,
 ) -> None:
     """Configure global Airflow connection settings.
 
@@ -258,6 +499,19 @@ def configure(
         username: Username for token-based authentication
         password: Password for token-based authentication
         project_dir: Project directory where Claude Code is running
+        max_connections: Maximum connections in the adapter's HTTP pool
+        max_keepalive_connections: Maximum idle keep-alive connections kept in the pool
+        keepalive_expiry: Seconds an idle keep-alive connection is kept open
+        http2: Whether to negotiate HTTP/2 with the Airflow API (requires 'h2')
+        response_cache: Whether to cache read-only API responses in memory
+        cache_max_entries: Maximum number of cached responses (LRU eviction)
+        airflow_version: Known Airflow version (e.g. "3.1.3"); skips version detection
+        version_cache_file: JSON file persisting detected versions across restarts
+        run_history_db: SQLite file for the locally synced DAG run history
+        output_format: Tool output JSON format, "compact" (default) or "pretty"
+        log_sample_rate: Fraction of tool calls whose (truncated) payloads are logged
+        log_slow_call_seconds: Tool calls at least this slow always log their payloads
+        trace_exporter: OpenTelemetry span exporter, "console", "otlp" or "none"
 
     Note:
         If auth_token is provided, it will be used directly.
@@ -269,6 +523,53 @@ def configure(
         _config.project_dir = project_dir
     if url:
         _config.url = url
+    if max_connections is not None and max_connections < 1:
+        raise ValueError(f"Invalid max connections {max_connections}; expected at least 1")
+    if (
+        max_connections is not None
+        or max_keepalive_connections is not None
+        or keepalive_expiry is not None
+    ):
+        _config.http_limits = httpx.Limits(
+            max_connections=(
+                DEFAULT_MAX_CONNECTIONS if max_connections is None else max_connections
+            ),
+            max_keepalive_connections=(
+                DEFAULT_MAX_KEEPALIVE_CONNECTIONS
+                if max_keepalive_connections is None
+                else max_keepalive_connections
+            ),
+            keepalive_expiry=(
+                DEFAULT_KEEPALIVE_EXPIRY_SECONDS if keepalive_expiry is None else keepalive_expiry
+            ),
+        )
+    if http2 is not None:
+        _config.http2 = http2
+    if response_cache is not None:
+        _config.response_cache = response_cache
+    if cache_max_entries is not None:
+        _config.cache_max_entries = cache_max_entries
+    if airflow_version:
+        parse_major_version(airflow_version)  # Fail fast on an invalid override
+        _config.airflow_version = airflow_version
+    if version_cache_file:
+        _config.version_cache_file = version_cache_file
+    if run_history_db:
+        _config.run_history_db = run_history_db
+    if output_format:
+        if output_format not in OUTPUT_FORMATS:
+            raise ValueError(
+                f"Invalid output format {output_format!r}; expected one of {OUTPUT_FORMATS}"
+            )
+        _config.output_format = output_format
+    if log_sample_rate is not None:
+        if not 0 <= log_sample_rate <= 1:
+            raise ValueError(f"Invalid log sample rate {log_sample_rate}; expected 0 to 1")
+        _timing_middleware.sample_rate = log_sample_rate
+    if log_slow_call_seconds is not None:
+        _timing_middleware.slow_call_seconds = log_slow_call_seconds
+    if trace_exporter:
+        tracing.configure_tracing(trace_exporter)
     if auth_token:
         # Direct token takes precedence - no token manager needed
         _config.auth_token = auth_token
@@ -309,6 +610,15 @@ def _get_auth_token() -> str | None:
     return None
 
 
+async def _aget_auth_token() -> str | None:
+    """Get the current authentication token without blocking the event loop."""
+    if _config.auth_token:
+        return _config.auth_token
+    if _config.token_manager:
+        return await _config.token_manager.aget_token()
+    return None
+
+
 def _get_basic_auth() -> tuple[str, str] | None:
     """Get basic auth credentials for Airflow 2.x fallback.
 
@@ -335,14 +645,93 @@ def _invalidate_token() -> None:
         _config.token_manager.invalidate()
 
 
+async def _gather_partial(*aws: Awaitable[Any]) -> list[Any]:
+    """Run independent adapter calls concurrently for the consolidated tools.
+
+    Each call is bounded by SUBREQUEST_TIMEOUT_SECONDS. Failures (including
+    timeouts) are returned in place of the result so callers can report
+    partial data instead of failing the whole tool.
+
+    Returns:
+        Results or exceptions, in the same order as the awaitables
+    """
+
+    async def _bounded(aw: Awaitable[Any]) -> Any:
+        try:
+            return await asyncio.wait_for(aw, SUBREQUEST_TIMEOUT_SECONDS)
+        except asyncio.TimeoutError as e:
+            raise TimeoutError(
+                f"Request timed out after {SUBREQUEST_TIMEOUT_SECONDS} seconds"
+            ) from e
+
+    return await asyncio.gather(*(_bounded(aw) for aw in aws), return_exceptions=True)
+
+
 # Helper functions for response formatting
-def _wrap_list_response(items: list[dict[str, Any]], key_name: str, data: dict[str, Any]) -> str:
+def _to_json(data: Any) -> str:
+    """Serialize tool output using the configured output format.
+
+    All tool and resource output goes through this helper. Uses orjson when it
+    is installed, falling back to the standard library for anything orjson
+    cannot encode (e.g. non-string dict keys).
+
+    Args:
+        data: JSON-serializable data
+
+    Returns:
+        JSON string, compact or indented depending on _config.output_format
+    """
+    with tracing.span("serialize") as current:
+        text = _serialize(data, pretty=_config.output_format == "pretty")
+        tracing.set_attributes(current, **{"output.size": len(text)})
+    return text
+
+
+def _serialize(data: Any, pretty: bool) -> str:
+    if orjson is not None:
+        try:
+            return orjson.dumps(data, option=orjson.OPT_INDENT_2 if pretty else 0).decode()
+        except TypeError:
+            pass
+    if pretty:
+        return json.dumps(data, indent=2, ensure_ascii=False)
+    return json.dumps(data, separators=(",", ":"), ensure_ascii=False)
+
+
+def _project(item: dict[str, Any], fields: Sequence[str] | None) -> dict[str, Any]:
+    """Keep only the requested top-level fields of an API object.
+
+    Args:
+        item: Object returned by the API
+        fields: Field names to keep; None or a list containing ALL_FIELDS keeps
+            everything. Fields the object does not have are ignored.
+
+    Returns:
+        The projected object
+    """
+    if not fields or ALL_FIELDS in fields:
+        return item
+    return {field: item[field] for field in fields if field in item}
+
+
+def _api_filters(**filters: Any) -> dict[str, Any]:
+    """Collect the list filters a tool was called with, dropping unset (None) ones."""
+    return {name: value for name, value in filters.items() if value is not None}
+
+
+def _wrap_list_response(
+    items: list[dict[str, Any]],
+    key_name: str,
+    data: dict[str, Any],
+    fields: Sequence[str] | None = None,
+) -> str:
     """Wrap API list response with pagination metadata.
 
     Args:
         items: List of items from the API
         key_name: Name for the items key in response (e.g., 'dags', 'dag_runs')
         data: Original API response data (for total_entries)
+        fields: Optional field names to project each item down to
 
     Returns:
         JSON string with pagination metadata
@@ -352,30 +741,31 @@ def _wrap_list_response(items: list[dict[str, Any]], key_name: str, data: dict[s
     result: dict[str, Any] = {
         f"total_{key_name}": total_entries,
         "returned_count": len(items),
-        key_name: items,
+        key_name: [_project(item, fields) for item in items],
     }
-    return json.dumps(result, indent=2)
+    return _to_json(result)
 
 
-def _get_dag_details_impl(dag_id: str) -> str:
+async def _get_dag_details_impl(dag_id: str, fields: list[str] | None = None) -> str:
     """Internal implementation for getting details about a specific DAG.
 
     Args:
         dag_id: The ID of the DAG to get details for
+        fields: Fields to return (default: all)
 
     Returns:
         JSON string containing the DAG details
     """
     try:
-        adapter = _get_adapter()
-        data = adapter.get_dag(dag_id)
-        return json.dumps(data, indent=2)
+        adapter = await _get_adapter()
+        data = await adapter.get_dag(dag_id)
+        return _to_json(_project(data, fields))
     except Exception as e:
         return str(e)
 
 
 @mcp.tool()
-def get_dag_details(dag_id: str) -> str:
+async def get_dag_details(dag_id: str, fields: list[str] | None = None) -> str:
     """Get detailed information about a specific Apache Airflow DAG.
 
     Use this tool when the user asks about:
@@ -405,39 +795,72 @@ def get_dag_details(dag_id: str) -> str:
 
     Args:
         dag_id: The ID of the DAG to get details for
+        fields: Only return these fields (default: all)
 
     Returns:
         JSON with complete details about the specified DAG
     """
-    return _get_dag_details_impl(dag_id=dag_id)
+    return await _get_dag_details_impl(dag_id=dag_id, fields=fields)
 
 
-def _list_dags_impl(
-    limit: int = DEFAULT_LIMIT,
+async def _list_dags_impl(
+    limit: int | None = None,
     offset: int = DEFAULT_OFFSET,
+    fields: list[str] | None = None,
+    dag_id_pattern: str | None = None,
+    tags: list[str] | None = None,
+    paused: bool | None = None,
+    only_active: bool | None = None,
+    order_by: str | None = None,
 ) -> str:
     """Internal implementation for listing DAGs from Airflow.
 
+    Filters are sent to Airflow so matching happens in its database.
+
     Args:
-        limit: Maximum number of DAGs to return (default: 100)
+        limit: Maximum number of DAGs to return (default: all)
         offset: Offset for pagination (default: 0)
+        fields: Fields to return for each DAG (default: DAGInfo.summary_fields)
+        dag_id_pattern: SQL LIKE pattern DAG IDs must match (e.g. "%etl%")
+        tags: Only DAGs with any of these tags
+        paused: Only paused (True) or unpaused (False) DAGs
+        only_active: Only DAGs whose files are still present (default: Airflow's)
+        order_by: Field to sort by, prefixed with '-' for descending
 
     Returns:
         JSON string containing the list of DAGs with their metadata
     """
     try:
-        adapter = _get_adapter()
-        data = adapter.list_dags(limit=limit, offset=offset)
+        adapter = await _get_adapter()
+        filters = _api_filters(
+            dag_id_pattern=dag_id_pattern,
+            tags=tags,
+            paused=paused,
+            only_active=only_active,
+            order_by=order_by,
+        )
+        data = await adapter.fetch_all(
+            adapter.list_dags, "dags", max_items=limit, offset=offset, **filters
+        )
 
         if "dags" in data:
-            return _wrap_list_response(data["dags"], "dags", data)
+            return _wrap_list_response(data["dags"], "dags", data, fields or DAGInfo.summary_fields)
         return f"No DAGs found. Response: {data}"
     except Exception as e:
         return str(e)
 
 
 @mcp.tool()
-def list_dags() -> str:
+async def list_dags(
+    dag_id_pattern: str | None = None,
+    tags: list[str] | None = None,
+    paused: bool | None = None,
+    only_active: bool | None = None,
+    order_by: str | None = None,
+    limit: int | None = None,
+    offset: int = DEFAULT_OFFSET,
+    fields: list[str] | None = None,
+) -> str:
     """Get information about all Apache Airflow DAGs (Directed Acyclic Graphs).
 
     Use this tool when the user asks about:
@@ -447,23 +870,266 @@ def list_dags() -> str:
     - DAG schedules, descriptions, or tags
     - Finding a specific DAG by name
 
-    Returns comprehensive DAG metadata including:
+    Prefer the filter arguments over listing everything: they are applied by
+    Airflow, so only matching DAGs are transferred.
+
+    Returns a summary of each DAG by default:
     - dag_id: Unique identifier for the DAG
     - is_paused: Whether the DAG is currently paused
-    - is_active: Whether the DAG is active
-    - schedule_interval: How often the DAG runs
-    - description: Human-readable description
+    - is_active (Airflow 2) / is_stale (Airflow 3): Whether the DAG file is still present
+    - schedule_interval / timetable_summary: How often the DAG runs
     - tags: Labels/categories for the DAG
     - owners: Who maintains the DAG
-    - file_token: Location of the DAG file
+    - has_import_errors: Whether the DAG file failed to parse
+    - next_dagrun: When the next run is scheduled
+
+    Request other fields such as description or fileloc with `fields`.
+
+    Args:
+        dag_id_pattern: SQL LIKE pattern for DAG IDs, e.g. "%etl%" (use % as wildcard)
+        tags: Only return DAGs having any of these tags
+        paused: True for only paused DAGs, False for only unpaused DAGs
+        only_active: True to hide DAGs whose files were removed (Airflow default)
+        order_by: Sort field, prefix with '-' for descending (e.g. "-dag_id")
+        limit: Maximum number of DAGs to return (default: all matching DAGs)
+        offset: Number of matching DAGs to skip (default: 0)
+        fields: Fields to return for each DAG, e.g. ["dag_id", "is_paused"].
+            Defaults to a compact summary (dag_id, dag_display_name, is_paused,
+            is_active/is_stale, owners, tags, schedule, has_import_errors, next_dagrun).
+            Pass ["*"] for every field.
 
     Returns:
-        JSON with list of all DAGs and their complete metadata
+        JSON with list of all DAGs and their metadata
+    """
+    return await _list_dags_impl(
+        limit=limit,
+        offset=offset,
+        fields=fields,
+        dag_id_pattern=dag_id_pattern,
+        tags=tags,
+        paused=paused,
+        only_active=only_active,
+        order_by=order_by,
+    )
+
+
+async def _search_dags_impl(
+    query: str = "",
+    owner: str | None = None,
+    tag: str | None = None,
+    operator: str | None = None,
+    limit: int = 50,
+    refresh: bool = False,
+) -> str:
+    """Internal implementation for searching the local DAG metadata index.
+
+    Args:
+        query: Words to match against DAG ids, descriptions, owners, tags,
+            task ids and operator names
+        owner: Only DAGs with a matching owner
+        tag: Only DAGs with a matching tag
+        operator: Only DAGs with a task using a matching operator class
+        limit: Maximum number of DAGs to return
+        refresh: Bring the index up to date before searching
+
+    Returns:
+        JSON string with matching DAGs and the index status
     """
-    return _list_dags_impl()
+    try:
+        if refresh:
+            await _dag_index.refresh()
+        await _dag_index.ensure_ready()
+        result = _dag_index.search(query, owner=owner, tag=tag, operator=operator, limit=limit)
+        result["index"] = _dag_index.status()
+        return _to_json(result)
+    except Exception as e:
+        return str(e)
+
+
+@mcp.tool()
+async def search_dags(
+    query: str = "",
+    owner: str | None = None,
+    tag: str | None = None,
+    operator: str | None = None,
+    limit: int = 50,
+    refresh: bool = False,
+) -> str:
+    """Search DAGs by name, owner, tag, task id or operator class.
+
+    Use this tool when the user asks about:
+    - "Which DAGs use KubernetesPodOperator?" or "What uses the S3 hook?"
+    - "Which DAGs are owned by team X?" or "Show DAGs tagged finance"
+    - "Which DAG has a task called load_customers?"
+    - Finding DAGs by anything other than an exact dag_id
+
+    Answers come from a local index of DAG and task metadata, so one call
+    replaces listing the tasks of every DAG. The index is built on first use
+    (which can take a while on large instances) and refreshed in the
+    background; only DAGs re-parsed since the last refresh are re-read.
+
+    Query words match the start of words in DAG ids, display names,
+    descriptions, owners, tags, task ids and operator names; every word must
+    match. Filters only match their own field.
+
+    Returns for each matching DAG:
+    - dag_id, dag_display_name, is_paused, owners, tags, last_parsed_time
+    - matching_tasks: Tasks whose id or operator matched (task_id, operator)
+
+    Args:
+        query: Free-text words, e.g. "customer load" (default: match all DAGs)
+        owner: Only DAGs with this owner, e.g. "data-team"
+        tag: Only DAGs with this tag, e.g. "finance"
+        operator: Only DAGs with a task using this operator, e.g. "KubernetesPodOperator"
+        limit: Maximum number of DAGs to return (default: 50)
+        refresh: Refresh the index before searching, e.g. right after a deploy (default: False)
+
+    Returns:
+        JSON with matching DAGs, total_matches, and the index size and age
+    """
+    return await _search_dags_impl(
+        query=query, owner=owner, tag=tag, operator=operator, limit=limit, refresh=refresh
+    )
+
+
+async def _sync_run_history_impl(
+    dag_ids: list[str] | None = None,
+    include_task_instances: bool = True,
+) -> str:
+    """Internal implementation for syncing the local run history.
+
+    Args:
+        dag_ids: DAGs to sync (default: every DAG)
+        include_task_instances: Also store task instances of finished runs
+
+    Returns:
+        JSON string with the number of runs and task instances fetched
+    """
+    try:
+        store = _get_run_history()
+        adapter = await _get_adapter()
+        result = await run_history.sync_run_history(
+            adapter, store, dag_ids=dag_ids, include_task_instances=include_task_instances
+        )
+        result["store"] = store.status()
+        return _to_json(result)
+    except Exception as e:
+        return str(e)
+
+
+@mcp.tool()
+async def sync_run_history(
+    dag_ids: list[str] | None = None,
+    include_task_instances: bool = True,
+) -> str:
+    """Bring the local DAG run history up to date with Airflow.
+
+    Use this tool when the user asks about:
+    - Preparing history for trend questions across many DAGs
+    - "Refresh the run history"
+
+    Only runs started since each DAG's last sync (or still running then)
+    are fetched, so repeated syncs are cheap. The first sync of a DAG reads
+    the last 30 days. get_run_history syncs the DAGs it reports on by
+    itself; call this to warm the store for every DAG at once.
+
+    Requires the server to be started with --run-history-db.
+
+    Args:
+        dag_ids: DAGs to sync (default: every DAG)
+        include_task_instances: Also store the task instances of finished runs,
+            needed for per-task failure counts (default: True)
+
+    Returns:
+        JSON with the number of DAGs synced, runs and task instances fetched,
+        per-DAG errors, and the size of the store
+    """
+    return await _sync_run_history_impl(
+        dag_ids=dag_ids, include_task_instances=include_task_instances
+    )
 
 
-def _get_dag_source_impl(dag_id: str) -> str:
+async def _get_run_history_impl(
+    dag_id: str | None = None,
+    since: str | None = None,
+    until: str | None = None,
+    sync: bool = True,
+    max_tasks: int = 20,
+) -> str:
+    """Internal implementation for summarizing the local run history.
+
+    Args:
+        dag_id: Only this DAG (default: every DAG in the store)
+        since: Only runs started at or after this ISO timestamp
+        until: Only runs started before this ISO timestamp
+        sync: Sync the reported DAGs incrementally first
+        max_tasks: Maximum number of most-failing tasks to return
+
+    Returns:
+        JSON string with per-DAG run statistics and the most-failing tasks
+    """
+    try:
+        store = _get_run_history()
+        result: dict[str, Any] = {}
+        if sync:
+            adapter = await _get_adapter()
+            result["sync"] = await run_history.sync_run_history(
+                adapter, store, dag_ids=[dag_id] if dag_id else None
+            )
+        result["dags"] = store.run_stats(dag_id=dag_id, since=since, until=until)
+        result["most_failed_tasks"] = store.task_failures(
+            dag_id=dag_id, since=since, until=until, limit=max_tasks
+        )
+        result["store"] = store.status()
+        return _to_json(result)
+    except Exception as e:
+        return str(e)
+
+
+@mcp.tool()
+async def get_run_history(
+    dag_id: str | None = None,
+    since: str | None = None,
+    until: str | None = None,
+    sync: bool = True,
+    max_tasks: int = 20,
+) -> str:
+    """Summarize DAG run history: failure rates, durations and failing tasks.
+
+    Use this tool when the user asks about:
+    - "How often did X fail this month?" or "What is the failure rate of X?"
+    - "How long does X usually take?" or "Is X getting slower?"
+    - "Which tasks fail most often?"
+
+    Answers come from a local SQLite store of DAG runs and task instances
+    that is synced incrementally, so trend questions do not page through
+    the whole run history on every call. The first sync of a DAG reads the
+    last 30 days; older history is not fetched.
+
+    Requires the server to be started with --run-history-db.
+
+    Returns for each DAG:
+    - total_runs, states (count per run state), failure_rate (of finished runs)
+    - duration_seconds: mean, p50, p95 and max run duration
+    - first_run_start, last_run_start, last_failure
+    And most_failed_tasks: dag_id, task_id, failures (runs failed in), last_failure
+
+    Args:
+        dag_id: Only this DAG (default: every DAG in the store)
+        since: Only runs started at or after this ISO timestamp, e.g. "2024-06-01"
+        until: Only runs started before this ISO timestamp
+        sync: Sync new runs from Airflow before answering (default: True)
+        max_tasks: Maximum number of most-failing tasks to return (default: 20)
+
+    Returns:
+        JSON with per-DAG statistics, most-failing tasks, sync counts and store size
+    """
+    return await _get_run_history_impl(
+        dag_id=dag_id, since=since, until=until, sync=sync, max_tasks=max_tasks
+    )
+
+
+async def _get_dag_source_impl(dag_id: str) -> str:
     """Internal implementation for getting DAG source code from Airflow.
 
     Args:
@@ -473,15 +1139,15 @@ def _get_dag_source_impl(dag_id: str) -> str:
         JSON string containing the DAG source code and metadata
     """
     try:
-        adapter = _get_adapter()
-        source_data = adapter.get_dag_source(dag_id)
-        return json.dumps(source_data, indent=2)
+        adapter = await _get_adapter()
+        source_data = await adapter.get_dag_source(dag_id)
+        return _to_json(source_data)
     except Exception as e:
         return str(e)
 
 
 @mcp.tool()
-def get_dag_source(dag_id: str) -> str:
+async def get_dag_source(dag_id: str) -> str:
     """Get the source code for a specific Apache Airflow DAG.
 
     Use this tool when the user asks about:
@@ -500,10 +1166,10 @@ def get_dag_source(dag_id: str) -> str:
     Returns:
         JSON with DAG source code and metadata
     """
-    return _get_dag_source_impl(dag_id=dag_id)
+    return await _get_dag_source_impl(dag_id=dag_id)
 
 
-def _get_dag_stats_impl(dag_ids: list[str] | None = None) -> str:
+async def _get_dag_stats_impl(dag_ids: list[str] | None = None) -> str:
     """Internal implementation for getting DAG statistics from Airflow.
 
     Args:
@@ -513,15 +1179,15 @@ def _get_dag_stats_impl(dag_ids: list[str] | None = None) -> str:
         JSON string containing DAG run statistics by state
     """
     try:
-        adapter = _get_adapter()
-        stats_data = adapter.get_dag_stats(dag_ids=dag_ids)
-        return json.dumps(stats_data, indent=2)
+        adapter = await _get_adapter()
+        stats_data = await adapter.get_dag_stats(dag_ids=dag_ids)
+        return _to_json(stats_data)
     except Exception as e:
         return str(e)
 
 
 @mcp.tool()
-def get_dag_stats(dag_ids: list[str] | None = None) -> str:
+async def get_dag_stats(dag_ids: list[str] | None = None) -> str:
     """Get statistics about DAG runs (success/failure counts by state).
 
     Use this tool when the user asks about:
@@ -544,59 +1210,67 @@ def get_dag_stats(dag_ids: list[str] | None = None) -> str:
     Returns:
         JSON with DAG run statistics organized by DAG and state
     """
-    return _get_dag_stats_impl(dag_ids=dag_ids)
+    return await _get_dag_stats_impl(dag_ids=dag_ids)
 
 
-def _list_dag_warnings_impl(
-    limit: int = DEFAULT_LIMIT,
+async def _list_dag_warnings_impl(
+    limit: int | None = None,
     offset: int = DEFAULT_OFFSET,
+    fields: list[str] | None = None,
 ) -> str:
     """Internal implementation for listing DAG warnings from Airflow.
 
     Args:
-        limit: Maximum number of warnings to return (default: 100)
+        limit: Maximum number of warnings to return (default: all)
         offset: Offset for pagination (default: 0)
+        fields: Fields to return for each warning (default: all)
 
     Returns:
         JSON string containing the list of DAG warnings
     """
     try:
-        adapter = _get_adapter()
-        data = adapter.list_dag_warnings(limit=limit, offset=offset)
+        adapter = await _get_adapter()
+        data = await adapter.fetch_all(
+            adapter.list_dag_warnings, "dag_warnings", max_items=limit, offset=offset
+        )
 
         if "dag_warnings" in data:
-            return _wrap_list_response(data["dag_warnings"], "dag_warnings", data)
+            return _wrap_list_response(data["dag_warnings"], "dag_warnings", data, fields)
         return f"No DAG warnings found. Response: {data}"
     except Exception as e:
         return str(e)
 
 
-def _list_import_errors_impl(
-    limit: int = DEFAULT_LIMIT,
+async def _list_import_errors_impl(
+    limit: int | None = None,
     offset: int = DEFAULT_OFFSET,
+    fields: list[str] | None = None,
 ) -> str:
     """Internal implementation for listing import errors from Airflow.
 
     Args:
-        limit: Maximum number of import errors to return (default: 100)
+        limit: Maximum number of import errors to return (default: all)
         offset: Offset for pagination (default: 0)
+        fields: Fields to return for each import error (default: all)
 
     Returns:
         JSON string containing the list of import errors
     """
     try:
-        adapter = _get_adapter()
-        data = adapter.list_import_errors(limit=limit, offset=offset)
+        adapter = await _get_adapter()
+        data = await adapter.fetch_all(
+            adapter.list_import_errors, "import_errors", max_items=limit, offset=offset
+        )
 
         if "import_errors" in data:
-            return _wrap_list_response(data["import_errors"], "import_errors", data)
+            return _wrap_list_response(data["import_errors"], "import_errors", data, fields)
         return f"No import errors found. Response: {data}"
     except Exception as e:
         return str(e)
 
 
 @mcp.tool()
-def list_dag_warnings() -> str:
+async def list_dag_warnings(fields: list[str] | None = None) -> str:
     """Get warnings and issues detected in DAG definitions.
 
     Use this tool when the user asks about:
@@ -611,14 +1285,17 @@ def list_dag_warnings() -> str:
     - message: Description of the warning
     - timestamp: When the warning was detected
 
+    Args:
+        fields: Only return these fields for each warning (default: all)
+
     Returns:
         JSON with list of DAG warnings and their details
     """
-    return _list_dag_warnings_impl()
+    return await _list_dag_warnings_impl(fields=fields)
 
 
 @mcp.tool()
-def list_import_errors() -> str:
+async def list_import_errors(fields: list[str] | None = None) -> str:
     """Get import errors from DAG files that failed to parse or load.
 
     Use this tool when the user asks about:
@@ -642,105 +1319,162 @@ def list_import_errors() -> str:
     - filename: Path to the DAG file with the error
     - stack_trace: Complete error message and traceback
 
+    Args:
+        fields: Only return these fields for each import error (default: all)
+
     Returns:
         JSON with list of import errors and their stack traces
     """
-    return _list_import_errors_impl()
+    return await _list_import_errors_impl(fields=fields)
 
 
-def _get_task_impl(dag_id: str, task_id: str) -> str:
+async def _get_task_impl(dag_id: str, task_id: str, fields: list[str] | None = None) -> str:
     """Internal implementation for getting task details from Airflow.
 
     Args:
         dag_id: The ID of the DAG
         task_id: The ID of the task
+        fields: Fields to return (default: all)
 
     Returns:
         JSON string containing the task details
     """
     try:
-        adapter = _get_adapter()
-        data = adapter.get_task(dag_id, task_id)
-        return json.dumps(data, indent=2)
+        adapter = await _get_adapter()
+        data = await adapter.get_task(dag_id, task_id)
+        return _to_json(_project(data, fields))
     except Exception as e:
         return str(e)
 
 
-def _list_tasks_impl(dag_id: str) -> str:
+async def _list_tasks_impl(dag_id: str, fields: list[str] | None = None) -> str:
     """Internal implementation for listing tasks in a DAG from Airflow.
 
     Args:
         dag_id: The ID of the DAG to list tasks for
+        fields: Fields to return for each task (default: TaskInfo.summary_fields)
 
     Returns:
         JSON string containing the list of tasks with their metadata
     """
     try:
-        adapter = _get_adapter()
-        data = adapter.list_tasks(dag_id)
+        adapter = await _get_adapter()
+        data = await adapter.list_tasks(dag_id)
 
         if "tasks" in data:
-            return _wrap_list_response(data["tasks"], "tasks", data)
+            return _wrap_list_response(
+                data["tasks"], "tasks", data, fields or TaskInfo.summary_fields
+            )
         return f"No tasks found. Response: {data}"
     except Exception as e:
         return str(e)
 
 
-def _get_task_instance_impl(dag_id: str, dag_run_id: str, task_id: str) -> str:
+async def _get_task_instance_impl(
+    dag_id: str, dag_run_id: str, task_id: str, fields: list[str] | None = None
+) -> str:
     """Internal implementation for getting task instance details from Airflow.
 
     Args:
         dag_id: The ID of the DAG
         dag_run_id: The ID of the DAG run
         task_id: The ID of the task
+        fields: Fields to return (default: all)
 
     Returns:
         JSON string containing the task instance details
     """
     try:
-        adapter = _get_adapter()
-        data = adapter.get_task_instance(dag_id, dag_run_id, task_id)
-        return json.dumps(data, indent=2)
+        adapter = await _get_adapter()
+        data = await adapter.get_task_instance(dag_id, dag_run_id, task_id)
+        return _to_json(_project(data, fields))
     except Exception as e:
         return str(e)
 
 
-def _get_task_logs_impl(
+async def _get_task_logs_impl(
     dag_id: str,
     dag_run_id: str,
     task_id: str,
     try_number: int = 1,
     map_index: int = -1,
+    tail_lines: int | None = None,
+    head_lines: int | None = None,
+    byte_offset: int | None = None,
+    byte_limit: int | None = None,
+    tail_bytes: int = DEFAULT_LOG_TAIL_BYTES,
+    continuation_token: str | None = None,
+    digest: bool = False,
 ) -> str:
     """Internal implementation for getting task instance logs from Airflow.
 
+    The log is streamed from Airflow and only the requested window is kept,
+    so large logs are never held in memory. With no window options the last
+    tail_bytes of the log are returned; digest returns only the tracebacks,
+    error lines and final lines instead.
+
     Args:
         dag_id: The ID of the DAG
         dag_run_id: The ID of the DAG run
         task_id: The ID of the task
         try_number: The task try number (1-indexed, default: 1)
         map_index: For mapped tasks, which map index (-1 for unmapped, default: -1)
+        tail_lines: Return only the last N lines
+        head_lines: Return only the first N lines
+        byte_offset: Start of a byte range to return
+        byte_limit: Length of the byte range (defaults to tail_bytes)
+        tail_bytes: Size of the default window at the end of the log
+        continuation_token: Read the next chunk using Airflow's log paging;
+            an empty string starts from the beginning of the log
+        digest: Return a digest of the errors in the log instead of its text
 
     Returns:
-        JSON string containing the task logs
+        JSON string containing the selected part of the task logs
     """
     try:
-        adapter = _get_adapter()
-        data = adapter.get_task_logs(
-            dag_id=dag_id,
-            dag_run_id=dag_run_id,
-            task_id=task_id,
-            try_number=try_number,
-            map_index=map_index,
-            full_content=True,
-        )
-        return json.dumps(data, indent=2)
+        adapter = await _get_adapter()
+        if continuation_token is not None:
+            data = await adapter.get_task_logs(
+                dag_id=dag_id,
+                dag_run_id=dag_run_id,
+                task_id=task_id,
+                try_number=try_number,
+                map_index=map_index,
+                full_content=False,
+                continuation_token=continuation_token or None,
+            )
+            if "content" in data:
+                data = {
+                    "content": task_logs.render_log_content(data["content"]),
+                    "continuation_token": data.get("continuation_token"),
+                }
+            return _to_json(data)
+
+        stream = adapter.stream_task_logs(dag_id, dag_run_id, task_id, try_number, map_index)
+        async with aclosing(stream) as lines:
+            if digest:
+                return _to_json({"mode": "digest", **await task_logs.digest(lines)})
+            if head_lines is not None:
+                mode = "head"
+                window = await task_logs.head_lines(lines, head_lines)
+            elif byte_offset is not None or byte_limit is not None:
+                mode = "range"
+                window = await task_logs.byte_range(
+                    lines, byte_offset or 0, byte_limit or tail_bytes
+                )
+            elif tail_lines is not None:
+                mode = "tail_lines"
+                window = await task_logs.tail_lines(lines, tail_lines)
+            else:
+                mode = "tail"
+                window = await task_logs.tail_bytes(lines, tail_bytes)
+        return _to_json({"mode": mode, **asdict(window)})
     except Exception as e:
         return str(e)
 
 
 @mcp.tool()
-def get_task(dag_id: str, task_id: str) -> str:
+async def get_task(dag_id: str, task_id: str, fields: list[str] | None = None) -> str:
     """Get detailed information about a specific task definition in a DAG.
 
     Use this tool when the user asks about:
@@ -770,15 +1504,16 @@ def get_task(dag_id: str, task_id: str) -> str:
     Args:
         dag_id: The ID of the DAG containing the task
         task_id: The ID of the task to get details for
+        fields: Only return these fields (default: all)
 
     Returns:
         JSON with complete task definition details
     """
-    return _get_task_impl(dag_id=dag_id, task_id=task_id)
+    return await _get_task_impl(dag_id=dag_id, task_id=task_id, fields=fields)
 
 
 @mcp.tool()
-def list_tasks(dag_id: str) -> str:
+async def list_tasks(dag_id: str, fields: list[str] | None = None) -> str:
     """Get all tasks defined in a specific DAG.
 
     Use this tool when the user asks about:
@@ -787,30 +1522,31 @@ def list_tasks(dag_id: str) -> str:
     - "What are the steps in DAG Z?" or "Show me the task structure"
     - "What does this DAG do?" or "Explain the workflow steps"
 
-    Returns information about all tasks in the DAG including:
+    Returns a summary of each task in the DAG by default:
     - task_id: Unique identifier for the task
-    - task_display_name: Human-readable display name
-    - owner: Who owns this task
     - operator_name: Type of operator (PythonOperator, BashOperator, etc.)
-    - start_date: When this task becomes active
-    - end_date: When this task becomes inactive (if set)
     - trigger_rule: When this task should run
     - retries: Number of retry attempts
-    - pool: Resource pool assignment
     - downstream_task_ids: List of tasks that depend on this task
-    - upstream_task_ids: List of tasks this task depends on
+
+    Request other fields such as owner, pool or upstream_task_ids with `fields`.
 
     Args:
         dag_id: The ID of the DAG to list tasks for
+        fields: Fields to return for each task, e.g. ["task_id", "pool"].
+            Defaults to a compact summary (task_id, operator_name, trigger_rule,
+            retries, downstream_task_ids). Pass ["*"] for every field.
 
     Returns:
         JSON with list of all tasks in the DAG and their configurations
     """
-    return _list_tasks_impl(dag_id=dag_id)
+    return await _list_tasks_impl(dag_id=dag_id, fields=fields)
 
 
 @mcp.tool()
-def get_task_instance(dag_id: str, dag_run_id: str, task_id: str) -> str:
+async def get_task_instance(
+    dag_id: str, dag_run_id: str, task_id: str, fields: list[str] | None = None
+) -> str:
     """Get detailed information about a specific task instance execution.
 
     Use this tool when the user asks about:
@@ -835,20 +1571,29 @@ def get_task_instance(dag_id: str, dag_run_id: str, task_id: str) -> str:
         dag_id: The ID of the DAG
         dag_run_id: The ID of the DAG run (e.g., "manual__2024-01-01T00:00:00+00:00")
         task_id: The ID of the task within the DAG
+        fields: Only return these fields (default: all)
 
     Returns:
         JSON with complete task instance details
     """
-    return _get_task_instance_impl(dag_id=dag_id, dag_run_id=dag_run_id, task_id=task_id)
+    return await _get_task_instance_impl(
+        dag_id=dag_id, dag_run_id=dag_run_id, task_id=task_id, fields=fields
+    )
 
 
 @mcp.tool()
-def get_task_logs(
+async def get_task_logs(
     dag_id: str,
     dag_run_id: str,
     task_id: str,
     try_number: int = 1,
     map_index: int = -1,
+    tail_lines: int | None = None,
+    head_lines: int | None = None,
+    byte_offset: int | None = None,
+    byte_limit: int | None = None,
+    continuation_token: str | None = None,
+    digest: bool = False,
 ) -> str:
     """Get logs for a specific task instance execution.
 
@@ -869,6 +1614,15 @@ def get_task_logs(
     This is essential for debugging failed tasks or understanding what
     happened during task execution.
 
+    By default only the last 32 KB of the log are returned, which is where
+    errors usually are. Use tail_lines, head_lines or a byte range to pick
+    another part; the response says whether the log was truncated and, for
+    byte ranges, the next_byte_offset to continue from.
+
+    Set digest=True to get only what explains a failure: Python tracebacks
+    (repeated ones reported once), ERROR/CRITICAL lines and the final lines
+    of the log, each with a byte_offset for reading the full context.
+
     Args:
         dag_id: The ID of the DAG (e.g., "example_dag")
         dag_run_id: The ID of the DAG run (e.g., "manual__2024-01-01T00:00:00+00:00")
@@ -877,45 +1631,252 @@ def get_task_logs(
                     Use higher numbers to get logs from retry attempts.
         map_index: For mapped tasks, which map index to get logs for.
                    Use -1 for non-mapped tasks (default: -1).
+        tail_lines: Return only the last N lines of the log
+        head_lines: Return only the first N lines of the log
+        byte_offset: Start of a byte range to return (default: 0)
+        byte_limit: Number of bytes to return from byte_offset (default: 32 KB)
+        continuation_token: Page through the log with Airflow's continuation
+                            tokens instead. Pass "" to read the first chunk,
+                            then the continuation_token from each response.
+        digest: Return a compact error digest instead of log text (default: False)
 
     Returns:
-        JSON with the task logs content
+        JSON with the selected log content and truncation details
     """
-    return _get_task_logs_impl(
+    return await _get_task_logs_impl(
         dag_id=dag_id,
         dag_run_id=dag_run_id,
         task_id=task_id,
         try_number=try_number,
         map_index=map_index,
+        tail_lines=tail_lines,
+        head_lines=head_lines,
+        byte_offset=byte_offset,
+        byte_limit=byte_limit,
+        continuation_token=continuation_token,
+        digest=digest,
     )
 
 
-def _list_dag_runs_impl(
-    limit: int = DEFAULT_LIMIT,
+async def _search_dag_run_logs_impl(
+    dag_id: str,
+    dag_run_id: str,
+    pattern: str,
+    task_ids: list[str] | None = None,
+    ignore_case: bool = False,
+    context_lines: int = 2,
+    max_matches: int = DEFAULT_LOG_SEARCH_MAX_MATCHES,
+    latest_try_only: bool = False,
+    max_concurrency: int = DEFAULT_LOG_CONCURRENCY,
+) -> str:
+    """Internal implementation for searching the logs of every task in a DAG run.
+
+    Logs of all task instances (each map index and try) are streamed with at
+    most max_concurrency reads at a time. All reads stop once max_matches
+    matches have been found.
+
+    Args:
+        dag_id: The ID of the DAG
+        dag_run_id: The ID of the DAG run
+        pattern: Regular expression to search for
+        task_ids: Only search these tasks (default: all tasks)
+        ignore_case: Match case-insensitively
+        context_lines: Lines of context to return before and after each match
+        max_matches: Stop searching after this many matches
+        latest_try_only: Only search the latest try of each task instance
+        max_concurrency: Maximum number of logs read at the same time
+
+    Returns:
+        JSON string with the matching lines and their locations
+    """
+    try:
+        regex = re.compile(pattern, re.IGNORECASE if ignore_case else 0)
+    except re.error as e:
+        return f"Invalid pattern {pattern!r}: {e}"
+
+    try:
+        adapter = await _get_adapter()
+        data = await adapter.fetch_all(
+            adapter.get_task_instances,
+            "task_instances",
+            dag_id=dag_id,
+            dag_run_id=dag_run_id,
+        )
+
+        # Task instances that never started have no logs
+        logs: list[tuple[str, int, int]] = []
+        for ti in data.get("task_instances", []):
+            if not ti.get("start_date") or (task_ids and ti.get("task_id") not in task_ids):
+                continue
+            map_index = ti.get("map_index")
+            map_index = -1 if map_index is None else map_index
+            latest_try = max(ti.get("try_number") or 1, 1)
+            first_try = latest_try if latest_try_only else 1
+            logs.extend(
+                (ti["task_id"], map_index, try_number)
+                for try_number in range(first_try, latest_try + 1)
+            )
+
+        budget = task_logs.MatchBudget(max_matches)
+        semaphore = asyncio.Semaphore(max_concurrency)
+        errors: list[dict[str, Any]] = []
+        searched = 0
+
+        async def _search(task_id: str, map_index: int, try_number: int) -> list[dict[str, Any]]:
+            nonlocal searched
+            async with semaphore:
+                if budget.exhausted:
+                    return []
+                location = {"task_id": task_id, "map_index": map_index, "try_number": try_number}
+                searched += 1
+                try:
+                    stream = adapter.stream_task_logs(
+                        dag_id, dag_run_id, task_id, try_number, map_index
+                    )
+                    async with aclosing(stream) as lines:
+                        found = await task_logs.search_lines(lines, regex, context_lines, budget)
+                except Exception as e:
+                    errors.append({**location, "error": str(e)})
+                    return []
+                return [{**location, **match} for match in found]
+
+        results = await asyncio.gather(*(_search(*log) for log in logs))
+        matches = sorted(
+            (match for found in results for match in found),
+            key=lambda m: (m["task_id"], m["map_index"], m["try_number"], m["line_number"]),
+        )
+
+        result: dict[str, Any] = {
+            "dag_id": dag_id,
+            "dag_run_id": dag_run_id,
+            "pattern": pattern,
+            "logs_searched": searched,
+            "total_matches": len(matches),
+            "truncated": budget.exhausted,
+            "matches": matches,
+        }
+        if errors:
+            result["errors"] = errors
+        return _to_json(result)
+    except Exception as e:
+        return str(e)
+
+
+@mcp.tool()
+async def search_dag_run_logs(
+    dag_id: str,
+    dag_run_id: str,
+    pattern: str,
+    task_ids: list[str] | None = None,
+    ignore_case: bool = False,
+    context_lines: int = 2,
+    max_matches: int = DEFAULT_LOG_SEARCH_MAX_MATCHES,
+    latest_try_only: bool = False,
+) -> str:
+    """Search the logs of every task in a DAG run for a regular expression.
+
+    Use this tool when the user asks about:
+    - "Which task logged error X?" or "Where does 'OutOfMemory' appear in this run?"
+    - "Find the traceback in run Y" or "Did any task print Z?"
+    - Finding an error without knowing which task or retry produced it
+
+    Logs of all task instances (every map index and try) are read
+    concurrently and only matching lines are returned, so one call replaces
+    calling get_task_logs for each task. The search stops once max_matches
+    matches are found.
+
+    Each match includes:
+    - task_id, map_index, try_number: Which log the match is in
+    - line_number, byte_offset: Where in the log it is (byte_offset can be
+      passed to get_task_logs to read around it)
+    - line: The matching line
+    - before/after: Surrounding context lines
+
+    Args:
+        dag_id: The ID of the DAG
+        dag_run_id: The ID of the DAG run (e.g., "manual__2024-01-01T00:00:00+00:00")
+        pattern: Python regular expression to search for (e.g., "Error|Exception")
+        task_ids: Only search these tasks (default: all tasks in the run)
+        ignore_case: Match case-insensitively (default: False)
+        context_lines: Lines of context before and after each match (default: 2)
+        max_matches: Maximum number of matches to return (default: 50)
+        latest_try_only: Only search the latest try of each task (default: False)
+
+    Returns:
+        JSON with matching lines, their locations and whether the search was truncated
+    """
+    return await _search_dag_run_logs_impl(
+        dag_id=dag_id,
+        dag_run_id=dag_run_id,
+        pattern=pattern,
+        task_ids=task_ids,
+        ignore_case=ignore_case,
+        context_lines=context_lines,
+        max_matches=max_matches,
+        latest_try_only=latest_try_only,
+    )
+
+
+async def _list_dag_runs_impl(
+    limit: int | None = None,
     offset: int = DEFAULT_OFFSET,
+    fields: list[str] | None = None,
+    dag_id: str | None = None,
+    state: list[str] | None = None,
+    start_date_gte: str | None = None,
+    start_date_lte: str | None = None,
+    order_by: str | None = None,
 ) -> str:
     """Internal implementation for listing DAG runs from Airflow.
 
+    Filters are sent to Airflow so matching happens in its database.
+
     Args:
-        limit: Maximum number of DAG runs to return (default: 100)
+        limit: Maximum number of DAG runs to return (default: all)
         offset: Offset for pagination (default: 0)
+        fields: Fields to return for each DAG run (default: DAGRun.summary_fields)
+        dag_id: Only runs of this DAG (default: all DAGs)
+        state: Only runs in any of these states
+        start_date_gte: Only runs started at or after this ISO 8601 timestamp
+        start_date_lte: Only runs started at or before this ISO 8601 timestamp
+        order_by: Field to sort by, prefixed with '-' for descending
 
     Returns:
         JSON string containing the list of DAG runs with their metadata
     """
     try:
-        adapter = _get_adapter()
-        data = adapter.list_dag_runs(limit=limit, offset=offset)
+        adapter = await _get_adapter()
+        filters = _api_filters(
+            dag_id=dag_id,
+            state=state,
+            start_date_gte=start_date_gte,
+            start_date_lte=start_date_lte,
+            order_by=order_by,
+        )
+        data = await adapter.fetch_all(
+            adapter.list_dag_runs, "dag_runs", max_items=limit, offset=offset, **filters
+        )
 
         if "dag_runs" in data:
-            return _wrap_list_response(data["dag_runs"], "dag_runs", data)
+            return _wrap_list_response(
+                data["dag_runs"], "dag_runs", data, fields or DAGRun.summary_fields
+            )
         return f"No DAG runs found. Response: {data}"
     except Exception as e:
         return str(e)
 
 
 @mcp.tool()
-def list_dag_runs() -> str:
+async def list_dag_runs(
+    dag_id: str | None = None,
+    state: list[str] | None = None,
+    start_date_gte: str | None = None,
+    start_date_lte: str | None = None,
+    order_by: str | None = None,
+    limit: int | None = None,
+    offset: int = DEFAULT_OFFSET,
+    fields: list[str] | None = None,
+) -> str:
     """Get execution history and status of DAG runs (workflow executions).
 
     Use this tool when the user asks about:
@@ -926,6 +1887,11 @@ def list_dag_runs() -> str:
     - Execution times, durations, or states
     - Finding runs by date or status
 
+    Prefer the filter arguments over listing everything: they are applied by
+    Airflow, so only matching runs are transferred. For example, the latest
+    failed runs of a DAG: dag_id="my_dag", state=["failed"],
+    order_by="-start_date", limit=5.
+
     Returns execution metadata including:
     - dag_run_id: Unique identifier for this execution
     - dag_id: Which DAG this run belongs to
@@ -934,37 +1900,61 @@ def list_dag_runs() -> str:
     - start_date: When execution actually started
     - end_date: When execution completed (if finished)
     - run_type: manual, scheduled, or backfill
-    - conf: Configuration passed to this run
+
+    Request other fields such as conf or note with `fields`.
+
+    Args:
+        dag_id: Only return runs of this DAG (default: all DAGs)
+        state: Only return runs in any of these states (e.g. ["failed", "running"])
+        start_date_gte: Only runs started at or after this ISO 8601 timestamp
+        start_date_lte: Only runs started at or before this ISO 8601 timestamp
+        order_by: Sort field, prefix with '-' for descending (e.g. "-start_date")
+        limit: Maximum number of runs to return (default: all matching runs)
+        offset: Number of matching runs to skip (default: 0)
+        fields: Fields to return for each run, e.g. ["dag_run_id", "state"].
+            Defaults to a compact summary (dag_run_id, dag_id, logical/execution
+            date, start/end dates, state, run_type). Pass ["*"] for every field.
 
     Returns:
-        JSON with list of DAG runs across all DAGs, sorted by most recent
+        JSON with list of matching DAG runs
     """
-    return _list_dag_runs_impl()
+    return await _list_dag_runs_impl(
+        limit=limit,
+        offset=offset,
+        fields=fields,
+        dag_id=dag_id,
+        state=state,
+        start_date_gte=start_date_gte,
+        start_date_lte=start_date_lte,
+        order_by=order_by,
+    )
 
 
-def _get_dag_run_impl(
+async def _get_dag_run_impl(
     dag_id: str,
     dag_run_id: str,
+    fields: list[str] | None = None,
 ) -> str:
     """Internal implementation for getting a specific DAG run from Airflow.
 
     Args:
         dag_id: The ID of the DAG
         dag_run_id: The ID of the DAG run
+        fields: Fields to return (default: all)
 
     Returns:
         JSON string containing the DAG run details
     """
     try:
-        adapter = _get_adapter()
-        data = adapter.get_dag_run(dag_id, dag_run_id)
-        return json.dumps(data, indent=2)
+        adapter = await _get_adapter()
+        data = await adapter.get_dag_run(dag_id, dag_run_id)
+        return _to_json(_project(data, fields))
     except Exception as e:
         return str(e)
 
 
 @mcp.tool()
-def get_dag_run(dag_id: str, dag_run_id: str) -> str:
+async def get_dag_run(dag_id: str, dag_run_id: str, fields: list[str] | None = None) -> str:
     """Get detailed information about a specific DAG run execution.
 
     Use this tool when the user asks about:
@@ -993,14 +1983,15 @@ def get_dag_run(dag_id: str, dag_run_id: str) -> str:
     Args:
         dag_id: The ID of the DAG (e.g., "example_dag")
         dag_run_id: The ID of the DAG run (e.g., "manual__2024-01-01T00:00:00+00:00")
+        fields: Only return these fields (default: all)
 
     Returns:
         JSON with complete details about the specified DAG run
     """
-    return _get_dag_run_impl(dag_id=dag_id, dag_run_id=dag_run_id)
+    return await _get_dag_run_impl(dag_id=dag_id, dag_run_id=dag_run_id, fields=fields)
 
 
-def _trigger_dag_impl(
+async def _trigger_dag_impl(
     dag_id: str,
     conf: dict | None = None,
 ) -> str:
@@ -1014,14 +2005,14 @@ def _trigger_dag_impl(
         JSON string containing the triggered DAG run details
     """
     try:
-        adapter = _get_adapter()
-        data = adapter.trigger_dag_run(dag_id=dag_id, conf=conf)
-        return json.dumps(data, indent=2)
+        adapter = await _get_adapter()
+        data = await adapter.trigger_dag_run(dag_id=dag_id, conf=conf)
+        return _to_json(data)
     except Exception as e:
         return str(e)
 
 
-def _get_failed_task_instances(
+async def _get_failed_task_instances(
     dag_id: str,
     dag_run_id: str,
 ) -> list[dict[str, Any]]:
@@ -1035,8 +2026,10 @@ def _get_failed_task_instances(
         List of failed task instance details
     """
     try:
-        adapter = _get_adapter()
-        data = adapter.get_task_instances(dag_id, dag_run_id)
+        adapter = await _get_adapter()
+        data = await adapter.fetch_all(
+            adapter.get_task_instances, "task_instances", dag_id=dag_id, dag_run_id=dag_run_id
+        )
 
         failed_states = {"failed", "upstream_failed"}
         failed_tasks = []
@@ -1060,108 +2053,198 @@ def _get_failed_task_instances(
         return []
 
 
-def _trigger_dag_and_wait_impl(
+def _wait_schedule(timeout: float, expected_duration: float | None = None) -> PollSchedule:
+    """Build the poll schedule for a wait, polling less often for longer timeouts."""
+    return PollSchedule(
+        max_interval=max(2.0, min(30.0, timeout / 60)),
+        expected_duration=expected_duration,
+    )
+
+
+async def _trigger_dag_and_wait_impl(
     dag_id: str,
     conf: dict | None = None,
-    poll_interval: float = 5.0,
     timeout: float = 3600.0,
+    ctx: Context | None = None,
 ) -> str:
     """Internal implementation for triggering a DAG and waiting for completion.
 
+    Polls adaptively (see PollSchedule), using the DAG's recent run durations
+    to avoid polling before the run is likely to be done.
+
     Args:
         dag_id: The ID of the DAG to trigger
         conf: Optional configuration dictionary to pass to the DAG run
-        poll_interval: Seconds between status checks (default: 5.0)
         timeout: Maximum time to wait in seconds (default: 3600.0 / 60 minutes)
+        ctx: Optional MCP context used to send progress notifications
 
     Returns:
         JSON string containing the final DAG run status and any failed task details
     """
     # Step 1: Trigger the DAG
-    trigger_response = _trigger_dag_impl(
-        dag_id=dag_id,
-        conf=conf,
-    )
-
     try:
-        trigger_data = json.loads(trigger_response)
-    except json.JSONDecodeError:
-        return json.dumps(
-            {
-                "error": f"Failed to trigger DAG: {trigger_response}",
-                "timed_out": False,
-            },
-            indent=2,
-        )
+        adapter = await _get_adapter()
+        trigger_data = await adapter.trigger_dag_run(dag_id=dag_id, conf=conf)
+    except Exception as e:
+        return _to_json({"error": f"Failed to trigger DAG: {e}", "timed_out": False})
 
     dag_run_id = trigger_data.get("dag_run_id")
     if not dag_run_id:
-        return json.dumps(
+        return _to_json(
             {
-                "error": f"No dag_run_id in trigger response: {trigger_response}",
+                "error": f"No dag_run_id in trigger response: {trigger_data}",
                 "timed_out": False,
-            },
-            indent=2,
+            }
         )
 
-    # Step 2: Poll for completion
-    start_time = time.time()
-    current_state = trigger_data.get("state", "queued")
-
-    while True:
-        elapsed = time.time() - start_time
-
-        # Check timeout
-        if elapsed >= timeout:
-            result: dict[str, Any] = {
-                "dag_id": dag_id,
-                "dag_run_id": dag_run_id,
-                "state": current_state,
-                "timed_out": True,
-                "elapsed_seconds": round(elapsed, 2),
-                "message": f"Timed out after {timeout} seconds. DAG run is still {current_state}.",
-            }
-            return json.dumps(result, indent=2)
+    # Step 2: Wait for completion
+    schedule = _wait_schedule(timeout, await expected_run_duration(adapter, dag_id))
+
+    async def _report(update: dict[str, Any]) -> None:
+        counts = update["task_counts"]
+        message = f"{dag_id} is {update['state']}"
+        if counts:
+            message += f": {counts['finished']}/{counts['total']} tasks finished"
+        await ctx.report_progress(update["elapsed_seconds"], timeout, message)
+
+    wait = await _run_poller.wait(
+        dag_id,
+        dag_run_id,
+        timeout,
+        schedule=schedule,
+        on_progress=_report if ctx is not None else None,
+        initial_state=trigger_data.get("state", "queued"),
+    )
 
-        # Wait before polling
-        time.sleep(poll_interval)
+    if wait.timed_out:
+        result: dict[str, Any] = {
+            "dag_id": dag_id,
+            "dag_run_id": dag_run_id,
+            "state": wait.state,
+            "timed_out": True,
+            "elapsed_seconds": wait.elapsed_seconds,
+            "message": f"Timed out after {timeout} seconds. DAG run is still {wait.state}.",
+        }
+        return _to_json(result)
+
+    result = {
+        "dag_run": wait.dag_run,
+        "timed_out": False,
+        "elapsed_seconds": wait.elapsed_seconds,
+    }
 
-        # Get current status
-        status_response = _get_dag_run_impl(
+    # Fetch failed task details if not successful
+    if wait.state != "success":
+        failed_tasks = await _get_failed_task_instances(
             dag_id=dag_id,
             dag_run_id=dag_run_id,
         )
+        if failed_tasks:
+            result["failed_tasks"] = failed_tasks
 
-        try:
-            status_data = json.loads(status_response)
-        except json.JSONDecodeError:
-            # If we can't parse, continue polling
-            continue
+    return _to_json(result)
 
-        current_state = status_data.get("state", current_state)
 
-        # Check if we've reached a terminal state
-        if current_state in TERMINAL_DAG_RUN_STATES:
-            result = {
-                "dag_run": status_data,
-                "timed_out": False,
-                "elapsed_seconds": round(time.time() - start_time, 2),
-            }
+async def _trigger_dags_and_wait_impl(
+    runs: list[dict[str, Any]],
+    timeout: float = 3600.0,
+    max_concurrency: int = DEFAULT_TRIGGER_CONCURRENCY,
+    ctx: Context | None = None,
+) -> str:
+    """Internal implementation for triggering several DAG runs and waiting for all of them.
 
-            # Fetch failed task details if not successful
-            if current_state != "success":
-                failed_tasks = _get_failed_task_instances(
-                    dag_id=dag_id,
-                    dag_run_id=dag_run_id,
-                )
-                if failed_tasks:
-                    result["failed_tasks"] = failed_tasks
+    Triggers run with at most max_concurrency requests in flight; all runs are
+    then waited on through the shared run poller, so polling costs the same
+    whether one or fifty runs are pending.
+
+    Args:
+        runs: Run specs, each {"dag_id": str, "conf": dict (optional)}
+        timeout: Maximum total time to wait in seconds (default: 3600.0 / 60 minutes)
+        max_concurrency: Maximum number of concurrent trigger requests (default: 5)
+        ctx: Optional MCP context used to send progress notifications
+
+    Returns:
+        JSON string with per-run results and a summary of final states
+    """
+    if not runs or not all(isinstance(spec, dict) and spec.get("dag_id") for spec in runs):
+        return _to_json({"error": "Each run needs a dag_id, e.g. [{'dag_id': 'x', 'conf': {}}]"})
+    try:
+        adapter = await _get_adapter()
+    except Exception as e:
+        return str(e)
 
-            return json.dumps(result, indent=2)
+    start = time.monotonic()
+    limit = asyncio.Semaphore(max(1, max_concurrency))
+    finished = 0
+
+    async def _trigger_and_wait(spec: dict[str, Any]) -> dict[str, Any]:
+        dag_id = spec["dag_id"]
+        outcome: dict[str, Any] = {"dag_id": dag_id}
+        try:
+            async with limit:
+                trigger_data = await adapter.trigger_dag_run(dag_id=dag_id, conf=spec.get("conf"))
+        except Exception as e:
+            outcome.update(state=None, error=f"Failed to trigger DAG: {e}")
+            return outcome
+
+        triggered_at = time.monotonic()
+        outcome["dag_run_id"] = dag_run_id = trigger_data.get("dag_run_id")
+        if not dag_run_id:
+            outcome.update(state=None, error=f"No dag_run_id in trigger response: {trigger_data}")
+            return outcome
+
+        wait = await _run_poller.wait(
+            dag_id,
+            dag_run_id,
+            max(0.0, timeout - (time.monotonic() - start)),
+            schedule=_wait_schedule(timeout),
+            initial_state=trigger_data.get("state", "queued"),
+        )
+        outcome.update(
+            state=wait.state,
+            timed_out=wait.timed_out,
+            elapsed_seconds=round(time.monotonic() - triggered_at, 2),
+        )
+        if not wait.timed_out and wait.state != "success":
+            async with limit:
+                failed_tasks = await _get_failed_task_instances(dag_id, dag_run_id)
+            if failed_tasks:
+                outcome["failed_tasks"] = failed_tasks
+        return outcome
+
+    async def _tracked(spec: dict[str, Any]) -> dict[str, Any]:
+        nonlocal finished
+        outcome = await _trigger_and_wait(spec)
+        finished += 1
+        if ctx is not None:
+            message = f"{finished}/{len(runs)} runs finished ({spec['dag_id']}: {outcome['state']})"
+            await ctx.report_progress(finished, len(runs), message)
+        return outcome
+
+    results = await asyncio.gather(*(_tracked(spec) for spec in runs))
+
+    summary: dict[str, int] = {}
+    for outcome in results:
+        if outcome.get("error"):
+            status = "trigger_failed"
+        elif outcome["timed_out"]:
+            status = "timed_out"
+        else:
+            status = outcome["state"]
+        summary[status] = summary.get(status, 0) + 1
+
+    return _to_json(
+        {
+            "total_runs": len(results),
+            "summary": summary,
+            "elapsed_seconds": round(time.monotonic() - start, 2),
+            "runs": results,
+        }
+    )
 
 
 @mcp.tool()
-def trigger_dag(dag_id: str, conf: dict | None = None) -> str:
+async def trigger_dag(dag_id: str, conf: dict | None = None) -> str:
     """Trigger a new DAG run (start a workflow execution manually).
 
     Use this tool when the user asks to:
@@ -1196,17 +2279,18 @@ def trigger_dag(dag_id: str, conf: dict | None = None) -> str:
     Returns:
         JSON with details about the newly triggered DAG run
     """
-    return _trigger_dag_impl(
+    return await _trigger_dag_impl(
         dag_id=dag_id,
         conf=conf,
     )
 
 
 @mcp.tool()
-def trigger_dag_and_wait(
+async def trigger_dag_and_wait(
     dag_id: str,
     conf: dict | None = None,
     timeout: float = 3600.0,
+    ctx: Context | None = None,
 ) -> str:
     """Trigger a DAG run and wait for it to complete before returning.
 
@@ -1218,7 +2302,8 @@ def trigger_dag_and_wait(
 
     This is a BLOCKING operation that will:
     1. Trigger the specified DAG
-    2. Poll for status automatically (interval scales with timeout)
+    2. Poll for status automatically (frequently at first, then less often,
+       informed by how long recent runs of the DAG took)
     3. Return once the DAG run reaches a terminal state (success, failed, upstream_failed)
     4. Include details about any failed tasks if the run was not successful
 
@@ -1227,6 +2312,7 @@ def trigger_dag_and_wait(
     `get_dag_run`.
 
     Default timeout is 60 minutes. Adjust the `timeout` parameter for longer DAGs.
+    Progress notifications report the run state and how many tasks have finished.
 
     Returns information about the completed DAG run including:
     - dag_id: Which DAG was run
@@ -1247,18 +2333,60 @@ def trigger_dag_and_wait(
     Returns:
         JSON with final DAG run status and any failed task details
     """
-    # Calculate poll interval based on timeout (2-10 seconds range)
-    poll_interval = max(2.0, min(10.0, timeout / 120))
-
-    return _trigger_dag_and_wait_impl(
+    return await _trigger_dag_and_wait_impl(
         dag_id=dag_id,
         conf=conf,
-        poll_interval=poll_interval,
         timeout=timeout,
+        ctx=ctx,
     )
 
 
-def _pause_dag_impl(dag_id: str) -> str:
+@mcp.tool()
+async def trigger_dags_and_wait(
+    runs: list[dict[str, Any]],
+    timeout: float = 3600.0,
+    max_concurrency: int = DEFAULT_TRIGGER_CONCURRENCY,
+    ctx: Context | None = None,
+) -> str:
+    """Trigger several DAG runs at once and wait for all of them to complete.
+
+    Use this tool when the user asks to:
+    - "Run DAGs X, Y and Z and wait for them" or "Kick off these pipelines"
+    - "Trigger DAG X for each of these configs and tell me the results"
+    - "Run these backfills and report which ones failed"
+
+    Prefer this over calling `trigger_dag_and_wait` repeatedly: all runs are
+    triggered with bounded parallelism and waited on together, so the total
+    wait is roughly that of the slowest run.
+
+    IMPORTANT: This is a write operation that creates one DAG run per spec.
+
+    Returns a consolidated result including:
+    - total_runs: Number of runs requested
+    - summary: Count of runs per final state (plus timed_out / trigger_failed)
+    - elapsed_seconds: Total time spent
+    - runs: Per run dag_id, dag_run_id, state, timed_out, elapsed_seconds
+      (time from its trigger until it finished), failed_tasks (when not
+      successful) or error (when the trigger failed)
+
+    Args:
+        runs: List of runs to trigger, each {"dag_id": "...", "conf": {...}}.
+              The same dag_id may appear several times with different confs.
+        timeout: Maximum total time to wait in seconds (default: 3600.0 / 60 minutes)
+        max_concurrency: Maximum number of trigger requests in flight (default: 5)
+
+    Returns:
+        JSON with per-run final states and failed task details
+    """
+    return await _trigger_dags_and_wait_impl(
+        runs=runs,
+        timeout=timeout,
+        max_concurrency=max_concurrency,
+        ctx=ctx,
+    )
+
+
+async def _pause_dag_impl(dag_id: str) -> str:
     """Internal implementation for pausing a DAG.
 
     Args:
@@ -1268,15 +2396,15 @@ def _pause_dag_impl(dag_id: str) -> str:
         JSON string containing the updated DAG details
     """
     try:
-        adapter = _get_adapter()
-        data = adapter.pause_dag(dag_id)
-        return json.dumps(data, indent=2)
+        adapter = await _get_adapter()
+        data = await adapter.pause_dag(dag_id)
+        return _to_json(data)
     except Exception as e:
         return str(e)
 
 
 @mcp.tool()
-def pause_dag(dag_id: str) -> str:
+async def pause_dag(dag_id: str) -> str:
     """Pause a DAG to prevent new scheduled runs from starting.
 
     Use this tool when the user asks to:
@@ -1299,10 +2427,10 @@ def pause_dag(dag_id: str) -> str:
     Returns:
         JSON with updated DAG details showing is_paused=True
     """
-    return _pause_dag_impl(dag_id=dag_id)
+    return await _pause_dag_impl(dag_id=dag_id)
 
 
-def _unpause_dag_impl(dag_id: str) -> str:
+async def _unpause_dag_impl(dag_id: str) -> str:
     """Internal implementation for unpausing a DAG.
 
     Args:
@@ -1312,15 +2440,15 @@ def _unpause_dag_impl(dag_id: str) -> str:
         JSON string containing the updated DAG details
     """
     try:
-        adapter = _get_adapter()
-        data = adapter.unpause_dag(dag_id)
-        return json.dumps(data, indent=2)
+        adapter = await _get_adapter()
+        data = await adapter.unpause_dag(dag_id)
+        return _to_json(data)
     except Exception as e:
         return str(e)
 
 
 @mcp.tool()
-def unpause_dag(dag_id: str) -> str:
+async def unpause_dag(dag_id: str) -> str:
     """Unpause a DAG to allow scheduled runs to resume.
 
     Use this tool when the user asks to:
@@ -1342,35 +2470,39 @@ def unpause_dag(dag_id: str) -> str:
     Returns:
         JSON with updated DAG details showing is_paused=False
     """
-    return _unpause_dag_impl(dag_id=dag_id)
+    return await _unpause_dag_impl(dag_id=dag_id)
 
 
-def _list_assets_impl(
-    limit: int = DEFAULT_LIMIT,
+async def _list_assets_impl(
+    limit: int | None = None,
     offset: int = DEFAULT_OFFSET,
+    fields: list[str] | None = None,
 ) -> str:
     """Internal implementation for listing assets from Airflow.
 
     Args:
-        limit: Maximum number of assets to return (default: 100)
+        limit: Maximum number of assets to return (default: all)
         offset: Offset for pagination (default: 0)
+        fields: Fields to return for each asset (default: all)
 
     Returns:
         JSON string containing the list of assets with their metadata
     """
     try:
-        adapter = _get_adapter()
-        data = adapter.list_assets(limit=limit, offset=offset)
+        adapter = await _get_adapter()
+        data = await adapter.fetch_all(
+            adapter.list_assets, "assets", max_items=limit, offset=offset
+        )
 
         if "assets" in data:
-            return _wrap_list_response(data["assets"], "assets", data)
+            return _wrap_list_response(data["assets"], "assets", data, fields)
         return f"No assets found. Response: {data}"
     except Exception as e:
         return str(e)
 
 
 @mcp.tool()
-def list_assets() -> str:
+async def list_assets(fields: list[str] | None = None) -> str:
     """Get data assets and datasets tracked by Airflow (data lineage).
 
     Use this tool when the user asks about:
@@ -1391,15 +2523,19 @@ def list_assets() -> str:
     - consuming_dags: Which DAGs depend on this asset
     - producing_tasks: Which tasks create/update this asset
 
+    Args:
+        fields: Only return these fields for each asset (default: all)
+
     Returns:
         JSON with list of all assets and their producing/consuming relationships
     """
-    return _list_assets_impl()
+    return await _list_assets_impl(fields=fields)
 
 
-def _list_connections_impl(
-    limit: int = DEFAULT_LIMIT,
+async def _list_connections_impl(
+    limit: int | None = None,
     offset: int = DEFAULT_OFFSET,
+    fields: list[str] | None = None,
 ) -> str:
     """Internal implementation for listing connections from Airflow.
 
@@ -1407,16 +2543,19 @@ def _list_connections_impl(
     to exclude sensitive information like passwords for security reasons.
 
     Args:
-        limit: Maximum number of connections to return (default: 100)
+        limit: Maximum number of connections to return (default: all)
         offset: Offset for pagination (default: 0)
+        fields: Fields to return for each connection (default: all but password)
 
     Returns:
         JSON string containing the list of connections with their metadata
     """
 
     try:
-        adapter = _get_adapter()
-        data = adapter.list_connections(limit=limit, offset=offset)
+        adapter = await _get_adapter()
+        data = await adapter.fetch_all(
+            adapter.list_connections, "connections", max_items=limit, offset=offset
+        )
 
         if "connections" in data:
             connections = data["connections"]
@@ -1438,6 +2577,7 @@ def _list_connections_impl(
                 }
                 for conn in connections
             ]
+            filtered_connections = [_project(conn, fields) for conn in filtered_connections]
 
             result = {
                 "total_connections": total_entries,
@@ -1445,14 +2585,14 @@ def _list_connections_impl(
                 "connections": filtered_connections,
             }
 
-            return json.dumps(result, indent=2)
+            return _to_json(result)
         return f"No connections found. Response: {data}"
     except Exception as e:
         return str(e)
 
 
 @mcp.tool()
-def list_connections() -> str:
+async def list_connections(fields: list[str] | None = None) -> str:
     """Get connection configurations for external systems (databases, APIs, services).
 
     Use this tool when the user asks about:
@@ -1477,174 +2617,194 @@ def list_connections() -> str:
 
     IMPORTANT: Passwords are NEVER returned for security reasons.
 
+    Args:
+        fields: Only return these fields for each connection (default: all)
+
     Returns:
         JSON with list of all connections (credentials excluded)
     """
-    return _list_connections_impl()
+    return await _list_connections_impl(fields=fields)
 
 
-def _get_variable_impl(
+async def _get_variable_impl(
     variable_key: str,
+    fields: list[str] | None = None,
 ) -> str:
     """Internal implementation for getting a specific variable from Airflow.
 
     Args:
         variable_key: The key of the variable to get
+        fields: Fields to return (default: all)
 
     Returns:
         JSON string containing the variable details
     """
     try:
-        adapter = _get_adapter()
-        data = adapter.get_variable(variable_key)
-        return json.dumps(data, indent=2)
+        adapter = await _get_adapter()
+        data = await adapter.get_variable(variable_key)
+        return _to_json(_project(data, fields))
     except Exception as e:
         return str(e)
 
 
-def _list_variables_impl(
-    limit: int = DEFAULT_LIMIT,
+async def _list_variables_impl(
+    limit: int | None = None,
     offset: int = DEFAULT_OFFSET,
+    fields: list[str] | None = None,
 ) -> str:
     """Internal implementation for listing variables from Airflow.
 
     Args:
-        limit: Maximum number of variables to return (default: 100)
+        limit: Maximum number of variables to return (default: all)
         offset: Offset for pagination (default: 0)
+        fields: Fields to return for each variable (default: all)
 
     Returns:
         JSON string containing the list of variables with their metadata
     """
     try:
-        adapter = _get_adapter()
-        data = adapter.list_variables(limit=limit, offset=offset)
+        adapter = await _get_adapter()
+        data = await adapter.fetch_all(
+            adapter.list_variables, "variables", max_items=limit, offset=offset
+        )
 
         if "variables" in data:
-            return _wrap_list_response(data["variables"], "variables", data)
+            return _wrap_list_response(data["variables"], "variables", data, fields)
         return f"No variables found. Response: {data}"
     except Exception as e:
         return str(e)
 
 
-def _get_version_impl() -> str:
+async def _get_version_impl() -> str:
     """Internal implementation for getting Airflow version information.
 
     Returns:
         JSON string containing the Airflow version information
     """
     try:
-        adapter = _get_adapter()
-        data = adapter.get_version()
-        return json.dumps(data, indent=2)
+        adapter = await _get_adapter()
+        data = await adapter.get_version()
+        return _to_json(data)
     except Exception as e:
         return str(e)
 
 
-def _get_config_impl() -> str:
+async def _get_config_impl() -> str:
     """Internal implementation for getting Airflow configuration.
 
     Returns:
         JSON string containing the Airflow configuration organized by sections
     """
     try:
-        adapter = _get_adapter()
-        data = adapter.get_config()
+        adapter = await _get_adapter()
+        data = await adapter.get_config()
 
         if "sections" in data:
             # Add summary metadata and pass through sections
             result = {"total_sections": len(data["sections"]), "sections": data["sections"]}
-            return json.dumps(result, indent=2)
+            return _to_json(result)
         return f"No configuration found. Response: {data}"
     except Exception as e:
         return str(e)
 
 
-def _get_pool_impl(
+async def _get_pool_impl(
     pool_name: str,
+    fields: list[str] | None = None,
 ) -> str:
     """Internal implementation for getting details about a specific pool.
 
     Args:
         pool_name: The name of the pool to get details for
+        fields: Fields to return (default: all)
 
     Returns:
         JSON string containing the pool details
     """
     try:
-        adapter = _get_adapter()
-        data = adapter.get_pool(pool_name)
-        return json.dumps(data, indent=2)
+        adapter = await _get_adapter()
+        data = await adapter.get_pool(pool_name)
+        return _to_json(_project(data, fields))
     except Exception as e:
         return str(e)
 
 
-def _list_pools_impl(
-    limit: int = DEFAULT_LIMIT,
+async def _list_pools_impl(
+    limit: int | None = None,
     offset: int = DEFAULT_OFFSET,
+    fields: list[str] | None = None,
 ) -> str:
     """Internal implementation for listing pools from Airflow.
 
     Args:
-        limit: Maximum number of pools to return (default: 100)
+        limit: Maximum number of pools to return (default: all)
         offset: Offset for pagination (default: 0)
+        fields: Fields to return for each pool (default: all)
 
     Returns:
         JSON string containing the list of pools with their metadata
     """
     try:
-        adapter = _get_adapter()
-        data = adapter.list_pools(limit=limit, offset=offset)
+        adapter = await _get_adapter()
+        data = await adapter.fetch_all(adapter.list_pools, "pools", max_items=limit, offset=offset)
 
         if "pools" in data:
-            return _wrap_list_response(data["pools"], "pools", data)
+            return _wrap_list_response(data["pools"], "pools", data, fields)
         return f"No pools found. Response: {data}"
     except Exception as e:
         return str(e)
 
 
-def _list_plugins_impl(
-    limit: int = DEFAULT_LIMIT,
+async def _list_plugins_impl(
+    limit: int | None = None,
     offset: int = DEFAULT_OFFSET,
+    fields: list[str] | None = None,
 ) -> str:
     """Internal implementation for listing installed plugins from Airflow.
 
     Args:
-        limit: Maximum number of plugins to return (default: 100)
+        limit: Maximum number of plugins to return (default: all)
         offset: Offset for pagination (default: 0)
+        fields: Fields to return for each plugin (default: all)
 
     Returns:
         JSON string containing the list of installed plugins
     """
     try:
-        adapter = _get_adapter()
-        data = adapter.list_plugins(limit=limit, offset=offset)
+        adapter = await _get_adapter()
+        data = await adapter.fetch_all(
+            adapter.list_plugins, "plugins", max_items=limit, offset=offset
+        )
 
         if "plugins" in data:
-            return _wrap_list_response(data["plugins"], "plugins", data)
+            return _wrap_list_response(data["plugins"], "plugins", data, fields)
         return f"No plugins found. Response: {data}"
     except Exception as e:
         return str(e)
 
 
-def _list_providers_impl() -> str:
+async def _list_providers_impl(fields: list[str] | None = None) -> str:
     """Internal implementation for listing installed providers from Airflow.
 
+    Args:
+        fields: Fields to return for each provider (default: all)
+
     Returns:
         JSON string containing the list of installed providers
     """
     try:
-        adapter = _get_adapter()
-        data = adapter.list_providers()
+        adapter = await _get_adapter()
+        data = await adapter.list_providers()
 
         if "providers" in data:
-            return _wrap_list_response(data["providers"], "providers", data)
+            return _wrap_list_response(data["providers"], "providers", data, fields)
         return f"No providers found. Response: {data}"
     except Exception as e:
         return str(e)
 
 
 @mcp.tool()
-def get_pool(pool_name: str) -> str:
+async def get_pool(pool_name: str, fields: list[str] | None = None) -> str:
     """Get detailed information about a specific resource pool.
 
     Use this tool when the user asks about:
@@ -1667,15 +2827,16 @@ def get_pool(pool_name: str) -> str:
 
     Args:
         pool_name: The name of the pool to get details for (e.g., "default_pool")
+        fields: Only return these fields (default: all)
 
     Returns:
         JSON with complete details about the specified pool
     """
-    return _get_pool_impl(pool_name=pool_name)
+    return await _get_pool_impl(pool_name=pool_name, fields=fields)
 
 
 @mcp.tool()
-def list_pools() -> str:
+async def list_pools(fields: list[str] | None = None) -> str:
     """Get resource pools for managing task concurrency and resource allocation.
 
     Use this tool when the user asks about:
@@ -1698,14 +2859,17 @@ def list_pools() -> str:
     - open_slots: Number of available slots (slots - occupied_slots)
     - description: Human-readable description of the pool's purpose
 
+    Args:
+        fields: Only return these fields for each pool (default: all)
+
     Returns:
         JSON with list of all pools and their current utilization
     """
-    return _list_pools_impl()
+    return await _list_pools_impl(fields=fields)
 
 
 @mcp.tool()
-def list_plugins() -> str:
+async def list_plugins(fields: list[str] | None = None) -> str:
     """Get information about installed Airflow plugins.
 
     Use this tool when the user asks about:
@@ -1727,14 +2891,17 @@ def list_plugins() -> str:
     - appbuilder_views: Flask-AppBuilder views for admin interface
     - appbuilder_menu_items: Custom menu items in the UI
 
+    Args:
+        fields: Only return these fields for each plugin (default: all)
+
     Returns:
         JSON with list of all installed plugins and their components
     """
-    return _list_plugins_impl()
+    return await _list_plugins_impl(fields=fields)
 
 
 @mcp.tool()
-def list_providers() -> str:
+async def list_providers(fields: list[str] | None = None) -> str:
     """Get information about installed Airflow provider packages.
 
     Use this tool when the user asks about:
@@ -1749,14 +2916,17 @@ def list_providers() -> str:
     - description: What the provider does
     - provider_info: Details about operators, hooks, and sensors included
 
+    Args:
+        fields: Only return these fields for each provider (default: all)
+
     Returns:
         JSON with list of all installed provider packages and their details
     """
-    return _list_providers_impl()
+    return await _list_providers_impl(fields=fields)
 
 
 @mcp.tool()
-def get_variable(variable_key: str) -> str:
+async def get_variable(variable_key: str, fields: list[str] | None = None) -> str:
     """Get a specific Airflow variable by key.
 
     Use this tool when the user asks about:
@@ -1775,15 +2945,16 @@ def get_variable(variable_key: str) -> str:
 
     Args:
         variable_key: The key/name of the variable to retrieve
+        fields: Only return these fields (default: all)
 
     Returns:
         JSON with the variable's key, value, and metadata
     """
-    return _get_variable_impl(variable_key=variable_key)
+    return await _get_variable_impl(variable_key=variable_key, fields=fields)
 
 
 @mcp.tool()
-def list_variables() -> str:
+async def list_variables(fields: list[str] | None = None) -> str:
     """Get all Airflow variables (key-value configuration pairs).
 
     Use this tool when the user asks about:
@@ -1805,14 +2976,17 @@ def list_variables() -> str:
     IMPORTANT: Sensitive variables (like passwords, API keys) may have their
     values masked in the response for security reasons.
 
+    Args:
+        fields: Only return these fields for each variable (default: all)
+
     Returns:
         JSON with list of all variables and their values
     """
-    return _list_variables_impl()
+    return await _list_variables_impl(fields=fields)
 
 
 @mcp.tool()
-def get_airflow_version() -> str:
+async def get_airflow_version() -> str:
     """Get version information for the Airflow instance.
 
     Use this tool when the user asks about:
@@ -1834,11 +3008,11 @@ def get_airflow_version() -> str:
     Returns:
         JSON with Airflow version information
     """
-    return _get_version_impl()
+    return await _get_version_impl()
 
 
 @mcp.tool()
-def get_airflow_config() -> str:
+async def get_airflow_config() -> str:
     """Get Airflow instance configuration and settings.
 
     Use this tool when the user asks about:
@@ -1866,7 +3040,7 @@ def get_airflow_config() -> str:
     Returns:
         JSON with complete Airflow configuration organized by sections
     """
-    return _get_config_impl()
+    return await _get_config_impl()
 
 
 # =============================================================================
@@ -1875,7 +3049,7 @@ def get_airflow_config() -> str:
 
 
 @mcp.tool()
-def explore_dag(dag_id: str) -> str:
+async def explore_dag(dag_id: str) -> str:
     """Comprehensive investigation of a DAG - get all relevant info in one call.
 
     USE THIS TOOL WHEN you need to understand a DAG completely. Instead of making
@@ -1899,32 +3073,102 @@ def explore_dag(dag_id: str) -> str:
         JSON with comprehensive DAG information
     """
     result: dict[str, Any] = {"dag_id": dag_id}
-    adapter = _get_adapter()
+    adapter = await _get_adapter()
+
+    # DAG details, tasks and source are independent - fetch them concurrently
+    dag_info, tasks_data, source = await _gather_partial(
+        adapter.get_dag(dag_id),
+        adapter.list_tasks(dag_id),
+        adapter.get_dag_source(dag_id),
+    )
 
     # Get DAG details
-    try:
-        result["dag_info"] = adapter.get_dag(dag_id)
-    except Exception as e:
-        result["dag_info"] = {"error": str(e)}
+    if isinstance(dag_info, BaseException):
+        result["dag_info"] = {"error": str(dag_info)}
+    else:
+        result["dag_info"] = dag_info
 
     # Get tasks
-    try:
-        tasks_data = adapter.list_tasks(dag_id)
+    if isinstance(tasks_data, BaseException):
+        result["tasks"] = {"error": str(tasks_data)}
+    else:
         result["tasks"] = tasks_data.get("tasks", [])
-    except Exception as e:
-        result["tasks"] = {"error": str(e)}
 
     # Get DAG source
-    try:
-        result["source"] = adapter.get_dag_source(dag_id)
-    except Exception as e:
-        result["source"] = {"error": str(e)}
+    if isinstance(source, BaseException):
+        result["source"] = {"error": str(source)}
+    else:
+        result["source"] = source
+
+    return _to_json(result)
+
+
+async def _summarize_task_log(
+    adapter: AsyncAirflowAdapter,
+    dag_id: str,
+    dag_run_id: str,
+    task_instance: dict[str, Any],
+    log_mode: str,
+    max_log_bytes: int,
+) -> dict[str, Any]:
+    """Read the latest try's log of a task instance and reduce it to a digest or tail."""
+    map_index = task_instance.get("map_index")
+    stream = adapter.stream_task_logs(
+        dag_id,
+        dag_run_id,
+        task_instance["task_id"],
+        max(task_instance.get("try_number") or 1, 1),
+        -1 if map_index is None else map_index,
+    )
+    async with aclosing(stream) as lines:
+        if log_mode == "tail":
+            return asdict(await task_logs.tail_bytes(lines, max_log_bytes))
+        return task_logs.trim_digest(await task_logs.digest(lines), max_log_bytes)
+
+
+async def _attach_failed_task_logs(
+    adapter: AsyncAirflowAdapter,
+    dag_id: str,
+    dag_run_id: str,
+    failed: list[tuple[dict[str, Any], dict[str, Any]]],
+    log_mode: str,
+    max_log_bytes: int,
+) -> None:
+    """Add a "log" summary to each failed task entry, reading logs concurrently.
 
-    return json.dumps(result, indent=2)
+    Args:
+        failed: (summary entry, task instance) pairs; tasks that never started
+            (e.g. upstream_failed) have no log and are left alone
+    """
+    semaphore = asyncio.Semaphore(DEFAULT_LOG_CONCURRENCY)
+
+    async def _attach(entry: dict[str, Any], task_instance: dict[str, Any]) -> None:
+        async with semaphore:
+            try:
+                entry["log"] = await asyncio.wait_for(
+                    _summarize_task_log(
+                        adapter, dag_id, dag_run_id, task_instance, log_mode, max_log_bytes
+                    ),
+                    SUBREQUEST_TIMEOUT_SECONDS,
+                )
+            except asyncio.TimeoutError:
+                entry["log"] = {
+                    "error": f"Log read timed out after {SUBREQUEST_TIMEOUT_SECONDS} seconds"
+                }
+            except Exception as e:
+                entry["log"] = {"error": str(e)}
+
+    await asyncio.gather(*(_attach(entry, ti) for entry, ti in failed if ti.get("start_date")))
 
 
 @mcp.tool()
-def diagnose_dag_run(dag_id: str, dag_run_id: str) -> str:
+async def diagnose_dag_run(
+    dag_id: str,
+    dag_run_id: str,
+    include_logs: bool = False,
+    log_mode: str = "digest",
+    max_log_bytes: int = DEFAULT_DIAGNOSE_LOG_BYTES,
+) -> str:
     """Diagnose issues with a specific DAG run - get run details and failed tasks.
 
     USE THIS TOOL WHEN troubleshooting a failed or problematic DAG run. Returns
@@ -1941,59 +3185,85 @@ def diagnose_dag_run(dag_id: str, dag_run_id: str) -> str:
     - Highlighted failed/upstream_failed tasks with details
     - Summary of task states
 
+    With include_logs=True, the logs of the failed tasks' latest tries are
+    read concurrently and each failed task gets a "log" entry: an error
+    digest (tracebacks, ERROR lines, final lines) or the end of the log.
+    This usually gives the root cause in one call, without get_task_logs.
+
     Args:
         dag_id: The ID of the DAG
         dag_run_id: The ID of the DAG run (e.g., "manual__2024-01-01T00:00:00+00:00")
+        include_logs: Attach a log summary to each failed task (default: False)
+        log_mode: "digest" for tracebacks and error lines, or "tail" for the
+                  end of the log (default: "digest")
+        max_log_bytes: Size cap for each task's log summary (default: 8 KB)
 
     Returns:
         JSON with diagnostic information about the DAG run
     """
+    if log_mode not in DIAGNOSE_LOG_MODES:
+        return f"Invalid log_mode {log_mode!r}; expected one of: {', '.join(DIAGNOSE_LOG_MODES)}"
+
     result: dict[str, Any] = {"dag_id": dag_id, "dag_run_id": dag_run_id}
-    adapter = _get_adapter()
+    adapter = await _get_adapter()
+
+    # Run details and task instances are fetched concurrently
+    run_info, tasks_data = await _gather_partial(
+        adapter.get_dag_run(dag_id, dag_run_id),
+        adapter.fetch_all(
+            adapter.get_task_instances,
+            "task_instances",
+            dag_id=dag_id,
+            dag_run_id=dag_run_id,
+        ),
+    )
 
     # Get DAG run details
-    try:
-        result["run_info"] = adapter.get_dag_run(dag_id, dag_run_id)
-    except Exception as e:
-        result["run_info"] = {"error": str(e)}
-        return json.dumps(result, indent=2)
+    if isinstance(run_info, BaseException):
+        result["run_info"] = {"error": str(run_info)}
+        return _to_json(result)
+    result["run_info"] = run_info
 
     # Get task instances for this run
-    try:
-        tasks_data = adapter.get_task_instances(dag_id, dag_run_id)
-        task_instances = tasks_data.get("task_instances", [])
-        result["task_instances"] = task_instances
+    if isinstance(tasks_data, BaseException):
+        result["task_instances"] = {"error": str(tasks_data)}
+        return _to_json(result)
+
+    task_instances = tasks_data.get("task_instances", [])
+    result["task_instances"] = [_project(ti, TaskInstance.summary_fields) for ti in task_instances]
+
+    # Summarize task states
+    state_counts: dict[str, int] = {}
+    failed: list[tuple[dict[str, Any], dict[str, Any]]] = []
+    for ti in task_instances:
+        state = ti.get("state", "unknown")
+        state_counts[state] = state_counts.get(state, 0) + 1
+        if state in ("failed", "upstream_failed"):
+            entry = {
+                "task_id": ti.get("task_id"),
+                "state": state,
+                "start_date": ti.get("start_date"),
+                "end_date": ti.get("end_date"),
+                "try_number": ti.get("try_number"),
+            }
+            if ti.get("map_index") not in (None, -1):
+                entry["map_index"] = ti["map_index"]
+            failed.append((entry, ti))
 
-        # Summarize task states
-        state_counts: dict[str, int] = {}
-        failed_tasks = []
-        for ti in task_instances:
-            state = ti.get("state", "unknown")
-            state_counts[state] = state_counts.get(state, 0) + 1
-            if state in ("failed", "upstream_failed"):
-                failed_tasks.append(
-                    {
-                        "task_id": ti.get("task_id"),
-                        "state": state,
-                        "start_date": ti.get("start_date"),
-                        "end_date": ti.get("end_date"),
-                        "try_number": ti.get("try_number"),
-                    }
-                )
+    if include_logs:
+        await _attach_failed_task_logs(adapter, dag_id, dag_run_id, failed, log_mode, max_log_bytes)
 
-        result["summary"] = {
-            "total_tasks": len(task_instances),
-            "state_counts": state_counts,
-            "failed_tasks": failed_tasks,
-        }
-    except Exception as e:
-        result["task_instances"] = {"error": str(e)}
+    result["summary"] = {
+        "total_tasks": len(task_instances),
+        "state_counts": state_counts,
+        "failed_tasks": [entry for entry, _ in failed],
+    }
 
-    return json.dumps(result, indent=2)
+    return _to_json(result)
 
 
 @mcp.tool()
-def get_system_health() -> str:
+async def get_system_health() -> str:
     """Get overall Airflow system health - import errors, warnings, and DAG stats.
 
     USE THIS TOOL WHEN you need a quick health check of the Airflow system.
@@ -2015,41 +3285,47 @@ def get_system_health() -> str:
         JSON with system health overview
     """
     result: dict[str, Any] = {}
-    adapter = _get_adapter()
+    adapter = await _get_adapter()
+
+    # All health checks are independent - run them concurrently
+    version, errors_data, warnings_data, dag_stats = await _gather_partial(
+        adapter.get_version(),
+        adapter.fetch_all(adapter.list_import_errors, "import_errors"),
+        adapter.fetch_all(adapter.list_dag_warnings, "dag_warnings"),
+        adapter.get_dag_stats(),
+    )
 
     # Get version info
-    try:
-        result["version"] = adapter.get_version()
-    except Exception as e:
-        result["version"] = {"error": str(e)}
+    if isinstance(version, BaseException):
+        result["version"] = {"error": str(version)}
+    else:
+        result["version"] = version
 
     # Get import errors
-    try:
-        errors_data = adapter.list_import_errors(limit=100)
+    if isinstance(errors_data, BaseException):
+        result["import_errors"] = {"error": str(errors_data)}
+    else:
         import_errors = errors_data.get("import_errors", [])
         result["import_errors"] = {
             "count": len(import_errors),
             "errors": import_errors,
         }
-    except Exception as e:
-        result["import_errors"] = {"error": str(e)}
 
     # Get DAG warnings
-    try:
-        warnings_data = adapter.list_dag_warnings(limit=100)
+    if isinstance(warnings_data, BaseException):
+        result["dag_warnings"] = {"error": str(warnings_data)}
+    else:
         dag_warnings = warnings_data.get("dag_warnings", [])
         result["dag_warnings"] = {
             "count": len(dag_warnings),
             "warnings": dag_warnings,
         }
-    except Exception as e:
-        result["dag_warnings"] = {"error": str(e)}
 
     # Get DAG stats
-    try:
-        result["dag_stats"] = adapter.get_dag_stats()
-    except Exception:
+    if isinstance(dag_stats, BaseException):
         result["dag_stats"] = {"available": False, "note": "dagStats endpoint not available"}
+    else:
+        result["dag_stats"] = dag_stats
 
     # Calculate overall health status
     import_error_count = result.get("import_errors", {}).get("count", 0)
@@ -2065,7 +3341,7 @@ def get_system_health() -> str:
         result["overall_status"] = "healthy"
         result["status_reason"] = "No import errors or warnings"
 
-    return json.dumps(result, indent=2)
+    return _to_json(result)
 
 
 # =============================================================================
@@ -2074,27 +3350,35 @@ def get_system_health() -> str:
 
 
 @mcp.resource("airflow://version")
-def resource_version() -> str:
+async def resource_version() -> str:
     """Get Airflow version information as a resource."""
-    return _get_version_impl()
+    return await _get_version_impl()
 
 
 @mcp.resource("airflow://providers")
-def resource_providers() -> str:
+async def resource_providers() -> str:
     """Get installed Airflow providers as a resource."""
-    return _list_providers_impl()
+    return await _list_providers_impl()
 
 
 @mcp.resource("airflow://plugins")
-def resource_plugins() -> str:
+async def resource_plugins() -> str:
     """Get installed Airflow plugins as a resource."""
-    return _list_plugins_impl()
+    return await _list_plugins_impl()
 
 
 @mcp.resource("airflow://config")
-def resource_config() -> str:
+async def resource_config() -> str:
     """Get Airflow configuration as a resource."""
-    return _get_config_impl()
+    return await _get_config_impl()
+
+
+@mcp.resource("airflow://cache-stats")
+def resource_cache_stats() -> str:
+    """Get response cache hit/miss counters as a resource."""
+    if _adapter is None or _adapter.cache is None:
+        return _to_json({"enabled": _config.response_cache, "initialized": False})
+    return _to_json({"enabled": True, **_adapter.cache.stats()})
 
 
 # =============================================================================
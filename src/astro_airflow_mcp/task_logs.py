@@ -0,0 +1,412 @@
+"""Bounded views over streamed task logs.
+
+Task logs can be hundreds of megabytes, so tools never hold a whole log in
+memory. Adapters yield log lines as they arrive from Airflow and the helpers
+here keep only the requested window: the last N bytes or lines, the first N
+lines, or a byte range. Head and range reads stop consuming the stream as
+soon as the window is filled, and searches stop once enough matches are found.
+A digest keeps only what explains a failure: tracebacks, error lines and the
+last lines of the log.
+"""
+
+import json
+import re
+from collections import deque
+from collections.abc import AsyncIterator
+from dataclasses import dataclass
+from typing import Any
+
+# Default window returned by get_task_logs: the end of a log is where failures are
+DEFAULT_LOG_TAIL_BYTES = 32 * 1024
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+
+
+@dataclass
+class LogWindow:
+    """A slice of a task log plus enough bookkeeping to fetch more of it.
+
+    Attributes:
+        content: The selected log text
+        lines: Number of lines in content
+        bytes_read: Bytes of log consumed from the stream to build the window
+        truncated: Whether part of the log outside the window was left out
+        next_byte_offset: Offset to continue a byte range read from, if more remains
+    """
+
+    content: str
+    lines: int
+    bytes_read: int
+    truncated: bool
+    next_byte_offset: int | None = None
+
+
+def _format_error_detail(error_detail: list[dict[str, Any]]) -> list[str]:
+    """Render Airflow 3's structured exception info as a Python-style traceback."""
+    lines: list[str] = []
+    for exc in error_detail:
+        if lines:
+            lines += [
+                "",
+                "The above exception was the direct cause of the following exception:",
+                "",
+            ]
+        lines.append("Traceback (most recent call last):")
+        for frame in exc.get("frames") or []:
+            lines.append(
+                f'  File "{frame.get("filename")}", line {frame.get("lineno")}, in {frame.get("name")}'
+            )
+        lines.append(f"{exc.get('exc_type')}: {exc.get('exc_value')}")
+    return lines
+
+
+def format_log_entry(entry: Any) -> str:
+    """Render one log entry as text.
+
+    Airflow 3 returns structured entries (dicts with timestamp, level and
+    event, plus error_detail for exceptions); Airflow 2 returns plain text
+    lines. Exceptions are rendered as tracebacks on the following lines.
+    """
+    if not isinstance(entry, dict):
+        return str(entry)
+    event = str(entry.get("event", ""))
+    timestamp = entry.get("timestamp")
+    level = entry.get("level")
+    prefix = f"[{timestamp}] " if timestamp else ""
+    if level:
+        prefix += f"{str(level).upper()} - "
+    error_detail = entry.get("error_detail")
+    if isinstance(error_detail, list) and error_detail:
+        return "\n".join([prefix + event, *_format_error_detail(error_detail)])
+    return prefix + event
+
+
+def decode_ndjson_line(line: str) -> str:
+    """Render one line of an NDJSON log stream as text, passing through non-JSON lines."""
+    try:
+        return format_log_entry(json.loads(line))
+    except ValueError:
+        return line
+
+
+def render_log_content(content: Any) -> str:
+    """Render the content of a JSON log response (string or list of entries) as text."""
+    if isinstance(content, list):
+        return "\n".join(format_log_entry(entry) for entry in content)
+    return "" if content is None else str(content)
+
+
+def _size(line: str) -> int:
+    return len(line.encode()) + 1
+
+
+async def tail_bytes(lines: AsyncIterator[str], max_bytes: int) -> LogWindow:
+    """Keep the last max_bytes of the log, cut at a line boundary where possible."""
+    window: deque[str] = deque()
+    window_size = 0
+    total = 0
+    async for line in lines:
+        size = _size(line)
+        total += size
+        window.append(line)
+        window_size += size
+        while len(window) > 1 and window_size > max_bytes:
+            window_size -= _size(window.popleft())
+
+    content = "\n".join(window)
+    if window_size > max_bytes:
+        # A single line longer than the window: keep its end
+        content = content.encode()[-max_bytes:].decode(errors="ignore")
+        window_size = max_bytes
+    return LogWindow(
+        content=content,
+        lines=len(window),
+        bytes_read=total,
+        truncated=window_size < total,
+    )
+
+
+async def tail_lines(lines: AsyncIterator[str], count: int) -> LogWindow:
+    """Keep the last count lines of the log."""
+    window: deque[str] = deque(maxlen=max(count, 0))
+    total = 0
+    seen = 0
+    async for line in lines:
+        total += _size(line)
+        seen += 1
+        window.append(line)
+    return LogWindow(
+        content="\n".join(window),
+        lines=len(window),
+        bytes_read=total,
+        truncated=seen > len(window),
+    )
+
+
+async def head_lines(lines: AsyncIterator[str], count: int) -> LogWindow:
+    """Take the first count lines of the log, without reading the rest of it."""
+    window: list[str] = []
+    total = 0
+    truncated = False
+    async for line in lines:
+        if len(window) >= count:
+            truncated = True
+            break
+        window.append(line)
+        total += _size(line)
+    return LogWindow(
+        content="\n".join(window),
+        lines=len(window),
+        bytes_read=total,
+        truncated=truncated,
+    )
+
+
+async def byte_range(lines: AsyncIterator[str], offset: int, limit: int) -> LogWindow:
+    """Take limit bytes of the log starting at offset, stopping once they are read.
+
+    Offsets count the log as UTF-8 text with one newline after each line, so
+    next_byte_offset can be passed back to read the following range.
+    """
+    end = offset + limit
+    position = 0
+    chunks: list[bytes] = []
+    more = False
+    async for line in lines:
+        if position >= end:
+            more = True
+            break
+        data = line.encode() + b"\n"
+        if position + len(data) > offset:
+            chunks.append(data[max(offset - position, 0) : end - position])
+        position += len(data)
+    if position > end:
+        more = True
+
+    content = b"".join(chunks).decode(errors="ignore")
+    return LogWindow(
+        content=content,
+        lines=content.count("\n") + (1 if content and not content.endswith("\n") else 0),
+        bytes_read=min(position, end),
+        truncated=more or offset > 0,
+        next_byte_offset=end if more else None,
+    )
+
+
+@dataclass
+class MatchBudget:
+    """A match limit shared by log searches running concurrently.
+
+    Searches stop reading their log once the budget is used up, so a search
+    over many logs ends as soon as enough matches are found.
+    """
+
+    limit: int
+    used: int = 0
+
+    @property
+    def exhausted(self) -> bool:
+        return self.used >= self.limit
+
+    def take(self) -> bool:
+        """Claim one match, returning False if the limit has been reached."""
+        if self.exhausted:
+            return False
+        self.used += 1
+        return True
+
+
+async def search_lines(
+    lines: AsyncIterator[str],
+    regex: re.Pattern[str],
+    context_lines: int,
+    budget: MatchBudget,
+) -> list[dict[str, Any]]:
+    """Find lines matching regex in a streamed log, with surrounding context.
+
+    Returns:
+        One dict per match with its 1-based line_number, byte_offset into the
+        log, the matching line and the lines before and after it
+    """
+    before: deque[str] = deque(maxlen=context_lines)
+    matches: list[dict[str, Any]] = []
+    # Matches still collecting their trailing context
+    pending: list[dict[str, Any]] = []
+    position = 0
+    line_number = 0
+    async for line in lines:
+        line_number += 1
+        for match in pending:
+            match["after"].append(line)
+        pending = [match for match in pending if len(match["after"]) < context_lines]
+
+        if regex.search(line) and budget.take():
+            match = {
+                "line_number": line_number,
+                "byte_offset": position,
+                "line": line,
+                "before": list(before),
+                "after": [],
+            }
+            matches.append(match)
+            if context_lines > 0:
+                pending.append(match)
+
+        before.append(line)
+        position += _size(line)
+        if budget.exhausted and not pending:
+            break
+    return matches
+
+
+# Digest limits: distinct error lines kept, lines kept per traceback, final lines
+DIGEST_MAX_ERROR_LINES = 50
+DIGEST_MAX_TRACEBACK_LINES = 100
+DIGEST_FINAL_LINES = 20
+
+TRACEBACK_START = "Traceback (most recent call last):"
+_ERROR_LINE = re.compile(r"\b(ERROR|CRITICAL)\b")
+# Leading timestamp of an Airflow log line, e.g. "[2024-01-01, 00:00:00 UTC] "
+_TIMESTAMP_PREFIX = re.compile(r"^\[[^\]]*\]\s*")
+
+
+class _Traceback:
+    """A traceback being collected from the log."""
+
+    def __init__(self, line_number: int, byte_offset: int):
+        self.line_number = line_number
+        self.byte_offset = byte_offset
+        self.lines: deque[str] = deque(maxlen=DIGEST_MAX_TRACEBACK_LINES)
+        self.dropped = 0
+
+    def add(self, line: str) -> None:
+        if len(self.lines) == self.lines.maxlen:
+            self.dropped += 1
+        self.lines.append(line)
+
+    @property
+    def exception(self) -> str:
+        return self.lines[-1] if self.lines else ""
+
+    @property
+    def key(self) -> tuple[str, ...]:
+        """Frames plus exception line, so the same error raised again is deduplicated."""
+        frames = tuple(line for line in self.lines if line.lstrip().startswith("File "))
+        return (*frames, self.exception)
+
+    def text(self) -> str:
+        lines = list(self.lines)
+        if self.dropped:
+            lines.insert(0, f"... ({self.dropped} earlier lines omitted)")
+        return "\n".join([TRACEBACK_START, *lines])
+
+
+async def digest(
+    lines: AsyncIterator[str],
+    final_lines: int = DIGEST_FINAL_LINES,
+    max_error_lines: int = DIGEST_MAX_ERROR_LINES,
+) -> dict[str, Any]:
+    """Extract the parts of a log that explain a failure.
+
+    The log is read once and only the digest is kept: Python tracebacks
+    (identical ones are reported once with an occurrence count),
+    ERROR/CRITICAL lines (deduplicated ignoring timestamps) and the final
+    lines before the task exited. Every entry has a byte_offset into the
+    full log, usable with get_task_logs to read around it.
+
+    Returns:
+        Dict with tracebacks, error_lines, final_lines and the size of the log
+    """
+    tracebacks: dict[tuple[str, ...], dict[str, Any]] = {}
+    errors: dict[str, dict[str, Any]] = {}
+    errors_omitted = 0
+    final: deque[tuple[int, str]] = deque(maxlen=final_lines)
+    current: _Traceback | None = None
+    position = 0
+    line_number = 0
+
+    def _finish(tb: _Traceback) -> None:
+        seen = tracebacks.get(tb.key)
+        if seen is not None:
+            seen["occurrences"] += 1
+            return
+        tracebacks[tb.key] = {
+            "line_number": tb.line_number,
+            "byte_offset": tb.byte_offset,
+            "exception": tb.exception,
+            "traceback": tb.text(),
+            "occurrences": 1,
+        }
+
+    async for entry in lines:
+        # Rendered structured entries can span several lines
+        for line in entry.split("\n"):
+            line_number += 1
+            final.append((position, line))
+            if current is not None:
+                current.add(line)
+                # Frames and source lines are indented; the first unindented
+                # line is the exception itself and ends the traceback
+                if line and not line[0].isspace():
+                    _finish(current)
+                    current = None
+            elif line.endswith(TRACEBACK_START):
+                current = _Traceback(line_number, position)
+            elif _ERROR_LINE.search(line):
+                message = _TIMESTAMP_PREFIX.sub("", line)
+                if message in errors:
+                    errors[message]["occurrences"] += 1
+                elif len(errors) < max_error_lines:
+                    errors[message] = {
+                        "line_number": line_number,
+                        "byte_offset": position,
+                        "line": line,
+                        "occurrences": 1,
+                    }
+                else:
+                    errors_omitted += 1
+            position += _size(line)
+    if current is not None:
+        _finish(current)
+
+    result: dict[str, Any] = {
+        "tracebacks": list(tracebacks.values()),
+        "error_lines": list(errors.values()),
+        "final_lines": {
+            "byte_offset": final[0][0] if final else position,
+            "content": "\n".join(line for _, line in final),
+        },
+        "lines_read": line_number,
+        "bytes_read": position,
+    }
+    if errors_omitted:
+        result["error_lines_omitted"] = errors_omitted
+    return result
+
+
+def trim_digest(result: dict[str, Any], max_bytes: int) -> dict[str, Any]:
+    """Shrink a digest until its JSON form fits in max_bytes.
+
+    Error lines go first, then all but the first traceback (usually the root
+    cause), then the remaining text is cut to its end. Sets truncated when
+    anything was removed.
+    """
+
+    def _fits() -> bool:
+        return len(json.dumps(result)) <= max_bytes
+
+    if _fits():
+        return result
+    result["truncated"] = True
+    while result["error_lines"] and not _fits():
+        result["error_lines"].pop()
+    while len(result["tracebacks"]) > 1 and not _fits():
+        result["tracebacks"].pop()
+    if not _fits():
+        # Keep the ends, where the exception and the exit status are
+        keep = max_bytes // 4
+        final = result["final_lines"]
+        final["content"] = final["content"].encode()[-keep:].decode(errors="ignore")
+        for tb in result["tracebacks"]:
+            tb["traceback"] = tb["traceback"].encode()[-keep:].decode(errors="ignore")
+    return result
@@ -0,0 +1,150 @@
+"""Optional OpenTelemetry tracing of tool calls and Airflow requests.
+
+Tracing is off unless configure_tracing() is given an exporter (the
+``--otel-exporter`` flag or ``OTEL_TRACES_EXPORTER``) and the OpenTelemetry
+SDK is installed (``pip install astro-airflow-mcp[tracing]``). While off,
+span() returns a shared no-op context manager, so instrumented code paths
+cost one function call.
+
+Spans are created on a tracer provider owned by this package rather than the
+global one, so an Airflow webserver's own tracing setup is left alone. Each
+Airflow API request carries a W3C traceparent header, letting its trace join
+Airflow's.
+"""
+
+import contextlib
+from collections.abc import Iterator
+from typing import Any
+
+import httpx
+from fastmcp.server.middleware import CallNext, Middleware, MiddlewareContext
+
+from astro_airflow_mcp.logging import get_logger
+from astro_airflow_mcp.metrics import endpoint_template
+
+try:
+    from opentelemetry import propagate, trace
+    from opentelemetry.sdk.resources import Resource
+    from opentelemetry.sdk.trace import TracerProvider
+    from opentelemetry.sdk.trace.export import (
+        BatchSpanProcessor,
+        ConsoleSpanExporter,
+        SpanExporter,
+    )
+except ImportError:  # pragma: no cover - optional dependency
+    trace = None  # type: ignore[assignment]
+
+logger = get_logger(__name__)
+
+TRACING_AVAILABLE = trace is not None
+# Exporter names accepted by configure_tracing
+TRACE_EXPORTERS = ("none", "console", "otlp")
+
+_NOOP = contextlib.nullcontext()
+_tracer: Any = None
+_provider: Any = None
+
+
+def tracing_enabled() -> bool:
+    return _tracer is not None
+
+
+def _create_exporter(name: str) -> "SpanExporter":
+    if name == "console":
+        return ConsoleSpanExporter()
+    if name == "otlp":
+        # Reads OTEL_EXPORTER_OTLP_ENDPOINT / OTEL_EXPORTER_OTLP_HEADERS
+        from opentelemetry.exporter.otlp.proto.http.trace_exporter import OTLPSpanExporter
+
+        return OTLPSpanExporter()
+    raise ValueError(f"Invalid trace exporter {name!r}; expected one of {TRACE_EXPORTERS}")
+
+
+def configure_tracing(exporter: "str | SpanExporter | None") -> None:
+    """Turn tracing on with the given exporter, or off with None or "none".
+
+    Args:
+        exporter: "console", "otlp" (configured by the standard OTEL_EXPORTER_OTLP_*
+            variables) or any OpenTelemetry SpanExporter instance
+
+    Raises:
+        ValueError: If the exporter name is unknown
+        ImportError: If tracing is requested but OpenTelemetry is not installed
+    """
+    global _tracer, _provider
+    previous, _provider, _tracer = _provider, None, None
+    if previous is not None:
+        previous.shutdown()
+    if exporter is None or exporter == "none":
+        return
+    if not TRACING_AVAILABLE:
+        raise ImportError(
+            "Tracing requires OpenTelemetry: pip install 'astro-airflow-mcp[tracing]'"
+        )
+    if isinstance(exporter, str):
+        exporter = _create_exporter(exporter)
+    _provider = TracerProvider(resource=Resource.create({"service.name": "astro-airflow-mcp"}))
+    _provider.add_span_processor(BatchSpanProcessor(exporter))
+    _tracer = _provider.get_tracer("astro_airflow_mcp")
+    logger.info("OpenTelemetry tracing enabled (%s)", type(exporter).__name__)
+
+
+def span(name: str, **attributes: Any) -> contextlib.AbstractContextManager[Any]:
+    """Context manager for a span, yielding the span (or None while tracing is off)."""
+    if _tracer is None:
+        return _NOOP
+    return _tracer.start_as_current_span(name, attributes=attributes)
+
+
+def set_attributes(current: Any, **attributes: Any) -> None:
+    """Set attributes on a span yielded by span(), ignoring None spans."""
+    if current is not None:
+        current.set_attributes(attributes)
+
+
+@contextlib.contextmanager
+def _request_span(
+    method: str, endpoint: str, headers: dict[str, str], record: dict[str, Any]
+) -> Iterator[Any]:
+    with _tracer.start_as_current_span(
+        f"{method.upper()} {endpoint_template(endpoint)}",
+        kind=trace.SpanKind.CLIENT,
+        attributes={
+            "http.request.method": method.upper(),
+            "url.template": endpoint_template(endpoint),
+        },
+    ) as current:
+        propagate.inject(headers)
+        yield current
+        response = record.get("response")
+        if isinstance(response, httpx.Response):
+            current.set_attribute("http.response.status_code", response.status_code)
+            current.set_attribute("http.response.body.size", len(response.content))
+            if response.status_code >= 400:
+                current.set_status(trace.StatusCode.ERROR)
+
+
+def request_span(
+    method: str, endpoint: str, headers: dict[str, str], record: dict[str, Any]
+) -> contextlib.AbstractContextManager[Any]:
+    """Span around one Airflow API request, adding traceparent to its headers.
+
+    The response is read from record["response"] (see metrics.upstream_request)
+    when the block exits.
+    """
+    if _tracer is None:
+        return _NOOP
+    return _request_span(method, endpoint, headers, record)
+
+
+class TracingMiddleware(Middleware):
+    """Open a span for every MCP tool call while tracing is on."""
+
+    async def on_call_tool(self, context: MiddlewareContext[Any], call_next: CallNext) -> Any:
+        if _tracer is None:
+            return await call_next(context)
+        tool = context.message.name
+        with _tracer.start_as_current_span(
+            f"tool {tool}", kind=trace.SpanKind.SERVER, attributes={"mcp.tool.name": tool}
+        ):
+            return await call_next(context)
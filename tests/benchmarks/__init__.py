@@ -0,0 +1,8 @@
+"""Benchmarks for Airflow MCP Server.
+
+These run the MCP tools against a fake Airflow API (tests/benchmarks/fake_airflow.py)
+serving Airflow 2 and 3 payloads, and report latency, throughput, memory and
+serialization cost as JSON:
+
+    python -m tests.benchmarks --output results.json
+"""
@@ -0,0 +1,83 @@
+"""Run the benchmarks against the fake Airflow API and print (or save) JSON results."""
+
+import argparse
+import asyncio
+import dataclasses
+import json
+import sys
+from datetime import timedelta
+
+from tests.benchmarks.dataset import PRESETS
+from tests.benchmarks.run import AIRFLOW_VERSIONS, SCENARIOS, BenchmarkOptions, run_benchmarks
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        prog="python -m tests.benchmarks",
+        description="Benchmark the MCP tools against a fake Airflow API",
+    )
+    parser.add_argument(
+        "--airflow-version",
+        action="append",
+        dest="airflow_versions",
+        help=f"Airflow version to emulate, repeatable (default: {', '.join(AIRFLOW_VERSIONS)})",
+    )
+    parser.add_argument(
+        "--preset", choices=sorted(PRESETS), default="medium", help="Size of the fake instance"
+    )
+    parser.add_argument("--dags", type=int, help="Override the preset's number of DAGs")
+    parser.add_argument("--runs-per-dag", type=int, help="Override the preset's runs per DAG")
+    parser.add_argument("--tasks-per-dag", type=int, help="Override the preset's tasks per DAG")
+    parser.add_argument("--log-lines", type=int, help="Override the preset's lines per task log")
+    parser.add_argument("--seed", type=int, default=0, help="Seed of the generated instance")
+    parser.add_argument(
+        "--latency-ms", type=float, default=0.0, help="Latency added to every API response"
+    )
+    parser.add_argument(
+        "--iterations", type=int, default=20, help="Calls per tool for latency and throughput"
+    )
+    parser.add_argument(
+        "--concurrency", type=int, default=8, help="Concurrent calls in the throughput test"
+    )
+    parser.add_argument(
+        "--tool",
+        action="append",
+        dest="tools",
+        choices=sorted(SCENARIOS),
+        help="Tool to benchmark, repeatable (default: all)",
+    )
+    parser.add_argument(
+        "--no-response-cache", action="store_true", help="Disable the adapter response cache"
+    )
+    parser.add_argument("--output", help="Write results to this file instead of stdout")
+    args = parser.parse_args()
+
+    overrides = {
+        "dags": args.dags,
+        "runs_per_dag": args.runs_per_dag,
+        "tasks_per_dag": args.tasks_per_dag,
+        "log_lines": args.log_lines,
+    }
+    options = BenchmarkOptions(
+        dataset=dataclasses.replace(
+            PRESETS[args.preset],
+            seed=args.seed,
+            **{k: v for k, v in overrides.items() if v is not None},
+        ),
+        airflow_versions=tuple(args.airflow_versions or AIRFLOW_VERSIONS),
+        latency=timedelta(milliseconds=args.latency_ms).total_seconds(),
+        iterations=args.iterations,
+        concurrency=args.concurrency,
+        tools=tuple(args.tools or SCENARIOS),
+        response_cache=not args.no_response_cache,
+    )
+    results = json.dumps(asyncio.run(run_benchmarks(options)), indent=2)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(results + "\n")
+    else:
+        sys.stdout.write(results + "\n")
+
+
+if __name__ == "__main__":
+    main()
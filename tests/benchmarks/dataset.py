@@ -0,0 +1,436 @@
+"""Deterministic synthetic Airflow instances for benchmarks and scale tests.
+
+A Dataset describes an Airflow deployment by its size and a seed. Every DAG,
+task, DAG run, task instance, log line and import error is derived from its
+index and the seed, so nothing is stored: a 5,000 DAG / 1M run instance costs
+no more memory than a small one, and every process generating the same
+Dataset sees the same data.
+
+Per-DAG attributes (owner, tags, task graph, operators, retries, mapped tasks,
+failure rate) come from a seeded RNG and are cached; per-run attributes (run
+and task states, map lengths, retries taken) come from a hash of the seed and
+the indices, so they can be computed in any order.
+
+PRESETS holds named sizes, including "large": 5,000 DAGs, 1M DAG runs and
+task logs of about 50MB.
+"""
+
+import functools
+import hashlib
+import random
+from collections.abc import Iterator
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Any, NamedTuple
+
+# The newest DAG run of every DAG starts shortly before this instant
+END_DATE = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+OWNERS = ("data-eng", "analytics", "ml-platform", "finance", "growth", "airflow")
+TAGS = (
+    "etl",
+    "reporting",
+    "ml",
+    "finance",
+    "marketing",
+    "hourly",
+    "critical",
+    "experimental",
+    "dbt",
+    "spark",
+)
+# (class name, module) of the operators tasks are drawn from
+OPERATORS = (
+    ("PythonOperator", "airflow.providers.standard.operators.python"),
+    ("BashOperator", "airflow.providers.standard.operators.bash"),
+    ("SQLExecuteQueryOperator", "airflow.providers.common.sql.operators.sql"),
+    ("KubernetesPodOperator", "airflow.providers.cncf.kubernetes.operators.pod"),
+    ("HttpSensor", "airflow.providers.http.sensors.http"),
+    ("EmptyOperator", "airflow.providers.standard.operators.empty"),
+)
+# (exception type, message) a failed task dies with
+FAILURES = (
+    ("ValueError", "Invalid value in column 'amount'"),
+    ("KeyError", "'customer_id'"),
+    ("ConnectionError", "Connection refused by warehouse.internal:5432"),
+    ("TimeoutError", "Sensor timed out after 3600 seconds"),
+    ("AirflowException", "Pod returned a failure: exit code 137 (OOMKilled)"),
+)
+
+
+def _iso(value: datetime | None) -> str | None:
+    return value.isoformat() if value else None
+
+
+class DagProfile(NamedTuple):
+    """Static, per-DAG attributes (everything that does not depend on a run)."""
+
+    owner: str
+    tags: tuple[str, ...]
+    paused: bool
+    failure_rate: float
+    upstream: tuple[tuple[int, ...], ...]
+    downstream: tuple[tuple[int, ...], ...]
+    operators: tuple[int, ...]
+    retries: tuple[int, ...]
+    mapped: tuple[bool, ...]
+
+    @property
+    def tasks(self) -> int:
+        return len(self.upstream)
+
+
+@dataclass(frozen=True)
+class Dataset:
+    """Size and shape of a synthetic Airflow instance.
+
+    Every DAG has runs_per_dag runs, one per run_interval, ending at END_DATE,
+    and between half of tasks_per_dag and tasks_per_dag tasks. The newest run
+    of an unpaused DAG is running (or queued); older runs fail at a per-DAG
+    rate averaging failure_rate, on one task whose downstream tasks are then
+    upstream_failed. About mapped_fraction of tasks are mapped, expanding to
+    1..max_map_length task instances per run.
+    """
+
+    dags: int = 100
+    runs_per_dag: int = 25
+    tasks_per_dag: int = 10
+    log_lines: int = 1_000
+    import_errors: int = 5
+    run_interval: timedelta = timedelta(hours=1)
+    run_duration: timedelta = timedelta(minutes=10)
+    failure_rate: float = 0.1
+    paused_fraction: float = 0.05
+    mapped_fraction: float = 0.1
+    max_map_length: int = 8
+    seed: int = 0
+
+    def _unit(self, *key: Any) -> float:
+        """A deterministic pseudo-random number in [0, 1) for a key."""
+        digest = hashlib.blake2b(repr((self.seed, *key)).encode(), digest_size=8).digest()
+        return int.from_bytes(digest, "big") / 2**64
+
+    def profile(self, dag: int) -> DagProfile:
+        return _profile(self, dag)
+
+    # Identifiers
+
+    def dag_id(self, dag: int) -> str:
+        return f"dag_{dag:05d}"
+
+    def dag_index(self, dag_id: str) -> int | None:
+        try:
+            dag = int(dag_id.removeprefix("dag_"))
+        except ValueError:
+            return None
+        return dag if 0 <= dag < self.dags and self.dag_id(dag) == dag_id else None
+
+    def task_id(self, task: int) -> str:
+        return f"task_{task:03d}"
+
+    def task_index(self, dag: int, task_id: str) -> int | None:
+        try:
+            task = int(task_id.removeprefix("task_"))
+        except ValueError:
+            return None
+        return task if 0 <= task < self.profile(dag).tasks else None
+
+    def run_start(self, run: int) -> datetime:
+        return END_DATE - (self.runs_per_dag - run) * self.run_interval
+
+    def run_id(self, run: int) -> str:
+        return f"scheduled__{self.run_start(run).isoformat()}"
+
+    def run_index(self, run_id: str) -> int | None:
+        try:
+            start = datetime.fromisoformat(run_id.removeprefix("scheduled__"))
+        except ValueError:
+            return None
+        run = self.runs_per_dag - round((END_DATE - start) / self.run_interval)
+        return run if 0 <= run < self.runs_per_dag and self.run_id(run) == run_id else None
+
+    def runs_between(self, gte: datetime | None, lte: datetime | None) -> range:
+        """Indices of the runs of a DAG started within [gte, lte]."""
+        first, last = 0, self.runs_per_dag - 1
+        if gte is not None:
+            first = max(first, self.runs_per_dag - int((END_DATE - gte) // self.run_interval))
+        if lte is not None:
+            last = min(last, self.runs_per_dag - _ceil_div(END_DATE - lte, self.run_interval))
+        return range(first, last + 1)
+
+    # States
+
+    def run_state(self, dag: int, run: int) -> str:
+        profile = self.profile(dag)
+        if run == self.runs_per_dag - 1 and not profile.paused:
+            return "queued" if self._unit("queued", dag) < 0.1 else "running"
+        return "failed" if self._unit("run", dag, run) < profile.failure_rate else "success"
+
+    def failed_task(self, dag: int, run: int) -> int | None:
+        """The task a failed run failed on."""
+        if self.run_state(dag, run) != "failed":
+            return None
+        return int(self._unit("failed_task", dag, run) * self.profile(dag).tasks)
+
+    def map_indices(self, dag: int, run: int, task: int) -> range:
+        """Map indices of a task's instances in a run; range(-1, 0) for unmapped tasks."""
+        if not self.profile(dag).mapped[task]:
+            return range(-1, 0)
+        return range(1 + int(self._unit("map", dag, run, task) * self.max_map_length))
+
+    def task_state(self, dag: int, run: int, task: int, map_index: int = -1) -> str | None:
+        state = self.run_state(dag, run)
+        if state == "queued":
+            return None
+        if state == "running":
+            half = self.profile(dag).tasks // 2
+            return "success" if task < half else "running" if task == half else None
+        failed = self.failed_task(dag, run)
+        if task == failed:
+            # Only the last instance of a mapped task fails
+            last = self.map_indices(dag, run, task)[-1]
+            return "failed" if map_index == last else "success"
+        if failed is not None and task in _descendants(self, dag, failed):
+            return "upstream_failed"
+        return "success"
+
+    def try_number(self, dag: int, run: int, task: int, state: str | None) -> int:
+        retries = self.profile(dag).retries[task]
+        if state in (None, "upstream_failed"):
+            return 0
+        if state == "failed":
+            return retries + 1
+        return 2 if retries and self._unit("retry", dag, run, task) < 0.05 else 1
+
+    def state_counts(self, dag: int) -> dict[str, int]:
+        return _state_counts(self, dag)
+
+    # Payloads
+
+    def dag(self, dag: int, v3: bool) -> dict[str, Any]:
+        dag_id = self.dag_id(dag)
+        profile = self.profile(dag)
+        data: dict[str, Any] = {
+            "dag_id": dag_id,
+            "dag_display_name": dag_id,
+            "description": f"{profile.owner} pipeline ({', '.join(profile.tags)})",
+            "fileloc": f"/usr/local/airflow/dags/{profile.owner}/{dag_id}.py",
+            "file_token": dag_id,
+            "is_paused": profile.paused,
+            "owners": [profile.owner],
+            "tags": [
+                {"name": tag, "dag_id": dag_id} if v3 else {"name": tag} for tag in profile.tags
+            ],
+            "max_active_runs": 16,
+            "max_active_tasks": 16,
+            "has_import_errors": False,
+            "last_parsed_time": _iso(END_DATE),
+        }
+        if v3:
+            data.update(is_stale=False, timetable_summary="@hourly", bundle_name="dags-folder")
+        else:
+            data.update(
+                is_active=True,
+                schedule_interval={"__type": "CronExpression", "value": "@hourly"},
+            )
+        return data
+
+    def dag_source(self, dag: int) -> str:
+        profile = self.profile(dag)
+        lines = [
+            f'with DAG("{self.dag_id(dag)}", schedule="@hourly", tags={list(profile.tags)}):',
+            *(
+                f"    {self.task_id(task)} = {OPERATORS[profile.operators[task]][0]}("
+                f'task_id="{self.task_id(task)}")'
+                for task in range(profile.tasks)
+            ),
+            *(
+                f"    {self.task_id(up)} >> {self.task_id(task)}"
+                for task in range(profile.tasks)
+                for up in profile.upstream[task]
+            ),
+        ]
+        return "\n".join(lines) + "\n"
+
+    def dag_run(self, dag: int, run: int, v3: bool) -> dict[str, Any]:
+        scheduled = self.run_start(run)
+        state = self.run_state(dag, run)
+        start = None if state == "queued" else scheduled
+        data: dict[str, Any] = {
+            "dag_id": self.dag_id(dag),
+            "dag_run_id": self.run_id(run),
+            "state": state,
+            "run_type": "scheduled",
+            "start_date": _iso(start),
+            "end_date": _iso(start + self.run_duration)
+            if start and state not in ("running", "queued")
+            else None,
+            "queued_at": _iso(scheduled - timedelta(seconds=5)),
+            "conf": {},
+            "note": None,
+        }
+        data["logical_date" if v3 else "execution_date"] = _iso(scheduled)
+        if not v3:
+            data["external_trigger"] = False
+        return data
+
+    def task(self, dag: int, task: int) -> dict[str, Any]:
+        profile = self.profile(dag)
+        operator, module = OPERATORS[profile.operators[task]]
+        return {
+            "task_id": self.task_id(task),
+            "task_display_name": self.task_id(task),
+            "owner": profile.owner,
+            "operator_name": operator,
+            "class_ref": {"class_name": operator, "module_path": module},
+            "trigger_rule": "all_success",
+            "retries": profile.retries[task],
+            "is_mapped": profile.mapped[task],
+            "pool": "default_pool",
+            "downstream_task_ids": [self.task_id(t) for t in profile.downstream[task]],
+            "upstream_task_ids": [self.task_id(t) for t in profile.upstream[task]],
+        }
+
+    def task_instance(self, dag: int, run: int, task: int, map_index: int = -1) -> dict[str, Any]:
+        profile = self.profile(dag)
+        state = self.task_state(dag, run, task, map_index)
+        slot = self.run_duration / (profile.tasks + 1)
+        start = (
+            self.run_start(run) + task * slot if state not in (None, "upstream_failed") else None
+        )
+        end = start + slot if start and state != "running" else None
+        return {
+            "dag_id": self.dag_id(dag),
+            "dag_run_id": self.run_id(run),
+            "task_id": self.task_id(task),
+            "map_index": map_index,
+            "state": state,
+            "start_date": _iso(start),
+            "end_date": _iso(end),
+            "duration": slot.total_seconds() if end else None,
+            "try_number": self.try_number(dag, run, task, state),
+            "max_tries": profile.retries[task],
+            "operator": OPERATORS[profile.operators[task]][0],
+            "pool": "default_pool",
+            "queue": "default",
+        }
+
+    def task_instances(self, dag: int, run: int) -> Iterator[dict[str, Any]]:
+        """All task instances of a run, mapped tasks expanded."""
+        for task in range(self.profile(dag).tasks):
+            for map_index in self.map_indices(dag, run, task):
+                yield self.task_instance(dag, run, task, map_index)
+
+    def log_entries(
+        self, dag: int, run: int, task: int, map_index: int = -1
+    ) -> Iterator[dict[str, Any]]:
+        """Structured log entries of a task instance, in order."""
+        start = self.run_start(run)
+        label = f"{self.dag_id(dag)}.{self.task_id(task)}"
+        if map_index != -1:
+            label += f"[{map_index}]"
+        for line in range(self.log_lines):
+            warning = line % 97 == 96
+            yield {
+                "timestamp": _iso(start + timedelta(milliseconds=line)),
+                "level": "warning" if warning else "info",
+                "event": f"Retrying slow request for batch {line} of {label}"
+                if warning
+                else f"Processed batch {line} of {label}: 500 rows in 12.5ms",
+            }
+        if self.task_state(dag, run, task, map_index) == "failed":
+            exc_type, exc_value = FAILURES[int(self._unit("error", dag, run) * len(FAILURES))]
+            yield {
+                "timestamp": _iso(start + timedelta(milliseconds=self.log_lines)),
+                "level": "error",
+                "event": "Task failed with exception",
+                "error_detail": [
+                    {
+                        "exc_type": exc_type,
+                        "exc_value": exc_value,
+                        "frames": [
+                            {"filename": f"{self.dag_id(dag)}.py", "lineno": 42, "name": "execute"}
+                        ],
+                    }
+                ],
+            }
+
+    def import_error(self, error: int, v3: bool) -> dict[str, Any]:
+        exc_type, exc_value = FAILURES[error % len(FAILURES)]
+        filename = f"/usr/local/airflow/dags/broken/broken_{error:04d}.py"
+        data: dict[str, Any] = {
+            "import_error_id": error + 1,
+            "timestamp": _iso(END_DATE - error * self.run_interval),
+            "filename": filename,
+            "stack_trace": (
+                "Traceback (most recent call last):\n"
+                f'  File "{filename}", line 7, in <module>\n'
+                f"{exc_type}: {exc_value}\n"
+            ),
+        }
+        if v3:
+            data["bundle_name"] = "dags-folder"
+        return data
+
+
+def _ceil_div(a: timedelta, b: timedelta) -> int:
+    return -(-a // b)
+
+
+@functools.lru_cache(maxsize=16_384)
+def _profile(ds: Dataset, dag: int) -> DagProfile:
+    rng = random.Random(f"{ds.seed}:{dag}")
+    tasks = rng.randint(max(1, ds.tasks_per_dag // 2), max(1, ds.tasks_per_dag))
+    # Each task depends on one or two of the few tasks before it, giving a
+    # layered graph whose topological order is the task order
+    upstream = tuple(
+        tuple(sorted(rng.sample(range(max(0, task - 4), task), min(task, rng.randint(1, 2)))))
+        for task in range(tasks)
+    )
+    downstream = tuple(
+        tuple(t for t in range(task + 1, tasks) if task in upstream[t]) for task in range(tasks)
+    )
+    return DagProfile(
+        owner=rng.choice(OWNERS),
+        tags=tuple(sorted(rng.sample(TAGS, rng.randint(1, 3)))),
+        paused=rng.random() < ds.paused_fraction,
+        # Most DAGs rarely fail and a few fail often, averaging failure_rate
+        failure_rate=ds.failure_rate * rng.choice((0.0, 0.5, 0.5, 1.0, 3.0)),
+        upstream=upstream,
+        downstream=downstream,
+        operators=tuple(rng.randrange(len(OPERATORS)) for _ in range(tasks)),
+        retries=tuple(rng.choice((0, 1, 1, 2, 3)) for _ in range(tasks)),
+        mapped=tuple(task > 0 and rng.random() < ds.mapped_fraction for task in range(tasks)),
+    )
+
+
+@functools.lru_cache(maxsize=16_384)
+def _descendants(ds: Dataset, dag: int, task: int) -> frozenset[int]:
+    downstream = ds.profile(dag).downstream
+    found: set[int] = set()
+    pending = list(downstream[task])
+    while pending:
+        current = pending.pop()
+        if current not in found:
+            found.add(current)
+            pending.extend(downstream[current])
+    return frozenset(found)
+
+
+@functools.lru_cache(maxsize=16_384)
+def _state_counts(ds: Dataset, dag: int) -> dict[str, int]:
+    counts: dict[str, int] = {}
+    for run in range(ds.runs_per_dag):
+        state = ds.run_state(dag, run)
+        counts[state] = counts.get(state, 0) + 1
+    return counts
+
+
+PRESETS = {
+    "small": Dataset(dags=20, runs_per_dag=10, tasks_per_dag=6, log_lines=200),
+    "medium": Dataset(),
+    # 5,000 DAGs, 1M DAG runs and ~50MB task logs
+    "large": Dataset(
+        dags=5_000, runs_per_dag=200, tasks_per_dag=20, log_lines=400_000, import_errors=50
+    ),
+}
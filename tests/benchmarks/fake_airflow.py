@@ -0,0 +1,412 @@
+"""A stand-in Airflow REST API serving a synthetic Dataset.
+
+Serves the endpoints the adapters use under /api/v1 (Airflow 2 payloads) or
+/api/v2 (Airflow 3 payloads), computing every response from a Dataset
+(tests/benchmarks/dataset.py). Lists are paged without materializing the
+instance, so even the "large" preset (5,000 DAGs, 1M runs) answers each page
+quickly. Logs stream as NDJSON or text when asked to. An optional
+per-request latency emulates a remote webserver.
+
+Serve one standalone to point the MCP server (or anything else) at it:
+
+    python -m tests.benchmarks.fake_airflow --preset large --airflow-version 2.10.5
+"""
+
+import argparse
+import asyncio
+import contextlib
+import dataclasses
+import functools
+import itertools
+import json
+import multiprocessing
+import socket
+import time
+from collections.abc import Callable, Iterator
+from datetime import datetime
+from typing import Any
+
+import uvicorn
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import JSONResponse, Response, StreamingResponse
+from starlette.routing import Route
+
+from tests.benchmarks.dataset import PRESETS, Dataset
+
+NDJSON = "application/x-ndjson"
+
+
+def _text_line(entry: dict[str, Any]) -> str:
+    """Render a log entry the way Airflow 2 writes plain text logs."""
+    line = f"[{entry['timestamp']}] {{dag.py:42}} {entry['level'].upper()} - {entry['event']}"
+    for exc in entry.get("error_detail", []):
+        frames = "".join(
+            f'\n  File "{f["filename"]}", line {f["lineno"]}, in {f["name"]}' for f in exc["frames"]
+        )
+        line += (
+            f"\nTraceback (most recent call last):{frames}\n{exc['exc_type']}: {exc['exc_value']}"
+        )
+    return line
+
+
+def _chunks(lines: Iterator[str], size: int = 1_000) -> Iterator[str]:
+    """Join lines into chunks of `size` lines, so large logs stream in few sends."""
+    while chunk := "".join(line + "\n" for line in itertools.islice(lines, size)):
+        yield chunk
+
+
+def _param_list(request: Request, name: str) -> list[str]:
+    """A list query parameter, given repeated or comma separated."""
+    return [v for value in request.query_params.getlist(name) for v in value.split(",") if v]
+
+
+def _date(value: Any) -> datetime | None:
+    return datetime.fromisoformat(value) if value else None
+
+
+def _page(
+    key: str,
+    total: int,
+    item: Callable[[int], Any],
+    limit: Any,
+    offset: Any,
+    descending: bool = False,
+) -> dict[str, Any]:
+    """One page of a list of `total` items, building only the items on the page."""
+    positions = range(total)[::-1] if descending else range(total)
+    offset = int(offset or 0)
+    return {
+        key: [item(i) for i in positions[offset : offset + int(limit or 100)]],
+        "total_entries": total,
+    }
+
+
+@functools.lru_cache(maxsize=64)
+def _matching_runs(
+    ds: Dataset, dags: tuple[int, ...], runs: range, states: frozenset[str]
+) -> list[tuple[int, int]]:
+    """(run, dag) pairs in the given states, oldest first, for paging through state filters.
+
+    Computed once per filter (a few seconds across the 1M runs of the large
+    preset) and cached for the following pages.
+    """
+    return [(run, dag) for run in runs for dag in dags if ds.run_state(dag, run) in states]
+
+
+def create_app(dataset: Dataset, version: str = "3.0.0", latency: float = 0.0) -> Starlette:
+    """Build the stand-in API for an Airflow version.
+
+    Args:
+        dataset: The instance to serve
+        version: Airflow version; 3.x serves /api/v2, 2.x serves /api/v1
+        latency: Seconds added to every response
+    """
+    v3 = version.startswith("3")
+    base = "/api/v2" if v3 else "/api/v1"
+    ds = dataset
+
+    def _dag(request: Request) -> int:
+        dag = ds.dag_index(request.path_params["dag_id"])
+        if dag is None:
+            raise _NotFound
+        return dag
+
+    def _run(request: Request) -> int:
+        run = ds.run_index(request.path_params["dag_run_id"])
+        if run is None:
+            raise _NotFound
+        return run
+
+    def _task(request: Request, dag: int) -> int:
+        task = ds.task_index(dag, request.path_params["task_id"])
+        if task is None:
+            raise _NotFound
+        return task
+
+    def _runs(dags: list[int], filters: dict[str, Any], limit: Any, offset: Any) -> dict[str, Any]:
+        # Runs are ordered by start date (run index), then DAG
+        runs = ds.runs_between(
+            _date(filters.get("start_date_gte")), _date(filters.get("start_date_lte"))
+        )
+        descending = str(filters.get("order_by") or "").startswith("-")
+        states = frozenset(filters.get("state") or ())
+        if states:
+            pairs = _matching_runs(ds, tuple(dags), runs, states)
+            total, pair = len(pairs), pairs.__getitem__
+        else:
+            total = len(runs) * len(dags)
+
+            def pair(i: int) -> tuple[int, int]:
+                return runs[i // len(dags)], dags[i % len(dags)]
+
+        def item(i: int) -> dict[str, Any]:
+            run, dag = pair(i)
+            return ds.dag_run(dag, run, v3)
+
+        return _page("dag_runs", total, item, limit, offset, descending)
+
+    def _task_instances(
+        dags: list[int], runs: list[int], states: list[str], limit: Any, offset: Any
+    ) -> dict[str, Any]:
+        tis = [
+            ti
+            for dag in dags
+            for run in runs
+            for ti in ds.task_instances(dag, run)
+            if not states or ti["state"] in states
+        ]
+        return _page("task_instances", len(tis), tis.__getitem__, limit, offset)
+
+    async def version_endpoint(_request: Request) -> Response:
+        return JSONResponse({"version": version, "git_version": None})
+
+    async def list_dags(request: Request) -> Response:
+        params = request.query_params
+        pattern = (params.get("dag_id_pattern") or "").strip("%")
+        tags = set(_param_list(request, "tags"))
+        owners = set(_param_list(request, "owners"))
+        paused = params.get("paused")
+        dags = [
+            dag
+            for dag in range(ds.dags)
+            if pattern in ds.dag_id(dag)
+            and (not tags or tags.intersection(ds.profile(dag).tags))
+            and (not owners or ds.profile(dag).owner in owners)
+            and (paused is None or ds.profile(dag).paused == (paused.lower() == "true"))
+        ]
+        return JSONResponse(
+            _page(
+                "dags",
+                len(dags),
+                lambda i: ds.dag(dags[i], v3),
+                params.get("limit"),
+                params.get("offset"),
+                descending=(params.get("order_by") or "").startswith("-"),
+            )
+        )
+
+    async def get_dag(request: Request) -> Response:
+        return JSONResponse(ds.dag(_dag(request), v3))
+
+    async def dag_source(request: Request) -> Response:
+        dag = ds.dag_index(request.path_params["file_token"])
+        if dag is None:
+            raise _NotFound
+        return JSONResponse({"content": ds.dag_source(dag)})
+
+    async def list_tasks(request: Request) -> Response:
+        dag = _dag(request)
+        tasks = [ds.task(dag, task) for task in range(ds.profile(dag).tasks)]
+        return JSONResponse({"tasks": tasks, "total_entries": len(tasks)})
+
+    async def get_task(request: Request) -> Response:
+        dag = _dag(request)
+        return JSONResponse(ds.task(dag, _task(request, dag)))
+
+    async def list_dag_runs(request: Request) -> Response:
+        dag_id = request.path_params["dag_id"]
+        dags = list(range(ds.dags)) if dag_id == "~" else [_dag(request)]
+        params = request.query_params
+        filters = {**params, "state": _param_list(request, "state")}
+        return JSONResponse(_runs(dags, filters, params.get("limit"), params.get("offset")))
+
+    async def list_dag_runs_batch(request: Request) -> Response:
+        body = await request.json()
+        if body.get("dag_ids"):
+            dags = [d for d in map(ds.dag_index, body["dag_ids"]) if d is not None]
+        else:
+            dags = list(range(ds.dags))
+        filters = {**body, "state": body.get("states")}
+        return JSONResponse(_runs(dags, filters, body.get("page_limit"), body.get("page_offset")))
+
+    async def get_dag_run(request: Request) -> Response:
+        return JSONResponse(ds.dag_run(_dag(request), _run(request), v3))
+
+    async def list_task_instances(request: Request) -> Response:
+        params = request.query_params
+        return JSONResponse(
+            _task_instances(
+                [_dag(request)],
+                [_run(request)],
+                _param_list(request, "state"),
+                params.get("limit"),
+                params.get("offset"),
+            )
+        )
+
+    async def list_task_instances_batch(request: Request) -> Response:
+        body = await request.json()
+        dags = [d for d in map(ds.dag_index, body.get("dag_ids") or []) if d is not None]
+        runs = [r for r in map(ds.run_index, body.get("dag_run_ids") or []) if r is not None]
+        return JSONResponse(
+            _task_instances(
+                dags, runs, body.get("state") or [], body.get("page_limit"), body.get("page_offset")
+            )
+        )
+
+    async def get_task_instance(request: Request) -> Response:
+        dag, run = _dag(request), _run(request)
+        task = _task(request, dag)
+        map_index = int(request.path_params.get("map_index", -1))
+        if map_index not in ds.map_indices(dag, run, task):
+            raise _NotFound
+        return JSONResponse(ds.task_instance(dag, run, task, map_index))
+
+    async def task_logs(request: Request) -> Response:
+        dag, run = _dag(request), _run(request)
+        task = _task(request, dag)
+        entries = ds.log_entries(dag, run, task, int(request.query_params.get("map_index", -1)))
+        accept = request.headers.get("accept", "")
+        if accept == NDJSON:
+            return StreamingResponse(_chunks(map(json.dumps, entries)), media_type=NDJSON)
+        if accept == "text/plain":
+            return StreamingResponse(_chunks(map(_text_line, entries)), media_type="text/plain")
+        if v3:
+            return JSONResponse({"content": list(entries), "continuation_token": None})
+        text = "\n".join(_text_line(entry) for entry in entries)
+        return JSONResponse({"content": text, "continuation_token": None})
+
+    async def dag_stats(request: Request) -> Response:
+        dag_ids = _param_list(request, "dag_ids") or [ds.dag_id(d) for d in range(ds.dags)]
+        dags = [
+            {
+                "dag_id": ds.dag_id(dag),
+                "stats": [
+                    {"state": state, "count": count}
+                    for state, count in sorted(ds.state_counts(dag).items())
+                ],
+            }
+            for dag in map(ds.dag_index, dag_ids)
+            if dag is not None
+        ]
+        return JSONResponse({"dags": dags, "total_entries": len(dags)})
+
+    async def list_import_errors(request: Request) -> Response:
+        params = request.query_params
+        return JSONResponse(
+            _page(
+                "import_errors",
+                ds.import_errors,
+                lambda i: ds.import_error(i, v3),
+                params.get("limit"),
+                params.get("offset"),
+            )
+        )
+
+    async def list_dag_warnings(_request: Request) -> Response:
+        return JSONResponse({"dag_warnings": [], "total_entries": 0})
+
+    task_instance = "/dags/{dag_id}/dagRuns/{dag_run_id}/taskInstances/{task_id}"
+    routes = [
+        Route("/version", version_endpoint),
+        Route("/dags", list_dags),
+        Route("/dags/~/dagRuns/list", list_dag_runs_batch, methods=["POST"]),
+        Route("/dags/~/dagRuns/~/taskInstances/list", list_task_instances_batch, methods=["POST"]),
+        Route("/dags/{dag_id}", get_dag),
+        Route("/dagSources/{file_token}", dag_source),
+        Route("/dags/{dag_id}/tasks", list_tasks),
+        Route("/dags/{dag_id}/tasks/{task_id}", get_task),
+        Route("/dags/{dag_id}/dagRuns", list_dag_runs),
+        Route("/dags/{dag_id}/dagRuns/{dag_run_id}", get_dag_run),
+        Route("/dags/{dag_id}/dagRuns/{dag_run_id}/taskInstances", list_task_instances),
+        Route(task_instance, get_task_instance),
+        Route(task_instance + "/{map_index:int}", get_task_instance),
+        Route(task_instance + "/logs/{try_number}", task_logs),
+        Route("/dagStats", dag_stats),
+        Route("/importErrors", list_import_errors),
+        Route("/dagWarnings", list_dag_warnings),
+    ]
+
+    app = Starlette(routes=[Route(base + r.path, r.endpoint, methods=r.methods) for r in routes])
+    app.add_exception_handler(_NotFound, _not_found)
+
+    if latency:
+
+        @app.middleware("http")
+        async def delay(request: Request, call_next: Any) -> Response:
+            await asyncio.sleep(latency)
+            return await call_next(request)
+
+    return app
+
+
+class _NotFound(Exception):
+    pass
+
+
+async def _not_found(_request: Request, _exc: Exception) -> Response:
+    return JSONResponse({"detail": "Not Found", "status": 404}, status_code=404)
+
+
+def _run_server(dataset: Dataset, version: str, latency: float, port: int) -> None:
+    app = create_app(dataset, version, latency)
+    uvicorn.run(app, host="127.0.0.1", port=port, log_level="warning", lifespan="off")
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+@contextlib.contextmanager
+def serve(dataset: Dataset, version: str = "3.0.0", latency: float = 0.0) -> Iterator[str]:
+    """Serve the stand-in API from a separate process, yielding its base URL.
+
+    A separate process keeps the server's CPU time and memory out of the
+    measurements taken in the benchmarking process.
+    """
+    port = _free_port()
+    process = multiprocessing.Process(
+        target=_run_server, args=(dataset, version, latency, port), daemon=True
+    )
+    process.start()
+    try:
+        deadline = time.monotonic() + 30
+        while True:
+            try:
+                socket.create_connection(("127.0.0.1", port), timeout=1).close()
+                break
+            except OSError:
+                if not process.is_alive() or time.monotonic() > deadline:
+                    raise RuntimeError("Fake Airflow server failed to start") from None
+                time.sleep(0.05)
+        yield f"http://127.0.0.1:{port}"
+    finally:
+        process.terminate()
+        process.join()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        prog="python -m tests.benchmarks.fake_airflow",
+        description="Serve a synthetic Airflow instance over the Airflow REST API",
+    )
+    parser.add_argument("--preset", choices=sorted(PRESETS), default="medium")
+    parser.add_argument("--dags", type=int, help="Override the preset's number of DAGs")
+    parser.add_argument("--runs-per-dag", type=int, help="Override the preset's runs per DAG")
+    parser.add_argument("--log-lines", type=int, help="Override the preset's lines per task log")
+    parser.add_argument("--seed", type=int, default=0, help="Seed of the generated instance")
+    parser.add_argument("--airflow-version", default="3.0.0", help="Airflow version to emulate")
+    parser.add_argument("--latency-ms", type=float, default=0.0)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    args = parser.parse_args()
+
+    overrides = {
+        "dags": args.dags,
+        "runs_per_dag": args.runs_per_dag,
+        "log_lines": args.log_lines,
+    }
+    dataset = dataclasses.replace(
+        PRESETS[args.preset],
+        seed=args.seed,
+        **{k: v for k, v in overrides.items() if v is not None},
+    )
+    app = create_app(dataset, args.airflow_version, args.latency_ms / 1000)
+    uvicorn.run(app, host=args.host, port=args.port, log_level="info", lifespan="off")
+
+
+if __name__ == "__main__":
+    main()
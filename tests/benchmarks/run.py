@@ -0,0 +1,228 @@
+"""Benchmark runner: call MCP tools against the fake Airflow API and measure them.
+
+For each emulated Airflow version, every scenario's tool is called through an
+in-memory MCP client (so argument validation, middleware and serialization
+are included) and measured for:
+
+- latency: sequential calls, in milliseconds
+- throughput: calls per second with `concurrency` calls in flight
+- memory: peak Python allocations (tracemalloc) during a single call
+- result size: characters of tool output
+
+Serialization cost is measured separately by encoding dataset payloads with
+the server's JSON helper in compact and pretty form.
+"""
+
+import asyncio
+import json
+import platform
+import statistics
+import sys
+import time
+import tracemalloc
+from collections.abc import Callable
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timezone
+from typing import Any
+
+from fastmcp import Client
+
+from astro_airflow_mcp import __version__, server
+from tests.benchmarks.dataset import Dataset
+from tests.benchmarks.fake_airflow import serve
+
+AIRFLOW_VERSIONS = ("2.10.5", "3.0.0")
+
+
+def _failed_task(ds: Dataset) -> dict[str, Any]:
+    """Arguments locating the failed task instance of the first failed run in the dataset."""
+    for run in range(ds.runs_per_dag):
+        for dag in range(ds.dags):
+            task = ds.failed_task(dag, run)
+            if task is not None:
+                return {
+                    "dag_id": ds.dag_id(dag),
+                    "dag_run_id": ds.run_id(run),
+                    "task_id": ds.task_id(task),
+                    "map_index": ds.map_indices(dag, run, task)[-1],
+                }
+    return {"dag_id": ds.dag_id(0), "dag_run_id": ds.run_id(0), "task_id": ds.task_id(0)}
+
+
+def _run_args(ds: Dataset, **extra: Any) -> dict[str, Any]:
+    failed = _failed_task(ds)
+    return {"dag_id": failed["dag_id"], "dag_run_id": failed["dag_run_id"], **extra}
+
+
+# Tool name -> tool arguments for a dataset
+SCENARIOS: dict[str, Callable[[Dataset], dict[str, Any]]] = {
+    "list_dags": lambda ds: {"limit": ds.dags},
+    "search_dags": lambda ds: {"query": ds.dag_id(0)[:-1]},
+    "get_dag_details": lambda ds: {"dag_id": ds.dag_id(0)},
+    "list_tasks": lambda ds: {"dag_id": ds.dag_id(0)},
+    "explore_dag": lambda ds: {"dag_id": ds.dag_id(0)},
+    "list_dag_runs": lambda ds: {"dag_id": ds.dag_id(0), "limit": ds.runs_per_dag},
+    "get_dag_stats": lambda ds: {"dag_ids": [ds.dag_id(0)]},
+    "get_task_logs": _failed_task,
+    "search_dag_run_logs": lambda ds: _run_args(ds, pattern="Traceback|Task failed"),
+    "diagnose_dag_run": lambda ds: _run_args(ds, include_logs=True),
+    "list_import_errors": lambda _ds: {},
+    "get_system_health": lambda _ds: {},
+}
+
+
+@dataclass
+class BenchmarkOptions:
+    dataset: Dataset = field(default_factory=Dataset)
+    airflow_versions: tuple[str, ...] = AIRFLOW_VERSIONS
+    latency: float = 0.0
+    iterations: int = 20
+    concurrency: int = 8
+    tools: tuple[str, ...] = tuple(SCENARIOS)
+    response_cache: bool = True
+
+
+def _latency_stats(samples: list[float]) -> dict[str, float]:
+    ordered = sorted(s * 1000 for s in samples)
+    return {
+        "min_ms": round(ordered[0], 3),
+        "mean_ms": round(statistics.fmean(ordered), 3),
+        "p50_ms": round(ordered[len(ordered) // 2], 3),
+        "p95_ms": round(ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))], 3),
+        "max_ms": round(ordered[-1], 3),
+    }
+
+
+async def _call(client: Client, tool: str, arguments: dict[str, Any]) -> str:
+    """Call a tool, raising if it failed.
+
+    Tools report Airflow errors as plain (non-JSON) text rather than MCP
+    errors, so anything that does not parse as JSON counts as a failure.
+    """
+    result = await client.call_tool(tool, arguments, raise_on_error=False)
+    text = "".join(getattr(block, "text", "") for block in result.content)
+    if result.is_error:
+        raise RuntimeError(text)
+    try:
+        json.loads(text)
+    except ValueError:
+        raise RuntimeError(text[:500]) from None
+    return text
+
+
+async def benchmark_tool(
+    client: Client, tool: str, arguments: dict[str, Any], iterations: int, concurrency: int
+) -> dict[str, Any]:
+    """Measure one tool's latency, throughput, peak memory and result size."""
+    try:
+        text = await _call(client, tool, arguments)  # Warm up (version detection, pools)
+    except Exception as e:
+        return {"arguments": arguments, "error": str(e)}
+
+    samples = []
+    for _ in range(iterations):
+        started = time.perf_counter()
+        await _call(client, tool, arguments)
+        samples.append(time.perf_counter() - started)
+
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def _bounded() -> None:
+        async with semaphore:
+            await _call(client, tool, arguments)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(_bounded() for _ in range(iterations)))
+    elapsed = time.perf_counter() - started
+
+    tracemalloc.start()
+    try:
+        baseline = tracemalloc.get_traced_memory()[0]
+        await _call(client, tool, arguments)
+        peak = tracemalloc.get_traced_memory()[1] - baseline
+    finally:
+        tracemalloc.stop()
+
+    return {
+        "arguments": arguments,
+        "latency": _latency_stats(samples),
+        "throughput_per_second": round(iterations / elapsed, 2),
+        "peak_memory_bytes": peak,
+        "result_chars": len(text),
+    }
+
+
+def benchmark_serialization(dataset: Dataset, iterations: int) -> dict[str, Any]:
+    """Time the tool output serializer on payloads shaped like tool results."""
+    payloads = {
+        "dags": {"dags": [dataset.dag(dag, v3=True) for dag in range(dataset.dags)]},
+        "dag_runs": {
+            "dag_runs": [dataset.dag_run(0, run, v3=True) for run in range(dataset.runs_per_dag)]
+        },
+        "task_instances": {
+            "task_instances": [
+                ti for run in range(dataset.runs_per_dag) for ti in dataset.task_instances(0, run)
+            ]
+        },
+        "log_entries": {"content": list(dataset.log_entries(0, 0, 0))},
+    }
+    results: dict[str, Any] = {"orjson": server.orjson is not None}
+    for name, payload in payloads.items():
+        results[name] = {}
+        for mode in ("compact", "pretty"):
+            samples = []
+            for _ in range(iterations):
+                started = time.perf_counter()
+                text = server._serialize(payload, pretty=mode == "pretty")
+                samples.append(time.perf_counter() - started)
+            results[name][mode] = {**_latency_stats(samples), "chars": len(text)}
+    return results
+
+
+async def _benchmark_version(options: BenchmarkOptions, version: str) -> dict[str, Any]:
+    ds = options.dataset
+    with serve(ds, version, options.latency) as url:
+        server.configure(
+            url=url,
+            auth_token="benchmark",
+            airflow_version=version,
+            response_cache=options.response_cache,
+        )
+        try:
+            async with Client(server.mcp) as client:
+                return {
+                    tool: await benchmark_tool(
+                        client,
+                        tool,
+                        SCENARIOS[tool](ds),
+                        options.iterations,
+                        options.concurrency,
+                    )
+                    for tool in options.tools
+                }
+        finally:
+            server._reset_adapter()
+
+
+async def run_benchmarks(options: BenchmarkOptions) -> dict[str, Any]:
+    """Run every scenario against each Airflow version; returns JSON-serializable results."""
+    return {
+        "meta": {
+            "package_version": __version__,
+            "python": sys.version.split()[0],
+            "platform": platform.platform(),
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "options": {
+                **asdict(options),
+                "dataset": {
+                    k: v.total_seconds() if hasattr(v, "total_seconds") else v
+                    for k, v in asdict(options.dataset).items()
+                },
+            },
+        },
+        "serialization": benchmark_serialization(options.dataset, options.iterations),
+        "tools": {
+            version: await _benchmark_version(options, version)
+            for version in options.airflow_versions
+        },
+    }
@@ -0,0 +1,212 @@
+"""Tests keeping the synthetic dataset, the stand-in API and the benchmark runner working."""
+
+import httpx
+import pytest
+
+from astro_airflow_mcp import server
+from astro_airflow_mcp.adapters import AsyncAirflowV2Adapter, AsyncAirflowV3Adapter, ResponseCache
+from tests.benchmarks.dataset import END_DATE, PRESETS, Dataset
+from tests.benchmarks.fake_airflow import create_app
+from tests.benchmarks.run import SCENARIOS, BenchmarkOptions, run_benchmarks
+
+VERSIONS = [("2.10.5", AsyncAirflowV2Adapter), ("3.0.0", AsyncAirflowV3Adapter)]
+
+
+@pytest.fixture(autouse=True)
+def restore_config():
+    """Put back the server config the runner overwrites."""
+    saved = vars(server._config).copy()
+    yield
+    vars(server._config).update(saved)
+    server._reset_adapter()
+
+
+def _failed_run(ds: Dataset) -> tuple[int, int]:
+    return next(
+        (dag, run)
+        for run in range(ds.runs_per_dag)
+        for dag in range(ds.dags)
+        if ds.run_state(dag, run) == "failed"
+    )
+
+
+def _adapter(mocker, ds: Dataset, version: str, adapter_class: type):
+    client = httpx.AsyncClient(transport=httpx.ASGITransport(app=create_app(ds, version)))
+    mocker.patch("httpx.AsyncClient", return_value=client)
+    return adapter_class("http://airflow", version, cache=ResponseCache())
+
+
+class TestDataset:
+    """Tests for the generated Airflow instance."""
+
+    def test_deterministic_per_seed(self):
+        """Test the same seed always generates the same instance, and another seed does not."""
+        first, second, other = Dataset(), Dataset(), Dataset(seed=1)
+
+        def snapshot(ds: Dataset) -> list:
+            return [
+                (ds.dag(dag, v3=True), list(ds.task_instances(dag, ds.runs_per_dag - 2)))
+                for dag in range(ds.dags)
+            ]
+
+        assert snapshot(first) == snapshot(second)
+        assert snapshot(first) != snapshot(other)
+
+    def test_ids_round_trip(self):
+        """Test ids map back to their index and unknown ids are rejected."""
+        ds = Dataset(runs_per_dag=5)
+        assert [ds.run_index(ds.run_id(run)) for run in range(5)] == list(range(5))
+        assert ds.run_index("manual__2020-01-01T00:00:00+00:00") is None
+        assert ds.dag_index(ds.dag_id(ds.dags)) is None
+        assert ds.task_index(0, ds.task_id(ds.profile(0).tasks)) is None
+
+    def test_runs_between_is_inclusive(self):
+        """Test the date filter keeps runs started exactly on its bounds."""
+        ds = Dataset(runs_per_dag=5)
+        assert ds.runs_between(ds.run_start(1), ds.run_start(3)) == range(1, 4)
+        assert ds.runs_between(END_DATE, None) == range(5, 5)
+
+    def test_task_graph_is_acyclic_and_consistent(self):
+        """Test upstream tasks come earlier and downstream lists mirror upstream lists."""
+        ds = Dataset(tasks_per_dag=20)
+        for dag in range(ds.dags):
+            profile = ds.profile(dag)
+            for task in range(profile.tasks):
+                assert all(up < task for up in profile.upstream[task])
+                for down in profile.downstream[task]:
+                    assert task in profile.upstream[down]
+
+    def test_failed_run_states(self):
+        """Test a failed run has one failed task whose descendants are upstream_failed."""
+        ds = Dataset(dags=200, runs_per_dag=50, tasks_per_dag=20, mapped_fraction=0.5)
+        dag, run = _failed_run(ds)
+        failed = ds.failed_task(dag, run)
+        states = {
+            (ti["task_id"], ti["map_index"]): ti["state"] for ti in ds.task_instances(dag, run)
+        }
+
+        last_index = ds.map_indices(dag, run, failed)[-1]
+        assert [key for key, state in states.items() if state == "failed"] == [
+            (ds.task_id(failed), last_index)
+        ]
+        for down in ds.profile(dag).downstream[failed]:
+            assert states[(ds.task_id(down), ds.map_indices(dag, run, down)[0])] == (
+                "upstream_failed"
+            )
+
+    def test_state_distribution(self):
+        """Test failures average the configured rate and the newest runs are unfinished."""
+        ds = Dataset(dags=500, runs_per_dag=40)
+        finished = [
+            ds.run_state(dag, run) for dag in range(ds.dags) for run in range(ds.runs_per_dag - 1)
+        ]
+        assert 0.07 < finished.count("failed") / len(finished) < 0.13
+        newest = {ds.run_state(dag, ds.runs_per_dag - 1) for dag in range(ds.dags)}
+        assert {"running", "queued"} <= newest
+
+    def test_mapped_tasks_expand(self):
+        """Test mapped tasks have map indices 0..n-1 and unmapped tasks only -1."""
+        ds = Dataset(mapped_fraction=0.5)
+        for dag in range(10):
+            for task in range(ds.profile(dag).tasks):
+                indices = ds.map_indices(dag, 0, task)
+                if ds.profile(dag).mapped[task]:
+                    assert indices[0] == 0
+                    assert 1 <= len(indices) <= ds.max_map_length
+                else:
+                    assert list(indices) == [-1]
+
+    def test_large_preset_size(self):
+        """Test the large preset is 5,000 DAGs with 1M runs."""
+        ds = PRESETS["large"]
+        assert ds.dags == 5_000
+        assert ds.dags * ds.runs_per_dag == 1_000_000
+
+
+class TestStandInServer:
+    """Tests for the stand-in API through the real adapters."""
+
+    @pytest.mark.anyio
+    @pytest.mark.parametrize(("version", "adapter_class"), VERSIONS)
+    async def test_pages_through_every_dag(self, mocker, version, adapter_class):
+        """Test paging through DAGs returns each DAG once, with filters applied."""
+        ds = Dataset(dags=250)
+        adapter = _adapter(mocker, ds, version, adapter_class)
+
+        result = await adapter.fetch_all(adapter.list_dags, "dags", page_size=100)
+        tagged = await adapter.fetch_all(adapter.list_dags, "dags", tags=["dbt"])
+
+        assert [d["dag_id"] for d in result["dags"]] == [ds.dag_id(d) for d in range(ds.dags)]
+        assert tagged["dags"]
+        assert all("dbt" in [t["name"] for t in d["tags"]] for d in tagged["dags"])
+        assert len(tagged["dags"]) < ds.dags
+
+    @pytest.mark.anyio
+    @pytest.mark.parametrize(("version", "adapter_class"), VERSIONS)
+    async def test_large_instance_pages_lazily(self, mocker, version, adapter_class):
+        """Test the last page of 1M runs is served without building the rest."""
+        ds = PRESETS["large"]
+        adapter = _adapter(mocker, ds, version, adapter_class)
+
+        page = await adapter.list_dag_runs("~", limit=100, offset=999_950)
+
+        assert page["total_entries"] == 1_000_000
+        assert len(page["dag_runs"]) == 50
+        assert page["dag_runs"][-1]["dag_id"] == ds.dag_id(ds.dags - 1)
+
+    @pytest.mark.anyio
+    @pytest.mark.parametrize(("version", "adapter_class"), VERSIONS)
+    async def test_streams_mapped_task_log(self, mocker, version, adapter_class):
+        """Test a failed mapped task's log streams with its traceback."""
+        ds = Dataset(log_lines=50, mapped_fraction=1.0)
+        adapter = _adapter(mocker, ds, version, adapter_class)
+        dag, run = _failed_run(ds)
+        task = ds.failed_task(dag, run)
+        map_index = ds.map_indices(dag, run, task)[-1]
+
+        lines = [
+            line
+            async for line in adapter.stream_task_logs(
+                ds.dag_id(dag), ds.run_id(run), ds.task_id(task), map_index=map_index
+            )
+        ]
+
+        assert len(lines) > 50
+        assert f"[{map_index}]" in lines[0]
+        assert any("Task failed with exception" in line for line in lines)
+
+    @pytest.mark.anyio
+    @pytest.mark.parametrize(("version", "adapter_class"), VERSIONS)
+    async def test_import_errors(self, mocker, version, adapter_class):
+        """Test import errors page with stack traces."""
+        adapter = _adapter(mocker, Dataset(import_errors=3), version, adapter_class)
+
+        result = await adapter.list_import_errors(limit=2)
+
+        assert result["total_entries"] == 3
+        assert len(result["import_errors"]) == 2
+        assert "Traceback" in result["import_errors"][0]["stack_trace"]
+
+
+class TestRunner:
+    """Tests for the benchmark runner against both API versions."""
+
+    @pytest.mark.anyio
+    async def test_every_scenario_succeeds(self):
+        """Test each tool scenario runs without errors on Airflow 2 and 3."""
+        options = BenchmarkOptions(
+            dataset=Dataset(dags=5, runs_per_dag=5, tasks_per_dag=4, log_lines=5),
+            iterations=2,
+            concurrency=2,
+        )
+
+        results = await run_benchmarks(options)
+
+        assert set(results["tools"]) == {"2.10.5", "3.0.0"}
+        for tools in results["tools"].values():
+            assert set(tools) == set(SCENARIOS)
+            for tool, result in tools.items():
+                assert "error" not in result, (tool, result)
+                assert result["latency"]["min_ms"] <= result["latency"]["max_ms"]
+                assert result["peak_memory_bytes"] > 0
+        assert results["serialization"]["dags"]["compact"]["chars"] > 0
@@ -0,0 +1,19 @@
+"""Shared pytest configuration."""
+
+import pytest
+
+from astro_airflow_mcp.adapters import clear_version_cache
+
+
+@pytest.fixture
+def anyio_backend():
+    """Run async tests on asyncio only (the server runs on asyncio)."""
+    return "asyncio"
+
+
+@pytest.fixture(autouse=True)
+def _clear_version_cache():
+    """Keep versions detected by one test from leaking into the next."""
+    clear_version_cache()
+    yield
+    clear_version_cache()
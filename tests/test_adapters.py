@@ -1,13 +1,20 @@
 """Tests for Airflow API adapters."""
 
+import asyncio
+
+import httpx
 import pytest
 
 from astro_airflow_mcp.adapters import (
     AirflowV2Adapter,
     AirflowV3Adapter,
+    AsyncAirflowV2Adapter,
+    AsyncAirflowV3Adapter,
     NotFoundError,
     create_adapter,
+    create_async_adapter,
     detect_version,
+    resolve_version,
 )
 
 
@@ -216,6 +223,154 @@ class TestAirflowV2Adapter:
         assert "consuming_dags" not in result["assets"][0]
 
 
+class TestPooledClient:
+    """Tests for the adapter's long-lived HTTP client."""
+
+    def test_client_reused_across_calls(self, mocker):
+        """Test the adapter creates one HTTP client and reuses it for every request."""
+        adapter = AirflowV2Adapter("http://localhost:8080", "2.9.0")
+
+        mock_response = mocker.Mock()
+        mock_response.json.return_value = {"dags": [], "total_entries": 0}
+        mock_response.status_code = 200
+        mock_response.raise_for_status = mocker.Mock()
+
+        mock_client = mocker.Mock()
+        mock_client.is_closed = False
+        mock_client.get.return_value = mock_response
+        client_cls = mocker.patch("httpx.Client", return_value=mock_client)
+
+        adapter.list_dags()
+        adapter.get_dag("example_dag")
+
+        client_cls.assert_called_once()
+        assert mock_client.get.call_count == 2
+
+    def test_client_uses_configured_limits(self, mocker):
+        """Test pool limits and HTTP/2 flag are passed to the HTTP client."""
+        limits = httpx.Limits(max_connections=5, max_keepalive_connections=2)
+        adapter = AirflowV3Adapter("http://localhost:8080", "3.0.0", limits=limits)
+        client_cls = mocker.patch("httpx.Client")
+
+        _ = adapter.client
+
+        call_kwargs = client_cls.call_args[1]
+        assert call_kwargs["limits"] is limits
+        assert call_kwargs["http2"] is False
+
+    def test_close_releases_client(self, mocker):
+        """Test close() closes the pooled client and a new one is created on next use."""
+        adapter = AirflowV2Adapter("http://localhost:8080", "2.9.0")
+        first_client = mocker.Mock(is_closed=False)
+        second_client = mocker.Mock(is_closed=False)
+        mocker.patch("httpx.Client", side_effect=[first_client, second_client])
+
+        assert adapter.client is first_client
+        adapter.close()
+
+        first_client.close.assert_called_once()
+        assert adapter.client is second_client
+
+    def test_context_manager_closes_client(self, mocker):
+        """Test using the adapter as a context manager closes the client on exit."""
+        mock_client = mocker.Mock(is_closed=False)
+        mocker.patch("httpx.Client", return_value=mock_client)
+
+        with AirflowV2Adapter("http://localhost:8080", "2.9.0") as adapter:
+            _ = adapter.client
+
+        mock_client.close.assert_called_once()
+
+
+class TestUnauthorizedRetry:
+    """Tests for re-authenticating after a 401 response."""
+
+    def test_401_invalidates_and_retries_once(self, mocker):
+        """Test a 401 runs the on_unauthorized hook and retries with the new token."""
+        tokens = iter(["expired_token", "fresh_token"])
+        current = {"token": next(tokens)}
+        on_unauthorized = mocker.Mock(side_effect=lambda: current.update(token=next(tokens)))
+        adapter = AirflowV3Adapter(
+            "http://localhost:8080",
+            "3.0.0",
+            token_getter=lambda: current["token"],
+            on_unauthorized=on_unauthorized,
+        )
+
+        ok_response = mocker.Mock(status_code=200)
+        ok_response.json.return_value = {"version": "3.0.0"}
+        mock_client = mocker.Mock(is_closed=False)
+        mock_client.get.side_effect = [mocker.Mock(status_code=401), ok_response]
+        mocker.patch("httpx.Client", return_value=mock_client)
+
+        assert adapter.get_version() == {"version": "3.0.0"}
+        on_unauthorized.assert_called_once()
+        retry_headers = mock_client.get.call_args[1]["headers"]
+        assert retry_headers["Authorization"] == "Bearer fresh_token"
+        assert retry_headers["Accept"] == "application/json"
+
+    def test_401_without_hook_is_not_retried(self, mocker):
+        """Test a 401 surfaces as an HTTP error when no hook is configured."""
+        adapter = AirflowV3Adapter("http://localhost:8080", "3.0.0", token_getter=lambda: "t")
+
+        response = mocker.Mock(status_code=401)
+        response.raise_for_status.side_effect = Exception("401 Unauthorized")
+        mock_client = mocker.Mock(is_closed=False)
+        mock_client.get.return_value = response
+        mocker.patch("httpx.Client", return_value=mock_client)
+
+        with pytest.raises(Exception, match="401"):
+            adapter.get_version()
+        assert mock_client.get.call_count == 1
+
+    @pytest.mark.anyio
+    async def test_async_401_retried_once(self, mocker):
+        """Test the async adapter retries a 401 once after the hook runs."""
+        on_unauthorized = mocker.Mock()
+        adapter = AsyncAirflowV3Adapter(
+            "http://localhost:8080",
+            "3.0.0",
+            token_getter=lambda: "t",
+            on_unauthorized=on_unauthorized,
+        )
+
+        unauthorized = mocker.Mock(status_code=401)
+        unauthorized.raise_for_status.side_effect = Exception("401 Unauthorized")
+        mock_client = mocker.AsyncMock(is_closed=False)
+        mock_client.patch.return_value = unauthorized
+        mocker.patch("httpx.AsyncClient", return_value=mock_client)
+
+        with pytest.raises(Exception, match="401"):
+            await adapter.pause_dag("example_dag")
+        on_unauthorized.assert_called_once()
+        assert mock_client.patch.await_count == 2
+
+    @pytest.mark.anyio
+    async def test_async_token_getter_awaited_on_retry(self, mocker):
+        """Test the async adapter awaits a coroutine token getter, including on a 401 retry."""
+        tokens = iter(["expired_token", "fresh_token"])
+
+        async def token_getter():
+            return next(tokens)
+
+        adapter = AsyncAirflowV3Adapter(
+            "http://localhost:8080",
+            "3.0.0",
+            token_getter=token_getter,
+            on_unauthorized=mocker.Mock(),
+        )
+        ok_response = mocker.Mock(status_code=200)
+        ok_response.json.return_value = {"version": "3.0.0"}
+        mock_client = mocker.AsyncMock(is_closed=False)
+        mock_client.get.side_effect = [mocker.Mock(status_code=401), ok_response]
+        mocker.patch("httpx.AsyncClient", return_value=mock_client)
+
+        assert await adapter.get_version() == {"version": "3.0.0"}
+        first, retry = (call[1]["headers"] for call in mock_client.get.call_args_list)
+        assert first["Authorization"] == "Bearer expired_token"
+        assert retry["Authorization"] == "Bearer fresh_token"
+
+
 class TestAirflowV3Adapter:
     """Tests for AirflowV3Adapter."""
 
@@ -276,7 +431,56 @@ class TestAirflowV3Adapter:
 
         call_kwargs = mock_client.get.call_args[1]
         assert call_kwargs["params"]["tags"] == ["production"]
-        assert call_kwargs["params"]["only_active"] is True
+        # Airflow 3 names the only_active filter exclude_stale
+        assert call_kwargs["params"]["exclude_stale"] is True
+        assert "only_active" not in call_kwargs["params"]
+
+    @pytest.mark.anyio
+    async def test_async_only_active_sent_as_exclude_stale(self, mocker):
+        """Test only_active=False asks Airflow 3 to include stale DAGs."""
+        adapter = AsyncAirflowV3Adapter("http://localhost:8080", "3.0.0")
+
+        mock_response = mocker.Mock()
+        mock_response.json.return_value = {"dags": []}
+        mock_response.status_code = 200
+
+        mock_client = mocker.AsyncMock(is_closed=False)
+        mock_client.get.return_value = mock_response
+        mocker.patch("httpx.AsyncClient", return_value=mock_client)
+
+        await adapter.list_dags(limit=10, only_active=False)
+
+        params = mock_client.get.call_args[1]["params"]
+        assert params["exclude_stale"] is False
+        assert "only_active" not in params
+
+    def test_list_dag_runs_batch_body(self, mocker):
+        """Test the batch DAG run query POSTs filters in the request body."""
+        adapter = AirflowV3Adapter(
+            "http://localhost:8080", "3.0.0", token_getter=lambda: "test_token"
+        )
+
+        mock_response = mocker.Mock()
+        mock_response.json.return_value = {"dag_runs": [], "total_entries": 0}
+        mock_response.status_code = 200
+        mock_response.raise_for_status = mocker.Mock()
+
+        mock_client = mocker.Mock()
+        mock_client.post.return_value = mock_response
+        mocker.patch("httpx.Client", return_value=mock_client)
+
+        adapter.list_dag_runs_batch(
+            dag_ids=["a", "b"], limit=50, start_date_gte="2024-01-01T00:00:00+00:00"
+        )
+
+        url = mock_client.post.call_args[0][0]
+        assert url == "http://localhost:8080/api/v2/dags/~/dagRuns/list"
+        assert mock_client.post.call_args[1]["json"] == {
+            "dag_ids": ["a", "b"],
+            "page_limit": 50,
+            "page_offset": 0,
+            "start_date_gte": "2024-01-01T00:00:00+00:00",
+        }
 
 
 class TestVersionDetection:
@@ -401,6 +605,456 @@ class TestAdapterFactory:
         assert "Unsupported Airflow version" in str(exc_info.value)
 
 
+class TestVersionResolution:
+    """Tests for version override and version caching."""
+
+    def test_override_skips_detection(self, mocker):
+        """Test an explicit version never probes the API."""
+        detect = mocker.patch("astro_airflow_mcp.adapters.detect_version")
+
+        adapter = create_adapter("http://localhost:8080", airflow_version="2.10.5")
+
+        detect.assert_not_called()
+        assert isinstance(adapter, AirflowV2Adapter)
+        assert adapter.version == "2.10.5"
+
+    def test_invalid_override(self):
+        """Test an invalid override raises ValueError."""
+        with pytest.raises(ValueError, match="Invalid Airflow version"):
+            resolve_version("http://localhost:8080", airflow_version="latest")
+
+    def test_detected_version_cached_in_process(self, mocker):
+        """Test re-creating an adapter for the same URL does not probe again."""
+        detect = mocker.patch(
+            "astro_airflow_mcp.adapters.detect_version", return_value=(3, "3.1.0")
+        )
+
+        create_adapter("http://localhost:8080")
+        adapter = create_adapter("http://localhost:8080")
+
+        detect.assert_called_once()
+        assert adapter.version == "3.1.0"
+
+    def test_detected_version_cached_on_disk(self, mocker, tmp_path):
+        """Test the on-disk cache survives a cleared in-process cache (a restart)."""
+        from astro_airflow_mcp.adapters import clear_version_cache
+
+        cache_file = tmp_path / "cache" / "versions.json"
+        detect = mocker.patch(
+            "astro_airflow_mcp.adapters.detect_version", return_value=(3, "3.1.0")
+        )
+
+        resolve_version("http://localhost:8080", version_cache_file=cache_file)
+        clear_version_cache()
+        result = resolve_version("http://localhost:8080", version_cache_file=cache_file)
+
+        detect.assert_called_once()
+        assert result == (3, "3.1.0")
+
+    def test_disk_cache_entry_expires(self, tmp_path):
+        """Test stale on-disk entries trigger a fresh probe."""
+        from astro_airflow_mcp.adapters.version_cache import get_cached_version
+
+        cache_file = tmp_path / "versions.json"
+        cache_file.write_text('{"http://localhost:8080": {"version": "2.9.0", "detected_at": 0}}')
+
+        assert get_cached_version("http://localhost:8080", cache_file=cache_file) is None
+
+    def test_failed_disk_cache_write_leaves_no_temp_file(self, mocker, tmp_path):
+        """Test the temp file is removed when replacing the cache file fails."""
+        from astro_airflow_mcp.adapters.version_cache import get_cached_version, store_version
+
+        cache_file = tmp_path / "versions.json"
+        mocker.patch("os.replace", side_effect=OSError("Read-only file system"))
+
+        store_version("http://localhost:8080", "3.1.0", cache_file=cache_file)
+
+        assert list(tmp_path.iterdir()) == []
+        assert get_cached_version("http://localhost:8080") == "3.1.0"
+
+    def test_corrupt_disk_cache_ignored(self, mocker, tmp_path):
+        """Test a corrupt cache file falls back to detection."""
+        cache_file = tmp_path / "versions.json"
+        cache_file.write_text("not json")
+        mocker.patch("astro_airflow_mcp.adapters.detect_version", return_value=(2, "2.9.0"))
+
+        assert resolve_version("http://localhost:8080", version_cache_file=cache_file) == (
+            2,
+            "2.9.0",
+        )
+
+    def test_v3_token_exchange_is_lazy(self, mocker):
+        """Test the sync V3 adapter exchanges credentials on first request, not on init."""
+        exchange = mocker.patch.object(
+            AirflowV3Adapter, "_exchange_for_token", return_value="jwt_token"
+        )
+
+        adapter = AirflowV3Adapter(
+            "http://localhost:8080", "3.0.0", basic_auth_getter=lambda: ("admin", "admin")
+        )
+        exchange.assert_not_called()
+
+        mock_client = mocker.Mock(is_closed=False)
+        mock_client.get.return_value = mocker.Mock(status_code=200, json=dict)
+        mocker.patch("httpx.Client", return_value=mock_client)
+        adapter.get_version()
+        adapter.get_version()
+
+        exchange.assert_called_once_with("http://localhost:8080", "admin", "admin")
+        call_kwargs = mock_client.get.call_args[1]
+        assert call_kwargs["headers"]["Authorization"] == "Bearer jwt_token"
+
+
+class TestAsyncAdapters:
+    """Tests for the asyncio adapters used by the MCP server."""
+
+    @pytest.mark.anyio
+    async def test_create_async_adapter_v3(self, mocker):
+        """Test async factory creates async V3 adapter for Airflow 3.x."""
+        mocker.patch(
+            "astro_airflow_mcp.adapters.detect_version",
+            return_value=(3, "3.0.0"),
+        )
+
+        adapter = await create_async_adapter("http://localhost:8080")
+
+        assert isinstance(adapter, AsyncAirflowV3Adapter)
+        assert adapter.version == "3.0.0"
+
+    @pytest.mark.anyio
+    async def test_create_async_adapter_unsupported_version(self, mocker):
+        """Test async factory raises error for unsupported version."""
+        mocker.patch(
+            "astro_airflow_mcp.adapters.detect_version",
+            return_value=(1, "1.10.0"),
+        )
+
+        with pytest.raises(RuntimeError, match="Unsupported Airflow version"):
+            await create_async_adapter("http://localhost:8080")
+
+    @pytest.mark.anyio
+    async def test_list_assets_normalizes_field_names_v2(self, mocker):
+        """Test async V2 adapter normalizes datasets to assets."""
+        adapter = AsyncAirflowV2Adapter("http://localhost:8080", "2.9.0")
+
+        mock_response = mocker.Mock()
+        mock_response.json.return_value = {
+            "datasets": [{"uri": "s3://bucket/key", "consuming_dags": [{"dag_id": "d1"}]}],
+            "total_entries": 1,
+        }
+        mock_response.status_code = 200
+
+        mock_client = mocker.AsyncMock(is_closed=False)
+        mock_client.get.return_value = mock_response
+        mocker.patch("httpx.AsyncClient", return_value=mock_client)
+
+        result = await adapter.list_assets()
+
+        assert result["assets"][0]["scheduled_dags"] == [{"dag_id": "d1"}]
+        assert "/api/v1/datasets" in mock_client.get.call_args[0][0]
+
+    @pytest.mark.anyio
+    async def test_v3_exchanges_basic_auth_for_token_on_first_request(self, mocker):
+        """Test async V3 adapter defers the JWT exchange to the first request."""
+        adapter = AsyncAirflowV3Adapter(
+            "http://localhost:8080",
+            "3.0.0",
+            basic_auth_getter=lambda: ("admin", "admin"),
+        )
+
+        token_response = mocker.Mock(status_code=200)
+        token_response.json.return_value = {"access_token": "jwt_token"}
+        dag_response = mocker.Mock(status_code=200)
+        dag_response.json.return_value = {"dag_id": "example_dag"}
+
+        mock_client = mocker.AsyncMock(is_closed=False)
+        mock_client.post.return_value = token_response
+        mock_client.get.return_value = dag_response
+        mocker.patch("httpx.AsyncClient", return_value=mock_client)
+
+        await adapter.get_dag("example_dag")
+        await adapter.get_dag("example_dag")
+
+        mock_client.post.assert_awaited_once()
+        assert mock_client.post.call_args[0][0] == "http://localhost:8080/auth/token"
+        call_kwargs = mock_client.get.call_args[1]
+        assert call_kwargs["headers"]["Authorization"] == "Bearer jwt_token"
+        assert call_kwargs["auth"] is None
+
+    @pytest.mark.anyio
+    async def test_async_404_raises_not_found(self, mocker):
+        """Test async adapter raises NotFoundError on 404."""
+        adapter = AsyncAirflowV3Adapter("http://localhost:8080", "3.0.0")
+
+        mock_client = mocker.AsyncMock(is_closed=False)
+        mock_client.get.return_value = mocker.Mock(status_code=404)
+        mocker.patch("httpx.AsyncClient", return_value=mock_client)
+
+        with pytest.raises(NotFoundError):
+            await adapter.get_dag("nonexistent_dag")
+
+    @pytest.mark.anyio
+    async def test_async_context_manager_closes_client(self, mocker):
+        """Test the async adapter closes its pooled client on exit."""
+        mock_client = mocker.AsyncMock(is_closed=False)
+        mocker.patch("httpx.AsyncClient", return_value=mock_client)
+
+        async with AsyncAirflowV2Adapter("http://localhost:8080", "2.9.0") as adapter:
+            _ = adapter.client
+
+        mock_client.aclose.assert_awaited_once()
+
+    @pytest.mark.anyio
+    async def test_stream_task_logs_v3_decodes_ndjson(self, mocker):
+        """Test async V3 adapter streams structured log lines as text."""
+        requests = []
+
+        def handler(request):
+            requests.append(request)
+            body = (
+                b'{"timestamp": "2024-01-01T00:00:00Z", "level": "info", "event": "start"}\n'
+                b'{"event": "done"}\n'
+            )
+            return httpx.Response(200, content=body)
+
+        client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        mocker.patch("httpx.AsyncClient", return_value=client)
+        adapter = AsyncAirflowV3Adapter("http://localhost:8080", "3.0.0")
+
+        lines = [line async for line in adapter.stream_task_logs("d", "r", "t", 2, map_index=3)]
+
+        assert lines == ["[2024-01-01T00:00:00Z] INFO - start", "done"]
+        assert requests[0].headers["Accept"] == "application/x-ndjson"
+        assert requests[0].url.path == "/api/v2/dags/d/dagRuns/r/taskInstances/t/logs/2"
+        assert requests[0].url.params["map_index"] == "3"
+
+    @pytest.mark.anyio
+    async def test_stream_task_logs_v2_plain_text_and_not_found(self, mocker):
+        """Test async V2 adapter streams plain text and raises NotFoundError on 404."""
+
+        def handler(request):
+            if "missing" in request.url.path:
+                return httpx.Response(404)
+            return httpx.Response(200, content=b"line 1\nline 2\n")
+
+        client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        mocker.patch("httpx.AsyncClient", return_value=client)
+        adapter = AsyncAirflowV2Adapter("http://localhost:8080", "2.9.0")
+
+        lines = [line async for line in adapter.stream_task_logs("d", "r", "t")]
+        assert lines == ["line 1", "line 2"]
+
+        with pytest.raises(NotFoundError):
+            async for _ in adapter.stream_task_logs("d", "r", "missing"):
+                pass
+
+    def test_stream_task_logs_sync(self, mocker):
+        """Test the sync adapter streams log lines too."""
+        client = httpx.Client(
+            transport=httpx.MockTransport(lambda _request: httpx.Response(200, content=b"a\nb"))
+        )
+        mocker.patch("httpx.Client", return_value=client)
+        adapter = AirflowV2Adapter("http://localhost:8080", "2.9.0")
+
+        assert list(adapter.stream_task_logs("d", "r", "t")) == ["a", "b"]
+
+
+class TestDagStatsChunking:
+    """Tests for chunked, concurrent dagStats collection."""
+
+    def test_chunk_dag_ids_respects_url_budget(self):
+        """Test IDs are split so each chunk's query string fits the budget."""
+        dag_ids = [f"dag_{i:04d}" for i in range(1000)]
+
+        chunks = AirflowV2Adapter._chunk_dag_ids(dag_ids, budget=200)
+
+        assert [d for chunk in chunks for d in chunk] == dag_ids
+        assert all(sum(len("&dag_ids=") + len(d) for d in chunk) <= 200 for chunk in chunks)
+        assert AirflowV2Adapter._chunk_dag_ids(["x" * 500], budget=200) == [["x" * 500]]
+
+    @pytest.mark.anyio
+    async def test_v2_paginates_dags_and_chunks_ids(self, mocker):
+        """Test V2 fetches every DAG page and reports a failed chunk as an error."""
+        stats_calls = []
+
+        def handler(request):
+            if request.url.path.endswith("/dags"):
+                offset = int(request.url.params["offset"])
+                dags = [{"dag_id": f"dag_{i:04d}"} for i in range(offset, min(offset + 100, 250))]
+                return httpx.Response(200, json={"dags": dags, "total_entries": 250})
+            ids = request.url.params["dag_ids"].split(",")
+            stats_calls.append(ids)
+            if "dag_0249" in ids:
+                return httpx.Response(503)
+            return httpx.Response(
+                200, json={"dags": [{"dag_id": d} for d in ids], "total_entries": len(ids)}
+            )
+
+        client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        mocker.patch("httpx.AsyncClient", return_value=client)
+        adapter = AsyncAirflowV2Adapter("http://localhost:8080", "2.9.0")
+
+        result = await adapter.get_dag_stats()
+
+        assert sum(len(ids) for ids in stats_calls) == 250
+        assert len(stats_calls) > 1
+        failed_chunk = result["errors"][0]["dag_ids"]
+        assert "dag_0249" in failed_chunk
+        assert result["total_entries"] == 250 - len(failed_chunk)
+        # Results keep the DAG order regardless of response order
+        dag_ids = [d["dag_id"] for d in result["dags"]]
+        assert dag_ids == sorted(dag_ids)
+
+    @pytest.mark.anyio
+    async def test_v3_falls_back_to_per_dag_requests_after_500(self, mocker):
+        """Test V3 stops batching after the Airflow 3.2.0 multiple-dag_ids 500 error."""
+        requests = []
+
+        def handler(request):
+            ids = request.url.params.get_list("dag_ids")
+            requests.append(ids)
+            if len(ids) > 1 or ids == ["broken"]:
+                return httpx.Response(500)
+            return httpx.Response(200, json={"dags": [{"dag_id": ids[0]}], "total_entries": 1})
+
+        client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        mocker.patch("httpx.AsyncClient", return_value=client)
+        adapter = AsyncAirflowV3Adapter("http://localhost:8080", "3.2.0")
+
+        result = await adapter.get_dag_stats(dag_ids=["a", "broken", "c"])
+
+        assert [d["dag_id"] for d in result["dags"]] == ["a", "c"]
+        assert result["errors"][0]["dag_id"] == "broken"
+        assert requests[0] == ["a", "broken", "c"]
+
+        requests.clear()
+        await adapter.get_dag_stats(dag_ids=["a", "c"])
+        assert requests == [["a"], ["c"]]
+
+    def test_v3_sync_batches_when_supported(self, mocker):
+        """Test the sync V3 adapter sends many dag_ids in one request when Airflow allows."""
+        requests = []
+
+        def handler(request):
+            ids = request.url.params.get_list("dag_ids")
+            requests.append(ids)
+            return httpx.Response(
+                200, json={"dags": [{"dag_id": d} for d in ids], "total_entries": len(ids)}
+            )
+
+        client = httpx.Client(transport=httpx.MockTransport(handler))
+        mocker.patch("httpx.Client", return_value=client)
+        adapter = AirflowV3Adapter("http://localhost:8080", "3.1.0")
+
+        result = adapter.get_dag_stats(dag_ids=["a", "b", "c"])
+
+        assert result["total_entries"] == 3
+        assert requests == [["a", "b", "c"]]
+        assert "errors" not in result
+
+
+def _paged_dags(total, max_page_limit=100):
+    """Build a fake list_dags that serves `total` DAGs, recording each request."""
+    calls = []
+
+    def list_dags(limit=100, offset=0, **kwargs):
+        calls.append((limit, offset, kwargs))
+        end = min(total, offset + min(limit, max_page_limit))
+        dags = [{"dag_id": f"dag_{i}"} for i in range(offset, end)]
+        return {"dags": dags, "total_entries": total}
+
+    return list_dags, calls
+
+
+class TestPagination:
+    """Tests for the adapters' paginated list helpers."""
+
+    def test_fetch_all_walks_every_page(self):
+        """Test fetch_all collects all items across pages."""
+        adapter = AirflowV2Adapter("http://localhost:8080", "2.9.0")
+        list_dags, calls = _paged_dags(250)
+
+        result = adapter.fetch_all(list_dags, "dags", tags=["prod"])
+
+        assert len(result["dags"]) == 250
+        assert result["dags"][-1]["dag_id"] == "dag_249"
+        assert result["total_entries"] == 250
+        assert [offset for _, offset, _ in calls] == [0, 100, 200]
+        assert all(kwargs == {"tags": ["prod"]} for _, _, kwargs in calls)
+
+    def test_fetch_all_respects_server_page_cap(self):
+        """Test pages step by the size Airflow actually returned."""
+        adapter = AirflowV2Adapter("http://localhost:8080", "2.9.0")
+        list_dags, calls = _paged_dags(120, max_page_limit=50)
+
+        result = adapter.fetch_all(list_dags, "dags", page_size=100)
+
+        assert [d["dag_id"] for d in result["dags"]] == [f"dag_{i}" for i in range(120)]
+        assert [offset for _, offset, _ in calls] == [0, 50, 100]
+
+    def test_fetch_all_small_limit_is_single_small_request(self):
+        """Test a limit below the page size is fetched with one request of that size."""
+        adapter = AirflowV2Adapter("http://localhost:8080", "2.9.0")
+        list_dags, calls = _paged_dags(2000)
+
+        result = adapter.fetch_all(list_dags, "dags", max_items=5, offset=10)
+
+        assert [d["dag_id"] for d in result["dags"]] == [f"dag_{i}" for i in range(10, 15)]
+        assert calls == [(5, 10, {})]
+
+    def test_iter_items_stops_early(self):
+        """Test iterating lazily only fetches the pages that are consumed."""
+        adapter = AirflowV2Adapter("http://localhost:8080", "2.9.0")
+        list_dags, calls = _paged_dags(1000)
+
+        for item in adapter.iter_items(list_dags, "dags"):
+            if item["dag_id"] == "dag_150":
+                break
+
+        assert len(calls) == 2
+
+    def test_fetch_all_returns_unavailable_response_as_is(self):
+        """Test responses without the list key are passed through."""
+        adapter = AirflowV2Adapter("http://localhost:8080", "2.9.0")
+        unavailable = {"available": False, "note": "not available"}
+
+        def list_assets(limit=100, offset=0):
+            return unavailable
+
+        assert adapter.fetch_all(list_assets, "assets") is unavailable
+
+    @pytest.mark.anyio
+    async def test_async_fetch_all_with_max_items(self):
+        """Test async fetch_all fetches remaining pages concurrently and caps items."""
+        adapter = AsyncAirflowV3Adapter("http://localhost:8080", "3.0.0")
+        list_dags_sync, calls = _paged_dags(2400)
+
+        async def list_dags(**kwargs):
+            return list_dags_sync(**kwargs)
+
+        result = await adapter.fetch_all(list_dags, "dags", max_items=950, max_concurrency=4)
+
+        assert len(result["dags"]) == 950
+        assert result["total_entries"] == 2400
+        assert [offset for _, offset, _ in calls] == [i * 100 for i in range(10)]
+
+    @pytest.mark.anyio
+    async def test_async_iter_pages_in_order(self):
+        """Test async iter_pages yields pages in offset order."""
+        adapter = AsyncAirflowV3Adapter("http://localhost:8080", "3.0.0")
+        list_dags_sync, _ = _paged_dags(330)
+
+        async def list_dags(**kwargs):
+            # Later pages finish first to check ordering is preserved
+            await asyncio.sleep(0.001 * (1000 - kwargs["offset"]) / 100)
+            return list_dags_sync(**kwargs)
+
+        pages = [page async for page in adapter.iter_pages(list_dags, "dags")]
+
+        assert [len(page) for page in pages] == [100, 100, 100, 30]
+        assert pages[3][0]["dag_id"] == "dag_300"
+
+
 class TestFeatureDetection:
     """Tests for runtime feature detection."""
 
@@ -0,0 +1,162 @@
+"""Tests for the adapter response cache."""
+
+import pytest
+
+from astro_airflow_mcp.adapters import AirflowV2Adapter, AsyncAirflowV3Adapter, ResponseCache
+
+
+@pytest.fixture
+def clock(mocker):
+    """Controllable monotonic clock for TTL tests."""
+    now = [1000.0]
+    mocker.patch("astro_airflow_mcp.adapters.cache.time.monotonic", side_effect=lambda: now[0])
+    return now
+
+
+def _response(mocker, data, status_code=200, etag=None):
+    response = mocker.Mock(status_code=status_code)
+    response.json.return_value = data
+    response.headers = {"ETag": etag} if etag else {}
+    return response
+
+
+class TestResponseCache:
+    """Tests for ResponseCache."""
+
+    def test_ttl_uses_most_specific_resource(self):
+        """Test TTL rules match the right-most known resource in the path."""
+        cache = ResponseCache()
+        assert cache.ttl_for("version") == 3600.0
+        assert cache.ttl_for("dags/example_dag") == 60.0
+        assert cache.ttl_for("dags/example_dag/dagRuns/run_1") == 2.0
+        assert cache.ttl_for("dags/d/dagRuns/r/taskInstances/t/logs/1") == 0.0
+        assert cache.ttl_for("unknownEndpoint") == cache.default_ttl
+
+    def test_hit_and_expiry(self, clock):
+        """Test entries are served until their TTL expires."""
+        cache = ResponseCache()
+        key = cache.make_key("dags/example_dag", {}, "id")
+        cache.put(key, {"dag_id": "example_dag"})
+
+        assert cache.get(key) == ({"dag_id": "example_dag"}, None)
+        clock[0] += 61
+        assert cache.get(key) == (None, None)
+        assert cache.stats()["hits"] == 1
+        assert cache.stats()["misses"] == 1
+
+    def test_returned_data_is_a_copy(self):
+        """Test callers cannot mutate cached data."""
+        cache = ResponseCache()
+        key = cache.make_key("connections", {}, "id")
+        cache.put(key, {"connections": [{"password": "secret"}]})
+
+        data, _ = cache.get(key)
+        data["connections"][0]["password"] = "***"
+
+        assert cache.get(key)[0]["connections"][0]["password"] == "secret"
+
+    def test_uncacheable_endpoint(self):
+        """Test endpoints with a zero TTL are never stored."""
+        cache = ResponseCache()
+        key = cache.make_key("dags/d/dagRuns/r/taskInstances/t/logs/1", {}, "id")
+        cache.put(key, {"content": "log"})
+
+        assert cache.stats()["size"] == 0
+
+    def test_lru_eviction(self):
+        """Test the least recently used entry is evicted beyond max_entries."""
+        cache = ResponseCache(max_entries=2)
+        keys = [cache.make_key(f"dags/dag_{i}", {}, "id") for i in range(3)]
+        cache.put(keys[0], {"i": 0})
+        cache.put(keys[1], {"i": 1})
+        cache.get(keys[0])
+        cache.put(keys[2], {"i": 2})
+
+        assert cache.get(keys[1]) == (None, None)
+        assert cache.get(keys[0])[0] == {"i": 0}
+        assert cache.stats()["evictions"] == 1
+
+    def test_key_includes_params_and_identity(self):
+        """Test params (order-insensitive) and auth identity are part of the key."""
+        cache = ResponseCache()
+        assert cache.make_key("dags", {"limit": 1, "tags": ["a"]}, "x") == cache.make_key(
+            "dags", {"tags": ["a"], "limit": 1}, "x"
+        )
+        assert cache.make_key("dags", {}, "x") != cache.make_key("dags", {}, "y")
+
+    def test_invalidate_dag(self):
+        """Test invalidation drops the DAG, the DAG list and cross-DAG listings only."""
+        cache = ResponseCache()
+        for endpoint in ["dags", "dags/a", "dags/a/tasks", "dags/~/dagRuns", "dags/b", "version"]:
+            cache.put(cache.make_key(endpoint, {}, "id"), {})
+
+        cache.invalidate_dag("a")
+
+        remaining = {key[0] for key in cache._entries}
+        assert remaining == {"dags/b", "version"}
+        assert cache.stats()["invalidations"] == 4
+
+
+class TestAdapterCaching:
+    """Tests for caching in the adapters' GET path."""
+
+    def test_second_call_served_from_cache(self, mocker):
+        """Test a repeated GET does not hit Airflow again."""
+        adapter = AirflowV2Adapter("http://localhost:8080", "2.9.0", cache=ResponseCache())
+        mock_client = mocker.Mock(is_closed=False)
+        mock_client.get.return_value = _response(mocker, {"version": "2.9.0"})
+        mocker.patch("httpx.Client", return_value=mock_client)
+
+        assert adapter.get_version() == {"version": "2.9.0"}
+        assert adapter.get_version() == {"version": "2.9.0"}
+
+        assert mock_client.get.call_count == 1
+
+    def test_etag_revalidation(self, mocker, clock):
+        """Test stale entries are revalidated with If-None-Match and 304 reuses the body."""
+        adapter = AirflowV2Adapter("http://localhost:8080", "2.9.0", cache=ResponseCache())
+        mock_client = mocker.Mock(is_closed=False)
+        mock_client.get.side_effect = [
+            _response(mocker, {"dag_id": "d"}, etag='"v1"'),
+            _response(mocker, None, status_code=304),
+        ]
+        mocker.patch("httpx.Client", return_value=mock_client)
+
+        adapter.get_dag("d")
+        clock[0] += 61
+        result = adapter.get_dag("d")
+
+        assert result == {"dag_id": "d"}
+        assert mock_client.get.call_args[1]["headers"]["If-None-Match"] == '"v1"'
+        assert adapter.cache.stats()["revalidations"] == 1
+
+    def test_pause_invalidates_dag(self, mocker):
+        """Test pausing a DAG drops its cached details."""
+        adapter = AirflowV2Adapter("http://localhost:8080", "2.9.0", cache=ResponseCache())
+        mock_client = mocker.Mock(is_closed=False)
+        mock_client.get.side_effect = [
+            _response(mocker, {"dag_id": "d", "is_paused": False}),
+            _response(mocker, {"dag_id": "d", "is_paused": True}),
+        ]
+        mock_client.patch.return_value = _response(mocker, {"dag_id": "d", "is_paused": True})
+        mocker.patch("httpx.Client", return_value=mock_client)
+
+        adapter.get_dag("d")
+        adapter.pause_dag("d")
+
+        assert adapter.get_dag("d")["is_paused"] is True
+        assert mock_client.get.call_count == 2
+
+    @pytest.mark.anyio
+    async def test_async_adapter_uses_cache(self, mocker):
+        """Test the async adapter serves repeated GETs from the cache."""
+        adapter = AsyncAirflowV3Adapter("http://localhost:8080", "3.0.0", cache=ResponseCache())
+        mock_client = mocker.AsyncMock(is_closed=False)
+        mock_client.get.return_value = _response(mocker, {"providers": []})
+        mocker.patch("httpx.AsyncClient", return_value=mock_client)
+
+        await adapter.list_providers()
+        await adapter.list_providers()
+
+        assert mock_client.get.await_count == 1
+        assert adapter.cache.stats()["hits"] == 1
@@ -1,7 +1,11 @@
 """Tests for consolidated MCP tools."""
 
+import asyncio
 import json
-from unittest.mock import MagicMock
+from unittest.mock import AsyncMock
+
+import httpx
+import pytest
 
 
 # Helper to get the underlying function from a decorated MCP tool
@@ -14,10 +18,22 @@ def get_tool_fn(module, tool_name):
     return tool
 
 
+def _paging_adapter():
+    """Build a mock adapter whose fetch_all returns its fetch function's single page."""
+    adapter = AsyncMock()
+
+    async def fetch_all(fetch, key, **kwargs):
+        return await fetch(**kwargs)
+
+    adapter.fetch_all.side_effect = fetch_all
+    return adapter
+
+
 class TestExploreDag:
     """Tests for explore_dag consolidated tool."""
 
-    def test_explore_dag_success(self, mocker):
+    @pytest.mark.anyio
+    async def test_explore_dag_success(self, mocker):
         """Test explore_dag returns combined data."""
         import astro_airflow_mcp.server as server_module
 
@@ -26,7 +42,7 @@ class TestExploreDag:
         mock_source = {"content": "print('hello')"}
 
         # Create mock adapter
-        mock_adapter = MagicMock()
+        mock_adapter = AsyncMock()
         mock_adapter.get_dag.return_value = mock_dag
         mock_adapter.list_tasks.return_value = mock_tasks
         mock_adapter.get_dag_source.return_value = mock_source
@@ -34,7 +50,7 @@ class TestExploreDag:
         mocker.patch("astro_airflow_mcp.server._get_adapter", return_value=mock_adapter)
 
         explore_dag_fn = get_tool_fn(server_module, "explore_dag")
-        result = explore_dag_fn("example_dag")
+        result = await explore_dag_fn("example_dag")
         data = json.loads(result)
 
         assert data["dag_id"] == "example_dag"
@@ -42,14 +58,15 @@ class TestExploreDag:
         assert len(data["tasks"]) == 2
         assert data["source"]["content"] == "print('hello')"
 
-    def test_explore_dag_partial_failure(self, mocker):
+    @pytest.mark.anyio
+    async def test_explore_dag_partial_failure(self, mocker):
         """Test explore_dag handles partial API failures."""
         import astro_airflow_mcp.server as server_module
 
         mock_dag = {"dag_id": "example_dag"}
 
         # Create mock adapter with partial failures
-        mock_adapter = MagicMock()
+        mock_adapter = AsyncMock()
         mock_adapter.get_dag.return_value = mock_dag
         mock_adapter.list_tasks.side_effect = Exception("Tasks endpoint failed")
         mock_adapter.get_dag_source.side_effect = Exception("Source endpoint failed")
@@ -57,7 +74,7 @@ class TestExploreDag:
         mocker.patch("astro_airflow_mcp.server._get_adapter", return_value=mock_adapter)
 
         explore_dag_fn = get_tool_fn(server_module, "explore_dag")
-        result = explore_dag_fn("example_dag")
+        result = await explore_dag_fn("example_dag")
         data = json.loads(result)
 
         # Should still have DAG info even if tasks/source failed
@@ -69,7 +86,8 @@ class TestExploreDag:
 class TestDiagnoseDagRun:
     """Tests for diagnose_dag_run consolidated tool."""
 
-    def test_diagnose_dag_run_success(self, mocker):
+    @pytest.mark.anyio
+    async def test_diagnose_dag_run_success(self, mocker):
         """Test diagnose_dag_run returns run and task info."""
         import astro_airflow_mcp.server as server_module
 
@@ -86,14 +104,14 @@ class TestDiagnoseDagRun:
         }
 
         # Create mock adapter
-        mock_adapter = MagicMock()
+        mock_adapter = AsyncMock()
         mock_adapter.get_dag_run.return_value = mock_run
-        mock_adapter.get_task_instances.return_value = mock_task_instances
+        mock_adapter.fetch_all.return_value = mock_task_instances
 
         mocker.patch("astro_airflow_mcp.server._get_adapter", return_value=mock_adapter)
 
         diagnose_fn = get_tool_fn(server_module, "diagnose_dag_run")
-        result = diagnose_fn("example_dag", "manual__2024-01-01")
+        result = await diagnose_fn("example_dag", "manual__2024-01-01")
         data = json.loads(result)
 
         assert data["dag_id"] == "example_dag"
@@ -106,19 +124,97 @@ class TestDiagnoseDagRun:
         assert data["summary"]["state_counts"]["failed"] == 1
         assert data["summary"]["state_counts"]["upstream_failed"] == 1
         assert len(data["summary"]["failed_tasks"]) == 2
+        mock_adapter.fetch_all.assert_awaited_once_with(
+            mock_adapter.get_task_instances,
+            "task_instances",
+            dag_id="example_dag",
+            dag_run_id="manual__2024-01-01",
+        )
+
+    @pytest.mark.anyio
+    async def test_diagnose_dag_run_attaches_log_digests(self, mocker):
+        """Test failed task logs are read concurrently and attached as digests."""
+        import astro_airflow_mcp.server as server_module
 
-    def test_diagnose_dag_run_not_found(self, mocker):
+        started = "2024-01-01T00:00:00Z"
+        mock_adapter = AsyncMock()
+        mock_adapter.get_dag_run.return_value = {"state": "failed"}
+        mock_adapter.fetch_all.return_value = {
+            "task_instances": [
+                {"task_id": "extract", "state": "failed", "try_number": 2, "start_date": started},
+                {"task_id": "load", "state": "failed", "try_number": 1, "start_date": started},
+                {"task_id": "report", "state": "upstream_failed"},
+            ]
+        }
+        logs = {
+            "extract": ["Traceback (most recent call last):", '  File "a.py"', "ValueError: x"],
+            "load": ["ERROR - Connection refused"],
+        }
+        requested = []
+        in_flight = 0
+        max_in_flight = 0
+
+        async def stream(dag_id, dag_run_id, task_id, try_number, map_index):
+            nonlocal in_flight, max_in_flight
+            requested.append((task_id, try_number, map_index))
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            for line in logs[task_id]:
+                yield line
+
+        mock_adapter.stream_task_logs = stream
+        mocker.patch("astro_airflow_mcp.server._get_adapter", return_value=mock_adapter)
+
+        diagnose_fn = get_tool_fn(server_module, "diagnose_dag_run")
+        data = json.loads(await diagnose_fn("example_dag", "run_1", include_logs=True))
+
+        failed = {t["task_id"]: t for t in data["summary"]["failed_tasks"]}
+        assert failed["extract"]["log"]["tracebacks"][0]["exception"] == "ValueError: x"
+        assert failed["load"]["log"]["error_lines"][0]["line"] == "ERROR - Connection refused"
+        assert "log" not in failed["report"]
+        assert sorted(requested) == [("extract", 2, -1), ("load", 1, -1)]
+        assert max_in_flight == 2
+
+    @pytest.mark.anyio
+    async def test_diagnose_dag_run_log_errors_are_per_task(self, mocker):
+        """Test a failing log read is reported on its task without failing the tool."""
+        import astro_airflow_mcp.server as server_module
+
+        mock_adapter = AsyncMock()
+        mock_adapter.get_dag_run.return_value = {"state": "failed"}
+        mock_adapter.fetch_all.return_value = {
+            "task_instances": [{"task_id": "t", "state": "failed", "start_date": "2024"}]
+        }
+
+        async def stream(*args):
+            raise Exception("Endpoint not found")
+            yield
+
+        mock_adapter.stream_task_logs = stream
+        mocker.patch("astro_airflow_mcp.server._get_adapter", return_value=mock_adapter)
+
+        diagnose_fn = get_tool_fn(server_module, "diagnose_dag_run")
+        data = json.loads(
+            await diagnose_fn("example_dag", "run_1", include_logs=True, log_mode="tail")
+        )
+
+        assert data["summary"]["failed_tasks"][0]["log"] == {"error": "Endpoint not found"}
+
+    @pytest.mark.anyio
+    async def test_diagnose_dag_run_not_found(self, mocker):
         """Test diagnose_dag_run handles missing run."""
         import astro_airflow_mcp.server as server_module
 
         # Create mock adapter that raises exception
-        mock_adapter = MagicMock()
+        mock_adapter = AsyncMock()
         mock_adapter.get_dag_run.side_effect = Exception("Run not found")
 
         mocker.patch("astro_airflow_mcp.server._get_adapter", return_value=mock_adapter)
 
         diagnose_fn = get_tool_fn(server_module, "diagnose_dag_run")
-        result = diagnose_fn("example_dag", "nonexistent")
+        result = await diagnose_fn("example_dag", "nonexistent")
         data = json.loads(result)
 
         assert "error" in data["run_info"]
@@ -127,7 +223,8 @@ class TestDiagnoseDagRun:
 class TestGetSystemHealth:
     """Tests for get_system_health consolidated tool."""
 
-    def test_get_system_health_healthy(self, mocker):
+    @pytest.mark.anyio
+    async def test_get_system_health_healthy(self, mocker):
         """Test get_system_health when system is healthy."""
         import astro_airflow_mcp.server as server_module
 
@@ -137,7 +234,7 @@ class TestGetSystemHealth:
         mock_stats = {"dags": []}
 
         # Create mock adapter
-        mock_adapter = MagicMock()
+        mock_adapter = _paging_adapter()
         mock_adapter.get_version.return_value = mock_version
         mock_adapter.list_import_errors.return_value = mock_import_errors
         mock_adapter.list_dag_warnings.return_value = mock_warnings
@@ -146,7 +243,7 @@ class TestGetSystemHealth:
         mocker.patch("astro_airflow_mcp.server._get_adapter", return_value=mock_adapter)
 
         health_fn = get_tool_fn(server_module, "get_system_health")
-        result = health_fn()
+        result = await health_fn()
         data = json.loads(result)
 
         assert data["version"]["version"] == "3.0.0"
@@ -154,7 +251,8 @@ class TestGetSystemHealth:
         assert data["dag_warnings"]["count"] == 0
         assert data["overall_status"] == "healthy"
 
-    def test_get_system_health_with_import_errors(self, mocker):
+    @pytest.mark.anyio
+    async def test_get_system_health_with_import_errors(self, mocker):
         """Test get_system_health detects import errors."""
         import astro_airflow_mcp.server as server_module
 
@@ -166,7 +264,7 @@ class TestGetSystemHealth:
         mock_stats = {"dags": []}
 
         # Create mock adapter
-        mock_adapter = MagicMock()
+        mock_adapter = _paging_adapter()
         mock_adapter.get_version.return_value = mock_version
         mock_adapter.list_import_errors.return_value = mock_import_errors
         mock_adapter.list_dag_warnings.return_value = mock_warnings
@@ -175,14 +273,15 @@ class TestGetSystemHealth:
         mocker.patch("astro_airflow_mcp.server._get_adapter", return_value=mock_adapter)
 
         health_fn = get_tool_fn(server_module, "get_system_health")
-        result = health_fn()
+        result = await health_fn()
         data = json.loads(result)
 
         assert data["import_errors"]["count"] == 1
         assert data["overall_status"] == "unhealthy"
         assert "import error" in data["status_reason"]
 
-    def test_get_system_health_with_warnings(self, mocker):
+    @pytest.mark.anyio
+    async def test_get_system_health_with_warnings(self, mocker):
         """Test get_system_health detects warnings."""
         import astro_airflow_mcp.server as server_module
 
@@ -194,7 +293,7 @@ class TestGetSystemHealth:
         mock_stats = {"dags": []}
 
         # Create mock adapter
-        mock_adapter = MagicMock()
+        mock_adapter = _paging_adapter()
         mock_adapter.get_version.return_value = mock_version
         mock_adapter.list_import_errors.return_value = mock_import_errors
         mock_adapter.list_dag_warnings.return_value = mock_warnings
@@ -203,13 +302,14 @@ class TestGetSystemHealth:
         mocker.patch("astro_airflow_mcp.server._get_adapter", return_value=mock_adapter)
 
         health_fn = get_tool_fn(server_module, "get_system_health")
-        result = health_fn()
+        result = await health_fn()
         data = json.loads(result)
 
         assert data["dag_warnings"]["count"] == 1
         assert data["overall_status"] == "warning"
 
-    def test_get_system_health_dag_stats_unavailable(self, mocker):
+    @pytest.mark.anyio
+    async def test_get_system_health_dag_stats_unavailable(self, mocker):
         """Test get_system_health handles missing dagStats (Airflow 2.x)."""
         import astro_airflow_mcp.server as server_module
 
@@ -218,7 +318,7 @@ class TestGetSystemHealth:
         mock_warnings = {"dag_warnings": []}
 
         # Create mock adapter where dag_stats raises exception
-        mock_adapter = MagicMock()
+        mock_adapter = _paging_adapter()
         mock_adapter.get_version.return_value = mock_version
         mock_adapter.list_import_errors.return_value = mock_import_errors
         mock_adapter.list_dag_warnings.return_value = mock_warnings
@@ -227,9 +327,106 @@ class TestGetSystemHealth:
         mocker.patch("astro_airflow_mcp.server._get_adapter", return_value=mock_adapter)
 
         health_fn = get_tool_fn(server_module, "get_system_health")
-        result = health_fn()
+        result = await health_fn()
         data = json.loads(result)
 
         assert data["dag_stats"]["available"] is False
         # Should still report overall health
         assert data["overall_status"] == "healthy"
+
+    @pytest.mark.anyio
+    async def test_get_system_health_counts_every_page(self, mocker):
+        """Test import errors beyond the first page are fetched and counted."""
+        import astro_airflow_mcp.server as server_module
+        from astro_airflow_mcp.adapters import AsyncAirflowV3Adapter
+
+        errors = [{"filename": f"/dags/broken_{i}.py"} for i in range(150)]
+
+        def handler(request):
+            path = request.url.path
+            if path.endswith("/importErrors"):
+                offset = int(request.url.params["offset"])
+                limit = int(request.url.params["limit"])
+                page = errors[offset : offset + limit]
+                return httpx.Response(200, json={"import_errors": page, "total_entries": 150})
+            if path.endswith("/dagWarnings"):
+                return httpx.Response(200, json={"dag_warnings": [], "total_entries": 0})
+            if path.endswith("/version"):
+                return httpx.Response(200, json={"version": "3.0.0"})
+            return httpx.Response(200, json={"dags": []})
+
+        client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        mocker.patch("httpx.AsyncClient", return_value=client)
+        adapter = AsyncAirflowV3Adapter("http://airflow", "3.0.0")
+        mocker.patch("astro_airflow_mcp.server._get_adapter", return_value=adapter)
+
+        health_fn = get_tool_fn(server_module, "get_system_health")
+        data = json.loads(await health_fn())
+
+        assert data["import_errors"]["count"] == 150
+        assert len(data["import_errors"]["errors"]) == 150
+        assert data["status_reason"] == "150 import error(s) detected"
+
+
+class TestConcurrentFanOut:
+    """Tests for concurrent sub-requests in consolidated tools."""
+
+    @pytest.mark.anyio
+    async def test_get_system_health_runs_checks_concurrently(self, mocker):
+        """Test get_system_health issues its sub-requests concurrently."""
+        import astro_airflow_mcp.server as server_module
+
+        started = asyncio.Event()
+        in_flight = 0
+        max_in_flight = 0
+
+        def slow_response(payload):
+            async def respond(*args, **kwargs):
+                nonlocal in_flight, max_in_flight
+                in_flight += 1
+                max_in_flight = max(max_in_flight, in_flight)
+                if max_in_flight == 4:
+                    started.set()
+                # Only completes once all four sub-requests are in flight together
+                await asyncio.wait_for(started.wait(), timeout=1)
+                in_flight -= 1
+                return payload
+
+            return respond
+
+        mock_adapter = _paging_adapter()
+        mock_adapter.get_version.side_effect = slow_response({"version": "3.0.0"})
+        mock_adapter.list_import_errors.side_effect = slow_response({"import_errors": []})
+        mock_adapter.list_dag_warnings.side_effect = slow_response({"dag_warnings": []})
+        mock_adapter.get_dag_stats.side_effect = slow_response({"dags": []})
+
+        mocker.patch("astro_airflow_mcp.server._get_adapter", return_value=mock_adapter)
+
+        health_fn = get_tool_fn(server_module, "get_system_health")
+        data = json.loads(await health_fn())
+
+        assert max_in_flight == 4
+        assert data["overall_status"] == "healthy"
+
+    @pytest.mark.anyio
+    async def test_explore_dag_sub_request_timeout(self, mocker):
+        """Test a slow sub-request times out without losing the other results."""
+        import astro_airflow_mcp.server as server_module
+
+        async def hang(dag_id):
+            await asyncio.sleep(10)
+
+        mock_adapter = AsyncMock()
+        mock_adapter.get_dag.return_value = {"dag_id": "example_dag"}
+        mock_adapter.list_tasks.return_value = {"tasks": [{"task_id": "task1"}]}
+        mock_adapter.get_dag_source.side_effect = hang
+
+        mocker.patch("astro_airflow_mcp.server._get_adapter", return_value=mock_adapter)
+        mocker.patch.object(server_module, "SUBREQUEST_TIMEOUT_SECONDS", 0.05)
+
+        explore_dag_fn = get_tool_fn(server_module, "explore_dag")
+        data = json.loads(await explore_dag_fn("example_dag"))
+
+        assert data["dag_info"]["dag_id"] == "example_dag"
+        assert len(data["tasks"]) == 1
+        assert "timed out" in data["source"]["error"]
@@ -0,0 +1,162 @@
+"""Tests for the local DAG metadata index."""
+
+import asyncio
+from unittest.mock import AsyncMock
+
+import pytest
+
+from astro_airflow_mcp.dag_index import DagIndex
+
+TASKS = {
+    # Airflow 3 reports operator_name, Airflow 2 only class_ref
+    "etl_customers": [
+        {"task_id": "extract_customers", "operator_name": "KubernetesPodOperator"},
+        {"task_id": "load_customers", "operator_name": "PythonOperator"},
+    ],
+    "finance_report": [
+        {"task_id": "build_report", "class_ref": {"class_name": "BashOperator"}},
+    ],
+}
+
+
+def _dag(dag_id, parsed, **kwargs):
+    return {"dag_id": dag_id, "last_parsed_time": parsed, "is_paused": False, **kwargs}
+
+
+def _raise(error):
+    raise error
+
+
+def _index(dags):
+    adapter = AsyncMock()
+    adapter.fetch_all.side_effect = lambda *_args, **_kwargs: {"dags": list(dags)}
+    adapter.list_tasks.side_effect = lambda dag_id: {"tasks": TASKS.get(dag_id, [])}
+
+    async def get_adapter():
+        return adapter
+
+    return DagIndex(get_adapter), adapter
+
+
+DAGS = [
+    _dag(
+        "etl_customers",
+        "2024-01-01T00:00:00Z",
+        owners=["data-team"],
+        tags=[{"name": "etl"}],
+        description="Load customer data",
+    ),
+    _dag("finance_report", "2024-01-01T00:00:00Z", owners=["finance"], tags=["reporting"]),
+]
+
+
+class TestDagIndex:
+    """Tests for crawling and searching DAG metadata."""
+
+    @pytest.mark.anyio
+    async def test_search_by_operator_owner_and_tag(self):
+        """Test filters and free text find DAGs by task and DAG metadata."""
+        index, _ = _index(DAGS)
+        await index.refresh()
+
+        by_operator = index.search(operator="KubernetesPodOperator")
+        assert [d["dag_id"] for d in by_operator["dags"]] == ["etl_customers"]
+        assert by_operator["dags"][0]["matching_tasks"] == [
+            {"task_id": "extract_customers", "operator": "KubernetesPodOperator"}
+        ]
+        assert [d["dag_id"] for d in index.search(operator="bash")["dags"]] == ["finance_report"]
+        assert [d["dag_id"] for d in index.search(owner="data-team")["dags"]] == ["etl_customers"]
+        assert [d["dag_id"] for d in index.search(tag="report")["dags"]] == ["finance_report"]
+        assert index.search("customer load")["total_matches"] == 1
+        assert index.search("customer", tag="reporting")["total_matches"] == 0
+        assert index.search()["total_matches"] == 2
+
+    @pytest.mark.anyio
+    async def test_refresh_only_reads_reparsed_dags(self):
+        """Test tasks are re-fetched only for new or re-parsed DAGs."""
+        dags = list(DAGS)
+        index, adapter = _index(dags)
+        await index.refresh()
+        assert adapter.list_tasks.await_count == 2
+
+        dags[1] = _dag("finance_report", "2024-01-02T00:00:00Z", owners=["treasury"])
+        dags.append(_dag("new_dag", "2024-01-02T00:00:00Z"))
+        adapter.list_tasks.reset_mock()
+        counts = await index.refresh()
+
+        assert counts == {"updated": 2, "unchanged": 1, "removed": 0}
+        assert sorted(c.args[0] for c in adapter.list_tasks.await_args_list) == [
+            "finance_report",
+            "new_dag",
+        ]
+        assert index.search(owner="finance")["total_matches"] == 0
+        assert index.search(owner="treasury")["total_matches"] == 1
+
+    @pytest.mark.anyio
+    async def test_removed_dags_leave_the_index(self):
+        """Test DAGs missing from list_dags are dropped with their terms."""
+        dags = list(DAGS)
+        index, _ = _index(dags)
+        await index.refresh()
+
+        del dags[0]
+        counts = await index.refresh()
+
+        assert counts["removed"] == 1
+        assert index.search("kubernetes")["total_matches"] == 0
+        assert len(index) == 1
+
+    @pytest.mark.anyio
+    async def test_ensure_ready_starts_background_refresh(self):
+        """Test first use crawls once and leaves a background refresher running."""
+        index, adapter = _index(DAGS)
+
+        await index.ensure_ready()
+        await index.ensure_ready()
+
+        assert adapter.fetch_all.await_count == 1
+        assert index.status()["indexed_tasks"] == 3
+        await index.close()
+
+    @pytest.mark.anyio
+    async def test_failed_task_listing_retried_next_refresh(self):
+        """Test a DAG whose tasks could not be listed is crawled again on the next refresh."""
+        index, adapter = _index(DAGS)
+        adapter.list_tasks.side_effect = lambda dag_id: (
+            _raise(Exception("503 Service Unavailable"))
+            if dag_id == "etl_customers"
+            else {"tasks": TASKS[dag_id]}
+        )
+        await index.refresh()
+
+        assert index.search(owner="data-team")["total_matches"] == 1
+        assert index.search(operator="kubernetes")["total_matches"] == 0
+
+        adapter.list_tasks.side_effect = lambda dag_id: {"tasks": TASKS[dag_id]}
+        adapter.list_tasks.reset_mock()
+        counts = await index.refresh()
+
+        assert counts["updated"] == 1
+        adapter.list_tasks.assert_awaited_once_with("etl_customers")
+        assert index.search(operator="kubernetes")["total_matches"] == 1
+
+    @pytest.mark.anyio
+    async def test_clear_discards_crawl_in_flight(self):
+        """Test a crawl of the previous Airflow does not refill a cleared index."""
+        index, adapter = _index(DAGS)
+        release = asyncio.Event()
+
+        async def list_tasks(dag_id):
+            await release.wait()
+            return {"tasks": TASKS[dag_id]}
+
+        adapter.list_tasks.side_effect = list_tasks
+        crawl = asyncio.ensure_future(index.refresh())
+        await asyncio.sleep(0)
+
+        index.clear()
+        release.set()
+        await crawl
+
+        assert len(index) == 0
+        assert index.status()["seconds_since_refresh"] is None
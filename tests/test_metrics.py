@@ -0,0 +1,123 @@
+"""Tests for Prometheus metrics."""
+
+import httpx
+import pytest
+from fastmcp import Client, FastMCP
+
+from astro_airflow_mcp import metrics
+from astro_airflow_mcp.adapters import ResponseCache
+from astro_airflow_mcp.adapters.airflow_v3 import AsyncAirflowV3Adapter
+from astro_airflow_mcp.metrics import MetricsMiddleware, endpoint_template, metrics_endpoint
+
+pytestmark = pytest.mark.skipif(
+    not metrics.METRICS_AVAILABLE, reason="prometheus_client not installed"
+)
+
+
+def _sample(name, **labels):
+    return metrics._metrics.registry.get_sample_value(name, labels) or 0.0
+
+
+class TestEndpointTemplate:
+    """Tests for low-cardinality endpoint labels."""
+
+    @pytest.mark.parametrize(
+        ("endpoint", "template"),
+        [
+            ("dags", "dags"),
+            ("dags/etl/dagRuns/manual__2024", "dags/{id}/dagRuns/{id}"),
+            (
+                "dags/etl/dagRuns/r1/taskInstances/load/logs/2",
+                "dags/{id}/dagRuns/{id}/taskInstances/{id}/logs/{id}",
+            ),
+            ("dags/~/dagRuns/list", "dags/~/dagRuns/list"),
+            ("dags/etl/details", "dags/{id}/details"),
+        ],
+    )
+    def test_ids_are_replaced(self, endpoint, template):
+        """Test ids are replaced while collections and literals are kept."""
+        assert endpoint_template(endpoint) == template
+
+
+class TestRecording:
+    """Tests for the recording paths."""
+
+    @pytest.mark.anyio
+    async def test_adapter_requests_and_cache_lookups(self, mocker):
+        """Test upstream requests are timed per endpoint template and status."""
+
+        def handler(request):
+            if request.url.path.endswith("/missing"):
+                return httpx.Response(404, json={})
+            return httpx.Response(200, json={"dag_id": "etl"}, headers={"ETag": '"1"'})
+
+        client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        mocker.patch("httpx.AsyncClient", return_value=client)
+        adapter = AsyncAirflowV3Adapter("http://airflow", "3.0.0", cache=ResponseCache())
+        labels = {"method": "GET", "endpoint": "dags/{id}", "status": "200"}
+        before = _sample("airflow_mcp_upstream_request_duration_seconds_count", **labels)
+        hits = _sample("airflow_mcp_response_cache_requests_total", result="hit")
+        misses = _sample("airflow_mcp_response_cache_requests_total", result="miss")
+
+        await adapter._call("dags/etl")
+        await adapter._call("dags/etl")
+        with pytest.raises(Exception, match="not found"):
+            await adapter._call("dags/missing")
+
+        after = _sample("airflow_mcp_upstream_request_duration_seconds_count", **labels)
+        assert after - before == 1
+        assert _sample("airflow_mcp_response_cache_requests_total", result="hit") - hits == 1
+        assert _sample("airflow_mcp_response_cache_requests_total", result="miss") - misses == 2
+        assert _sample(
+            "airflow_mcp_upstream_request_duration_seconds_count",
+            method="GET",
+            endpoint="dags/{id}",
+            status="404",
+        )
+        assert _sample("airflow_mcp_upstream_requests_in_flight") == 0
+
+    @pytest.mark.anyio
+    async def test_cache_miss_counted_when_request_fails(self, mocker):
+        """Test a miss is counted before the request, so failed requests are included."""
+
+        def handler(request):
+            raise httpx.ConnectError("Connection refused")
+
+        client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        mocker.patch("httpx.AsyncClient", return_value=client)
+        adapter = AsyncAirflowV3Adapter("http://airflow", "3.0.0", cache=ResponseCache())
+        misses = _sample("airflow_mcp_response_cache_requests_total", result="miss")
+
+        with pytest.raises(httpx.ConnectError):
+            await adapter._call("dags/etl")
+
+        assert _sample("airflow_mcp_response_cache_requests_total", result="miss") - misses == 1
+
+    @pytest.mark.anyio
+    async def test_tool_calls(self):
+        """Test tool calls are timed by tool name, unknown names share one label."""
+        server = FastMCP("test")
+        server.add_middleware(MetricsMiddleware())
+
+        @server.tool()
+        def echo(text: str) -> str:
+            return text
+
+        before = _sample("airflow_mcp_tool_duration_seconds_count", tool="echo", status="ok")
+        async with Client(server) as client:
+            await client.call_tool("echo", {"text": "hello"})
+            with pytest.raises(Exception, match="Unknown tool"):
+                await client.call_tool("no_such_tool", {})
+
+        after = _sample("airflow_mcp_tool_duration_seconds_count", tool="echo", status="ok")
+        assert after - before == 1
+        assert _sample("airflow_mcp_tool_response_bytes_sum", tool="echo") >= 5
+        assert _sample("airflow_mcp_tool_duration_seconds_count", tool="unknown", status="error")
+
+    @pytest.mark.anyio
+    async def test_metrics_endpoint(self):
+        """Test the endpoint serves the Prometheus text format."""
+        response = await metrics_endpoint(None)
+
+        assert response.status_code == 200
+        assert b"airflow_mcp_tool_duration_seconds" in response.body
@@ -0,0 +1,85 @@
+"""Tests for tool call logging."""
+
+import io
+import logging
+
+import pytest
+from fastmcp import Client, FastMCP
+
+from astro_airflow_mcp import logging as mcp_logging
+from astro_airflow_mcp.metrics import upstream_request
+from astro_airflow_mcp.middleware import ToolTimingMiddleware
+
+
+def _server(middleware):
+    server = FastMCP("test")
+    server.add_middleware(middleware)
+
+    @server.tool()
+    def big(size: int) -> str:
+        for _ in range(2):
+            with upstream_request("get", "dags"):
+                pass
+        return "x" * size
+
+    return server
+
+
+class TestToolTimingMiddleware:
+    """Tests for the sampled, size-capped tool call logging."""
+
+    @pytest.mark.anyio
+    async def test_logs_timing_without_payloads(self, caplog):
+        """Test ordinary calls log one line with counts and no payload."""
+        caplog.set_level(logging.INFO, logger="airflow_mcp.requests")
+
+        async with Client(_server(ToolTimingMiddleware())) as client:
+            await client.call_tool("big", {"size": 5000})
+
+        [record] = caplog.records
+        assert "Tool big completed" in record.getMessage()
+        assert "upstream_requests=2" in record.getMessage()
+        assert "response_bytes=5000" in record.getMessage()
+
+    @pytest.mark.anyio
+    async def test_slow_calls_log_truncated_payloads(self, caplog):
+        """Test payloads of slow calls are logged, cut to the size cap."""
+        caplog.set_level(logging.INFO, logger="airflow_mcp.requests")
+        middleware = ToolTimingMiddleware(slow_call_seconds=0, max_payload_chars=100)
+
+        async with Client(_server(middleware)) as client:
+            await client.call_tool("big", {"size": 5000})
+
+        payload = caplog.records[-1].getMessage()
+        assert "(slow call)" in payload
+        assert 'arguments={"size": 5000}' in payload
+        assert payload.endswith("x" * 100 + "... (truncated)")
+
+    @pytest.mark.anyio
+    async def test_sampled_calls_log_payloads(self, caplog):
+        """Test a sample rate of 1 logs every call's payload."""
+        caplog.set_level(logging.INFO, logger="airflow_mcp.requests")
+
+        async with Client(_server(ToolTimingMiddleware(sample_rate=1.0))) as client:
+            await client.call_tool("big", {"size": 3})
+
+        assert caplog.records[-1].getMessage().endswith("result=xxx")
+
+
+def test_configure_logging_writes_through_queue(mocker):
+    """Test records are handed to a queue and written by the listener thread."""
+    stream = io.StringIO()
+    mocker.patch("sys.stdout", stream)
+    logger = mcp_logging.get_logger()
+    try:
+        mcp_logging.configure_logging(level="INFO")
+        assert isinstance(logger.handlers[0], logging.handlers.QueueHandler)
+
+        mcp_logging.get_logger("test").info("hello")
+        mcp_logging._stop_listener()
+    finally:
+        logger.handlers.clear()
+        logger.propagate = True
+        logger.setLevel(logging.NOTSET)
+
+    assert stream.getvalue() == "INFO: hello\n"
@@ -2,6 +2,8 @@
 
 from datetime import datetime
 
+import pytest
+
 from astro_airflow_mcp.models import (
     APIError,
     AssetInfo,
@@ -129,6 +131,13 @@ class TestTaskInstance:
         assert ti.duration == 10.5
 
 
+@pytest.mark.parametrize("model", [DAGInfo, DAGRun, TaskInfo, TaskInstance])
+def test_summary_fields_are_declared(model):
+    """Test default field projections only name documented model fields."""
+    assert model.summary_fields
+    assert set(model.summary_fields) <= set(model.model_fields)
+
+
 class TestPoolInfo:
     """Tests for PoolInfo model."""
 
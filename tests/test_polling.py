@@ -0,0 +1,257 @@
+"""Tests for the DAG run wait engine."""
+
+import asyncio
+from unittest.mock import AsyncMock
+
+import pytest
+
+from astro_airflow_mcp.polling import (
+    QUEUED_RUN_POLL_TICKS,
+    PollSchedule,
+    RunStatePoller,
+    expected_run_duration,
+    parse_timestamp,
+)
+
+
+class TestPollSchedule:
+    """Tests for adaptive poll intervals."""
+
+    def test_intervals_grow_with_elapsed_time(self):
+        """Test polls start fast and slow down up to the maximum."""
+        schedule = PollSchedule(min_interval=1.0, max_interval=30.0, growth=0.1)
+
+        assert schedule.next_interval(0) == 1.0
+        assert schedule.next_interval(100) == 10.0
+        assert schedule.next_interval(10_000) == 30.0
+
+    def test_expected_duration_spreads_early_polls(self):
+        """Test polls before the typical run duration are spread out."""
+        schedule = PollSchedule(max_interval=60.0, expected_duration=100.0)
+
+        assert schedule.next_interval(0) == 50.0
+        assert schedule.next_interval(90) == 9.0
+        # Past the expected duration the normal growth applies again
+        assert schedule.next_interval(150) == 15.0
+
+
+FAST = PollSchedule(min_interval=0.01, growth=0.0)
+
+
+def _batch_adapter(*ticks):
+    """Build an adapter whose batch endpoint serves one list of runs per tick."""
+    adapter = AsyncMock()
+    responses = iter(ticks)
+
+    async def fetch_all(fetch, key, **kwargs):
+        if key == "task_instances":
+            return await fetch(**kwargs)
+        return {"dag_runs": next(responses), "total_entries": 0}
+
+    adapter.fetch_all.side_effect = fetch_all
+    return adapter
+
+
+def _poller(adapter):
+    async def get_adapter():
+        return adapter
+
+    return RunStatePoller(get_adapter)
+
+
+def _run(dag_id, run_id, state):
+    return {"dag_id": dag_id, "dag_run_id": run_id, "state": state}
+
+
+class TestRunStatePoller:
+    """Tests for the shared batched DAG run poller."""
+
+    @pytest.mark.anyio
+    async def test_many_waiters_share_one_query_per_tick(self):
+        """Test concurrent waits are resolved from the same batched queries."""
+        adapter = _batch_adapter(
+            [_run("a", "r1", "running"), _run("b", "r2", "running")],
+            [_run("a", "r1", "success"), _run("b", "r2", "running")],
+            [_run("b", "r2", "failed")],
+        )
+        poller = _poller(adapter)
+
+        results = await asyncio.gather(
+            poller.wait("a", "r1", timeout=5, schedule=FAST),
+            poller.wait("b", "r2", timeout=5, schedule=FAST),
+            poller.wait("b", "r2", timeout=5, schedule=FAST),
+        )
+
+        assert [r.state for r in results] == ["success", "failed", "failed"]
+        assert adapter.fetch_all.await_count == 3
+        kwargs = adapter.fetch_all.await_args_list[0].kwargs
+        assert kwargs["dag_ids"] == ["a", "b"]
+        assert "start_date_gte" in kwargs
+        adapter.get_dag_run.assert_not_awaited()
+        assert poller.pending == 0
+
+    @pytest.mark.anyio
+    async def test_timeout_returns_last_observed_run(self):
+        """Test a timed out wait reports the last state it saw."""
+        adapter = AsyncMock()
+        adapter.fetch_all.return_value = {"dag_runs": [_run("a", "r1", "running")]}
+        poller = _poller(adapter)
+
+        result = await poller.wait("a", "r1", timeout=0.05, schedule=FAST)
+
+        assert result.timed_out is True
+        assert result.state == "running"
+        assert poller.pending == 0
+        await poller.close()
+
+    @pytest.mark.anyio
+    async def test_falls_back_to_individual_polls(self):
+        """Test runs are fetched one by one if the batch endpoint fails."""
+        adapter = AsyncMock()
+        adapter.fetch_all.side_effect = Exception("404 Not Found")
+        adapter.get_dag_run.return_value = _run("a", "r1", "success")
+        poller = _poller(adapter)
+
+        result = await poller.wait("a", "r1", timeout=5, schedule=FAST)
+
+        assert result.state == "success"
+        adapter.get_dag_run.assert_awaited_with("a", "r1")
+
+    @pytest.mark.anyio
+    async def test_started_runs_missing_from_batch_polled_individually(self):
+        """Test a started run outside the batch's start_date window is still resolved."""
+        adapter = AsyncMock()
+        adapter.fetch_all.return_value = {"dag_runs": []}
+        adapter.get_dag_run.return_value = _run("a", "r1", "success")
+        poller = _poller(adapter)
+
+        result = await poller.wait("a", "r1", timeout=5, schedule=FAST, initial_state="running")
+
+        assert result.state == "success"
+        adapter.get_dag_run.assert_awaited_once_with("a", "r1")
+
+    @pytest.mark.anyio
+    async def test_queued_runs_missing_from_batch_polled_every_few_ticks(self):
+        """Test queued runs absent from the batch are only fetched on their own now and then."""
+        adapter = AsyncMock()
+        adapter.fetch_all.return_value = {"dag_runs": []}
+        adapter.get_dag_run.return_value = _run("a", "r1", "queued")
+        poller = _poller(adapter)
+        waiter = asyncio.ensure_future(
+            poller.wait("a", "r1", timeout=5, schedule=PollSchedule(min_interval=60))
+        )
+        await asyncio.sleep(0)
+
+        for _ in range(2 * QUEUED_RUN_POLL_TICKS):
+            await poller.poll_once()
+
+        assert adapter.get_dag_run.await_count == 2
+        waiter.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+        await poller.close()
+
+    @pytest.mark.anyio
+    async def test_run_failing_while_queued_is_resolved(self):
+        """Test a run that fails without ever getting a start_date still wakes its waiter."""
+        adapter = AsyncMock()
+        adapter.fetch_all.return_value = {"dag_runs": []}
+        adapter.get_dag_run.return_value = {**_run("a", "r1", "failed"), "start_date": None}
+        poller = _poller(adapter)
+
+        result = await poller.wait("a", "r1", timeout=5, schedule=FAST)
+
+        assert result.timed_out is False
+        assert result.state == "failed"
+        assert adapter.get_dag_run.await_count == 1
+
+    @pytest.mark.anyio
+    async def test_reports_progress_with_task_counts(self):
+        """Test progress updates carry the state and batched task counts."""
+        adapter = _batch_adapter([_run("a", "r1", "running")], [_run("a", "r1", "success")])
+        adapter.list_task_instances_batch.return_value = {
+            "task_instances": [
+                {"dag_id": "a", "dag_run_id": "r1", "state": "success"},
+                {"dag_id": "a", "dag_run_id": "r1", "state": "skipped"},
+                {"dag_id": "a", "dag_run_id": "r1", "state": "running"},
+                {"dag_id": "a", "dag_run_id": "r1", "state": None},
+            ]
+        }
+        updates = []
+
+        async def on_progress(update):
+            updates.append(update)
+
+        result = await _poller(adapter).wait(
+            "a", "r1", timeout=5, schedule=FAST, on_progress=on_progress
+        )
+
+        assert result.state == "success"
+        assert len(updates) == 1
+        assert updates[0]["state"] == "running"
+        assert updates[0]["task_counts"] == {
+            "total": 4,
+            "finished": 2,
+            "running": 1,
+            "failed": 0,
+        }
+
+    @pytest.mark.anyio
+    async def test_cancellation_only_affects_cancelled_waiter(self):
+        """Test cancelling one waiter leaves other waiters on the run alone."""
+        adapter = AsyncMock()
+        adapter.fetch_all.return_value = {"dag_runs": []}
+        poller = _poller(adapter)
+        slow = PollSchedule(min_interval=60)
+        cancelled = asyncio.ensure_future(poller.wait("a", "r1", timeout=5, schedule=slow))
+        other = asyncio.ensure_future(poller.wait("a", "r1", timeout=5, schedule=slow))
+        await asyncio.sleep(0)
+
+        cancelled.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await cancelled
+
+        assert poller.pending == 1
+        other.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await other
+        assert poller.pending == 0
+        await poller.close()
+
+
+class TestExpectedRunDuration:
+    """Tests for estimating run duration from history."""
+
+    @pytest.mark.anyio
+    async def test_median_of_recent_successful_runs(self):
+        """Test the median duration of recent successful runs is used."""
+        adapter = AsyncMock()
+        adapter.list_dag_runs.return_value = {
+            "dag_runs": [
+                {"start_date": "2024-01-01T00:00:00Z", "end_date": "2024-01-01T00:01:00Z"},
+                {"start_date": "2024-01-02T00:00:00Z", "end_date": "2024-01-02T00:03:00Z"},
+                {"start_date": "2024-01-03T00:00:00Z", "end_date": "2024-01-03T00:02:00Z"},
+                {"start_date": "2024-01-04T00:00:00Z", "end_date": None},
+            ]
+        }
+
+        assert await expected_run_duration(adapter, "etl") == 120.0
+        adapter.list_dag_runs.assert_awaited_once_with(
+            dag_id="etl", limit=5, state=["success"], order_by="-start_date"
+        )
+
+    @pytest.mark.anyio
+    async def test_no_history(self):
+        """Test missing or unavailable history gives no estimate."""
+        adapter = AsyncMock()
+        adapter.list_dag_runs.side_effect = Exception("403 Forbidden")
+
+        assert await expected_run_duration(adapter, "etl") is None
+
+    def test_parse_timestamp_with_z_suffix(self):
+        """Test a trailing Z is read as UTC, as the API serializes it."""
+        assert parse_timestamp("2024-01-01T00:00:00Z") == parse_timestamp(
+            "2024-01-01T00:00:00+00:00"
+        )
+        assert parse_timestamp("2024-01-01T00:00:00Z").utcoffset().total_seconds() == 0
+        assert parse_timestamp("not a date") is None
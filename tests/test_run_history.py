@@ -0,0 +1,144 @@
+"""Tests for the local run history store and its incremental sync."""
+
+from unittest.mock import AsyncMock
+
+import pytest
+
+from astro_airflow_mcp.run_history import RunHistoryStore, sync_dag, sync_run_history
+
+
+def _run(run_id, state, start, end=None):
+    return {"dag_run_id": run_id, "state": state, "start_date": start, "end_date": end}
+
+
+def _adapter(*responses):
+    """Build an adapter whose list_dag_runs pages serve one list of runs per sync."""
+    adapter = AsyncMock()
+    runs = iter(responses)
+
+    async def fetch_all(fetch, key, **kwargs):
+        if key == "dag_runs":
+            return {"dag_runs": next(runs)}
+        return await fetch(**kwargs)
+
+    adapter.fetch_all.side_effect = fetch_all
+    adapter.list_task_instances_batch.return_value = {"task_instances": []}
+    return adapter
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = RunHistoryStore(tmp_path / "history.db", "http://airflow")
+    yield store
+    store.close()
+
+
+class TestSync:
+    """Tests for watermark-based incremental sync."""
+
+    @pytest.mark.anyio
+    async def test_watermark_stops_at_oldest_unfinished_run(self, store):
+        """Test the next sync starts at the oldest run that was still running."""
+        adapter = _adapter(
+            [
+                _run("r1", "success", "2024-01-01T00:00:00+00:00", "2024-01-01T00:01:00+00:00"),
+                _run("r2", "running", "2024-01-02T00:00:00+00:00"),
+                _run("r3", "failed", "2024-01-03T00:00:00+00:00", "2024-01-03T00:05:00+00:00"),
+            ],
+            [
+                _run("r2", "success", "2024-01-02T00:00:00+00:00", "2024-01-02T00:02:00+00:00"),
+                _run("r3", "failed", "2024-01-03T00:00:00+00:00", "2024-01-03T00:05:00+00:00"),
+            ],
+        )
+
+        await sync_dag(adapter, store, "etl")
+        assert store.watermark("etl") == "2024-01-02T00:00:00+00:00"
+        await sync_dag(adapter, store, "etl")
+
+        second = adapter.fetch_all.await_args_list[-2].kwargs
+        assert second["start_date_gte"] == "2024-01-02T00:00:00+00:00"
+        assert store.watermark("etl") == "2024-01-03T00:00:00+00:00"
+        [stats] = store.run_stats("etl")
+        assert stats["states"] == {"success": 2, "failed": 1}
+        assert stats["failure_rate"] == round(1 / 3, 4)
+        assert stats["duration_seconds"]["max"] == 300.0
+
+    @pytest.mark.anyio
+    async def test_task_instances_fetched_once_per_finished_run(self, store):
+        """Test task instances are only fetched for runs that newly finished."""
+        finished = _run("r1", "failed", "2024-01-01T00:00:00+00:00", "2024-01-01T00:01:00+00:00")
+        adapter = _adapter([finished], [finished])
+        adapter.list_task_instances_batch.return_value = {
+            "task_instances": [
+                {"dag_id": "etl", "dag_run_id": "r1", "task_id": "load", "state": "failed"},
+                {"dag_id": "etl", "dag_run_id": "r1", "task_id": "extract", "state": "success"},
+            ]
+        }
+
+        await sync_dag(adapter, store, "etl")
+        await sync_dag(adapter, store, "etl")
+
+        adapter.list_task_instances_batch.assert_awaited_once_with(
+            dag_ids=["etl"], dag_run_ids=["r1"]
+        )
+        assert store.task_failures("etl") == [
+            {"dag_id": "etl", "task_id": "load", "failures": 1, "last_failure": None}
+        ]
+
+    @pytest.mark.anyio
+    async def test_errors_are_reported_per_dag(self, store):
+        """Test a DAG that fails to sync does not stop the others."""
+        adapter = _adapter([_run("r1", "success", "2024-01-01T00:00:00+00:00")])
+        adapter.list_dags.return_value = {"dags": [{"dag_id": "a"}, {"dag_id": "b"}]}
+
+        result = await sync_run_history(adapter, store)
+
+        assert result["dag_runs"] == 1
+        assert [e["dag_id"] for e in result["errors"]] == ["b"]
+        assert store.watermark("b") is None
+
+
+class TestRunHistoryStore:
+    """Tests for the SQLite store."""
+
+    def test_history_is_dropped_for_another_airflow(self, tmp_path):
+        """Test reopening the file for a different Airflow starts over."""
+        path = tmp_path / "history.db"
+        store = RunHistoryStore(path, "http://one")
+        store.save_runs("etl", [_run("r1", "success", "2024-01-01T00:00:00+00:00")], "x")
+        store.close()
+
+        same = RunHistoryStore(path, "http://one")
+        assert same.status()["dag_runs"] == 1
+        same.close()
+        other = RunHistoryStore(path, "http://two")
+        assert other.status()["dag_runs"] == 0
+        assert other.watermark("etl") is None
+        other.close()
+
+    def test_stats_filter_by_time_window(self, store):
+        """Test since/until restrict the runs that are counted."""
+        store.save_runs(
+            "etl",
+            [
+                _run("r1", "failed", "2024-05-31T00:00:00+00:00"),
+                _run("r2", "failed", "2024-06-01T00:00:00+00:00"),
+                _run("r3", "success", "2024-06-15T00:00:00+00:00"),
+            ],
+            "x",
+        )
+
+        [stats] = store.run_stats(since="2024-06-01", until="2024-07-01")
+
+        assert stats["total_runs"] == 2
+        assert stats["last_failure"]["dag_run_id"] == "r2"
+
+    def test_duration_from_z_suffixed_timestamps(self, store):
+        """Test run durations are computed for timestamps ending in Z."""
+        store.save_runs(
+            "etl", [_run("r1", "success", "2024-06-01T00:00:00Z", "2024-06-01T00:01:30Z")], "x"
+        )
+
+        [stats] = store.run_stats("etl")
+
+        assert stats["duration_seconds"]["max"] == 90.0
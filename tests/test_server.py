@@ -1,18 +1,33 @@
 """Tests for server API client wrapper."""
 
+import asyncio
+import base64
 import json
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 
 import httpx
 import pytest
 
+from astro_airflow_mcp.polling import WaitResult
 from astro_airflow_mcp.server import (
     TOKEN_REFRESH_BUFFER_SECONDS,
     AirflowTokenManager,
     _config,
     _get_auth_token,
     _get_dag_details_impl,
+    _get_run_history_impl,
+    _get_task_logs_impl,
+    _list_dag_runs_impl,
     _list_dags_impl,
+    _list_tasks_impl,
+    _reset_adapter,
+    _search_dag_run_logs_impl,
+    _search_dags_impl,
+    _to_json,
+    _trigger_dag_and_wait_impl,
+    _trigger_dags_and_wait_impl,
     configure,
 )
 
@@ -23,44 +38,57 @@ def reset_config():
     original_url = _config.url
     original_token = _config.auth_token
     original_manager = _config.token_manager
+    original_limits = _config.http_limits
+    original_http2 = _config.http2
+    original_cache = (_config.response_cache, _config.cache_max_entries)
+    original_output_format = _config.output_format
+    original_run_history_db = _config.run_history_db
     yield
     _config.url = original_url
     _config.auth_token = original_token
     _config.token_manager = original_manager
+    _config.http_limits = original_limits
+    _config.http2 = original_http2
+    _config.response_cache, _config.cache_max_entries = original_cache
+    _config.output_format = original_output_format
+    _config.run_history_db = original_run_history_db
 
 
 class TestImplFunctions:
     """Tests for _impl functions using mocked adapters."""
 
-    def test_get_dag_details_impl_success(self, mocker):
+    @pytest.mark.anyio
+    async def test_get_dag_details_impl_success(self, mocker):
         """Test _get_dag_details_impl with successful response."""
         mock_dag_data = {
             "dag_id": "example_dag",
             "is_paused": False,
             "description": "Test DAG",
         }
-        mock_adapter = mocker.Mock()
+        mock_adapter = mocker.AsyncMock()
         mock_adapter.get_dag.return_value = mock_dag_data
         mocker.patch("astro_airflow_mcp.server._get_adapter", return_value=mock_adapter)
 
-        result = _get_dag_details_impl("example_dag")
+        result = await _get_dag_details_impl("example_dag")
         result_data = json.loads(result)
 
         assert result_data["dag_id"] == "example_dag"
         assert result_data["is_paused"] is False
         assert result_data["description"] == "Test DAG"
 
-    def test_get_dag_details_impl_error(self, mocker):
+    @pytest.mark.anyio
+    async def test_get_dag_details_impl_error(self, mocker):
         """Test _get_dag_details_impl with adapter error."""
-        mock_adapter = mocker.Mock()
+        mock_adapter = mocker.AsyncMock()
         mock_adapter.get_dag.side_effect = Exception("DAG not found")
         mocker.patch("astro_airflow_mcp.server._get_adapter", return_value=mock_adapter)
 
-        result = _get_dag_details_impl("nonexistent_dag")
+        result = await _get_dag_details_impl("nonexistent_dag")
 
         assert "DAG not found" in result
 
-    def test_list_dags_impl_success(self, mocker):
+    @pytest.mark.anyio
+    async def test_list_dags_impl_success(self, mocker):
         """Test _list_dags_impl with successful response."""
         mock_response = {
             "dags": [
@@ -69,26 +97,136 @@ class TestImplFunctions:
             ],
             "total_entries": 2,
         }
-        mock_adapter = mocker.Mock()
-        mock_adapter.list_dags.return_value = mock_response
+        mock_adapter = mocker.AsyncMock()
+        mock_adapter.fetch_all.return_value = mock_response
         mocker.patch("astro_airflow_mcp.server._get_adapter", return_value=mock_adapter)
 
-        result = _list_dags_impl(limit=10, offset=0)
+        result = await _list_dags_impl(limit=10, offset=0)
         result_data = json.loads(result)
 
+        mock_adapter.fetch_all.assert_awaited_once_with(
+            mock_adapter.list_dags, "dags", max_items=10, offset=0
+        )
         assert result_data["total_dags"] == 2
         assert result_data["returned_count"] == 2
         assert len(result_data["dags"]) == 2
         assert result_data["dags"][0]["dag_id"] == "dag1"
 
-    def test_list_dags_impl_empty(self, mocker):
+    @pytest.mark.anyio
+    async def test_list_dags_impl_filters(self, mocker):
+        """Test DAG filters are passed to Airflow and unset ones are omitted."""
+        mock_adapter = mocker.AsyncMock()
+        mock_adapter.fetch_all.return_value = {"dags": [], "total_entries": 0}
+        mocker.patch("astro_airflow_mcp.server._get_adapter", return_value=mock_adapter)
+
+        await _list_dags_impl(limit=5, dag_id_pattern="%etl%", tags=["prod"], paused=False)
+
+        mock_adapter.fetch_all.assert_awaited_once_with(
+            mock_adapter.list_dags,
+            "dags",
+            max_items=5,
+            offset=0,
+            dag_id_pattern="%etl%",
+            tags=["prod"],
+            paused=False,
+        )
+
+    @pytest.mark.anyio
+    async def test_list_dag_runs_impl_filters(self, mocker):
+        """Test DAG run filters, including the DAG ID path filter, reach the adapter."""
+        mock_adapter = mocker.AsyncMock()
+        mock_adapter.fetch_all.return_value = {"dag_runs": [], "total_entries": 0}
+        mocker.patch("astro_airflow_mcp.server._get_adapter", return_value=mock_adapter)
+
+        await _list_dag_runs_impl(
+            dag_id="etl",
+            state=["failed"],
+            start_date_gte="2024-01-01T00:00:00Z",
+            order_by="-start_date",
+        )
+
+        mock_adapter.fetch_all.assert_awaited_once_with(
+            mock_adapter.list_dag_runs,
+            "dag_runs",
+            max_items=None,
+            offset=0,
+            dag_id="etl",
+            state=["failed"],
+            start_date_gte="2024-01-01T00:00:00Z",
+            order_by="-start_date",
+        )
+
+    @pytest.mark.anyio
+    async def test_list_dags_impl_default_fields(self, mocker):
+        """Test list results are projected to the DAG summary fields by default."""
+        mock_adapter = mocker.AsyncMock()
+        mock_adapter.fetch_all.return_value = {
+            "dags": [{"dag_id": "dag1", "is_paused": False, "doc_md": "# Long docs"}],
+            "total_entries": 1,
+        }
+        mocker.patch("astro_airflow_mcp.server._get_adapter", return_value=mock_adapter)
+
+        result_data = json.loads(await _list_dags_impl())
+
+        assert result_data["dags"] == [{"dag_id": "dag1", "is_paused": False}]
+
+    @pytest.mark.anyio
+    @pytest.mark.parametrize(
+        ("fields", "expected"),
+        [
+            (["dag_id"], {"dag_id": "dag1"}),
+            (["dag_id", "missing"], {"dag_id": "dag1"}),
+            (["*"], {"dag_id": "dag1", "is_paused": False, "doc_md": "# Long docs"}),
+        ],
+    )
+    async def test_list_dags_impl_fields(self, mocker, fields, expected):
+        """Test explicit field selection, including unknown fields and '*'."""
+        mock_adapter = mocker.AsyncMock()
+        mock_adapter.fetch_all.return_value = {
+            "dags": [{"dag_id": "dag1", "is_paused": False, "doc_md": "# Long docs"}],
+            "total_entries": 1,
+        }
+        mocker.patch("astro_airflow_mcp.server._get_adapter", return_value=mock_adapter)
+
+        result_data = json.loads(await _list_dags_impl(fields=fields))
+
+        assert result_data["dags"] == [expected]
+
+    @pytest.mark.anyio
+    async def test_get_dag_details_impl_fields(self, mocker):
+        """Test get tools return every field unless fields are requested."""
+        mock_adapter = mocker.AsyncMock()
+        mock_adapter.get_dag.return_value = {"dag_id": "d", "is_paused": True, "doc_md": "x"}
+        mocker.patch("astro_airflow_mcp.server._get_adapter", return_value=mock_adapter)
+
+        full = json.loads(await _get_dag_details_impl("d"))
+        projected = json.loads(await _get_dag_details_impl("d", fields=["is_paused"]))
+
+        assert full == {"dag_id": "d", "is_paused": True, "doc_md": "x"}
+        assert projected == {"is_paused": True}
+
+    @pytest.mark.anyio
+    async def test_list_tasks_impl_default_fields(self, mocker):
+        """Test list_tasks drops fields outside the task summary by default."""
+        mock_adapter = mocker.AsyncMock()
+        mock_adapter.list_tasks.return_value = {
+            "tasks": [{"task_id": "t1", "operator_name": "BashOperator", "doc_md": "x"}]
+        }
+        mocker.patch("astro_airflow_mcp.server._get_adapter", return_value=mock_adapter)
+
+        result_data = json.loads(await _list_tasks_impl("d"))
+
+        assert result_data["tasks"] == [{"task_id": "t1", "operator_name": "BashOperator"}]
+
+    @pytest.mark.anyio
+    async def test_list_dags_impl_empty(self, mocker):
         """Test _list_dags_impl with no DAGs."""
         mock_response = {"dags": [], "total_entries": 0}
-        mock_adapter = mocker.Mock()
-        mock_adapter.list_dags.return_value = mock_response
+        mock_adapter = mocker.AsyncMock()
+        mock_adapter.fetch_all.return_value = mock_response
         mocker.patch("astro_airflow_mcp.server._get_adapter", return_value=mock_adapter)
 
-        result = _list_dags_impl()
+        result = await _list_dags_impl()
         result_data = json.loads(result)
 
         assert result_data["total_dags"] == 0
@@ -96,6 +234,381 @@ class TestImplFunctions:
         assert result_data["dags"] == []
 
 
+class TestGetTaskLogs:
+    """Tests for windowed task log retrieval."""
+
+    @staticmethod
+    def _adapter(mocker, lines):
+        adapter = mocker.Mock()
+        closed = []
+
+        async def stream(*args):
+            try:
+                for line in lines:
+                    yield line
+            finally:
+                closed.append(True)
+
+        adapter.stream_task_logs.side_effect = stream
+        adapter.closed = closed
+        mocker.patch("astro_airflow_mcp.server._get_adapter", return_value=adapter)
+        return adapter
+
+    @pytest.mark.anyio
+    async def test_default_returns_tail_of_log(self, mocker):
+        """Test the default window is the end of the log."""
+        lines = [f"line {i}" for i in range(10_000)]
+        self._adapter(mocker, lines)
+
+        result = json.loads(await _get_task_logs_impl("d", "r", "t", tail_bytes=20))
+
+        assert result["mode"] == "tail"
+        assert result["content"] == "line 9998\nline 9999"
+        assert result["truncated"] is True
+
+    @pytest.mark.anyio
+    async def test_head_lines_closes_stream_early(self, mocker):
+        """Test a head read stops the stream once enough lines are read."""
+        adapter = self._adapter(mocker, ["a", "b", "c"])
+
+        result = json.loads(await _get_task_logs_impl("d", "r", "t", head_lines=1))
+
+        assert result["content"] == "a"
+        assert adapter.closed == [True]
+
+    @pytest.mark.anyio
+    async def test_byte_range(self, mocker):
+        """Test a byte range returns the offset to continue from."""
+        self._adapter(mocker, ["alpha", "beta"])
+
+        result = json.loads(await _get_task_logs_impl("d", "r", "t", byte_offset=2, byte_limit=3))
+
+        assert result["mode"] == "range"
+        assert result["content"] == "pha"
+        assert result["next_byte_offset"] == 5
+
+    @pytest.mark.anyio
+    async def test_digest_mode(self, mocker):
+        """Test digest mode returns tracebacks instead of log text."""
+        self._adapter(
+            mocker,
+            ["INFO - start", "Traceback (most recent call last):", '  File "x.py"', "Boom: x"],
+        )
+
+        result = json.loads(await _get_task_logs_impl("d", "r", "t", digest=True))
+
+        assert result["mode"] == "digest"
+        assert result["tracebacks"][0]["exception"] == "Boom: x"
+
+    @pytest.mark.anyio
+    async def test_continuation_token_uses_airflow_paging(self, mocker):
+        """Test continuation tokens page through Airflow's chunked log reads."""
+        adapter = mocker.AsyncMock()
+        adapter.get_task_logs.return_value = {
+            "content": [{"event": "chunk"}],
+            "continuation_token": "next",
+        }
+        mocker.patch("astro_airflow_mcp.server._get_adapter", return_value=adapter)
+
+        result = json.loads(await _get_task_logs_impl("d", "r", "t", continuation_token="tok"))
+
+        assert result == {"content": "chunk", "continuation_token": "next"}
+        kwargs = adapter.get_task_logs.await_args.kwargs
+        assert kwargs["full_content"] is False
+        assert kwargs["continuation_token"] == "tok"
+        adapter.stream_task_logs.assert_not_called()
+
+
+class TestSearchDagRunLogs:
+    """Tests for searching logs across a DAG run."""
+
+    @staticmethod
+    def _adapter(mocker, task_instances, logs):
+        adapter = mocker.Mock()
+        adapter.fetch_all = mocker.AsyncMock(return_value={"task_instances": task_instances})
+
+        async def stream(dag_id, dag_run_id, task_id, try_number, map_index):
+            for line in logs[(task_id, map_index, try_number)]:
+                yield line
+
+        adapter.stream_task_logs.side_effect = stream
+        mocker.patch("astro_airflow_mcp.server._get_adapter", return_value=adapter)
+        return adapter
+
+    @pytest.mark.anyio
+    async def test_searches_every_try_and_map_index(self, mocker):
+        """Test all tries and map indexes are searched and matches are located."""
+        started = "2024-01-01T00:00:00Z"
+        adapter = self._adapter(
+            mocker,
+            [
+                {"task_id": "load", "map_index": -1, "try_number": 2, "start_date": started},
+                {"task_id": "map", "map_index": 0, "try_number": 1, "start_date": started},
+                {"task_id": "never_ran", "map_index": -1, "try_number": 0, "start_date": None},
+            ],
+            {
+                ("load", -1, 1): ["ok", "KeyError: 'x'"],
+                ("load", -1, 2): ["ok"],
+                ("map", 0, 1): ["keyerror lower"],
+            },
+        )
+
+        result = json.loads(
+            await _search_dag_run_logs_impl("d", "r", "keyerror", ignore_case=True, context_lines=0)
+        )
+
+        assert result["logs_searched"] == 3
+        assert result["truncated"] is False
+        assert [(m["task_id"], m["try_number"], m["line_number"]) for m in result["matches"]] == [
+            ("load", 1, 2),
+            ("map", 1, 1),
+        ]
+        assert adapter.stream_task_logs.call_count == 3
+
+    @pytest.mark.anyio
+    async def test_stops_at_max_matches(self, mocker):
+        """Test the search is truncated once enough matches are found."""
+        started = "2024-01-01T00:00:00Z"
+        self._adapter(
+            mocker,
+            [{"task_id": f"t{i}", "try_number": 1, "start_date": started} for i in range(5)],
+            {(f"t{i}", -1, 1): ["ERROR"] * 10 for i in range(5)},
+        )
+
+        result = json.loads(
+            await _search_dag_run_logs_impl("d", "r", "ERROR", max_matches=3, max_concurrency=1)
+        )
+
+        assert result["total_matches"] == 3
+        assert result["truncated"] is True
+        assert result["logs_searched"] == 1
+
+    @pytest.mark.anyio
+    async def test_invalid_pattern(self):
+        """Test an invalid regex is reported without calling Airflow."""
+        result = await _search_dag_run_logs_impl("d", "r", "(unclosed")
+
+        assert result.startswith("Invalid pattern")
+
+
+class TestSearchDags:
+    """Tests for the search_dags tool."""
+
+    @pytest.mark.anyio
+    async def test_builds_index_on_first_use(self, mocker):
+        """Test the first search crawls Airflow and returns index status."""
+        import astro_airflow_mcp.server as server_module
+
+        adapter = mocker.AsyncMock()
+        adapter.fetch_all.return_value = {"dags": [{"dag_id": "etl", "owners": ["ops"]}]}
+        adapter.list_tasks.return_value = {"tasks": [{"task_id": "t", "operator_name": "X"}]}
+        mocker.patch("astro_airflow_mcp.server._get_adapter", return_value=adapter)
+        server_module._dag_index.clear()
+
+        try:
+            result = json.loads(await _search_dags_impl(owner="ops"))
+        finally:
+            await server_module._dag_index.close()
+            server_module._dag_index.clear()
+
+        assert [d["dag_id"] for d in result["dags"]] == ["etl"]
+        assert result["index"]["indexed_dags"] == 1
+
+
+class TestGetRunHistory:
+    """Tests for the run history tools."""
+
+    @pytest.mark.anyio
+    async def test_disabled_without_database(self, reset_config):
+        """Test the tools explain how to enable the store."""
+        _config.run_history_db = None
+
+        result = await _get_run_history_impl(dag_id="etl")
+
+        assert "--run-history-db" in result
+
+    @pytest.mark.anyio
+    async def test_syncs_then_reports(self, mocker, reset_config, tmp_path):
+        """Test a report syncs the DAG incrementally and summarizes its runs."""
+        import astro_airflow_mcp.server as server_module
+
+        adapter = mocker.AsyncMock()
+        adapter.fetch_all.return_value = {
+            "dag_runs": [
+                {
+                    "dag_run_id": "r1",
+                    "state": "success",
+                    "start_date": "2024-01-01T00:00:00+00:00",
+                    "end_date": "2024-01-01T00:10:00+00:00",
+                }
+            ]
+        }
+        mocker.patch("astro_airflow_mcp.server._get_adapter", return_value=adapter)
+        _config.run_history_db = str(tmp_path / "history.db")
+
+        try:
+            result = json.loads(await _get_run_history_impl(dag_id="etl"))
+        finally:
+            server_module._close_run_history()
+
+        assert result["sync"]["dag_runs"] == 1
+        assert result["dags"][0]["duration_seconds"]["p50"] == 600.0
+        assert result["store"]["dags_synced"] == 1
+
+
+class TestTriggerDagAndWait:
+    """Tests for _trigger_dag_and_wait_impl."""
+
+    @pytest.mark.anyio
+    async def test_failed_run_reports_progress_and_failed_tasks(self, mocker):
+        """Test progress is forwarded to the MCP context and failures are detailed."""
+        mock_adapter = mocker.AsyncMock()
+        mock_adapter.trigger_dag_run.return_value = {"dag_run_id": "run_1", "state": "queued"}
+        mock_adapter.list_dag_runs.return_value = {"dag_runs": []}
+        mock_adapter.fetch_all.return_value = {
+            "task_instances": [{"task_id": "load", "state": "failed"}]
+        }
+        mocker.patch("astro_airflow_mcp.server._get_adapter", return_value=mock_adapter)
+
+        async def fake_wait(dag_id, dag_run_id, timeout, **kwargs):
+            await kwargs["on_progress"](
+                {
+                    "state": "running",
+                    "elapsed_seconds": 5.0,
+                    "task_counts": {"total": 2, "finished": 1, "running": 1, "failed": 0},
+                }
+            )
+            return WaitResult({"dag_run_id": dag_run_id, "state": "failed"}, False, 9.5, 3)
+
+        mocker.patch("astro_airflow_mcp.server._run_poller.wait", side_effect=fake_wait)
+        ctx = mocker.AsyncMock()
+
+        result = json.loads(await _trigger_dag_and_wait_impl("etl", timeout=60, ctx=ctx))
+
+        ctx.report_progress.assert_awaited_once_with(5.0, 60, "etl is running: 1/2 tasks finished")
+        assert result["dag_run"]["state"] == "failed"
+        assert result["elapsed_seconds"] == 9.5
+        assert result["failed_tasks"][0]["task_id"] == "load"
+        mock_adapter.fetch_all.assert_awaited_once_with(
+            mock_adapter.get_task_instances, "task_instances", dag_id="etl", dag_run_id="run_1"
+        )
+
+    @pytest.mark.anyio
+    async def test_trigger_failure(self, mocker):
+        """Test a failed trigger is reported without waiting."""
+        mock_adapter = mocker.AsyncMock()
+        mock_adapter.trigger_dag_run.side_effect = Exception("DAG is paused")
+        mocker.patch("astro_airflow_mcp.server._get_adapter", return_value=mock_adapter)
+        wait = mocker.patch("astro_airflow_mcp.server._run_poller.wait")
+
+        result = json.loads(await _trigger_dag_and_wait_impl("etl"))
+
+        assert "DAG is paused" in result["error"]
+        wait.assert_not_called()
+
+
+class TestTriggerDagsAndWait:
+    """Tests for _trigger_dags_and_wait_impl."""
+
+    @pytest.mark.anyio
+    async def test_consolidated_results_with_bounded_triggers(self, mocker):
+        """Test runs are triggered with bounded parallelism and reported together."""
+        in_flight = 0
+        peak = 0
+
+        async def trigger_dag_run(dag_id, conf=None):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            if dag_id == "broken":
+                raise Exception("DAG not found")
+            return {"dag_run_id": f"run_{conf['n']}", "state": "queued"}
+
+        mock_adapter = mocker.AsyncMock()
+        mock_adapter.trigger_dag_run.side_effect = trigger_dag_run
+        mock_adapter.fetch_all.return_value = {
+            "task_instances": [{"task_id": "load", "state": "failed"}]
+        }
+        mocker.patch("astro_airflow_mcp.server._get_adapter", return_value=mock_adapter)
+
+        async def fake_wait(dag_id, dag_run_id, timeout, **kwargs):
+            state = "failed" if dag_run_id == "run_0" else "success"
+            return WaitResult({"dag_run_id": dag_run_id, "state": state}, False, 1.0, 1)
+
+        wait = mocker.patch("astro_airflow_mcp.server._run_poller.wait", side_effect=fake_wait)
+        ctx = mocker.AsyncMock()
+        runs = [{"dag_id": "etl", "conf": {"n": n}} for n in range(6)] + [{"dag_id": "broken"}]
+
+        result = json.loads(
+            await _trigger_dags_and_wait_impl(runs, timeout=60, max_concurrency=2, ctx=ctx)
+        )
+
+        assert peak == 2
+        assert wait.await_count == 6
+        assert result["total_runs"] == 7
+        assert result["summary"] == {"failed": 1, "success": 5, "trigger_failed": 1}
+        assert result["runs"][0]["failed_tasks"][0]["task_id"] == "load"
+        assert "DAG not found" in result["runs"][6]["error"]
+        # Each run is timed from its own trigger, not from the start of the batch
+        assert result["runs"][5]["elapsed_seconds"] < result["elapsed_seconds"]
+        assert ctx.report_progress.await_count == 7
+        assert ctx.report_progress.await_args_list[-1].args[:2] == (7, 7)
+
+    @pytest.mark.anyio
+    async def test_rejects_specs_without_dag_id(self, mocker):
+        """Test invalid run specs are rejected before anything is triggered."""
+        get_adapter = mocker.patch("astro_airflow_mcp.server._get_adapter")
+
+        result = json.loads(await _trigger_dags_and_wait_impl([{"conf": {}}]))
+
+        assert "dag_id" in result["error"]
+        get_adapter.assert_not_called()
+
+
+class TestOutputFormat:
+    """Tests for the shared JSON serialization helper."""
+
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    def test_compact_output(self, reset_config, mocker, use_orjson):
+        """Test compact output has no insignificant whitespace."""
+        import astro_airflow_mcp.server as server_module
+
+        if not use_orjson:
+            mocker.patch.object(server_module, "orjson", None)
+        configure(output_format="compact")
+
+        result = _to_json({"dags": [{"dag_id": "caf\u00e9", "is_paused": False}]})
+
+        assert result == '{"dags":[{"dag_id":"caf\u00e9","is_paused":false}]}'
+
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    def test_pretty_output(self, reset_config, mocker, use_orjson):
+        """Test pretty output is indented, keeps non-ASCII text and round-trips."""
+        import astro_airflow_mcp.server as server_module
+
+        if not use_orjson:
+            mocker.patch.object(server_module, "orjson", None)
+        configure(output_format="pretty")
+
+        result = _to_json({"a": [1, 2], "dag_id": "caf\u00e9"})
+
+        assert "\n  " in result
+        assert "caf\u00e9" in result
+        assert json.loads(result) == {"a": [1, 2], "dag_id": "caf\u00e9"}
+
+    def test_non_string_keys_fall_back_to_json(self, reset_config):
+        """Test data orjson rejects is still serialized."""
+        configure(output_format="compact")
+        assert json.loads(_to_json({1: "one"})) == {"1": "one"}
+
+    def test_invalid_output_format(self, reset_config):
+        """Test configure() rejects unknown formats."""
+        with pytest.raises(ValueError, match="Invalid output format"):
+            configure(output_format="yaml")
+
+
 class TestConfiguration:
     """Tests for global configuration."""
 
@@ -138,6 +651,53 @@ class TestConfiguration:
         assert _config.auth_token == "direct_token"
         assert _config.token_manager is None  # Token manager not created
 
+    def test_configure_http_pool_settings(self, reset_config):
+        """Test configure() builds connection pool limits for the adapter."""
+        configure(max_connections=50, keepalive_expiry=60.0, http2=True)
+        assert _config.http_limits.max_connections == 50
+        assert _config.http_limits.keepalive_expiry == 60.0
+        assert _config.http2 is True
+
+    def test_configure_http_pool_settings_honor_zero(self, reset_config):
+        """Test an explicit 0 is applied rather than replaced by the default."""
+        configure(max_keepalive_connections=0, keepalive_expiry=0.0)
+        assert _config.http_limits.max_keepalive_connections == 0
+        assert _config.http_limits.keepalive_expiry == 0.0
+        with pytest.raises(ValueError, match="max connections"):
+            configure(max_connections=0)
+
+    def test_configure_response_cache(self, reset_config):
+        """Test configure() updates response cache settings."""
+        configure(response_cache=False, cache_max_entries=64)
+        assert _config.response_cache is False
+        assert _config.cache_max_entries == 64
+
+    def test_reset_adapter_without_event_loop(self, mocker):
+        """Test _reset_adapter drops the adapter when no event loop is running."""
+        import astro_airflow_mcp.server as server_module
+
+        mock_adapter = mocker.AsyncMock()
+        mocker.patch.object(server_module, "_adapter", mock_adapter)
+
+        _reset_adapter()
+
+        mock_adapter.aclose.assert_not_called()
+        assert server_module._adapter is None
+
+    @pytest.mark.anyio
+    async def test_reset_adapter_closes_client(self, mocker):
+        """Test _reset_adapter schedules the adapter's HTTP client close."""
+        import astro_airflow_mcp.server as server_module
+
+        mock_adapter = mocker.AsyncMock()
+        mocker.patch.object(server_module, "_adapter", mock_adapter)
+
+        _reset_adapter()
+        await asyncio.sleep(0)
+
+        mock_adapter.aclose.assert_awaited_once()
+        assert server_module._adapter is None
+
 
 class TestAirflowTokenManager:
     """Tests for the AirflowTokenManager class."""
@@ -369,6 +929,112 @@ class TestAirflowTokenManager:
 
         assert auth == ("admin", "secret")
 
+    def test_concurrent_get_token_fetches_once(self, mocker):
+        """Test concurrent callers share a single token fetch (single-flight)."""
+        manager = AirflowTokenManager("http://localhost:8080", "admin", "admin")
+        started = threading.Event()
+
+        def slow_fetch():
+            started.set()
+            time.sleep(0.05)
+            manager._token = "fresh_token"
+            manager._token_fetched_at = time.time()
+
+        fetch = mocker.patch.object(manager, "_fetch_token", side_effect=slow_fetch)
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            tokens = list(pool.map(lambda _: manager.get_token(), range(8)))
+
+        assert tokens == ["fresh_token"] * 8
+        fetch.assert_called_once()
+
+    def test_token_near_expiry_refreshed_in_background(self, mocker):
+        """Test a still-valid token inside the refresh buffer is returned immediately."""
+        manager = AirflowTokenManager("http://localhost:8080", "admin", "admin")
+        manager._token = "old_token"
+        manager._token_lifetime_seconds = 1800
+        manager._token_fetched_at = time.time() - 1800 + TOKEN_REFRESH_BUFFER_SECONDS - 10
+        refreshed = threading.Event()
+
+        def fetch():
+            manager._token = "new_token"
+            manager._token_fetched_at = time.time()
+            refreshed.set()
+
+        mocker.patch.object(manager, "_fetch_token", side_effect=fetch)
+
+        assert manager.get_token() == "old_token"
+        assert refreshed.wait(timeout=1)
+        manager._background_refresh.join(timeout=1)
+        assert manager.get_token() == "new_token"
+
+    def test_valid_token_not_blocked_by_running_refresh(self, mocker):
+        """Test callers with a token inside the refresh buffer never wait on the fetch."""
+        manager = AirflowTokenManager("http://localhost:8080", "admin", "admin")
+        manager._token = "old_token"
+        manager._token_lifetime_seconds = 1800
+        manager._token_fetched_at = time.time() - 1800 + TOKEN_REFRESH_BUFFER_SECONDS - 10
+        release = threading.Event()
+        mocker.patch.object(manager, "_fetch_token", side_effect=lambda: release.wait(5))
+
+        try:
+            assert manager.get_token() == "old_token"
+            with ThreadPoolExecutor(max_workers=1) as pool:
+                # The background fetch still holds _refresh_lock here
+                assert pool.submit(manager.get_token).result(timeout=1) == "old_token"
+        finally:
+            release.set()
+            manager._background_refresh.join(timeout=1)
+
+    @pytest.mark.anyio
+    async def test_async_refresh_does_not_block_event_loop(self, mocker):
+        """Test other coroutines make progress while an expired token is fetched."""
+        manager = AirflowTokenManager("http://localhost:8080", "admin", "admin")
+        release = threading.Event()
+
+        def slow_fetch():
+            release.wait(timeout=5)
+            manager._token = "fresh_token"
+            manager._token_fetched_at = time.time()
+
+        fetch = mocker.patch.object(manager, "_fetch_token", side_effect=slow_fetch)
+        tokens = asyncio.gather(manager.aget_token(), manager.aget_token())
+
+        progress = 0
+        for _ in range(5):
+            await asyncio.sleep(0.01)
+            progress += 1
+
+        assert progress == 5
+        assert not tokens.done()
+        release.set()
+        assert await tokens == ["fresh_token", "fresh_token"]
+        fetch.assert_called_once()
+
+    def test_lifetime_from_jwt_exp_claim(self, mocker):
+        """Test the token lifetime is read from the JWT exp claim without expires_in."""
+        claims = base64.urlsafe_b64encode(
+            json.dumps({"sub": "admin", "exp": int(time.time()) + 600}).encode()
+        ).rstrip(b"=")
+        jwt = f"header.{claims.decode()}.signature"
+
+        mock_response = mocker.Mock(status_code=200)
+        mock_response.json.return_value = {"access_token": jwt}
+        mock_client = mocker.Mock()
+        mock_client.post.return_value = mock_response
+        mock_client.__enter__ = mocker.Mock(return_value=mock_client)
+        mock_client.__exit__ = mocker.Mock(return_value=False)
+        mocker.patch("httpx.Client", return_value=mock_client)
+
+        manager = AirflowTokenManager("http://localhost:8080", "admin", "admin")
+        manager._fetch_token()
+
+        assert 590 <= manager._token_lifetime_seconds <= 600
+
+    def test_jwt_lifetime_non_jwt_token(self):
+        """Test opaque tokens fall back to the default lifetime."""
+        assert AirflowTokenManager._jwt_lifetime_seconds("opaque-token") is None
+
     def test_get_basic_auth_none_without_credentials(self):
         """Test get_basic_auth returns None without credentials."""
         manager = AirflowTokenManager(airflow_url="http://localhost:8080")
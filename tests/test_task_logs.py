@@ -0,0 +1,217 @@
+"""Tests for bounded task log views."""
+
+import json
+import re
+
+import pytest
+
+from astro_airflow_mcp.task_logs import (
+    MatchBudget,
+    byte_range,
+    decode_ndjson_line,
+    digest,
+    head_lines,
+    render_log_content,
+    search_lines,
+    tail_bytes,
+    tail_lines,
+    trim_digest,
+)
+
+
+async def _lines(*lines):
+    for line in lines:
+        yield line
+
+
+class TestLogWindows:
+    """Tests for selecting part of a streamed log."""
+
+    @pytest.mark.anyio
+    async def test_tail_bytes_keeps_whole_lines_at_the_end(self):
+        """Test the byte tail drops lines from the start until the window fits."""
+        window = await tail_bytes(_lines("aaaa", "bbbb", "cccc"), max_bytes=10)
+
+        assert window.content == "bbbb\ncccc"
+        assert window.lines == 2
+        assert window.bytes_read == 15
+        assert window.truncated is True
+
+    @pytest.mark.anyio
+    async def test_tail_bytes_cuts_oversized_line(self):
+        """Test a single line longer than the window keeps only its end."""
+        window = await tail_bytes(_lines("x" * 100 + "END"), max_bytes=5)
+
+        assert window.content == "x" * 2 + "END"
+        assert window.truncated is True
+
+    @pytest.mark.anyio
+    async def test_tail_bytes_small_log_is_not_truncated(self):
+        """Test a log smaller than the window is returned whole."""
+        window = await tail_bytes(_lines("one", "two"), max_bytes=1024)
+
+        assert window.content == "one\ntwo"
+        assert window.truncated is False
+
+    @pytest.mark.anyio
+    async def test_tail_and_head_lines(self):
+        """Test line-based windows at either end of the log."""
+        tail = await tail_lines(_lines("1", "2", "3", "4"), 2)
+        head = await head_lines(_lines("1", "2", "3", "4"), 2)
+
+        assert (tail.content, tail.truncated) == ("3\n4", True)
+        assert (head.content, head.truncated) == ("1\n2", True)
+
+    @pytest.mark.anyio
+    async def test_head_lines_stops_reading(self):
+        """Test a head read does not consume the rest of the stream."""
+        consumed = []
+
+        async def stream():
+            for line in ("1", "2", "3", "4", "5"):
+                consumed.append(line)
+                yield line
+
+        await head_lines(stream(), 2)
+
+        assert consumed == ["1", "2", "3"]
+
+    @pytest.mark.anyio
+    async def test_byte_range_pages_through_log(self):
+        """Test consecutive byte ranges cover the log exactly once."""
+        log = ("alpha", "beta", "gamma")
+        first = await byte_range(_lines(*log), offset=0, limit=8)
+        second = await byte_range(_lines(*log), offset=first.next_byte_offset, limit=16)
+
+        assert first.content == "alpha\nbe"
+        assert first.next_byte_offset == 8
+        assert second.content == "ta\ngamma\n"
+        assert second.next_byte_offset is None
+        assert first.content + second.content == "alpha\nbeta\ngamma\n"
+
+
+class TestSearchLines:
+    """Tests for searching a streamed log."""
+
+    @pytest.mark.anyio
+    async def test_matches_with_context_and_location(self):
+        """Test matches carry surrounding lines, line numbers and byte offsets."""
+        lines = _lines("start", "ok", "Error: boom", "cleanup", "end")
+
+        matches = await search_lines(lines, re.compile("Error"), 1, MatchBudget(10))
+
+        assert matches == [
+            {
+                "line_number": 3,
+                "byte_offset": 9,
+                "line": "Error: boom",
+                "before": ["ok"],
+                "after": ["cleanup"],
+            }
+        ]
+
+    @pytest.mark.anyio
+    async def test_stops_reading_when_budget_is_used(self):
+        """Test a search stops consuming the log once the shared limit is reached."""
+        consumed = []
+
+        async def stream():
+            for i in range(100):
+                consumed.append(i)
+                yield f"match {i}"
+
+        budget = MatchBudget(2)
+        matches = await search_lines(stream(), re.compile("match"), 0, budget)
+
+        assert [m["line"] for m in matches] == ["match 0", "match 1"]
+        assert budget.exhausted
+        assert len(consumed) == 2
+
+
+AIRFLOW2_FAILURE = [
+    "[2024-01-01, 00:00:00 UTC] {taskinstance.py:100} INFO - Starting attempt 1",
+    "[2024-01-01, 00:00:01 UTC] {taskinstance.py:200} ERROR - Task failed with exception",
+    "Traceback (most recent call last):",
+    '  File "/dags/etl.py", line 10, in execute',
+    "    load()",
+    "KeyError: 'customer_id'",
+    "[2024-01-01, 00:00:02 UTC] {taskinstance.py:200} ERROR - Task failed with exception",
+    "Traceback (most recent call last):",
+    '  File "/dags/etl.py", line 10, in execute',
+    "    load()",
+    "KeyError: 'customer_id'",
+    "[2024-01-01, 00:00:03 UTC] {local_task_job.py:300} INFO - Task exited with return code 1",
+]
+
+
+class TestDigest:
+    """Tests for extracting failure information from a log."""
+
+    @pytest.mark.anyio
+    async def test_deduplicates_tracebacks_and_error_lines(self):
+        """Test repeated tracebacks and error lines are reported once with counts."""
+        result = await digest(_lines(*AIRFLOW2_FAILURE), final_lines=2)
+
+        assert len(result["tracebacks"]) == 1
+        tb = result["tracebacks"][0]
+        assert tb["exception"] == "KeyError: 'customer_id'"
+        assert tb["occurrences"] == 2
+        assert tb["line_number"] == 3
+        assert tb["traceback"].startswith("Traceback (most recent call last):\n  File")
+
+        assert len(result["error_lines"]) == 1
+        assert result["error_lines"][0]["occurrences"] == 2
+        assert "Task exited with return code 1" in result["final_lines"]["content"]
+        assert result["lines_read"] == len(AIRFLOW2_FAILURE)
+
+    @pytest.mark.anyio
+    async def test_byte_offsets_point_into_full_log(self):
+        """Test digest offsets can be used to read the original log."""
+        result = await digest(_lines(*AIRFLOW2_FAILURE))
+        full_log = "".join(line + "\n" for line in AIRFLOW2_FAILURE).encode()
+
+        offset = result["tracebacks"][0]["byte_offset"]
+        assert full_log[offset:].startswith(b"Traceback")
+        assert result["bytes_read"] == len(full_log)
+
+    @pytest.mark.anyio
+    async def test_airflow3_structured_exception(self):
+        """Test Airflow 3 error_detail entries produce a traceback."""
+        entry = (
+            '{"level": "error", "event": "Task failed with exception", "error_detail": '
+            '[{"exc_type": "ValueError", "exc_value": "bad input", '
+            '"frames": [{"filename": "/dags/etl.py", "lineno": 3, "name": "run"}]}]}'
+        )
+
+        result = await digest(_lines(decode_ndjson_line(entry)))
+
+        assert result["tracebacks"][0]["exception"] == "ValueError: bad input"
+        assert result["error_lines"][0]["line"] == "ERROR - Task failed with exception"
+
+    @pytest.mark.anyio
+    async def test_trim_digest_keeps_root_cause(self):
+        """Test trimming drops error lines before the first traceback."""
+        lines = [f"ERROR - failure {i}" for i in range(30)] + AIRFLOW2_FAILURE
+        result = await digest(_lines(*lines))
+
+        trimmed = trim_digest(result, 1500)
+
+        assert trimmed["truncated"] is True
+        assert len(json.dumps(trimmed)) <= 1500
+        assert trimmed["tracebacks"][0]["exception"] == "KeyError: 'customer_id'"
+
+
+class TestLogRendering:
+    """Tests for turning structured log entries into text."""
+
+    def test_ndjson_line(self):
+        """Test Airflow 3 structured entries are rendered with timestamp and level."""
+        line = '{"timestamp": "2024-01-01T00:00:00Z", "level": "error", "event": "boom"}'
+
+        assert decode_ndjson_line(line) == "[2024-01-01T00:00:00Z] ERROR - boom"
+        assert decode_ndjson_line("plain text") == "plain text"
+
+    def test_render_log_content(self):
+        """Test JSON log responses render to text for both API versions."""
+        assert render_log_content("line 1\nline 2") == "line 1\nline 2"
+        assert render_log_content([{"event": "a"}, {"event": "b"}]) == "a\nb"
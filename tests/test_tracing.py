@@ -0,0 +1,77 @@
+"""Tests for OpenTelemetry tracing."""
+
+import httpx
+import pytest
+from fastmcp import Client, FastMCP
+
+from astro_airflow_mcp import tracing
+from astro_airflow_mcp.adapters import ResponseCache
+from astro_airflow_mcp.adapters.airflow_v3 import AsyncAirflowV3Adapter
+
+pytestmark = pytest.mark.skipif(
+    not tracing.TRACING_AVAILABLE, reason="opentelemetry-sdk not installed"
+)
+
+
+@pytest.fixture
+def spans():
+    """Enable tracing into an in-memory exporter; yields a function returning finished spans."""
+    from opentelemetry.sdk.trace.export.in_memory_span_exporter import InMemorySpanExporter
+
+    exporter = InMemorySpanExporter()
+    tracing.configure_tracing(exporter)
+
+    def finished():
+        tracing._provider.force_flush()
+        return exporter.get_finished_spans()
+
+    yield finished
+    tracing.configure_tracing(None)
+
+
+class TestTracing:
+    """Tests for spans around tool calls and Airflow requests."""
+
+    def test_disabled_by_default(self):
+        """Test spans are shared no-op context managers while tracing is off."""
+        assert not tracing.tracing_enabled()
+        with tracing.span("anything") as current:
+            assert current is None
+
+    def test_unknown_exporter(self):
+        """Test an unknown exporter name is rejected."""
+        with pytest.raises(ValueError, match="Invalid trace exporter"):
+            tracing.configure_tracing("zipkin")
+
+    @pytest.mark.anyio
+    async def test_tool_and_request_spans_share_a_trace(self, mocker, spans):
+        """Test request spans nest under the tool span and propagate traceparent."""
+        seen_headers = []
+
+        def handler(request):
+            seen_headers.append(request.headers)
+            return httpx.Response(200, json={"dag_id": "etl"})
+
+        client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        mocker.patch("httpx.AsyncClient", return_value=client)
+        adapter = AsyncAirflowV3Adapter("http://airflow", "3.0.0", cache=ResponseCache())
+
+        server = FastMCP("test")
+        server.add_middleware(tracing.TracingMiddleware())
+
+        @server.tool()
+        async def get_dag(dag_id: str) -> str:
+            return (await adapter.get_dag(dag_id))["dag_id"]
+
+        async with Client(server) as mcp_client:
+            await mcp_client.call_tool("get_dag", {"dag_id": "etl"})
+
+        by_name = {s.name: s for s in spans()}
+        tool, request = by_name["tool get_dag"], by_name["GET dags/{id}"]
+        assert request.parent.span_id == tool.context.span_id
+        assert request.attributes["http.response.status_code"] == 200
+        assert by_name["cache lookup"].attributes["cache.hit"] is False
+
+        traceparent = seen_headers[0]["traceparent"]
+        assert traceparent.split("-")[1] == f"{request.context.trace_id:032x}"
+        assert traceparent.split("-")[2] == f"{request.context.span_id:016x}"